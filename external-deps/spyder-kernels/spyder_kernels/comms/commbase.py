@@ -50,6 +50,14 @@
             'call_return_value': The return value of the function
            }
         - The buffer contains the return value if it is bytes
+    - Several function calls (spyder_msg_type = 'remote_call_batch'):
+        - The content is a dictionnary {
+            'calls': The list of function call contents described above,
+            'buffer_counts': The number of buffers of each call
+          }
+        - The buffers of all the calls are concatenated.
+      This is only sent to the other side if it's in the features that it
+      returns from `_get_comm_features`.
 """
 import logging
 import sys
@@ -63,6 +71,9 @@
 # Max timeout (in secs) for blocking calls
 TIMEOUT = 3
 
+# Optional message types that this side can handle
+COMM_FEATURES = ['remote_call_batch']
+
 
 class CommError(RuntimeError):
     pass
@@ -199,6 +210,8 @@ def __init__(self):
             'remote_call', self._handle_remote_call)
         self._register_message_handler(
             'remote_call_reply', self._handle_remote_call_reply)
+        self._register_message_handler(
+            'remote_call_batch', self._handle_remote_call_batch)
 
     def get_comm_id_list(self, comm_id=None):
         """Get a list of comms id."""
@@ -367,6 +380,17 @@ def _handle_remote_call(self, msg, buffers):
                 msg_dict['call_name'], msg_dict['call_id'])
             self._set_call_return_value(msg_dict, exc_infos, is_error=True)
 
+    def _handle_remote_call_batch(self, msg, buffers):
+        """Handle several remote calls sent in a single message."""
+        content = msg['content']
+        buffers = list(buffers or [])
+        for call_dict, buffer_count in zip(
+            content['calls'], content['buffer_counts']
+        ):
+            call_buffers = buffers[:buffer_count]
+            buffers = buffers[buffer_count:]
+            self._handle_remote_call({'content': call_dict}, call_buffers)
+
     def _remote_callback(self, call_name, call_args, call_kwargs):
         """Call the callback function for the remote call."""
         if call_name in self._remote_call_handlers:
@@ -432,6 +456,10 @@ def on_incoming_call(self, call_dict):
         """A call was received"""
         pass
 
+    def _handle_unconnected_call(self, call_dict):
+        """A non-blocking call was made while the comm is not connected."""
+        logger.debug("Call to unconnected comm: %s" % call_dict['call_name'])
+
     def _send_call(self, call_dict, comm_id, buffers=None):
         """Send call."""
         call_dict = self.on_outgoing_call(call_dict)
@@ -604,8 +632,7 @@ def __call__(self, *args, **kwargs):
             # Only an error if the call is blocking.
             if blocking:
                 raise CommError("The comm is not connected.")
-            logger.debug("Call to unconnected comm: %s" % self._name)
-            return
+            return self._comms_wrapper._handle_unconnected_call(call_dict)
         self._comms_wrapper._register_call(call_dict, self._callback)
         self._comms_wrapper._send_call(call_dict, self._comm_id, buffers)
         return self._comms_wrapper._get_call_return_value(
@@ -17,7 +17,7 @@
 from IPython.core.getipython import get_ipython
 import zmq
 
-from spyder_kernels.comms.commbase import CommBase, CommError
+from spyder_kernels.comms.commbase import CommBase, CommError, COMM_FEATURES
 from spyder_kernels.comms.utils import WriteContext
 
 
@@ -50,6 +50,10 @@ def __init__(self, kernel):
         self._cached_messages = {}
         self._pending_comms = {}
 
+        # Register handlers
+        self.register_call_handler(
+            '_get_comm_features', self._get_comm_features)
+
     def close(self, comm_id=None):
         """Close the comm and notify the other side."""
         with self.comm_lock:
@@ -145,6 +149,10 @@ def _notify_comm_ready(self, comm):
             callback=self._comm_ready_callback
         )._comm_ready()
 
+    def _get_comm_features(self):
+        """Return the optional message types that the kernel can handle."""
+        return COMM_FEATURES
+
     def _comm_ready_callback(self, ret):
         """A comm has replied, so process all cached messages related to it."""
         comm = self._pending_comms.pop(self.calling_comm_id, None)
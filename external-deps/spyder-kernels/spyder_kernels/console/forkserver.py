@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Fork server to start kernels quickly on Linux.
+
+A zygote process imports the modules kernels need (plus the ones selected by
+users) once and then forks a new kernel each time it's asked for one. That
+way kernels don't pay for the interpreter startup and those imports.
+
+Kernels are requested by running
+
+    python -m spyder_kernels.console.forkserver --preload numpy,pandas
+        -f CONNECTION_FILE
+
+which starts the zygote if it's not running yet, asks it for a kernel and
+stays alive until the kernel exits, forwarding signals to it. So for Jupyter
+clients this process behaves like the kernel itself.
+
+Notes
+-----
+* Zygotes are identified by the interpreter, the preloaded modules, the
+  environment variables they were started with and the pid of the process
+  that uses them. They exit when that process is gone or after being idle
+  for a while.
+* Modules that start threads or read environment variables on import are
+  not good candidates to be preloaded.
+"""
+
+# Standard library imports
+import argparse
+import array
+import fcntl
+import hashlib
+import importlib
+import json
+import os
+import os.path as osp
+import selectors
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+
+# Modules always imported by zygotes
+BASE_MODULES = ['IPython', 'ipykernel.kernelapp']
+
+# Signals forwarded by launchers to their kernels
+FORWARDED_SIGNALS = [
+    signal.SIGINT,
+    signal.SIGTERM,
+    signal.SIGHUP,
+    signal.SIGQUIT,
+    signal.SIGUSR1,
+    signal.SIGUSR2,
+]
+
+# Time launchers wait for a new zygote to be ready
+STARTUP_TIMEOUT = 60  # seconds
+
+# Time between checks done by zygotes to know if they have to exit
+POLL_INTERVAL = 2  # seconds
+
+# Time zygotes wait without running kernels before exiting
+IDLE_TIMEOUT = 3600  # seconds
+
+
+# =============================================================================
+# ---- Helpers
+# =============================================================================
+def get_socket_path(preload, parent_pid):
+    """Get the path of the socket of the zygote for the current process."""
+    key = json.dumps(
+        [sys.executable, preload, parent_pid, sorted(os.environ.items())]
+    )
+    name = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    directory = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return osp.join(directory, 'spyder-forkserver-{}.sock'.format(name))
+
+
+def send_message(sock, data, fds=()):
+    """Send `data` through `sock`, along with file descriptors `fds`."""
+    header = struct.pack('!I', len(data))
+    if fds:
+        sock.sendmsg(
+            [header],
+            [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', fds))]
+        )
+    else:
+        sock.sendall(header)
+    sock.sendall(data)
+
+
+def receive_message(sock, maxfds=0):
+    """
+    Receive data sent by `send_message` through `sock`.
+
+    Returns the data and the file descriptors sent with it, or None if the
+    other end closed the connection.
+    """
+    fds = array.array('i')
+    header, ancdata, __, __ = sock.recvmsg(
+        4, socket.CMSG_SPACE(maxfds * fds.itemsize)
+    )
+    for level, kind, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(
+                cmsg_data[:len(cmsg_data) - (len(cmsg_data) % fds.itemsize)]
+            )
+
+    header += _receive_exactly(sock, 4 - len(header))
+    if len(header) < 4:
+        return None
+
+    length = struct.unpack('!I', header)[0]
+    data = _receive_exactly(sock, length)
+    if len(data) < length:
+        return None
+
+    return data, list(fds)
+
+
+def _receive_exactly(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def _get_exit_code(status):
+    """Convert a status returned by os.waitpid to an exit code."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+# =============================================================================
+# ---- Zygote
+# =============================================================================
+class Zygote:
+    """Process that forks kernels after importing their common modules."""
+
+    def __init__(self, socket_path, preload, parent_pid=None):
+        self.socket_path = socket_path
+        self.preload = preload
+        self.parent_pid = parent_pid
+        self.children = {}
+        self.last_activity = time.monotonic()
+
+    def preload_modules(self):
+        """Import the modules shared by all kernels."""
+        for name in BASE_MODULES + self.preload:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                traceback.print_exc()
+
+    def serve(self):
+        """Fork kernels until the zygote is no longer needed."""
+        # Only the user can connect to the socket
+        old_umask = os.umask(0o077)
+        try:
+            self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.server.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        self.server.listen()
+
+        # Be woken up when kernels exit
+        self.wakeup_reader, self.wakeup_writer = socket.socketpair()
+        self.wakeup_writer.setblocking(False)
+        signal.set_wakeup_fd(self.wakeup_writer.fileno())
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.server, selectors.EVENT_READ)
+        self.selector.register(self.wakeup_reader, selectors.EVENT_READ)
+
+        try:
+            while not self.is_done():
+                for key, __ in self.selector.select(POLL_INTERVAL):
+                    if key.fileobj is self.server:
+                        self.accept()
+                    else:
+                        self.wakeup_reader.recv(4096)
+                self.reap_children()
+        finally:
+            self.server.close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+    def is_done(self):
+        """Check if the zygote has to exit."""
+        if self.parent_pid:
+            try:
+                os.kill(self.parent_pid, 0)
+            except ProcessLookupError:
+                return True
+            except PermissionError:
+                pass
+
+        return (
+            not self.children
+            and time.monotonic() - self.last_activity > IDLE_TIMEOUT
+        )
+
+    def accept(self):
+        """Fork a kernel for a launcher that connected to the zygote."""
+        conn, __ = self.server.accept()
+        self.last_activity = time.monotonic()
+        fds = []
+        try:
+            message = receive_message(conn, maxfds=3)
+            if message is None or len(message[1]) != 3:
+                raise ValueError("Invalid request")
+            data, fds = message
+            request = json.loads(data.decode('utf-8'))
+
+            pid = os.fork()
+            if pid == 0:
+                self.run_kernel(conn, fds, request)
+
+            send_message(conn, str(pid).encode('ascii'))
+        except Exception:
+            traceback.print_exc()
+            conn.close()
+            return
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+        self.children[pid] = conn
+
+    def reap_children(self):
+        """Report the exit code of finished kernels to their launchers."""
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+
+            conn = self.children.pop(pid, None)
+            if conn is not None:
+                try:
+                    send_message(
+                        conn, str(_get_exit_code(status)).encode('ascii')
+                    )
+                except OSError:
+                    pass
+                conn.close()
+            self.last_activity = time.monotonic()
+
+    def run_kernel(self, conn, fds, request):
+        """Run a kernel in a forked child. This never returns."""
+        exit_code = 1
+        try:
+            # Forget about the zygote state
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            self.selector.close()
+            self.server.close()
+            self.wakeup_reader.close()
+            self.wakeup_writer.close()
+            for child_conn in self.children.values():
+                child_conn.close()
+
+            # Use the standard streams, environment and working directory of
+            # the launcher
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+                os.close(fd)
+            fds.clear()
+            os.environ.clear()
+            os.environ.update(request['env'])
+            os.chdir(request['cwd'])
+            tempfile.tempdir = None
+
+            # Exit if the launcher is killed
+            threading.Thread(
+                target=self.watch_launcher, args=(conn,), daemon=True
+            ).start()
+
+            from spyder_kernels.console import start
+            sys.argv = [start.__file__] + request['argv']
+            start.main()
+            exit_code = 0
+        except SystemExit as err:
+            if isinstance(err.code, int):
+                exit_code = err.code
+            elif err.code is None:
+                exit_code = 0
+        except BaseException:
+            traceback.print_exc(file=sys.__stderr__)
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(exit_code)
+
+    @staticmethod
+    def watch_launcher(conn):
+        """Exit when the launcher closes its connection."""
+        try:
+            while conn.recv(1):
+                pass
+        except OSError:
+            pass
+        os._exit(1)
+
+
+def run_zygote(socket_path, preload, parent_pid=None):
+    """Start a zygote and serve kernels from it."""
+    # Remove the current directory from sys.path, as `python -m` does
+    while '' in sys.path:
+        sys.path.remove('')
+    cwd = os.getcwd()
+    if cwd in sys.path:
+        sys.path.remove(cwd)
+
+    zygote = Zygote(socket_path, preload, parent_pid=parent_pid)
+    zygote.preload_modules()
+    zygote.serve()
+
+
+# =============================================================================
+# ---- Launcher
+# =============================================================================
+def connect_to_zygote(preload, parent_pid=None):
+    """Connect to a zygote with `preload`, starting it if necessary."""
+    socket_path = get_socket_path(preload, parent_pid)
+
+    # Prevent several launchers from starting a zygote at the same time
+    with open(socket_path + '.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        sock = _connect(socket_path)
+        if sock is not None:
+            return sock
+
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+        cmd = [sys.executable]
+        for option, value in sys._xoptions.items():
+            if value is True:
+                cmd.append('-X{}'.format(option))
+            else:
+                cmd.append('-X{}={}'.format(option, value))
+        cmd += ['-m', 'spyder_kernels.console.forkserver', '--zygote',
+                '--socket', socket_path, '--preload', ','.join(preload)]
+        if parent_pid:
+            cmd += ['--parent-pid', str(parent_pid)]
+
+        zygote = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True
+        )
+
+        start = time.monotonic()
+        while time.monotonic() - start < STARTUP_TIMEOUT:
+            if zygote.poll() is not None:
+                break
+            sock = _connect(socket_path)
+            if sock is not None:
+                return sock
+            time.sleep(0.05)
+
+    raise RuntimeError("The fork server for kernels couldn't be started")
+
+
+def _connect(socket_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def launch_kernel(argv, preload, parent_pid=None):
+    """
+    Ask a zygote for a kernel started with `argv` and wait until it exits.
+
+    Returns the exit code of the kernel.
+    """
+    sock = connect_to_zygote(preload, parent_pid=parent_pid)
+    request = {
+        'argv': argv,
+        'env': dict(os.environ),
+        'cwd': os.getcwd(),
+    }
+    send_message(
+        sock, json.dumps(request).encode('utf-8'),
+        fds=[sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()]
+    )
+
+    message = receive_message(sock)
+    if message is None:
+        raise RuntimeError("The fork server couldn't start a kernel")
+    pid = int(message[0])
+
+    def forward_signal(signum, frame):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    for signum in FORWARDED_SIGNALS:
+        signal.signal(signum, forward_signal)
+
+    message = receive_message(sock)
+    if message is None:
+        # The zygote died, so the kernel did too
+        return 1
+
+    return int(message[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Start Spyder kernels from a fork server.",
+    )
+    parser.add_argument(
+        '--preload', default='',
+        help="Comma separated list of modules preloaded by the fork server"
+    )
+    parser.add_argument(
+        '--parent-pid', type=int, default=None,
+        help="The fork server exits when this process is gone"
+    )
+    parser.add_argument('--zygote', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--socket', help=argparse.SUPPRESS)
+    args, kernel_argv = parser.parse_known_args()
+
+    preload = [name.strip() for name in args.preload.split(',')
+               if name.strip()]
+
+    if args.zygote:
+        run_zygote(args.socket, preload, parent_pid=args.parent_pid)
+        return
+
+    exit_code = launch_kernel(
+        kernel_argv, preload, parent_pid=args.parent_pid
+    )
+    sys.exit(exit_code if exit_code >= 0 else 128 - exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -20,6 +20,7 @@
 import traceback
 import tempfile
 import threading
+import tracemalloc
 import cloudpickle
 
 # Third-party imports
@@ -76,6 +77,9 @@ def __init__(self, *args, **kwargs):
 
         self.namespace_view_settings = {}
         self.faulthandler_handle = None
+        self._memory_cache = {}
+        self._allocations_snapshot = None
+        self._tracemalloc_started = False
         self._cwd_initialised = False
 
         # Add handlers to control to process messages while debugging
@@ -121,16 +125,24 @@ def frontend_call(self, blocking=False, broadcast=True,
             timeout=timeout,
             display_error=display_error)
 
-    def get_state(self):
+    def get_state(self, namespace=True):
         """"get current state to send to the frontend"""
         state = {}
         with WriteContext("get_state"):
             if self._cwd_initialised:
                 state["cwd"] = self.get_cwd()
-            state["namespace_view"] = self.get_namespace_view()
-            state["var_properties"] = self.get_var_properties()
+            if namespace:
+                state.update(self.get_namespace_state())
         return state
 
+    def get_namespace_state(self):
+        """Get namespace view and variable properties for the frontend"""
+        with WriteContext("get_namespace_state"):
+            return {
+                "namespace_view": self.get_namespace_view(),
+                "var_properties": self.get_var_properties(),
+            }
+
     def publish_state(self):
         """Publish the current kernel state"""
         if not self.frontend_comm.is_open():
@@ -308,7 +320,8 @@ def get_namespace_view(self, frame=None):
                 'size': 1,
                 'view': '1',
                 'python_type': 'int',
-                'numpy_type': 'Unknown'
+                'numpy_type': 'Unknown',
+                'memory': 28
             }
         }
 
@@ -321,12 +334,17 @@ def get_namespace_view(self, frame=None):
           `get_type_string`.
         * 'numpy_type' is its Numpy type (if any) computed with
           `get_numpy_type_string`.
+        * 'memory' is the memory it uses in bytes, computed with
+          `get_memory_size`. It's only present if the `show_memory` setting
+          is on.
         """
 
         settings = self.namespace_view_settings
         if settings:
             ns = self.shell._get_current_namespace(frame=frame)
-            view = make_remote_view(ns, settings, EXCLUDED_NAMES)
+            view = make_remote_view(
+                ns, settings, EXCLUDED_NAMES, memory_cache=self._memory_cache
+            )
             return view
         else:
             return None
@@ -362,6 +380,38 @@ def get_var_properties(self):
         else:
             return None
 
+    @comm_handler
+    def get_top_allocations(self, limit=10):
+        """
+        Get the lines of code that allocated most memory since the last cell
+        started running.
+
+        This is only available when tracing memory allocations (see
+        `set_trace_allocations`). Otherwise, return None.
+        """
+        if self._allocations_snapshot is None or not tracemalloc.is_tracing():
+            return None
+
+        snapshot = self._filter_allocations_snapshot(
+            tracemalloc.take_snapshot())
+        stats = snapshot.compare_to(self._allocations_snapshot, 'lineno')
+        stats = sorted(
+            [stat for stat in stats if stat.size_diff > 0],
+            key=lambda stat: stat.size_diff,
+            reverse=True
+        )
+
+        return [
+            {
+                'filename': stat.traceback[0].filename,
+                'lineno': stat.traceback[0].lineno,
+                'size': stat.size,
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff
+            }
+            for stat in stats[:limit]
+        ]
+
     @comm_handler
     def get_value(self, name, encoded=False):
         """Get the value of a variable"""
@@ -654,8 +704,38 @@ def set_configuration(self, conf):
                     self._load_wurlitzer()
             elif key == "autoreload_magic":
                 self._autoreload_magic(value)
+            elif key == "trace_allocations":
+                self.set_trace_allocations(value)
         return ret
 
+    def set_trace_allocations(self, trace):
+        """
+        Start or stop tracing memory allocations with tracemalloc.
+
+        While tracing, a snapshot of the allocated memory is taken before
+        running each cell, to compare it against later in
+        `get_top_allocations`.
+        """
+        callbacks = self.shell.events.callbacks['pre_run_cell']
+        if trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracemalloc_started = True
+            if self._snapshot_allocations not in callbacks:
+                self.shell.events.register(
+                    'pre_run_cell', self._snapshot_allocations)
+            self._snapshot_allocations()
+        else:
+            if self._snapshot_allocations in callbacks:
+                self.shell.events.unregister(
+                    'pre_run_cell', self._snapshot_allocations)
+            self._allocations_snapshot = None
+
+            # Tracing started by the user's code is left alone
+            if self._tracemalloc_started:
+                tracemalloc.stop()
+                self._tracemalloc_started = False
+
     def set_color_scheme(self, color_scheme):
         if color_scheme == "dark":
             # Needed to change the colors of tracebacks
@@ -897,6 +977,21 @@ def _eval(self, text):
             return None, False
 
     # --- For Matplotlib
+    def _snapshot_allocations(self, info=None):
+        """Take a snapshot of the allocated memory before running a cell."""
+        self._allocations_snapshot = self._filter_allocations_snapshot(
+            tracemalloc.take_snapshot())
+
+    def _filter_allocations_snapshot(self, snapshot):
+        """Remove the allocations done by tracemalloc and importlib."""
+        return snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(
+                False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ])
+
     def _set_mpl_backend(self, backend, pylab=False):
         """
         Set a backend for Matplotlib.
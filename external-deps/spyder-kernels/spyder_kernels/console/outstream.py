@@ -9,8 +9,12 @@
 """
 Custom Spyder Outstream class.
 """
+import atexit
+from collections import deque
 import os
 import sys
+import tempfile
+import time
 
 from ipykernel.iostream import OutStream
 
@@ -18,18 +22,36 @@
 class TTYOutStream(OutStream):
     """Subclass of OutStream that represents a TTY."""
 
+    # If output is written faster than this, it's not sent to the frontend
+    # until it slows down or stops. Meanwhile, it's saved to a file and
+    # only its last `tail_lines` lines are kept to be sent afterwards.
+    max_lines_per_second = 10000
+    tail_lines = 1000
+
     def __init__(self, session, pub_thread, name, pipe=None, echo=None, *,
                  watchfd=True):
         super().__init__(session, pub_thread, name, pipe,
                          echo=echo, watchfd=watchfd, isatty=True)
 
+        self._governor_last_flush = 0
+        self._governor_file = None
+        self._governor_path = None
+        self._governor_lines = 0
+        self._governor_tail = deque(maxlen=self.tail_lines)
+        self._governor_parent = None
+        self._governor_release_pending = False
+
+        # Files with held back output, which are removed at exit
+        self._governor_saved_paths = []
+
     def _flush(self):
         """This is where the actual send happens.
 
         _flush should generally be called in the IO thread,
         unless the thread has been destroyed (e.g. forked subprocess).
 
-        NOTE: Overrided method to be able to filter messages.
+        NOTE: Overrided method to be able to filter messages and to hold
+        back runaway output.
         See spyder-ide/spyder#22181
         """
         self._flush_pending = False
@@ -42,6 +64,7 @@ def _flush(self):
                 if self.echo is not sys.__stderr__:
                     print(f"Flush failed: {e}", file=sys.__stderr__)
 
+        has_data = False
         for parent, data in self._flush_buffers():
             # Messages that will not be printed to the console. This allows us
             # to deal with issues such as spyder-ide/spyder#22181
@@ -50,23 +73,147 @@ def _flush(self):
             if data and not any(
                 [message in data for message in filter_messages]
             ):
-                # FIXME: this disables Session's fork-safe check,
-                # since pub_thread is itself fork-safe.
-                # There should be a better way to do this.
-                self.session.pid = os.getpid()
-                content = {"name": self.name, "text": data}
-                msg = self.session.msg("stream", content, parent=parent)
-
-                # Each transform either returns a new
-                # message or None. If None is returned,
-                # the message has been 'used' and we return.
-                for hook in self._hooks:
-                    msg = hook(msg)
-                    if msg is None:
-                        return
-
-                self.session.send(
-                    self.pub_thread,
-                    msg,
-                    ident=self.topic,
-                )
+                has_data = True
+                if self._hold_back(parent, data):
+                    continue
+                if not self._send(parent, data):
+                    return
+
+        if not has_data:
+            # Output stopped, e.g. because execution finished
+            self._release_held_back()
+
+    def _send(self, parent, data):
+        """
+        Send data to the frontend.
+
+        Returns False if a hook consumed the message.
+        """
+        # FIXME: this disables Session's fork-safe check,
+        # since pub_thread is itself fork-safe.
+        # There should be a better way to do this.
+        self.session.pid = os.getpid()
+        content = {"name": self.name, "text": data}
+        msg = self.session.msg("stream", content, parent=parent)
+
+        # Each transform either returns a new
+        # message or None. If None is returned,
+        # the message has been 'used' and we return.
+        for hook in self._hooks:
+            msg = hook(msg)
+            if msg is None:
+                return False
+
+        self.session.send(
+            self.pub_thread,
+            msg,
+            ident=self.topic,
+        )
+        return True
+
+    def _hold_back(self, parent, data):
+        """
+        Save data to a file instead of sending it if output is too fast.
+
+        Returns True if data was held back.
+        """
+        now = time.monotonic()
+        elapsed = max(now - self._governor_last_flush, self.flush_interval)
+        self._governor_last_flush = now
+        lines = data.count("\n")
+        too_fast = lines / elapsed > self.max_lines_per_second
+
+        if self._governor_file is None:
+            # Don't hold back single prints that fit in the tail
+            if not too_fast or lines <= self.tail_lines:
+                return False
+            fd, self._governor_path = tempfile.mkstemp(
+                prefix="spyder-output-", suffix=".txt")
+            self._governor_file = os.fdopen(
+                fd, "w", encoding="utf-8", errors="replace")
+            if not self._governor_saved_paths:
+                atexit.register(self._remove_saved_output)
+            self._governor_saved_paths.append(self._governor_path)
+        elif not too_fast:
+            # Output slowed down
+            self._release_held_back()
+            return False
+
+        self._governor_file.write(data)
+        self._governor_lines += lines
+        self._governor_parent = parent
+
+        tail = data.splitlines(keepends=True)
+        if (
+            tail and self._governor_tail
+            and not self._governor_tail[-1].endswith("\n")
+        ):
+            self._governor_tail[-1] += tail.pop(0)
+        self._governor_tail.extend(tail)
+
+        self._schedule_release()
+        return True
+
+    def _schedule_release(self):
+        """
+        Check after a flush interval if held back output can be released.
+
+        This is necessary because no flush happens while nothing is written,
+        e.g. if a burst of output is followed by a long computation.
+        """
+        if self._governor_release_pending:
+            return
+        self._governor_release_pending = True
+
+        def _schedule_in_thread():
+            self._io_loop.call_later(self.flush_interval, self._check_release)
+
+        self.pub_thread.schedule(_schedule_in_thread)
+
+    def _check_release(self):
+        """Release held back output if nothing was written recently."""
+        self._governor_release_pending = False
+        if self._governor_file is None:
+            return
+
+        elapsed = time.monotonic() - self._governor_last_flush
+        if elapsed >= self.flush_interval:
+            # Output slowed down below the threshold or stopped
+            self._release_held_back()
+        else:
+            self._schedule_release()
+
+    def _release_held_back(self):
+        """Send a truncation notice and the tail of held back output."""
+        if self._governor_file is None:
+            return
+
+        self._governor_file.close()
+        omitted = max(self._governor_lines - len(self._governor_tail), 0)
+        notice = (
+            "\n[Output truncated: {} lines were not shown. The full output "
+            "was saved to {}]\n".format(omitted, self._governor_path)
+        )
+        text = notice + "".join(self._governor_tail)
+        parent = self._governor_parent
+
+        self._governor_file = None
+        self._governor_path = None
+        self._governor_lines = 0
+        self._governor_tail.clear()
+        self._governor_parent = None
+
+        self._send(parent, text)
+
+    def _remove_saved_output(self):
+        """Remove the files with held back output when the kernel exits."""
+        if self._governor_file is not None:
+            self._governor_file.close()
+            self._governor_file = None
+
+        for path in self._governor_saved_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._governor_saved_paths = []
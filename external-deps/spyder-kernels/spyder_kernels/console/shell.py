@@ -343,6 +343,10 @@ def request_pdb_stop(self):
             if pdb_session.interrupting:
                 # interrupt already requested, wait
                 return
+            if pdb_session.monitoring_breakpoints:
+                # Tracing needs to be restored from the main thread
+                self.raise_interrupt_signal()
+                return
             # trace_dispatch is active, stop at the next possible position
             pdb_session.interrupt()
         elif (self.spyderkernel_sigint_handler
@@ -376,7 +380,7 @@ def spyderkernel_sigint_handler(self, signum, frame):
             if pdb_session.interrupting:
                 # second call to interrupt, raise
                 raise KeyboardInterrupt
-            pdb_session.interrupt()
+            pdb_session.interrupt(frame)
             return
 
         if self._allow_kbdint:
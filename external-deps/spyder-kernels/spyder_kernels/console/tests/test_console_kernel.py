@@ -19,6 +19,7 @@
 import time
 from subprocess import Popen, PIPE
 import sys
+import tracemalloc
 import inspect
 import uuid
 from collections import namedtuple
@@ -315,6 +316,70 @@ def test_get_namespace_view_filter_on(kernel, filter_on):
     settings['exclude_capitalized'] = False
 
 
+def test_get_namespace_view_memory(kernel):
+    """
+    Test the memory used by variables in the namespace view.
+    """
+    asyncio.run(kernel.do_execute('a = list(range(1000))', True))
+
+    settings = kernel.namespace_view_settings
+    settings['show_memory'] = True
+    memory = kernel.get_namespace_view()['a']['memory']
+    assert memory > sys.getsizeof(list(range(1000)))
+
+    # Lists can't be weakly referenced, so they are not cached
+    assert 'a' not in kernel._memory_cache
+    asyncio.run(kernel.do_execute('a.append(1)', True))
+    assert kernel.get_namespace_view()['a']['memory'] > memory
+
+    # The memory is reused while the variable doesn't change
+    asyncio.run(kernel.do_execute(
+        'import numpy as np; b = np.zeros(1000)', True))
+    assert kernel.get_namespace_view()['b']['memory'] == 8000
+    assert kernel._memory_cache['b'][2] == 8000
+    kernel._memory_cache['b'] = kernel._memory_cache['b'][:2] + (0,)
+    assert kernel.get_namespace_view()['b']['memory'] == 0
+
+    asyncio.run(kernel.do_execute('b = np.zeros(2000)', True))
+    assert kernel.get_namespace_view()['b']['memory'] == 16000
+
+    # The cache doesn't keep removed variables alive
+    asyncio.run(kernel.do_execute('del b', True))
+    assert kernel._memory_cache['b'][0]() is None
+
+    # Restore settings for other tests
+    settings['show_memory'] = False
+    assert 'memory' not in kernel.get_namespace_view()['a']
+
+
+def test_get_top_allocations(kernel):
+    """
+    Test the top memory allocations of the kernel.
+    """
+    assert kernel.get_top_allocations() is None
+
+    kernel.set_trace_allocations(True)
+    try:
+        asyncio.run(kernel.do_execute('b = [0] * 100000', True))
+        allocations = kernel.get_top_allocations(limit=5)
+    finally:
+        kernel.set_trace_allocations(False)
+
+    assert 0 < len(allocations) <= 5
+    assert allocations[0]['size_diff'] >= 8 * 100000
+    assert kernel.get_top_allocations() is None
+    assert not tracemalloc.is_tracing()
+
+    # Tracing started by users is not stopped
+    tracemalloc.start()
+    try:
+        kernel.set_trace_allocations(True)
+        kernel.set_trace_allocations(False)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
 def test_get_var_properties(kernel):
     """
     Test the properties fo the variables in the namespace.
@@ -495,6 +560,79 @@ def test_output_from_c_libraries(kernel, capsys):
     assert captured.out == "Hello from C\n"
 
 
+def test_runaway_output_is_truncated():
+    """
+    Test that only the tail of runaway output is sent to the frontend.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        msg_id = client.execute("for i in range(300000): print(i)")
+
+        text = ""
+        while True:
+            msg = client.get_iopub_msg(timeout=TIMEOUT)
+            if msg["parent_header"].get("msg_id") != msg_id:
+                continue
+            if msg["msg_type"] == "stream":
+                text += msg["content"]["text"]
+            elif (
+                msg["msg_type"] == "status"
+                and msg["content"]["execution_state"] == "idle"
+            ):
+                break
+
+        assert "[Output truncated:" in text
+        assert text.endswith("299999\n")
+        assert text.count("\n") < 300000
+
+        # The full output was saved to a file
+        fname = text.split("The full output was saved to ")[1].split("]")[0]
+        with open(fname) as f:
+            assert f.read().endswith("299999\n")
+
+        # The file is removed when the kernel exits
+        client.shutdown()
+        t0 = time.time()
+        while osp.exists(fname):
+            assert time.time() - t0 < 10
+            time.sleep(0.1)
+
+
+def test_held_back_output_is_released_when_output_stops():
+    """
+    Test that the tail of runaway output is sent when output stops, even if
+    the cell is still running.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        msg_id = client.execute(
+            "import time\n"
+            "for i in range(300000): print(i)\n"
+            "time.sleep(10)"
+        )
+
+        text = ""
+        while "299999\n" not in text:
+            msg = client.get_iopub_msg(timeout=TIMEOUT)
+            if msg["parent_header"].get("msg_id") != msg_id:
+                continue
+            if msg["msg_type"] == "stream":
+                text += msg["content"]["text"]
+
+            # The tail must arrive before the cell finishes sleeping
+            assert not (
+                msg["msg_type"] == "status"
+                and msg["content"]["execution_state"] == "idle"
+            )
+
+        assert "[Output truncated:" in text
+        assert text.endswith("299999\n")
+
+
 @flaky(max_runs=3)
 def test_cwd_in_sys_path():
     """
@@ -649,6 +787,37 @@ def test_dask_multiprocessing(tmpdir):
         assert content['found']
 
 
+@flaky(max_runs=3)
+def test_profilefile(tmpdir):
+    """
+    Test that profilefile runs files in the kernel namespace.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        # Remove all variables
+        client.execute_interactive("%reset -f", timeout=TIMEOUT)
+
+        # Write code to a file
+        code = "result = sum(i ** 2 for i in range(1000))"
+        p = tmpdir.join("profile-test.py")
+        p.write(code)
+
+        # Profile it in the current namespace
+        client.execute_interactive(
+            "%profilefile {} --current-namespace".format(repr(str(p))),
+            timeout=TIMEOUT)
+
+        # Verify that `result` is defined in the current namespace
+        client.inspect('result')
+        msg = client.get_shell_msg(timeout=TIMEOUT)
+        while "found" not in msg['content']:
+            msg = client.get_shell_msg(timeout=TIMEOUT)
+        content = msg['content']
+        assert content['found']
+
+
 @flaky(max_runs=3)
 def test_runfile(tmpdir):
     """
@@ -1025,6 +1194,49 @@ def error_wrapper(*args, **kwargs):
     pdb_obj.curframe_locals = None
 
 
+def test_pdb_state_deltas(kernel):
+    """
+    Test that Pdb only sends the parts of its state that changed.
+    """
+    def get_frame():
+        return inspect.currentframe()
+
+    pdb_obj = SpyderPdb()
+    pdb_obj.curframe = get_frame()
+    pdb_obj.curframe_locals = pdb_obj.curframe.f_locals
+    pdb_obj.stack = [(pdb_obj.curframe, pdb_obj.curframe.f_lineno)]
+    pdb_obj.curindex = 0
+    pdb_obj.pdb_publish_stack = True
+    kernel.shell._namespace_stack = [pdb_obj]
+
+    state = pdb_obj.get_pdb_state()
+    assert 'step' in state
+    assert 'stack' in state
+    assert 'namespace_view' in state
+
+    # Only the step is sent if nothing else changed
+    pdb_obj._previous_step = None
+    pdb_obj._last_pdb_state_time = 0
+    state = pdb_obj.get_pdb_state()
+    assert 'step' in state
+    assert 'stack' not in state
+    assert 'namespace_view' not in state
+
+    # The namespace view is held back when stepping quickly
+    pdb_obj.curframe_locals['test_pdb_state'] = 0
+    state = pdb_obj.get_pdb_state()
+    assert 'namespace_view' not in state
+    assert pdb_obj._namespace_pending
+
+    pdb_obj._last_pdb_state_time = 0
+    state = pdb_obj.get_pdb_state()
+    assert 'test_pdb_state' in state['namespace_view']
+    assert not pdb_obj._namespace_pending
+
+    pdb_obj.curframe = None
+    pdb_obj.curframe_locals = None
+
+
 def test_functions_with_locals_in_pdb(kernel):
     """
     Test that functions with locals work in Pdb.
@@ -1269,6 +1481,181 @@ def test_debug_namespace(tmpdir):
                     break
 
 
+def test_breakpoint_after_loop(tmpdir):
+    """
+    Test that a breakpoint placed after a loop is reached.
+
+    On Python 3.12+ breakpoints are handled with sys.monitoring, so the loop
+    doesn't run under sys.settrace.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        # Write code to a file
+        d = tmpdir.join("pdb-breakpoint-test.py")
+        d.write(dedent(
+            """
+            import sys
+
+            def func(n):
+                total = 0
+                for i in range(n):
+                    total += i
+                return sys.gettrace()
+
+            tracer = func(200000)
+            print(tracer is None)
+            """
+        ))
+
+        # Set a breakpoint in the last line
+        client.execute_interactive(
+            "get_ipython().set_pdb_configuration("
+            "{{'breakpoints': {{{}: [(11, None)]}}}})".format(repr(str(d))),
+            timeout=TIMEOUT
+        )
+
+        # Debug file `d` until the breakpoint is reached
+        client.execute("%debugfile {}".format(repr(str(d))))
+        client.get_stdin_msg(timeout=TIMEOUT)
+
+        # Make sure we stopped at the breakpoint and the loop was only
+        # traced if sys.monitoring is not available
+        client.input('print("tracer is None:", tracer is None)')
+        expected = "tracer is None: {}".format(sys.version_info >= (3, 12))
+
+        t0 = time.time()
+        while True:
+            assert time.time() - t0 < 5
+            msg = client.get_iopub_msg(timeout=TIMEOUT)
+            if msg.get('msg_type') == 'stream':
+                text = msg["content"].get("text")
+                if "tracer is None:" in text:
+                    assert expected in text
+                    break
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="sys.monitoring is not available")
+def test_time_to_breakpoint(tmpdir):
+    """
+    Compare the time it takes to reach a breakpoint placed after a loop when
+    breakpoints are handled with sys.monitoring and with sys.settrace.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    # Write code to a file
+    d = tmpdir.join("pdb-time-test.py")
+    d.write(dedent(
+        """
+        import time
+
+        def func(n):
+            total = 0
+            for i in range(n):
+                total += i
+            return total
+
+        t_start = time.perf_counter()
+        func(1000000)
+        elapsed = time.perf_counter() - t_start
+        print(elapsed)
+        """
+    ))
+
+    times = {}
+    for monitoring in [True, False]:
+        with setup_kernel(cmd) as client:
+            # Handle breakpoints with sys.settrace
+            if not monitoring:
+                client.execute_interactive(
+                    "import spyder_kernels.customize.spyderpdb as spyderpdb;"
+                    "spyderpdb.MONITORING_AVAILABLE = False",
+                    timeout=TIMEOUT
+                )
+
+            # Set a breakpoint in the last line
+            client.execute_interactive(
+                "get_ipython().set_pdb_configuration("
+                "{{'breakpoints': {{{}: [(13, None)]}}}})".format(
+                    repr(str(d))),
+                timeout=TIMEOUT
+            )
+
+            # Debug file `d` until the breakpoint is reached
+            client.execute("%debugfile {}".format(repr(str(d))))
+            client.get_stdin_msg(timeout=TIMEOUT)
+            client.input('print("elapsed:", elapsed)')
+
+            t0 = time.time()
+            while True:
+                assert time.time() - t0 < 5
+                msg = client.get_iopub_msg(timeout=TIMEOUT)
+                if msg.get('msg_type') == 'stream':
+                    text = msg["content"].get("text")
+                    if "elapsed:" in text:
+                        times[monitoring] = float(text.split()[-1])
+                        break
+
+    print("Time to breakpoint with sys.monitoring: {:.3f} s".format(
+        times[True]))
+    print("Time to breakpoint with sys.settrace: {:.3f} s".format(
+        times[False]))
+    assert times[True] < times[False]
+
+
+def test_breakpoint_set_while_running(tmpdir):
+    """
+    Test that breakpoints set while the code runs after continuing are hit,
+    even in functions that already ran.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        # Write code to a file
+        d = tmpdir.join("pdb-new-breakpoint-test.py")
+        d.write(dedent(
+            """
+            def func(value):
+                return value
+
+            def never_called():
+                pass
+
+            func("first")
+            get_ipython().set_pdb_configuration(
+                {{'breakpoints': {{{fname}: [(6, None), (3, None)]}}}})
+            bb = func("hello")
+            """
+        ).format(fname=repr(str(d))))
+
+        # Set a breakpoint that is never hit, so that the debugger
+        # continues until the end unless the new one is hit
+        client.execute_interactive(
+            "get_ipython().set_pdb_configuration("
+            "{{'breakpoints': {{{}: [(6, None)]}}}})".format(repr(str(d))),
+            timeout=TIMEOUT
+        )
+
+        # Debug file `d` until the new breakpoint is reached
+        client.execute("%debugfile {}".format(repr(str(d))))
+        client.get_stdin_msg(timeout=TIMEOUT)
+
+        # Make sure we stopped in the second call of func
+        client.input('value')
+
+        t0 = time.time()
+        while True:
+            assert time.time() - t0 < 5
+            msg = client.get_iopub_msg(timeout=TIMEOUT)
+            if msg.get('msg_type') == 'stream':
+                if 'hello' in msg["content"].get("text"):
+                    break
+
+
 def test_interrupt():
     """
     Test that the kernel can be interrupted by calling a comm handler.
@@ -1389,6 +1776,32 @@ def test_django_settings(kernel):
     assert "'settings':" in nsview
 
 
+def test_exec_code_cache(kernel, tmpdir):
+    """
+    Test that the code of cells is only compiled the first time it's run.
+    """
+    code_runner = kernel.shell.magics_manager.registry['SpyderCodeRunner']
+    filename = str(tmpdir.join("cells.py"))
+    ns_globals = {}
+
+    for i in range(3):
+        out = code_runner._exec_code(
+            "x = 1\nx + 1", filename, ns_globals,
+            capture_last_expression=True, cache_code=True
+        )
+        assert ns_globals["x"] == 1
+        assert out == 2
+
+    assert len(code_runner._code_cache) == 1
+
+    # Changing the code compiles it again
+    code_runner._exec_code(
+        "x = 2", filename, ns_globals, cache_code=True
+    )
+    assert ns_globals["x"] == 2
+    assert len(code_runner._code_cache) == 2
+
+
 def test_hard_link_pdb(tmpdir):
     """
     Test that breakpoints on a file are recognised even when the path is
@@ -1410,6 +1823,56 @@ def test_hard_link_pdb(tmpdir):
     assert pdb_obj.canonic(str(d)) == pdb_obj.canonic(str(hard_link))
 
 
+@pytest.mark.skipif(
+    not sys.platform.startswith('linux'), reason="Only works on Linux")
+def test_forkserver(tmpdir):
+    """Test that kernels started by the fork server work as usual."""
+    connection_file = str(tmpdir.join('kernel.json'))
+    cmd = [sys.executable, '-m', 'spyder_kernels.console.forkserver',
+           '--preload', 'numpy', '--parent-pid', str(os.getpid()),
+           '-f', connection_file]
+
+    def start_kernel():
+        launcher = Popen(cmd, stdout=PIPE, stderr=PIPE)
+        tic = time.time()
+        while not os.path.exists(connection_file):
+            assert launcher.poll() is None
+            assert time.time() < tic + SETUP_TIMEOUT
+            time.sleep(0.1)
+
+        client = BlockingKernelClient(connection_file=connection_file)
+        while True:
+            try:
+                client.load_connection_file()
+                break
+            except ValueError:
+                # The file is not written yet
+                time.sleep(0.1)
+        client.start_channels()
+        client.wait_for_ready(timeout=SETUP_TIMEOUT)
+        return launcher, client
+
+    for __ in range(2):
+        launcher, client = start_kernel()
+        try:
+            # The kernel is forked from a process where numpy was imported
+            reply = client.execute_interactive(
+                "import os, sys; pid = os.getpid(); "
+                "preloaded = 'numpy' in sys.modules",
+                user_expressions={'pid': 'pid', 'preloaded': 'preloaded'},
+                timeout=TIMEOUT)
+            expressions = reply['content']['user_expressions']
+            assert expressions['pid']['data']['text/plain'] != str(launcher.pid)
+            assert expressions['preloaded']['data']['text/plain'] == 'True'
+        finally:
+            client.stop_channels()
+
+        # Signals are forwarded to the kernel and the launcher exits with it
+        launcher.terminate()
+        assert launcher.wait(timeout=TIMEOUT) != 0
+        os.remove(connection_file)
+
+
 @pytest.mark.skipif(not os.environ.get('CI'), reason="Only works on CIs")
 def test_get_pythonenv_info(kernel):
     """Test the output we get from this method."""
@@ -14,8 +14,11 @@
 import bdb
 import builtins
 from contextlib import contextmanager
+import cProfile
+import hashlib
 import io
 import logging
+import marshal
 import os
 import pdb
 import shlex
@@ -49,6 +52,14 @@
 # For logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of compiled cells kept to run them again
+CODE_CACHE_SIZE = 100
+
+
+def get_code_hash(code):
+    """Get the hash used to identify the contents of cells and files."""
+    return hashlib.sha1(code.encode('utf-8', 'surrogatepass')).hexdigest()
+
 
 def runfile_arguments(func):
     """Decorator to add runfile magic arguments to magic."""
@@ -148,6 +159,13 @@ def __init__(self, *args, **kwargs):
         self.umr = UserModuleReloader(
             namelist=os.environ.get("SPY_UMR_NAMELIST", None)
         )
+
+        # Compiled cells, by code hash, filename and compilation options
+        self._code_cache = {}
+
+        # Last contents of files with cells, by filename
+        self._file_code_cache = {}
+
         super().__init__(*args, **kwargs)
 
     @runfile_arguments
@@ -232,6 +250,74 @@ def debugcell(self, line, local_ns=None):
                 context_locals=local_ns,
             )
 
+    @runfile_arguments
+    @needs_local_scope
+    @line_magic
+    def profilefile(self, line, local_ns=None):
+        """
+        Profile a file.
+        """
+        args, local_ns = self._parse_runfile_argstring(
+            self.profilefile, line, local_ns)
+
+        with self._profile_exec(args.filename) as profile_exec:
+            self._exec_file(
+                filename=args.filename,
+                canonic_filename=args.canonic_filename,
+                args=args.args,
+                wdir=args.wdir,
+                current_namespace=args.current_namespace,
+                exec_fun=profile_exec,
+                post_mortem=args.post_mortem,
+                context_globals=args.namespace,
+                context_locals=local_ns,
+            )
+
+    @runcell_arguments
+    @needs_local_scope
+    @line_magic
+    def profilecell(self, line, local_ns=None):
+        """
+        Profile a code cell from an editor.
+        """
+        args = self._parse_runcell_argstring(self.profilecell, line)
+
+        with self._profile_exec(args.filename) as profile_exec:
+            return self._exec_cell(
+                cell_id=args.cell_id,
+                filename=args.filename,
+                canonic_filename=args.canonic_filename,
+                exec_fun=profile_exec,
+                post_mortem=args.post_mortem,
+                context_globals=self.shell.user_ns,
+                context_locals=local_ns,
+            )
+
+    @contextmanager
+    def _profile_exec(self, filename):
+        """
+        Get an exec function to profile code with cProfile.
+
+        The results are sent to the frontend to show them in the Profiler
+        once the code finishes running.
+        """
+        profiler = cProfile.Profile()
+
+        def profile_exec(code, glob=None, loc=None):
+            profiler.runctx(code, glob, loc)
+
+        try:
+            yield profile_exec
+        finally:
+            profiler.create_stats()
+            try:
+                # This is the format cProfile uses to save stats to a file
+                frontend_request(blocking=False).show_profile_data(
+                    marshal.dumps(profiler.stats), filename
+                )
+            except Exception:
+                logger.debug("Could not send profile data", exc_info=True)
+
     @contextmanager
     def _debugger_exec(self, filename, continue_if_has_breakpoints):
         """Get an exec function to use for debugging."""
@@ -359,7 +445,7 @@ def _exec_cell(
         """
         try:
             # Get code from spyder
-            cell_code = frontend_request(blocking=True).run_cell(cell_id, filename)
+            cell_code, file_hash = self._get_cell_code(cell_id, filename)
         except Exception:
             print(
                 "This command failed to be executed because an error occurred "
@@ -376,7 +462,13 @@ def _exec_cell(
         # Trigger `post_execute` to exit the additional pre-execution.
         # See Spyder PR #7310.
         self.shell.events.trigger("post_execute")
-        file_code = self._get_file_code(filename, save_all=False)
+
+        # The editor identifies cells by their remote filename
+        remote_filename = filename
+
+        # The file code fills linecache with the editor contents. It's only
+        # sent again if the file changed.
+        file_code = self._get_cell_file_code(remote_filename, file_hash)
 
         # Here the remote filename has been used. It must now be valid locally.
         filename = canonic_filename
@@ -389,15 +481,79 @@ def _exec_cell(
             context_locals=context_locals,
             context_globals=context_globals
         ) as (ns_globals, ns_locals):
-            return self._exec_code(
-                cell_code,
-                filename,
-                ns_globals,
-                ns_locals,
-                post_mortem=post_mortem,
-                exec_fun=exec_fun,
-                capture_last_expression=True,
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            try:
+                return self._exec_code(
+                    cell_code,
+                    filename,
+                    ns_globals,
+                    ns_locals,
+                    post_mortem=post_mortem,
+                    exec_fun=exec_fun,
+                    capture_last_expression=True,
+                    cache_code=True,
+                )
+            finally:
+                # Timings are meaningless when debugging or profiling
+                if exec_fun is None:
+                    self._send_cell_timing(
+                        cell_id,
+                        remote_filename,
+                        time.perf_counter() - wall_start,
+                        time.process_time() - cpu_start,
+                    )
+
+    def _get_cell_code(self, cell_id, filename):
+        """
+        Get the code of a cell and the hash of its file from Spyder's editor.
+
+        The hash is None if the editor can't provide it.
+        """
+        try:
+            cell = frontend_request(blocking=True).get_cell_code(
+                cell_id, filename
             )
+        except Exception as error:
+            # Errors raised by the frontend are rebuilt here with a new type
+            # that only keeps their name, so they can't be caught by type.
+            if type(error).__name__ != "CommError":
+                raise
+
+            # Older versions of Spyder can only send the cell code
+            return (
+                frontend_request(blocking=True).run_cell(cell_id, filename),
+                None,
+            )
+
+        return cell["code"], cell["file_hash"]
+
+    def _get_cell_file_code(self, filename, file_hash):
+        """
+        Get the code of a file with cells, reusing the last one received if
+        its hash didn't change.
+        """
+        cached = self._file_code_cache.get(filename)
+        if file_hash is not None and cached is not None:
+            if cached[0] == file_hash:
+                return cached[1]
+
+        file_code = self._get_file_code(filename, save_all=False)
+        if isinstance(file_code, str):
+            self._file_code_cache[filename] = (
+                get_code_hash(file_code), file_code
+            )
+
+        return file_code
+
+    def _send_cell_timing(self, cell_id, filename, wall_time, cpu_time):
+        """Send the time a cell took to run to the editor."""
+        try:
+            frontend_request(blocking=False).cell_timing(
+                cell_id, filename, wall_time, cpu_time
+            )
+        except Exception:
+            logger.debug("Could not send cell timing", exc_info=True)
 
     def _get_current_file_name(self):
         """Get the current editor file name."""
@@ -443,13 +599,48 @@ def _exec_code(
         exec_fun=None,
         capture_last_expression=False,
         global_warning=False,
+        cache_code=False,
     ):
-        """Execute code and display any exception."""
+        """
+        Execute code and display any exception.
+
+        If `cache_code` is True, the compiled code is reused the next time
+        the same code is run, unless it's run with locals.
+        """
         if exec_fun is None:
             exec_fun = exec
 
+        if code.rstrip()[-1:] == ";":
+            # Supress output with ;
+            capture_last_expression = False
+
         is_ipython = os.path.splitext(filename)[1] == ".ipy"
+        cache_key = None
+        if cache_code and (ns_locals is None or ns_locals is ns_globals):
+            cache_key = (
+                get_code_hash(code),
+                filename,
+                is_ipython,
+                capture_last_expression,
+            )
+
         try:
+            cached = None
+            if cache_key is not None:
+                cached = self._code_cache.pop(cache_key, None)
+            if cached is not None:
+                # Keep the most recently used code at the end
+                self._code_cache[cache_key] = cached
+                compiled_code, capture_last_expression = cached
+                if capture_last_expression:
+                    ns_globals["__spyder_builtins__"] = builtins
+                exec_fun(compiled_code, ns_globals, None)
+                if capture_last_expression:
+                    out = ns_globals.pop("_spyder_out", None)
+                    if out is not None:
+                        return out
+                return
+
             if not is_ipython:
                 # TODO: Remove the try-except and let the SyntaxError raise
                 # because there should't be IPython code in a Python file.
@@ -492,18 +683,23 @@ def _exec_code(
                     )
                     self.show_global_msg = False
 
-            if code.rstrip()[-1:] == ";":
-                # Supress output with ;
-                capture_last_expression = False
-
             if capture_last_expression:
                 ast_code, capture_last_expression = capture_last_Expr(
                     ast_code, "_spyder_out", ns_globals
                 )
 
-            exec_encapsulate_locals(
-                ast_code, ns_globals, ns_locals, exec_fun, filename
-            )
+            if cache_key is not None:
+                compiled_code = compile(ast_code, filename, "exec")
+                self._code_cache[cache_key] = (
+                    compiled_code, capture_last_expression
+                )
+                if len(self._code_cache) > CODE_CACHE_SIZE:
+                    self._code_cache.pop(next(iter(self._code_cache)))
+                exec_fun(compiled_code, ns_globals, None)
+            else:
+                exec_encapsulate_locals(
+                    ast_code, ns_globals, ns_locals, exec_fun, filename
+                )
 
             if capture_last_expression:
                 out = ns_globals.pop("_spyder_out", None)
@@ -588,7 +784,7 @@ def _parse_argstring(self, magic_func, argstring):
         return args
     
     def _parse_runfile_argstring(self, magic_func, argstring, local_ns):
-        """Parse an args string for runfile and debugfile."""
+        """Parse an args string for runfile, debugfile and profilefile."""
         args = self._parse_argstring(magic_func, argstring)
         if args.namespace is None:
             args.namespace = self.shell.user_ns
@@ -606,7 +802,7 @@ def _parse_runfile_argstring(self, magic_func, argstring, local_ns):
         return args, local_ns
 
     def _parse_runcell_argstring(self, magic_func, argstring):
-        """Parse an args string for runcell and debugcell."""
+        """Parse an args string for runcell, debugcell and profilecell."""
         args = self._parse_argstring(magic_func, argstring)
         args.cell_id = args.name
         if args.cell_id is None:
@@ -84,21 +84,27 @@ def __enter__(self):
         # Save current namespace for access by variable explorer
         self.shell.add_namespace_manager(self)
 
-        if (self._file_code is not None
-                and isinstance(self._file_code, bytes)):
+        self.update_linecache(self._file_code)
+        return self.ns_globals, self.ns_locals
+
+    def update_linecache(self, file_code):
+        """
+        Make linecache return the lines of file_code for this file, which
+        can be different from the ones saved on disk.
+        """
+        if file_code is not None and isinstance(file_code, bytes):
             try:
-                self._file_code = self._file_code.decode()
+                file_code = file_code.decode()
             except UnicodeDecodeError:
                 # Setting the cache is not supported for non utf-8 files
-                self._file_code = None
-        if self._file_code is not None:
+                file_code = None
+        if file_code is not None:
             # '\n' is used instead of the native line endings. (see linecache)
             # mtime is set to None to avoid a cache update.
             linecache.cache[self.filename] = (
-                len(self._file_code), None,
-                [line + '\n' for line in self._file_code.splitlines()],
+                len(file_code), None,
+                [line + '\n' for line in file_code.splitlines()],
                 self.filename)
-        return self.ns_globals, self.ns_locals
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
@@ -16,6 +16,7 @@
 import sys
 import traceback
 import threading
+import time
 from collections import namedtuple
 from functools import lru_cache
 
@@ -33,6 +34,9 @@
 
 logger = logging.getLogger(__name__)
 
+# Breakpoints can be handled with sys.monitoring (PEP 669) on Python 3.12+
+MONITORING_AVAILABLE = hasattr(sys, "monitoring")
+
 
 class DebugWrapper:
     """
@@ -72,6 +76,11 @@ class SpyderPdb(ipyPdb):
      - Add completion to non-command code.
     """
 
+    # Minimum time between debugger states (in seconds) to send the
+    # namespace view right away. Below that, the user is stepping quickly
+    # and the view is sent once the debugger is idle.
+    NAMESPACE_DEBOUNCE = 0.25
+
     def __init__(self, completekey='tab', stdin=None, stdout=None,
                  skip=None, nosigint=False):
         """Init Pdb."""
@@ -123,6 +132,17 @@ def __init__(self, completekey='tab', stdin=None, stdout=None,
         self._canonic_inode_to_filename = {}
         self._canonic_filename_to_inode = {}
 
+        # True when breakpoints are handled by sys.monitoring instead of
+        # sys.settrace while continuing
+        self.monitoring_breakpoints = False
+        self._monitored_code = set()
+
+        # Last namespace and stack sent to the frontend, to avoid sending
+        # them again if they didn't change
+        self._reset_published_state()
+        self._last_pdb_state_time = 0
+        self._namespace_pending = False
+
     # --- Methods overriden for code execution
     def print_exclamation_warning(self):
         """Print pdb warning for exclamation mark."""
@@ -242,10 +262,14 @@ def default(self, line):
                 traceback.format_exception_only(*exc_info)[-1].strip())
 
     # --- Methods overriden for signal handling
-    def interrupt(self):
+    def interrupt(self, frame=None):
         """Stop debugger on next instruction."""
         self.interrupting = True
         self.message("\nProgram interrupted. (Use 'cont' to resume).")
+        if frame is not None:
+            # Go back to tracing if breakpoints were handled by
+            # sys.monitoring
+            self._stop_monitoring(frame)
         self.set_step()
 
     def set_trace(self, frame=None):
@@ -255,6 +279,7 @@ def set_trace(self, frame=None):
 
     def set_quit(self):
         """Register that debugger is not tracing."""
+        self._stop_monitoring()
         self.shell.remove_pdb_session(self)
         super(SpyderPdb, self).set_quit()
 
@@ -547,9 +572,32 @@ def set_continue(self):
 
         Reimplemented to avoid stepping out of debugging if there are no
         breakpoints. We could add more later.
+
+        If there are breakpoints and sys.monitoring is available, tracing is
+        stopped and breakpoints are handled by it instead.
         """
         # Don't stop except at breakpoints or when finished
         self._set_stopinfo(self.botframe, None, -1)
+        if self.breaks and self._start_monitoring():
+            sys.settrace(None)
+            frame = sys._getframe().f_back
+            while frame and frame is not self.botframe:
+                del frame.f_trace
+                frame = frame.f_back
+
+    def set_break(self, filename, lineno, temporary=False, cond=None,
+                  funcname=None):
+        """
+        Set a new breakpoint.
+
+        Reimplemented so that breakpoints set while sys.monitoring handles
+        them are also hit.
+        """
+        error = super(SpyderPdb, self).set_break(
+            filename, lineno, temporary=temporary, cond=cond,
+            funcname=funcname)
+        self._update_monitoring()
+        return error
 
     def do_debug(self, arg):
         """
@@ -596,6 +644,7 @@ def recursive_debugger(self):
             # recursive debugger might change the position, but the parent
             # debugger (self) is not aware of this.
             self._previous_step = None
+            self._reset_published_state()
 
     def user_return(self, frame, return_value):
         """This function is called when a return trap is set here."""
@@ -665,6 +714,7 @@ def canonic(self, filename):
 
     def do_exitdb(self, arg):
         """Exit the debugger"""
+        self._stop_monitoring()
         self._set_stopinfo(self.botframe, None, -1)
         sys.settrace(None)
         frame = sys._getframe().f_back
@@ -725,6 +775,13 @@ def cmd_input(self, prompt=''):
         # Get input by running eventloop
         if is_main_thread and kernel.eventloop:
             while self._cmd_input_line is None:
+                # Send the namespace view once no command arrived during the
+                # debounce interval
+                if (
+                    time.monotonic() - self._last_pdb_state_time
+                    >= self.NAMESPACE_DEBOUNCE
+                ):
+                    self._publish_pending_namespace()
                 eventloop = kernel.eventloop
                 # Check if the current backend is Tk on Windows
                 # to let GUI update.
@@ -738,6 +795,12 @@ def cmd_input(self, prompt=''):
                     break
 
         # Get input by blocking
+        if self._cmd_input_line is None and self._namespace_pending:
+            # Send the namespace view if no input arrives in the meantime
+            kernel.frontend_comm.wait_until(
+                lambda: self._cmd_input_line is not None,
+                timeout=self.NAMESPACE_DEBOUNCE)
+            self._publish_pending_namespace()
         if self._cmd_input_line is None:
             kernel.frontend_comm.wait_until(
                 lambda: self._cmd_input_line is not None)
@@ -796,14 +859,27 @@ def get_pdb_state(self):
         """
         Send debugger state (frame position) to the frontend.
 
-        The state is only sent if it has changed since the last update.
+        The state is only sent if it has changed since the last update. The
+        same applies to the namespace view and the stack, which are also
+        left out if the user is stepping quickly. In that case, the
+        namespace view is sent once the debugger is idle.
         """
-        state = self.shell.kernel.get_state()
+        kernel = self.shell.kernel
 
         frame = self.curframe
         if frame is None:
             self._previous_step = None
-            return state
+            return kernel.get_state()
+
+        state = kernel.get_state(namespace=False)
+
+        now = time.monotonic()
+        if now - self._last_pdb_state_time < self.NAMESPACE_DEBOUNCE:
+            self._namespace_pending = True
+        else:
+            self._namespace_pending = False
+            state.update(self._get_namespace_state())
+        self._last_pdb_state_time = now
 
         if self._request_where:
             self._request_where = False
@@ -830,22 +906,76 @@ def get_pdb_state(self):
 
         if self.pdb_publish_stack:
             # Publish Pdb stack so we can update the Debugger plugin on Spyder
-            pdb_stack = stacksummary_to_json(
-                traceback.StackSummary.extract(self.stack)
-            )
-            pdb_index = self.curindex
-            skip_hidden = getattr(self, 'skip_hidden', False)
+            stack_state = self._get_stack_state()
+            if stack_state != self._previous_stack_state:
+                self._previous_stack_state = stack_state
+                state['stack'] = stack_state
 
-            if skip_hidden:
-                # Filter out the hidden frames
-                hidden = self.hidden_frames(self.stack)
-                pdb_stack = [f for f, h in zip(pdb_stack, hidden) if not h]
-                # Adjust the index
-                pdb_index -= sum([bool(i) for i in hidden[:pdb_index]])
+        return state
 
-            state['stack'] = (pdb_stack, pdb_index)
+    def _get_namespace_state(self):
+        """
+        Get the namespace view and variable properties if they changed
+        since they were last sent to the frontend.
+        """
+        namespace_state = self.shell.kernel.get_namespace_state()
+        if namespace_state == self._previous_namespace_state:
+            return {}
+        self._previous_namespace_state = namespace_state
+        return namespace_state
+
+    def _publish_pending_namespace(self):
+        """Send the namespace view if it was held back while stepping."""
+        if not self._namespace_pending:
+            return
+        self._namespace_pending = False
 
-        return state
+        namespace_state = self._get_namespace_state()
+        if namespace_state:
+            try:
+                self.shell.kernel.frontend_call(
+                    blocking=False).update_state(namespace_state)
+            except Exception:
+                pass
+
+    def _get_stack_state(self):
+        """
+        Get the Pdb stack and index to publish.
+
+        Only frames that changed since the last call are serialized again.
+        """
+        unchanged = 0
+        for (previous_frame, previous_lineno), (frame, lineno) in zip(
+                self._previous_stack, self.stack):
+            if previous_frame is not frame or previous_lineno != lineno:
+                break
+            unchanged += 1
+
+        pdb_stack = self._previous_stack_json[:unchanged]
+        pdb_stack += stacksummary_to_json(
+            traceback.StackSummary.extract(self.stack[unchanged:])
+        )
+        self._previous_stack = list(self.stack)
+        self._previous_stack_json = pdb_stack
+
+        pdb_index = self.curindex
+        skip_hidden = getattr(self, 'skip_hidden', False)
+
+        if skip_hidden:
+            # Filter out the hidden frames
+            hidden = self.hidden_frames(self.stack)
+            pdb_stack = [f for f, h in zip(pdb_stack, hidden) if not h]
+            # Adjust the index
+            pdb_index -= sum([bool(i) for i in hidden[:pdb_index]])
+
+        return (pdb_stack, pdb_index)
+
+    def _reset_published_state(self):
+        """Forget the namespace and stack sent to the frontend."""
+        self._previous_namespace_state = None
+        self._previous_stack = []
+        self._previous_stack_json = []
+        self._previous_stack_state = None
 
     def run(self, cmd, globals=None, locals=None):
         """Debug a statement executed via the exec() function.
@@ -853,7 +983,11 @@ def run(self, cmd, globals=None, locals=None):
         globals defaults to __main__.dict; locals defaults to globals.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).run(cmd, globals, locals)
+            try:
+                super(SpyderPdb, self).run(cmd, globals, locals)
+            finally:
+                self._stop_monitoring()
+                self._reset_published_state()
 
     def runeval(self, expr, globals=None, locals=None):
         """Debug an expression executed via the eval() function.
@@ -861,7 +995,11 @@ def runeval(self, expr, globals=None, locals=None):
         globals defaults to __main__.dict; locals defaults to globals.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).runeval(expr, globals, locals)
+            try:
+                super(SpyderPdb, self).runeval(expr, globals, locals)
+            finally:
+                self._stop_monitoring()
+                self._reset_published_state()
 
     def runcall(self, *args, **kwds):
         """Debug a single function call.
@@ -869,10 +1007,143 @@ def runcall(self, *args, **kwds):
         Return the result of the function call.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).runcall(*args, **kwds)
+            try:
+                super(SpyderPdb, self).runcall(*args, **kwds)
+            finally:
+                self._stop_monitoring()
+                self._reset_published_state()
 
     def set_remote_filename(self, filename):
         """Set remote filename to signal Spyder on mainpyfile."""
         self.remote_filename = filename
         self.mainpyfile = self.canonic(filename)
         self._wait_for_mainpyfile = True
+
+    # --- Methods defined by us to handle breakpoints with sys.monitoring
+    def _start_monitoring(self):
+        """
+        Handle breakpoints with sys.monitoring instead of sys.settrace.
+
+        Only code objects that contain breakpoints generate line events, so
+        the rest of the code runs at full speed until a breakpoint is hit.
+
+        Returns
+        -------
+        bool
+            True if breakpoints are handled by sys.monitoring.
+        """
+        if not MONITORING_AVAILABLE or self.monitoring_breakpoints:
+            return self.monitoring_breakpoints
+
+        monitoring = sys.monitoring
+        tool_id = monitoring.DEBUGGER_ID
+        try:
+            monitoring.use_tool_id(tool_id, "spyder-kernels")
+        except ValueError:
+            # Another debugger is already using sys.monitoring
+            return False
+
+        self.monitoring_breakpoints = True
+        monitoring.register_callback(
+            tool_id, monitoring.events.PY_START, self._monitoring_py_start)
+        monitoring.register_callback(
+            tool_id, monitoring.events.LINE, self._monitoring_line)
+
+        # Events disabled while handling previous breakpoints need to be
+        # seen again
+        monitoring.restart_events()
+        monitoring.set_events(tool_id, monitoring.events.PY_START)
+
+        # Code that is already running doesn't generate PY_START events
+        frame = sys._getframe().f_back
+        while frame and frame is not self.botframe:
+            self._monitor_code(frame.f_code)
+            frame = frame.f_back
+
+        return True
+
+    def _stop_monitoring(self, frame=None):
+        """
+        Stop handling breakpoints with sys.monitoring.
+
+        If `frame` is given, it and its parents are traced again with
+        sys.settrace, like in Bdb.set_trace.
+        """
+        if not self.monitoring_breakpoints:
+            return
+
+        monitoring = sys.monitoring
+        tool_id = monitoring.DEBUGGER_ID
+        monitoring.set_events(tool_id, monitoring.events.NO_EVENTS)
+        for code in self._monitored_code:
+            monitoring.set_local_events(
+                tool_id, code, monitoring.events.NO_EVENTS)
+        self._monitored_code = set()
+        monitoring.register_callback(
+            tool_id, monitoring.events.PY_START, None)
+        monitoring.register_callback(tool_id, monitoring.events.LINE, None)
+        monitoring.free_tool_id(tool_id)
+        self.monitoring_breakpoints = False
+
+        if frame is not None:
+            while frame:
+                frame.f_trace = self.trace_dispatch
+                if frame is self.botframe:
+                    break
+                frame = frame.f_back
+            sys.settrace(self.trace_dispatch)
+
+    def _update_monitoring(self):
+        """Take new breakpoints into account while using sys.monitoring."""
+        if not self.monitoring_breakpoints:
+            return
+
+        # Code and lines that had no breakpoints were disabled, so their
+        # events need to be seen again
+        sys.monitoring.restart_events()
+
+        # Code that is already running doesn't generate PY_START events
+        for frame in sys._current_frames().values():
+            while frame:
+                self._monitor_code(frame.f_code)
+                frame = frame.f_back
+
+    def _monitor_code(self, code):
+        """Generate line events for code if it contains breakpoints."""
+        if code in self._monitored_code:
+            return
+
+        lines = self.breaks.get(self.canonic(code.co_filename))
+        if not lines:
+            return
+
+        if any(line in lines for __, __, line in code.co_lines()):
+            sys.monitoring.set_local_events(
+                sys.monitoring.DEBUGGER_ID, code, sys.monitoring.events.LINE)
+            self._monitored_code.add(code)
+
+    def _monitoring_py_start(self, code, instruction_offset):
+        """Callback for sys.monitoring PY_START events."""
+        self._monitor_code(code)
+
+        # Each code object only needs to be checked once, until breakpoints
+        # change
+        return sys.monitoring.DISABLE
+
+    def _monitoring_line(self, code, line_number):
+        """Callback for sys.monitoring LINE events."""
+        lines = self.breaks.get(self.canonic(code.co_filename))
+        if not lines or line_number not in lines:
+            # Not a breakpoint, never check this line again
+            return sys.monitoring.DISABLE
+
+        frame = sys._getframe(1)
+        if not self.break_here(frame):
+            # E.g. the breakpoint condition is false
+            return
+
+        # Go back to tracing so that the user can step from here
+        self._stop_monitoring(frame)
+        self.user_line(frame)
+        if self.quitting:
+            raise bdb.BdbQuit
@@ -11,6 +11,7 @@
 # Stdlib imports
 import os
 import sys
+import time
 
 # Third party imports
 import pytest
@@ -96,3 +97,39 @@ def test_umr_reload_modules(user_module):
     # Reload user modules
     import foo3
     assert umr.is_module_reloadable(foo3, 'foo3')
+
+
+def test_umr_smart(user_module, tmpdir):
+    """
+    Test that the UMR only reloads modules that changed and the ones that
+    import them in smart mode.
+    """
+    # Create user module with another module that imports it
+    user_module('foo5')
+    package = tmpdir.join('foo5')
+    package.join('baz.py').write('from foo5.bar import square')
+    package.join('qux.py').write('x = 1')
+
+    # Make sure the modules are older than the UMR
+    past = time.time() - 100
+    for modfile in package.listdir():
+        os.utime(str(modfile), (past, past))
+
+    # Create UMR
+    umr = UserModuleReloader(smart=True)
+
+    import foo5.baz
+    import foo5.qux
+
+    # Nothing changed
+    assert umr.run() == []
+    assert 'foo5.bar' in sys.modules
+
+    # Change a module
+    package.join('bar.py').write('def square(x):\n    return x * x')
+    os.utime(str(package.join('bar.py')), (past + 10, past + 10))
+
+    # It's reloaded along with the module that imports it
+    assert umr.run() == ['foo5.bar', 'foo5.baz']
+    assert 'foo5.bar' not in sys.modules
+    assert 'foo5.qux' in sys.modules
@@ -5,8 +5,11 @@
 
 """User module reloader."""
 
+import ast
+from importlib.machinery import SourceFileLoader
 import os
 import sys
+import time
 
 from spyder_kernels.customize.utils import path_is_library
 
@@ -18,9 +21,12 @@ class UserModuleReloader:
 
     pathlist [list]: blacklist in terms of module path
     namelist [list]: blacklist in terms of module name
+
+    In smart mode, only user modules whose source changed since they were
+    imported are deleted, along with the modules that import them.
     """
 
-    def __init__(self, namelist=None, pathlist=None):
+    def __init__(self, namelist=None, pathlist=None, smart=None):
         if namelist is None:
             namelist = []
         else:
@@ -57,15 +63,41 @@ def __init__(self, namelist=None, pathlist=None):
         verbose = os.environ.get("SPY_UMR_VERBOSE", "")
         self.verbose = verbose.lower() == "true"
 
+        # Check if the UMR should only reload modules that changed
+        if smart is None:
+            smart = os.environ.get("SPY_UMR_SMART", "").lower() == "true"
+        self.smart = smart
+
+        # Reloadable state of modules, by name and path
+        self._reloadable = {}
+
+        # Path, modification time and imported modules of the user modules
+        # seen by the last run, by name
+        self._records = {}
+
+        # Names of the modules imported by user files, by path and
+        # modification time
+        self._imports = {}
+
+        # Time of the last run. Modules that were first seen after it and
+        # didn't change since then were imported with their current source.
+        self._last_run = time.time()
+
+        self.import_timer = None
+        if self.enabled and self.smart:
+            self.import_timer = ImportTimer(self)
+            sys.meta_path.insert(0, self.import_timer)
+
     def is_module_reloadable(self, module, modname):
         """Decide if a module is reloadable or not."""
-        if (
-            path_is_library(getattr(module, '__file__', None), self.pathlist)
-            or self.is_module_in_namelist(modname)
-        ):
-            return False
-        else:
-            return True
+        path = getattr(module, '__file__', None)
+        key = (modname, path)
+        if key not in self._reloadable:
+            self._reloadable[key] = not (
+                path_is_library(path, self.pathlist)
+                or self.is_module_in_namelist(modname)
+            )
+        return self._reloadable[key]
 
     def is_module_in_namelist(self, modname):
         """Decide if a module can be reloaded or not according to its name."""
@@ -79,6 +111,9 @@ def run(self):
         modules installed in subdirectories of Python interpreter's binary
         Do not del C modules
         """
+        if self.smart:
+            return self.run_smart()
+
         modnames_to_reload = []
         for modname, module in list(sys.modules.items()):
             if modname not in self.previous_modules:
@@ -96,3 +131,196 @@ def run(self):
                   % ("Reloaded modules", ": "+", ".join(modnames)))
 
         return modnames_to_reload
+
+    def run_smart(self):
+        """
+        Delete the user modules whose source changed since they were
+        imported, along with the modules that import them (directly or not).
+        """
+        previous_modules = set(self.previous_modules)
+        user_modules = {
+            modname: module
+            for modname, module in list(sys.modules.items())
+            if modname not in previous_modules
+            and self.is_module_reloadable(module, modname)
+        }
+
+        # Find the modules that changed
+        changed = set()
+        records = {}
+        for modname, module in user_modules.items():
+            path = getattr(module, '__file__', None)
+            try:
+                mtime = os.stat(path).st_mtime
+            except (OSError, TypeError):
+                changed.add(modname)
+                continue
+
+            record = self._records.get(modname)
+            if record is None:
+                # Modules imported after the last run started could have
+                # been imported before their last change.
+                if mtime > self._last_run:
+                    changed.add(modname)
+            elif record[0] != path or record[1] != mtime:
+                changed.add(modname)
+
+            records[modname] = (
+                path, mtime, self._get_imports(module, path, mtime)
+            )
+
+        # Add the modules that import the ones that changed
+        importers = {}
+        for modname, (__, __, imports) in records.items():
+            for imported in imports:
+                importers.setdefault(imported, set()).add(modname)
+
+        to_reload = set()
+        pending = list(changed)
+        while pending:
+            modname = pending.pop()
+            if modname in to_reload:
+                continue
+            to_reload.add(modname)
+            pending.extend(importers.get(modname, []))
+
+        modnames_to_reload = sorted(
+            modname for modname in to_reload if modname in user_modules
+        )
+        for modname in modnames_to_reload:
+            del sys.modules[modname]
+            records.pop(modname, None)
+
+        self._records = records
+        self._last_run = time.time()
+
+        # Report reloaded modules and the time saved by not reloading the
+        # other ones.
+        if self.verbose:
+            kept = [modname for modname in user_modules
+                    if modname not in to_reload]
+            if modnames_to_reload:
+                print("\x1b[4;33m%s\x1b[24m%s\x1b[0m"
+                      % ("Reloaded modules",
+                         ": " + ", ".join(modnames_to_reload)))
+            if kept and self.import_timer is not None:
+                saved = sum(
+                    self.import_timer.import_times.get(modname, 0)
+                    for modname in kept
+                )
+                print("\x1b[4;33m%s\x1b[24m%s\x1b[0m"
+                      % ("Kept modules",
+                         ": %d (%.2f s saved)" % (len(kept), saved)))
+
+        return modnames_to_reload
+
+    def _get_imports(self, module, path, mtime):
+        """Get the names of the modules imported by a module's source."""
+        key = (path, mtime)
+        if key in self._imports:
+            return self._imports[key]
+
+        imports = set()
+        package = getattr(module, '__package__', None) or ''
+        try:
+            with open(path, 'rb') as f:
+                tree = ast.parse(f.read(), path)
+        except Exception:
+            tree = None
+
+        for node in ast.walk(tree) if tree is not None else []:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.add(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    parts = package.split('.')
+                    if node.level > 1:
+                        parts = parts[:-(node.level - 1)]
+                    base = '.'.join(parts)
+                    if node.module:
+                        base = base + '.' + node.module if base else (
+                            node.module)
+                else:
+                    base = node.module
+                if not base:
+                    continue
+                imports.add(base)
+
+                # Names imported from packages can be submodules
+                for alias in node.names:
+                    imports.add(base + '.' + alias.name)
+
+        # Importing a submodule imports its parent packages too
+        for modname in list(imports):
+            parts = modname.split('.')
+            for i in range(1, len(parts)):
+                imports.add('.'.join(parts[:i]))
+        imports.discard(module.__name__)
+
+        self._imports[key] = imports
+        return imports
+
+
+class TimedSourceFileLoader(SourceFileLoader):
+    """Loader of user modules that records how long it takes to run them."""
+
+    def __init__(self, fullname, path, timer):
+        super().__init__(fullname, path)
+        self.timer = timer
+
+    def exec_module(self, module):
+        stack = self.timer.stack
+        stack.append(0)
+        start = time.perf_counter()
+        try:
+            super().exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+
+            # Don't count the time spent importing other modules
+            self.timer.import_times[module.__name__] = elapsed - stack.pop()
+            if stack:
+                stack[-1] += elapsed
+
+
+class ImportTimer:
+    """
+    Meta path finder that records how long user modules take to be
+    imported.
+
+    It finds modules with the other finders of sys.meta_path, so it doesn't
+    slow down imports.
+    """
+
+    def __init__(self, umr):
+        self.umr = umr
+        self.import_times = {}
+        self.stack = []
+        self._is_library = {}
+
+    def find_spec(self, fullname, path, target=None):
+        spec = None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+
+        if (
+            spec is not None
+            and type(spec.loader) is SourceFileLoader
+            and spec.origin
+        ):
+            if spec.origin not in self._is_library:
+                self._is_library[spec.origin] = path_is_library(
+                    spec.origin, self.umr.pathlist)
+            if not self._is_library[spec.origin]:
+                spec.loader = TimedSourceFileLoader(
+                    fullname, spec.origin, self)
+
+        return spec
+
+    def invalidate_caches(self):
+        pass
@@ -12,6 +12,8 @@
 from itertools import islice
 import inspect
 import re
+import sys
+import weakref
 
 from spyder_kernels.utils.lazymodules import (
     bs4, FakeObject, numpy as np, pandas as pd, PIL)
@@ -131,6 +133,79 @@ def get_size(item):
         return 1
 
 
+# Maximum depth containers are traversed to when computing their memory size
+MEMORY_SIZE_MAX_DEPTH = 3
+
+# Maximum number of items of a container whose size is computed. The size of
+# the rest is estimated from them.
+MEMORY_SIZE_MAX_ITEMS = 1000
+
+
+def get_memory_size(item, depth=MEMORY_SIZE_MAX_DEPTH, _seen=None):
+    """
+    Return the approximate memory used by an item, in bytes.
+
+    This uses `nbytes` for arrays, `memory_usage` for dataframes, series and
+    indexes, and `sys.getsizeof` for everything else. The items of
+    containers are added up to `depth` levels, and only the first
+    `MEMORY_SIZE_MAX_ITEMS` of them are visited in each container.
+
+    Return None if the size can't be computed.
+    """
+    if _seen is None:
+        _seen = set()
+
+    # Don't count twice objects referenced several times
+    if id(item) in _seen:
+        return 0
+    _seen.add(id(item))
+
+    try:
+        if (
+            hasattr(item, 'size') and hasattr(item.size, 'compute') or
+            hasattr(item, 'shape') and hasattr(item.shape, 'compute')
+        ):
+            # Computing the size of dask objects could be expensive (see
+            # get_size)
+            return sys.getsizeof(item)
+        elif isinstance(item, (pd.DataFrame, pd.Series, pd.Index)):
+            memory = item.memory_usage(deep=True)
+            if isinstance(item, pd.DataFrame):
+                memory = memory.sum()
+            return int(memory)
+        elif isinstance(getattr(item, 'nbytes', None), (int, np.integer)):
+            # Arrays and other buffer-like objects
+            return int(item.nbytes)
+
+        size = sys.getsizeof(item)
+        if depth <= 0 or not isinstance(
+            item, (list, tuple, set, frozenset, dict)
+        ):
+            return size
+
+        if isinstance(item, dict):
+            elements = (
+                element for pair in item.items() for element in pair
+            )
+            length = 2 * len(item)
+        else:
+            elements = iter(item)
+            length = len(item)
+
+        visited = 0
+        items_size = 0
+        for element in islice(elements, MEMORY_SIZE_MAX_ITEMS):
+            items_size += get_memory_size(element, depth - 1, _seen) or 0
+            visited += 1
+
+        if visited < length:
+            items_size = items_size * length // visited
+
+        return size + items_size
+    except Exception:
+        return None
+
+
 def get_object_attrs(obj):
     """
     Get the attributes of an object using dir.
@@ -619,7 +694,7 @@ def _is_string(obj):
                    'exclude_capitalized', 'exclude_unsupported',
                    'excluded_names', 'minmax', 'show_callable_attributes',
                    'show_special_attributes', 'exclude_callables_and_modules',
-                   'filter_on')
+                   'filter_on', 'show_memory')
 
 
 def get_supported_types():
@@ -678,22 +753,58 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
         excluded_names=excluded_names, filter_on=settings['filter_on'])
 
 
-def make_remote_view(data, settings, more_excluded_names=None):
+def make_remote_view(data, settings, more_excluded_names=None,
+                     memory_cache=None):
     """
     Make a remote view of dictionary *data*
     -> globals explorer
+
+    If the `show_memory` setting is on, the memory used by each variable is
+    added to the view. Since that can be slow for large objects, it's
+    reused from `memory_cache` for variables that still refer to the same
+    object with the same size since the last view. Only weak references to
+    objects are kept in the cache.
     """
     data = get_remote_data(data, settings, mode='editable',
                            more_excluded_names=more_excluded_names)
+    show_memory = settings.get('show_memory', False)
+    new_memory_cache = {}
+
     remote = {}
     for key, value in list(data.items()):
         view = value_to_display(value, minmax=settings['minmax'])
+        size = get_size(value)
         remote[key] = {
             'type':  get_human_readable_type(value),
-            'size':  get_size(value),
+            'size':  size,
             'view':  view,
             'python_type': get_type_string(value),
             'numpy_type': get_numpy_type_string(value)
         }
 
+        if show_memory:
+            cached = (memory_cache or {}).get(key)
+            try:
+                reuse = (
+                    cached is not None and cached[0]() is value and
+                    cached[1] == size
+                )
+            except Exception:
+                reuse = False
+
+            memory = cached[2] if reuse else get_memory_size(value)
+            remote[key]['memory'] = memory
+            try:
+                new_memory_cache[key] = (weakref.ref(value), size, memory)
+            except TypeError:
+                # Objects that can't be weakly referenced (e.g. lists) are
+                # not cached, so that they are not kept alive by it
+                pass
+
+    # Only keep the variables in this view, so the cache doesn't hold
+    # references to removed ones
+    if memory_cache is not None:
+        memory_cache.clear()
+        memory_cache.update(new_memory_cache)
+
     return remote
@@ -26,7 +26,7 @@
 from spyder_kernels.utils.nsview import (
     sort_against, is_supported, value_to_display, get_size,
     get_supported_types, get_type_string, get_numpy_type_string,
-    is_editable_type)
+    is_editable_type, get_memory_size, MEMORY_SIZE_MAX_ITEMS)
 
 
 def generate_complex_object():
@@ -444,5 +444,33 @@ def test_get_numpy_type():
     assert get_numpy_type_string(df) == 'Unknown'
 
 
+def test_get_memory_size():
+    """Test for get_memory_size."""
+    # Arrays and frames
+    arr = np.zeros((100, 10))
+    assert get_memory_size(arr) == arr.nbytes
+
+    df = pd.DataFrame({'a': range(100), 'b': ['x' * 10] * 100})
+    assert get_memory_size(df) == df.memory_usage(deep=True).sum()
+
+    # Containers add up their items
+    items = [np.zeros(100), np.zeros(100)]
+    assert get_memory_size(items) == sys.getsizeof(items) + 2 * 800
+    assert get_memory_size({'a': arr}) > arr.nbytes
+
+    # Objects referenced several times are only counted once
+    assert get_memory_size([arr, arr]) == sys.getsizeof([arr, arr]) + 8000
+
+    # The size of large containers is estimated
+    large = [np.zeros(1) for __ in range(3 * MEMORY_SIZE_MAX_ITEMS)]
+    assert get_memory_size(large) == sys.getsizeof(large) + 3 * (
+        MEMORY_SIZE_MAX_ITEMS * 8)
+
+    # Recursive containers
+    recursive = [1]
+    recursive.append(recursive)
+    assert get_memory_size(recursive) > 0
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -141,6 +141,7 @@
               'custom': False,
               'umr/enabled': True,
               'umr/verbose': True,
+              'umr/smart': False,
               'umr/namelist': [],
               'custom_interpreters_list': [],
               'custom_interpreter': '',
@@ -180,6 +181,9 @@
               # that generate a lot of Command Prompts while running,
               # and that's extremely annoying for Windows users.
               'hide_cmd_windows': True,
+              'kernel_pool_size': 1,
+              'fork_server': False,
+              'fork_server/preload': '',
               }),
             ('variable_explorer',
              {
@@ -196,7 +200,9 @@
               'minmax': False,
               'show_callable_attributes': True,
               'show_special_attributes': False,
-              'filter_on': True
+              'filter_on': True,
+              'show_memory': False,
+              'trace_allocations': False
              }),
             ('debugger',
              {
@@ -218,6 +224,8 @@
              {
               'mute_inline_plotting': True,
               'show_plot_outline': False,
+              'spill_to_disk': False,
+              'memory_budget': 512,
              }),
             ('editor',
              {
@@ -335,6 +343,7 @@
               'enable': True,
               'name_filters': NAME_FILTERS,
               'show_hidden': False,
+              'hide_git_ignored': False,
               'single_click_to_open': False,
               'size_column': False,
               'type_column': False,
@@ -366,6 +375,7 @@
             ('profiler',
              {
               'enable': True,
+              'profile_in_console': False,
               }),
             ('pylint',
              {
@@ -373,6 +383,7 @@
               'history_filenames': [],
               'max_entries': 30,
               'project_dir': None,
+              'project_jobs': 0,
               }),
             ('workingdir',
              {
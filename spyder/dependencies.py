@@ -7,16 +7,25 @@
 """Module checking Spyder runtime dependencies"""
 
 # Standard library imports
+import importlib.util
+import json
+import logging
 import os
 import os.path as osp
 import sys
+import threading
 
 # Local imports
-from spyder.config.base import _, running_in_ci, is_conda_based_app
+from spyder.config.base import (
+    _, get_conf_path, running_in_ci, is_conda_based_app)
 from spyder.utils import programs
 
 
 HERE = osp.dirname(osp.abspath(__file__))
+logger = logging.getLogger(__name__)
+
+# File where the installed versions of dependencies are cached
+INSTALLED_VERSIONS_CACHE = 'dependencies_versions.json'
 
 # Python 3.8
 PY38 = sys.version_info[:2] == (3, 8)
@@ -351,19 +360,8 @@ def __init__(self, modname, package_name, features, required_version,
         self.distribution_name = self.package_name.replace('-', '_')
 
         if installed_version is None:
-            try:
-                self.installed_version = programs.get_module_version(modname)
-                if not self.installed_version:
-                    # Use get_package_version and the distribution name
-                    # because there are cases for which the version can't
-                    # be obtained from the module (e.g. pylsp_black).
-                    self.installed_version = programs.get_package_version(
-                        self.distribution_name)
-            except Exception:
-                # NOTE: Don't add any exception type here!
-                # Modules can fail to import in several ways besides
-                # ImportError
-                self.installed_version = None
+            self.installed_version = get_installed_version(
+                modname, package_name)
         else:
             self.installed_version = installed_version
 
@@ -373,12 +371,11 @@ def check(self):
             # TODO: Remove when spyder-kernels 3 is released!
             return True
         if self.required_version:
-            installed = programs.is_module_installed(
-                self.modname,
-                self.required_version,
-                distribution_name=self.distribution_name
+            return (
+                self.installed_version is not None
+                and programs.check_version_range(
+                    self.installed_version, self.required_version)
             )
-            return installed
         else:
             return True
 
@@ -399,6 +396,112 @@ def get_status(self):
 
 DEPENDENCIES = []
 
+# Installed versions of dependencies, by module name
+_INSTALLED_VERSIONS = None
+_INSTALLED_VERSIONS_LOCK = threading.Lock()
+
+
+def _get_site_packages_key():
+    """
+    Return the key used to check if the cached versions of dependencies are
+    still valid.
+
+    It's made of the modification time of the directories in sys.path, which
+    changes every time packages are installed, updated or removed from them.
+    The current directory is left out, because it changes when switching
+    directories and packages are not installed in it.
+    """
+    cwd = osp.normcase(os.getcwd())
+    key = []
+    for path in sys.path:
+        if not path or osp.normcase(osp.abspath(path)) == cwd:
+            continue
+        try:
+            key.append([path, os.stat(path).st_mtime])
+        except OSError:
+            key.append([path, None])
+
+    return key
+
+
+def _load_installed_versions():
+    """Load the cached versions of dependencies if they are still valid."""
+    try:
+        with open(get_conf_path(INSTALLED_VERSIONS_CACHE), 'r') as f:
+            cache = json.load(f)
+        if cache['key'] == _get_site_packages_key():
+            return cache['versions']
+    except Exception:
+        pass
+
+    return {}
+
+
+def save_installed_versions():
+    """Save the versions of dependencies to disk."""
+    with _INSTALLED_VERSIONS_LOCK:
+        if _INSTALLED_VERSIONS is None:
+            return
+        cache = {
+            'key': _get_site_packages_key(),
+            'versions': _INSTALLED_VERSIONS
+        }
+
+    try:
+        with open(get_conf_path(INSTALLED_VERSIONS_CACHE), 'w') as f:
+            json.dump(cache, f)
+    except Exception:
+        logger.debug("Unable to save the versions of dependencies",
+                     exc_info=True)
+
+
+def get_installed_version(modname, package_name):
+    """
+    Get the installed version of a dependency without importing it.
+
+    The version is read from the metadata of its distribution, whose name is
+    `package_name` (i.e. its name on PyPI). Modules are only imported if
+    they are installed without metadata (e.g. when they're run from a git
+    checkout).
+
+    Returns None if the dependency is not installed.
+    """
+    global _INSTALLED_VERSIONS
+    with _INSTALLED_VERSIONS_LOCK:
+        if _INSTALLED_VERSIONS is None:
+            _INSTALLED_VERSIONS = _load_installed_versions()
+        if modname in _INSTALLED_VERSIONS:
+            return _INSTALLED_VERSIONS[modname]
+
+    # Try with the distribution name too (see Dependency.__init__)
+    version = None
+    for name in dict.fromkeys(
+        [package_name, package_name.replace('-', '_'), modname]
+    ):
+        version = programs.get_package_version(name)
+        if version:
+            break
+
+    if not version:
+        try:
+            installed = importlib.util.find_spec(modname) is not None
+        except Exception:
+            installed = False
+
+        if installed:
+            try:
+                version = programs.get_module_version(modname)
+            except Exception:
+                # NOTE: Don't add any exception type here!
+                # Modules can fail to import in several ways besides
+                # ImportError
+                version = None
+
+    with _INSTALLED_VERSIONS_LOCK:
+        _INSTALLED_VERSIONS[modname] = version
+
+    return version
+
 
 def add(modname, package_name, features, required_version,
         installed_version=None, kind=MANDATORY):
@@ -485,3 +588,5 @@ def declare_dependencies():
             add(dep['modname'], dep['package_name'],
                 dep['features'], dep['required_version'],
                 kind=dep.get('kind', MANDATORY))
+
+    save_installed_versions()
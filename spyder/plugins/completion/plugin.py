@@ -1261,6 +1261,10 @@ def gather_and_reply(self, request_responses: dict):
 
         if req_type == CompletionRequestTypes.DOCUMENT_COMPLETION:
             responses = self.gather_completions(req_id_responses)
+
+            # Results are partial if some providers didn't answer in time
+            if request_responses.get('timed_out', False):
+                responses['isIncomplete'] = True
         else:
             responses = self.gather_responses(req_type, req_id_responses)
 
@@ -1282,6 +1286,10 @@ def gather_completions(self, req_id_responses: dict):
         merge_stats = {source: 0 for source in req_id_responses}
         responses = []
         dedupe_set = set()
+        is_incomplete = any(
+            response.get('isIncomplete', False)
+            for response in req_id_responses.values()
+        )
         for priority, source in enumerate(priorities):
             if source not in req_id_responses:
                 continue
@@ -1296,7 +1304,7 @@ def gather_completions(self, req_id_responses: dict):
                 merge_stats[source] += 1
 
         logger.debug('Responses statistics: {0}'.format(merge_stats))
-        responses = {'params': responses}
+        responses = {'params': responses, 'isIncomplete': is_incomplete}
         return responses
 
     def gather_responses(self, req_type: int, responses: dict):
@@ -90,7 +90,9 @@ def document_completion_request(self, params):
 
     @handles(CompletionRequestTypes.DOCUMENT_COMPLETION)
     def process_document_completion(self, response, req_id):
+        is_incomplete = False
         if isinstance(response, dict):
+            is_incomplete = response.get('isIncomplete', False)
             response = response['items']
 
         must_resolve = self.server_capabilites['completionProvider'].get(
@@ -111,7 +113,7 @@ def process_document_completion(self, response, req_id):
         if req_id in self.req_reply:
             self.req_reply[req_id](
                 CompletionRequestTypes.DOCUMENT_COMPLETION,
-                {'params': response}
+                {'params': response, 'isIncomplete': is_incomplete}
             )
 
     @send_request(method=CompletionRequestTypes.COMPLETION_RESOLVE)
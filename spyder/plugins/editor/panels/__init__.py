@@ -9,6 +9,7 @@
 Panels are widgets used to extend editor functionalities.
 """
 
+from .celltiming import CellTimingPanel
 from .classfunctiondropdown import ClassFunctionDropdown
 from .codefolding import FoldingPanel
 from .edgeline import EdgeLine
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+This module contains the Cell Timing panel
+"""
+
+# Third party imports
+from qtpy.QtCore import QSize, Qt
+from qtpy.QtGui import QColor, QPainter
+
+# Local imports
+from spyder.config.base import _
+from spyder.plugins.editor.api.panel import Panel
+
+
+class CellTimingPanel(Panel):
+    """
+    Panel that shows the time cells took to run on their first line (on the
+    left side of the line number area).
+    """
+
+    def __init__(self):
+        Panel.__init__(self)
+
+        self.setMouseTracking(True)
+        self.scrollable = True
+        self.timing_color = QColor(Qt.darkGray)
+
+        # Number of characters of the longest time shown until now
+        self._max_chars = 0
+
+    def sizeHint(self):
+        """Override Qt method."""
+        return QSize(self.compute_width(), 0)
+
+    def paintEvent(self, event):
+        """Override Qt method.
+
+        Paint the wall time of the cells that were run.
+        """
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self.editor.sideareas_color)
+        self.paint_cell(painter)
+
+        painter.setFont(self.editor.font())
+        painter.setPen(self.timing_color)
+        font_height = self.editor.fontMetrics().height()
+
+        for top, line_number, block in self.editor.visible_blocks:
+            data = block.userData()
+            if data and data.cell_timing is not None:
+                wall_time, __ = data.cell_timing
+                painter.drawText(0, top, self.width() - 3, font_height,
+                                 int(Qt.AlignRight | Qt.AlignBottom),
+                                 self.format_time(wall_time))
+
+    def leaveEvent(self, event):
+        """Override Qt method."""
+        self.editor.hide_tooltip()
+
+    def mouseMoveEvent(self, event):
+        """Override Qt method.
+
+        Show the wall and CPU time of the cell under the mouse.
+        """
+        line_number = self.editor.get_linenumber_from_mouse_event(event)
+        block = self.editor.document().findBlockByNumber(line_number - 1)
+        data = block.userData()
+
+        if data and data.cell_timing is not None:
+            wall_time, cpu_time = data.cell_timing
+            text = _("Wall: {wall}, CPU: {cpu}").format(
+                wall=self.format_time(wall_time),
+                cpu=self.format_time(cpu_time)
+            )
+            self.editor.show_tooltip(text, at_line=line_number)
+        else:
+            self.editor.hide_tooltip()
+
+    def wheelEvent(self, event):
+        """Override Qt method."""
+        self.editor.wheelEvent(event)
+
+    # --- Other methods
+    # -----------------------------------------------------------------
+
+    @staticmethod
+    def format_time(seconds):
+        """Format the time a cell took to run."""
+        if seconds < 1:
+            return "{:.0f} ms".format(seconds * 1000)
+        elif seconds < 60:
+            return "{:.2f} s".format(seconds)
+        else:
+            return "{:d} min {:.0f} s".format(
+                int(seconds // 60), seconds % 60)
+
+    def compute_width(self):
+        """Compute and return the panel width."""
+        if not self._max_chars:
+            return 0
+        return 6 + self.editor.fontMetrics().width('9' * self._max_chars)
+
+    def add_timing(self, wall_time):
+        """
+        Make room for a new cell time and show the panel, which is hidden
+        until the first cell is run.
+        """
+        chars = len(self.format_time(wall_time))
+        if chars > self._max_chars:
+            self._max_chars = chars
+            self.editor.panels.refresh()
+        if not self.isVisible():
+            self.setVisible(True)
+        self.update()
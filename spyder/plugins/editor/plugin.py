@@ -124,6 +124,18 @@ class Editor(SpyderDockablePlugin):
     :py:meth:spyder.plugins.editor.widgets.editorstack.EditorStack.send_to_help
     """
 
+    sig_help_prerender_requested = Signal(dict)
+    """
+    This signal is emitted to render in advance the help of an object hovered
+    in the editor, without showing it.
+
+    Parameters
+    ----------
+    help_data: dict
+        Dictionary required by the Help pane to render a docstring. It has
+        the same keys as the one emitted by `sig_help_requested`.
+    """
+
     sig_open_files_finished = Signal()
     """
     This signal is emitted when the editor finished to open files.
@@ -180,6 +192,8 @@ def on_initialize(self):
 
         # ---- Help related signals
         widget.sig_help_requested.connect(self.sig_help_requested)
+        widget.sig_help_prerender_requested.connect(
+            self.sig_help_prerender_requested)
 
         # ---- General signals
         widget.starting_long_process.connect(self.before_long_process)
@@ -793,6 +807,12 @@ def on_ipyconsole_available(self):
         ipyconsole.register_spyder_kernel_call_handler(
             'run_cell', widget.handle_run_cell
         )
+        ipyconsole.register_spyder_kernel_call_handler(
+            'get_cell_code', widget.handle_get_cell_code
+        )
+        ipyconsole.register_spyder_kernel_call_handler(
+            'cell_timing', widget.handle_cell_timing
+        )
 
     @on_plugin_teardown(plugin=Plugins.IPythonConsole)
     def on_ipyconsole_teardown(self):
@@ -802,6 +822,8 @@ def on_ipyconsole_teardown(self):
         ipyconsole.unregister_spyder_kernel_call_handler('current_filename')
         ipyconsole.unregister_spyder_kernel_call_handler('get_file_code')
         ipyconsole.unregister_spyder_kernel_call_handler('run_cell')
+        ipyconsole.unregister_spyder_kernel_call_handler('get_cell_code')
+        ipyconsole.unregister_spyder_kernel_call_handler('cell_timing')
 
     @on_plugin_available(plugin=Plugins.Switcher)
     def on_switcher_available(self):
@@ -84,6 +84,7 @@ def __init__(self, editor, color=None, selection_start=None,
         self.import_statement = None
         self.selection_start = selection_start
         self.selection_end = selection_end
+        self.cell_timing = None
 
     def _selection(self):
         """
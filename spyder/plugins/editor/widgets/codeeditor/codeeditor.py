@@ -52,8 +52,8 @@
                                               EditorExtensionsManager,
                                               SnippetsExtension)
 from spyder.plugins.editor.panels import (
-    ClassFunctionDropdown, EdgeLine, FoldingPanel, IndentationGuide,
-    LineNumberArea, PanelsManager, ScrollFlagArea)
+    CellTimingPanel, ClassFunctionDropdown, EdgeLine, FoldingPanel,
+    IndentationGuide, LineNumberArea, PanelsManager, ScrollFlagArea)
 from spyder.plugins.editor.utils.editor import (TextHelper, BlockUserData,
                                                 get_file_language)
 from spyder.plugins.editor.utils.kill_ring import QtKillRing
@@ -321,7 +321,12 @@ def __init__(self, parent=None):
         # Line number area management
         self.linenumberarea = self.panels.register(LineNumberArea())
 
+        # Time cells took to run, hidden until one is run
+        self.celltiming_panel = self.panels.register(CellTimingPanel())
+        self.celltiming_panel.setVisible(False)
+
         # Set order for the left panels
+        self.celltiming_panel.order_in_zone = 3
         self.linenumberarea.order_in_zone = 2
         self.folding_panel.order_in_zone = 0  # Debugger panel is 1
 
@@ -1780,9 +1785,23 @@ def set_color_scheme(self, color_scheme):
 
     def set_text(self, text):
         """Set the text of the editor"""
+        # Large documents are highlighted after their text is set, so that
+        # only their visible part is highlighted right away
+        highlighter = self.highlighter
+        lazy_highlight = (
+            highlighter is not None
+            and not isinstance(highlighter, sh.PygmentsSH)
+            and text.count('\n') >= highlighter.LAZY_REHIGHLIGHT_MIN_BLOCKS
+        )
+        if lazy_highlight:
+            highlighter.defer_highlighting()
+
         self.setPlainText(text)
         self.set_eol_chars(text=text)
 
+        if lazy_highlight:
+            highlighter.rehighlight()
+
         if (isinstance(self.highlighter, sh.PygmentsSH)
                 and not running_under_pytest()):
             self.highlighter.make_charlist()
@@ -2221,9 +2240,9 @@ def cell_list(self):
             if oedata.def_type == OED.CELL:
                 yield oedata
 
-    def get_cell_code(self, cell):
+    def get_cell_block(self, cell):
         """
-        Get cell code for a given cell.
+        Get the first block of a cell, given by its name or index.
 
         If the cell doesn't exist, raises an exception
         """
@@ -2244,7 +2263,15 @@ def get_cell_code(self, cell):
         if not selected_block:
             raise RuntimeError("Cell {} not found.".format(repr(cell)))
 
-        cursor = QTextCursor(selected_block)
+        return selected_block
+
+    def get_cell_code(self, cell):
+        """
+        Get cell code for a given cell.
+
+        If the cell doesn't exist, raises an exception
+        """
+        cursor = QTextCursor(self.get_cell_block(cell))
         text, _, off_pos, col_pos = self.get_cell_as_executable_code(cursor)
         return text
 
@@ -2254,27 +2281,25 @@ def get_cell_code_and_position(self, cell):
 
         If the cell doesn't exist, raise an exception.
         """
-        selected_block = None
-        if is_string(cell):
-            for oedata in self.cell_list():
-                if oedata.def_name == cell:
-                    selected_block = oedata.block
-                    break
-        else:
-            if cell == 0:
-                selected_block = self.document().firstBlock()
-            else:
-                cell_list = list(self.cell_list())
-                if cell <= len(cell_list):
-                    selected_block = cell_list[cell - 1].block
-
-        if not selected_block:
-            raise RuntimeError("Cell {} not found.".format(repr(cell)))
-
-        cursor = QTextCursor(selected_block)
+        cursor = QTextCursor(self.get_cell_block(cell))
         text, _, off_pos, col_pos = self.get_cell_as_executable_code(cursor)
         return text, off_pos, col_pos
 
+    def set_cell_timing(self, cell, wall_time, cpu_time):
+        """
+        Set the time the last run of a cell took, to show it on its first
+        line.
+
+        If the cell doesn't exist, raises an exception
+        """
+        block = self.get_cell_block(cell)
+        data = block.userData()
+        if not data:
+            data = BlockUserData(self)
+        data.cell_timing = (wall_time, cpu_time)
+        block.setUserData(data)
+        self.celltiming_panel.add_timing(wall_time)
+
     def get_cell_count(self):
         """Get number of cells in document."""
         return 1 + len(list(self.cell_list()))
@@ -44,6 +44,7 @@
     collect_folding_regions,
 )
 from spyder.plugins.editor.utils.editor import BlockUserData
+from spyder.plugins.editor.widgets.completion import CompletionCache
 from spyder.utils import sourcecode
 
 
@@ -192,6 +193,7 @@ def __init__(self, *args, **kwargs):
         self.document_symbols_enabled = False
         self.formatting_characters = []
         self.completion_args = None
+        self._completion_cache = CompletionCache()
         self.folding_supported = False
         self._folding_info = None
         self.is_cloned = False
@@ -645,6 +647,28 @@ def _process_code_analysis(self, underline):
 
     # ---- Completion
     # -------------------------------------------------------------------------
+    def _get_completion_cache_key(self):
+        """
+        Get the key and prefix used to cache completions at the cursor
+        position.
+        """
+        cursor = self.textCursor()
+        under_cursor = self.get_current_word_and_position(completion=True)
+        if under_cursor:
+            word, word_start = under_cursor
+        else:
+            word, word_start = "", cursor.position()
+
+        # The text before the word (e.g. `np.` or `os.`) determines what can
+        # be completed, so it must be part of the key.
+        block = cursor.block()
+        line_prefix = block.text()[:word_start - block.position()]
+
+        return (
+            (self.filename, cursor.blockNumber(), word_start, line_prefix),
+            word
+        )
+
     @schedule_request(method=CompletionRequestTypes.DOCUMENT_COMPLETION)
     def do_completion(self, automatic=False):
         """Trigger completion."""
@@ -652,6 +676,25 @@ def do_completion(self, automatic=False):
         current_word = self.get_current_word(
             completion=True, valid_python_variable=False
         )
+        cache_key, cache_prefix = self._get_completion_cache_key()
+
+        # Refilter the last completions we got, instead of sending a new
+        # request, while the user keeps typing the same word.
+        # Note: Completions requested explicitly by users are always
+        # computed again.
+        if automatic:
+            completion_list = self._completion_cache.lookup(
+                cache_key, cache_prefix
+            )
+            if completion_list:
+                logger.debug(
+                    f"Reusing {len(completion_list)} cached completions for "
+                    f"prefix {cache_prefix!r}"
+                )
+                self.completion_widget.show_list(
+                    completion_list, cursor.position(), automatic
+                )
+                return
 
         params = {
             "file": self.filename,
@@ -662,7 +705,12 @@ def do_completion(self, automatic=False):
             "selection_end": cursor.selectionEnd(),
             "current_word": current_word,
         }
-        self.completion_args = (self.textCursor().position(), automatic)
+        self.completion_args = (
+            self.textCursor().position(),
+            automatic,
+            cache_key,
+            cache_prefix,
+        )
         return params
 
     @handles(CompletionRequestTypes.DOCUMENT_COMPLETION)
@@ -673,7 +721,7 @@ def process_completion(self, params):
             # This should not happen
             return
         self.completion_args = None
-        position, automatic = args
+        position, automatic, cache_key, cache_prefix = args
 
         start_cursor = self.textCursor()
         start_cursor.movePosition(QTextCursor.StartOfBlock)
@@ -759,6 +807,13 @@ def sort_key(completion):
                     reindented_text = eol_char.join(reindented_text)
                     completion["insertText"] = reindented_text
 
+            self._completion_cache.store(
+                cache_key,
+                cache_prefix,
+                [completion.copy() for completion in completion_list],
+                incomplete=params.get("isIncomplete", False),
+            )
+
             self.completion_widget.show_list(
                 completion_list, position, automatic
             )
@@ -7,11 +7,12 @@
 # Standard library imports
 import os.path as osp
 import sys
+import time
 
 # Third party imports
 from qtpy import QT_VERSION
 from qtpy.QtCore import Qt, QEvent, QPointF
-from qtpy.QtGui import QTextCursor, QMouseEvent
+from qtpy.QtGui import QSyntaxHighlighter, QTextCursor, QMouseEvent
 from qtpy.QtWidgets import QApplication, QTextEdit
 import pytest
 
@@ -24,6 +25,39 @@
 ASSETS = osp.join(HERE, 'assets')
 
 
+def test_set_text_large_file(codeeditor, qtbot):
+    """
+    Check that only the visible part of large files is highlighted when
+    their text is set and measure the time it takes.
+    """
+    editor = codeeditor
+    highlighter = editor.highlighter
+    text = '\n'.join(
+        f'x{i} = "spam"  # comment {i}'
+        for i in range(10 * highlighter.LAZY_REHIGHLIGHT_MIN_BLOCKS)
+    )
+
+    start = time.perf_counter()
+    editor.set_text(text)
+    elapsed = time.perf_counter() - start
+
+    # The rest of the file is highlighted later
+    last_block = editor.document().lastBlock()
+    assert highlighter._lazy_rehighlight_block is not None
+    assert not last_block.layout().formats()
+    qtbot.waitUntil(lambda: highlighter._lazy_rehighlight_block is None,
+                    timeout=30000)
+    assert last_block.layout().formats()
+
+    start = time.perf_counter()
+    QSyntaxHighlighter.rehighlight(highlighter)
+    full_elapsed = time.perf_counter() - start
+
+    print(f"Time to set the text of a large file: {elapsed:.3f} s "
+          f"(highlighting all of it takes {full_elapsed:.3f} s)")
+    assert elapsed < 5
+
+
 def test_editor_upper_to_lower(codeeditor):
     widget = codeeditor
     text = 'UPPERCASE'
@@ -11,9 +11,10 @@
 import sys
 
 # Third psrty imports
-from qtpy.QtCore import QPoint, Qt, Signal, Slot
+from qtpy.QtCore import (QAbstractListModel, QModelIndex, QPoint, Qt, Signal,
+                         Slot)
 from qtpy.QtGui import QFontMetrics, QFocusEvent
-from qtpy.QtWidgets import QListWidget, QListWidgetItem, QToolTip
+from qtpy.QtWidgets import QListView, QToolTip
 
 # Local imports
 from spyder.api.config.mixins import SpyderConfigurationAccessor
@@ -29,7 +30,118 @@
 COMPLETION_DELTA_FOR_SCROLLBAR = 7 if sys.platform.startswith("linux") else 0
 
 
-class CompletionWidget(QListWidget, SpyderConfigurationAccessor):
+class CompletionCache:
+    """
+    Last aggregated completion result of an editor.
+
+    Results are stored per (file, line, word start, text before the word)
+    and can be reused while the word under the cursor keeps extending the
+    prefix they were requested for, because filtering a longer prefix only
+    removes items. Results marked as incomplete by the providers (LSP
+    `isIncomplete`) are never reused.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Drop the stored result."""
+        self.key = None
+        self.prefix = None
+        self.completions = None
+        self.incomplete = False
+
+    def store(self, key, prefix, completions, incomplete=False):
+        """Save the completions obtained for prefix at key."""
+        self.key = key
+        self.prefix = prefix or ''
+        self.completions = completions
+        self.incomplete = incomplete
+
+    def lookup(self, key, prefix):
+        """
+        Return the stored completions that can be refiltered for prefix at
+        key, or None if a new request is required.
+        """
+        if (
+            self.completions is None
+            or self.incomplete
+            or key != self.key
+            or not (prefix or '').startswith(self.prefix)
+        ):
+            return None
+
+        # Completions with a text edit were computed for a precise range,
+        # so they can't be applied once the word under the cursor changes.
+        return [
+            completion.copy() for completion in self.completions
+            if 'textEdit' not in completion
+        ]
+
+
+class CompletionModel(QAbstractListModel):
+    """
+    Model for the completions shown by CompletionWidget.
+
+    The HTML representation of an item is only built when the view asks for
+    it, i.e. when the item is visible.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.widget = parent
+        self.completions = []
+        self.height = COMPLETION_ITEM_HEIGHT
+        self.width = COMPLETION_ITEM_WIDTH
+        self._display_cache = {}
+
+    def set_completions(self, completions, height=None, width=None):
+        """Reset the model with a new list of completions."""
+        self.beginResetModel()
+        self.completions = completions
+        if height is not None:
+            self.height = height
+        if width is not None:
+            self.width = width
+        self._display_cache = {}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """Override Qt method."""
+        if parent.isValid():
+            return 0
+        return len(self.completions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Override Qt method."""
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if not 0 <= row < len(self.completions):
+            return None
+
+        completion = self.completions[row]
+        if role == Qt.UserRole:
+            return completion
+        elif role in (Qt.DisplayRole, Qt.DecorationRole,
+                      Qt.AccessibleTextRole):
+            if row not in self._display_cache:
+                self._display_cache[row] = self.widget.get_item_display(
+                    completion, height=self.height, width=self.width)
+            text, icon, accessible_text = self._display_cache[row]
+
+            if role == Qt.DisplayRole:
+                return text
+            elif role == Qt.DecorationRole:
+                return icon
+            else:
+                return accessible_text
+
+        return None
+
+
+class CompletionWidget(QListView, SpyderConfigurationAccessor):
     """Completion list widget."""
 
     ITEM_TYPE_MAP = {
@@ -57,6 +169,10 @@ class CompletionWidget(QListWidget, SpyderConfigurationAccessor):
 
     sig_show_completions = Signal(object)
 
+    # Signals kept for compatibility with the QListWidget API
+    itemActivated = Signal(object)
+    currentRowChanged = Signal(int)
+
     # Signal with the info about the current completion item documentation
     # str: completion name
     # str: completion signature/documentation,
@@ -68,6 +184,16 @@ def __init__(self, parent, ancestor):
         self.textedit = parent
         self._language = None
         self.setWindowFlags(Qt.SubWindow | Qt.FramelessWindowHint)
+
+        # Model
+        self._model = CompletionModel(self)
+        self.setModel(self._model)
+        self.setUniformItemSizes(True)
+        self.activated.connect(self.itemActivated)
+        self.selectionModel().currentRowChanged.connect(
+            lambda current, previous: self.currentRowChanged.emit(
+                current.row()))
+
         self.hide()
         self.itemActivated.connect(self.item_selected)
         self.currentRowChanged.connect(self.row_changed)
@@ -92,6 +218,37 @@ def setup_appearance(self, size, font):
         self.resize(*size)
         self.setFont(font)
 
+    # ---- QListWidget API
+    def count(self):
+        """Number of items displayed by the widget."""
+        return self._model.rowCount()
+
+    def item(self, row):
+        """Return the index of the item displayed at row."""
+        if not 0 <= row < self.count():
+            return None
+        return self._model.index(row)
+
+    def currentItem(self):
+        """Return the index of the current item."""
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        return index
+
+    def currentRow(self):
+        """Return the current row."""
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row):
+        """Set the current row."""
+        self.setCurrentIndex(self._model.index(row))
+
+    def clear(self):
+        """Remove all items."""
+        self._model.set_completions([])
+
+    # ---- Public API
     def is_empty(self):
         """Check if widget is empty."""
         if self.count() == 0:
@@ -186,8 +343,6 @@ def update_list(self, current_word, new=True):
 
         If no items are left on the list the autocompletion should stop
         """
-        self.clear()
-
         self.display_index = []
         height = self.item_height
 
@@ -207,6 +362,9 @@ def update_list(self, current_word, new=True):
             # right border.
             width = COMPLETION_ITEM_WIDTH + COMPLETION_DELTA_FOR_SCROLLBAR
 
+        # Only filter items here. Their HTML representation is computed by
+        # the model when they are displayed.
+        completions = []
         for i, completion in enumerate(self.completion_list):
             if not self.is_internal_console:
                 if not new and 'textEdit' in completion:
@@ -217,21 +375,15 @@ def update_list(self, current_word, new=True):
 
             if not self.check_can_complete(completion_label, current_word):
                 continue
-            item = QListWidgetItem()
 
-            if not self.is_internal_console:
-                self.set_item_display(
-                    item, completion, height=height, width=width)
-                item.setData(Qt.UserRole, completion)
+            if self.is_internal_console:
+                completions.append(completion_label)
             else:
-                completion_text = self.get_html_item_representation(
-                    completion_label, '', height=height, width=width)
-                item.setData(Qt.UserRole, completion_label)
-                item.setText(completion_text)
-
-            self.addItem(item)
+                completions.append(completion)
             self.display_index.append(i)
 
+        self._model.set_completions(completions, height=height, width=width)
+
         if self.count() == 0:
             self.hide()
 
@@ -240,8 +392,16 @@ def _get_cached_icon(self, name):
             self.ICON_MAP[name] = ima.icon(name)
         return self.ICON_MAP[name]
 
-    def set_item_display(self, item_widget, item_info, height, width):
-        """Set item text & icons using the info available."""
+    def get_item_display(self, item_info, height, width):
+        """
+        Get the text, icon and accessible text used to display a completion
+        item.
+        """
+        if self.is_internal_console:
+            item_text = self.get_html_item_representation(
+                item_info, '', height=height, width=width)
+            return item_text, None, item_info
+
         item_type = self.ITEM_TYPE_MAP.get(item_info['kind'], 'no_match')
         item_label = item_info['label']
         icon_provider = ("iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0l"
@@ -262,13 +422,12 @@ def set_item_display(self, item_widget, item_info, height, width):
             img_height=img_height, img_width=img_width, height=height,
             width=width)
 
-        item_widget.setText(item_text)
-        item_widget.setIcon(self._get_cached_icon(item_type))
-
         # Set data for accessible readers using item label and type
         # See spyder-ide/spyder#17047 and
         # https://doc.qt.io/qt-5/qt.html#ItemDataRole-enum
-        item_widget.setData(Qt.AccessibleTextRole, f"{item_label} {item_type}")
+        accessible_text = f"{item_label} {item_type}"
+
+        return item_text, self._get_cached_icon(item_type), accessible_text
 
     def get_html_item_representation(self, item_completion, item_type,
                                      icon_provider=None,
@@ -336,7 +495,7 @@ def hide(self, focus_to_parent=True):
             # time, which can generate odd UX situations.
             tooltip._hide()
 
-        QListWidget.hide(self)
+        QListView.hide(self)
         QToolTip.hideText()
 
     def keyPressEvent(self, event):
@@ -379,7 +538,7 @@ def keyPressEvent(self, event):
             elif key == Qt.Key_Down and self.currentRow() == self.count()-1:
                 self.setCurrentRow(0)
             else:
-                QListWidget.keyPressEvent(self, event)
+                QListView.keyPressEvent(self, event)
         elif key in (Qt.Key_Home, Qt.Key_End):
             # This allows users to easily move to the beginning/end of the
             # current line when this widget is visible.
@@ -415,7 +574,7 @@ def keyPressEvent(self, event):
             self.textedit.keyPressEvent(event)
         else:
             self.hide()
-            QListWidget.keyPressEvent(self, event)
+            QListView.keyPressEvent(self, event)
 
     def is_up_to_date(self, item=None):
         """
@@ -200,6 +200,18 @@ class EditorStack(QWidget, SpyderWidgetMixin):
     :py:meth:spyder.plugins.editor.widgets.editorstack.EditorStack.send_to_help
     """
 
+    sig_help_prerender_requested = Signal(dict)
+    """
+    This signal is emitted to render in advance the help of an object hovered
+    in the editor, without showing it.
+
+    Parameters
+    ----------
+    help_data: dict
+        Dictionary required by the Help pane to render a docstring. It has
+        the same keys as the one emitted by `sig_help_requested`.
+    """
+
     def __init__(self, parent, actions, use_switcher=True):
         if PYQT5 or PYQT6:
             super().__init__(parent, class_parent=parent)
@@ -732,6 +744,17 @@ def display_help(self, help_text, clicked):
 
         self.send_to_help(name, help_text, force=True)
 
+    @Slot(str, bool)
+    def prerender_help(self, help_text, clicked):
+        """Render in advance the help of the object hovered in the editor."""
+        if clicked or not self.help_enabled:
+            return
+
+        editor = self.get_current_editor()
+        name = editor.get_last_hover_word()
+        self.sig_help_prerender_requested.emit(
+            self._get_help_data(name, help_text))
+
     # ---- Editor Widget Settings
     @on_conf_change(section='help', option='connect/editor')
     def on_help_connection_change(self, value):
@@ -2537,6 +2560,7 @@ def create_new_editor(self, fname, enc, txt, set_current, new=False,
             self.sig_update_code_analysis_actions)
         editor.sig_refresh_formatting.connect(self.sig_refresh_formatting)
         editor.sig_save_requested.connect(self.save)
+        editor.sig_display_object_info.connect(self.prerender_help)
         language = get_file_language(fname, txt)
         editor.setup_editor(
             linenumbers=self.linenumbers_enabled,
@@ -2663,6 +2687,12 @@ def send_to_help(self, name, signature, force=False):
         if not force and not self.help_enabled:
             return
 
+        doc = self._get_help_data(name, signature)
+        doc['force_refresh'] = force
+        self.sig_help_requested.emit(doc)
+
+    def _get_help_data(self, name, signature):
+        """Get the data required by Help to show `signature` for `name`."""
         editor = self.get_current_editor()
         language = editor.language.lower()
         signature = to_text_string(signature)
@@ -2677,16 +2707,14 @@ def send_to_help(self, name, signature, force=False):
         else:
             documentation = signature
 
-        doc = {
+        return {
             'obj_text': '',
             'name': name,
             'argspec': args,
             'note': '',
             'docstring': documentation,
-            'force_refresh': force,
             'path': editor.filename
         }
-        self.sig_help_requested.emit(doc)
 
     def new(self, filename, encoding, text, default_content=False,
             empty=False):
@@ -13,6 +13,7 @@
 
 # Standard library imports
 from datetime import datetime
+import hashlib
 import logging
 import os
 import os.path as osp
@@ -231,6 +232,18 @@ class EditorMainWidget(PluginMainWidget):
     :py:meth:spyder.plugins.editor.widgets.editorstack.EditorStack.send_to_help
     """
 
+    sig_help_prerender_requested = Signal(dict)
+    """
+    This signal is emitted to render in advance the help of an object hovered
+    in the editor, without showing it.
+
+    Parameters
+    ----------
+    help_data: dict
+        Dictionary required by the Help pane to render a docstring. It has
+        the same keys as the one emitted by `sig_help_requested`.
+    """
+
     sig_open_files_finished = Signal()
     """
     This signal is emitted when the editor finished to open files.
@@ -1636,6 +1649,8 @@ def register_editorstack(self, editorstack):
         editorstack.sig_load_bookmark.connect(self.load_bookmark)
         editorstack.sig_save_bookmarks.connect(self.save_bookmarks)
         editorstack.sig_help_requested.connect(self.sig_help_requested)
+        editorstack.sig_help_prerender_requested.connect(
+            self.sig_help_prerender_requested)
         editorstack.sig_codeeditor_created.connect(self.sig_codeeditor_created)
         editorstack.sig_codeeditor_changed.connect(self.sig_codeeditor_changed)
         editorstack.sig_codeeditor_deleted.connect(self.sig_codeeditor_deleted)
@@ -2115,8 +2130,7 @@ def update_recent_file_menu(self):
             for fname in recent_files:
                 action = create_action(
                     self, fname,
-                    icon=ima.get_icon_by_extension_or_type(
-                        fname, scale_factor=1.0))
+                    icon=ima.get_icon_by_extension(fname, scale_factor=1.0))
                 action.triggered[bool].connect(self.load)
                 action.setData(to_qvariant(fname))
 
@@ -2939,6 +2953,40 @@ def handle_run_cell(self, cell_name, filename):
         # The file is open, load code from editor
         return editor.get_cell_code(cell_name)
 
+    def handle_get_cell_code(self, cell_name, filename):
+        """
+        Get cell code from cell name and file name, along with a hash of the
+        file contents, so the kernel can tell if the file changed.
+        """
+        editorstack = self._get_editorstack()
+        editor = self.get_editor(filename)
+
+        if editor is None:
+            raise RuntimeError(
+                "File {} not open in the editor".format(filename))
+
+        editorstack.last_cell_call = (filename, cell_name)
+
+        file_hash = hashlib.sha1(
+            editor.toPlainText().encode('utf-8', 'surrogatepass')
+        ).hexdigest()
+        return {
+            "code": editor.get_cell_code(cell_name),
+            "file_hash": file_hash,
+        }
+
+    def handle_cell_timing(self, cell_name, filename, wall_time, cpu_time):
+        """
+        Show the wall and CPU time a cell took to run next to it.
+        """
+        editor = self.get_editor(filename)
+
+        if editor is None:
+            raise RuntimeError(
+                "File {} not open in the editor".format(filename))
+
+        editor.set_cell_timing(cell_name, wall_time, cpu_time)
+
     def handle_cell_count(self, filename):
         """Get number of cells in file to loop."""
         editor = self.get_editor(filename)
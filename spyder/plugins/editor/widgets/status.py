@@ -13,8 +13,7 @@
 from spyder.api.widgets.status import StatusBarWidget
 from spyder.api.translations import _
 from spyder.py3compat import to_text_string
-from spyder.utils.workers import WorkerManager
-from spyder.utils.vcs import get_git_refs
+from spyder.utils.vcs_status import get_vcs_status_service
 
 
 class ReadWriteStatus(StatusBarWidget):
@@ -80,61 +79,43 @@ class VCSStatus(StatusBarWidget):
 
     def __init__(self, parent):
         super().__init__(parent)
-        self._worker_manager = WorkerManager(max_threads=1)
-        self._git_is_working = None
-        self._git_job_queue = None
-        self._last_git_job = None
-
-    # ---- Qt reimplemented
-    def closeEvent(self, event):
-        super().closeEvent(event)
-        self._worker_manager.terminate_all()
+        self._root = None
+        self._vcs_status = get_vcs_status_service()
+        self._vcs_status.sig_status_changed.connect(self._on_status_changed)
 
     def update_vcs_state(self, idx, fname, fname2):
         """Update vcs status."""
-        self.update_vcs(fname, None)
+        self.update_vcs(fname, None, force=True)
 
     def update_vcs(self, fname, index, force=False):
         """Update vcs status."""
-        if self._last_git_job == (fname, index) and not force:
-            self._git_job_queue = None
+        dirname = osp.dirname(fname)
+        if force:
+            self._vcs_status.refresh(dirname)
+
+        self._root = self._vcs_status.get_root(dirname)
+        if self._root is None:
+            self.setVisible(False)
+            self.set_value('')
             return
 
-        if self._git_is_working:
-            self._git_job_queue = (fname, index)
-        else:
-            self._worker_manager.terminate_all()
-            worker = self._worker_manager.create_python_worker(
-                self.get_git_refs, fname)
-            worker.sig_finished.connect(self.process_git_data)
-            self._last_git_job = (fname, index)
-            self._git_job_queue = None
-            self._git_is_working = True
-            worker.start()
-
-    def get_git_refs(self, fname):
-        """Get Git active branch, state, branches (plus tags)."""
-        return get_git_refs(osp.dirname(fname))
-
-    def process_git_data(self, worker, output, error):
-        """Receive data from git and update gui."""
-        # Output can be None under some circumstances, so we need to deal with
-        # it here.
-        # Fixes spyder-ide/spyder#21865
-        if output is None:
-            branch, files_modified = None, []
-        else:
-            __, branch, files_modified = output
+        # The status is read in the background if it's not known yet
+        repo = self._vcs_status.get_repo_status(self._root)
+        if repo.loaded:
+            self.show_repo_status(repo)
 
+    def show_repo_status(self, repo):
+        """Show the branch and number of changed files of a repository."""
+        branch = repo.branch
         text = branch if branch else ''
-        if len(files_modified):
-            text = text + ' [{}]'.format(len(files_modified))
+        if len(repo.files):
+            text = text + ' [{}]'.format(len(repo.files))
         self.setVisible(bool(branch))
         self.set_value(text)
 
-        self._git_is_working = False
-        if self._git_job_queue:
-            self.update_vcs(*self._git_job_queue)
+    def _on_status_changed(self, root):
+        if root == self._root:
+            self.show_repo_status(self._vcs_status.get_repo_status(root))
 
     def change_branch(self):
         """Change current branch."""
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for completion.py
+"""
+
+# Local imports
+from spyder.plugins.editor.widgets.completion import CompletionCache
+
+
+def make_completion(label, **kwargs):
+    completion = {
+        'label': label,
+        'filterText': label,
+        'insertText': label,
+        'sortText': label,
+        'kind': 1,
+    }
+    completion.update(kwargs)
+    return completion
+
+
+def test_completion_cache_refilter():
+    """Check that cached completions are reused when the prefix grows."""
+    cache = CompletionCache()
+    key = ('test.py', 3, 10, 'np.')
+    completions = [
+        make_completion('asin'),
+        make_completion('acos'),
+        make_completion('atan', textEdit={'newText': 'atan'}),
+    ]
+    cache.store(key, 'a', completions)
+
+    # Longer prefix at the same position
+    cached = cache.lookup(key, 'as')
+    assert [c['label'] for c in cached] == ['asin', 'acos']
+
+    # Cached items are copies
+    cached[0]['point'] = None
+    assert 'point' not in completions[0]
+
+    # Shorter prefix, other position or other file
+    assert cache.lookup(key, '') is None
+    assert cache.lookup(('test.py', 3, 11, 'np.'), 'as') is None
+    assert cache.lookup(('other.py', 3, 10, 'np.'), 'as') is None
+
+    # Same position after other text
+    assert cache.lookup(('test.py', 3, 10, 'os.'), 'as') is None
+
+
+def test_completion_cache_incomplete():
+    """Check that incomplete results are never reused."""
+    cache = CompletionCache()
+    key = ('test.py', 0, 0, '')
+    cache.store(key, 'a', [make_completion('abs')], incomplete=True)
+    assert cache.lookup(key, 'ab') is None
+
+    cache.store(key, 'a', [make_completion('abs')])
+    assert cache.lookup(key, 'ab') is not None
+
+    cache.clear()
+    assert cache.lookup(key, 'ab') is None
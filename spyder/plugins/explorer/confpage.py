@@ -30,10 +30,15 @@ def setup_page(self):
         # General options group
         basic_group = QGroupBox(_("General options"))
         check_show_hidden_files = newcb(_("Show hidden files"), 'show_hidden')
+        check_hide_ignored_files = newcb(
+            _("Hide files ignored by Git"), 'hide_git_ignored',
+            tip=_("Hide the files and directories that match the patterns "
+                  "in the .gitignore files of Git repositories"))
         check_single_click = newcb(
             _("Single click to open files"), 'single_click_to_open')
         basic_layout = QVBoxLayout()
         basic_layout.addWidget(check_show_hidden_files)
+        basic_layout.addWidget(check_hide_ignored_files)
         basic_layout.addWidget(check_single_click)
         basic_group.setLayout(basic_layout)
 
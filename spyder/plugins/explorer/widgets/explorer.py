@@ -22,7 +22,6 @@
 from qtpy import PYQT5, PYQT6
 from qtpy.compat import getexistingdirectory, getsavefilename
 from qtpy.QtCore import (
-    QDir,
     QMimeData,
     QSortFilterProxyModel,
     Qt,
@@ -37,7 +36,6 @@
     QApplication,
     QDialog,
     QDialogButtonBox,
-    QFileSystemModel,
     QInputDialog,
     QLabel,
     QLineEdit,
@@ -59,8 +57,9 @@
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.config.base import get_home_dir
 from spyder.config.main import NAME_FILTERS
+from spyder.plugins.explorer.widgets.fsmodel import AsyncFileSystemModel
 from spyder.plugins.explorer.widgets.utils import (
-    create_script, fixpath, IconProvider, show_in_external_file_explorer)
+    create_script, fixpath, show_in_external_file_explorer)
 from spyder.py3compat import to_binary_string
 from spyder.utils import encoding
 from spyder.utils.icon_manager import ima
@@ -672,7 +671,7 @@ def setup(self):
         self.context_menu.aboutToShow.connect(self.update_actions)
 
     @on_conf_change(option=['size_column', 'type_column', 'date_column',
-                            'name_filters', 'show_hidden',
+                            'name_filters', 'show_hidden', 'hide_git_ignored',
                             'single_click_to_open'])
     def on_conf_update(self, option, value):
         if option == 'size_column':
@@ -686,6 +685,8 @@ def on_conf_update(self, option, value):
                 self.filter_files(value)
         elif option == 'show_hidden':
             self.set_show_hidden(value)
+        elif option == 'hide_git_ignored':
+            self.fsmodel.set_hide_ignored(value)
         elif option == 'single_click_to_open':
             self.set_single_click_to_open(value)
 
@@ -952,8 +953,7 @@ def startDrag(self, dropActions):
     # ------------------------------------------------------------------------
     def setup_fs_model(self):
         """Setup filesystem model"""
-        self.fsmodel = QFileSystemModel(self)
-        self.fsmodel.setNameFilterDisables(False)
+        self.fsmodel = AsyncFileSystemModel(self)
 
     def install_model(self):
         """Install filesystem model"""
@@ -967,8 +967,9 @@ def setup_view(self):
         self.setAnimated(False)
         self.setSortingEnabled(True)
         self.sortByColumn(0, Qt.AscendingOrder)
-        self.fsmodel.modelReset.connect(self.reset_icon_provider)
-        self.reset_icon_provider()
+        self.fsmodel.set_hide_ignored(
+            self.get_conf('hide_git_ignored', default=False)
+        )
 
     # ---- File/Dir Helpers
     # ------------------------------------------------------------------------
@@ -1761,17 +1762,7 @@ def set_name_filters(self, name_filters):
 
     def set_show_hidden(self, state):
         """Toggle 'show hidden files' state"""
-        filters = (QDir.AllDirs | QDir.Files | QDir.Drives |
-                   QDir.NoDotAndDotDot)
-        if state:
-            filters = (QDir.AllDirs | QDir.Files | QDir.Drives |
-                       QDir.NoDotAndDotDot | QDir.Hidden)
-        self.fsmodel.setFilter(filters)
-
-    def reset_icon_provider(self):
-        """Reset file system model icon provider
-        The purpose of this is to refresh files/directories icons"""
-        self.fsmodel.setIconProvider(IconProvider())
+        self.fsmodel.set_show_hidden(state)
 
     def convert_notebook(self, fname):
         """Convert an IPython notebook to a Python script in editor"""
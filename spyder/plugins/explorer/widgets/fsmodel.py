@@ -0,0 +1,873 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+File system model that lists directories in worker threads.
+
+Directories are read with `os.scandir` in batches, so large directories or
+slow network mounts don't block the interface, and the size and
+modification date of files are only read for the rows that are shown.
+"""
+
+# Standard library imports
+from fnmatch import fnmatch
+import itertools
+import os
+import os.path as osp
+import re
+import stat
+
+# Third party imports
+from qtpy.QtCore import (QAbstractItemModel, QDateTime, QFileSystemWatcher,
+                         QLocale, QModelIndex, Qt, QTimer, Signal)
+from qtpy.QtGui import QColor
+
+# Local imports
+from spyder.api.translations import _
+from spyder.utils import vcs
+from spyder.utils.icon_manager import ima
+from spyder.utils.palette import SpyderPalette
+from spyder.utils.vcs_status import get_vcs_status_service
+from spyder.utils.workers import WorkerManager
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# The first batch is small to show the first entries of a directory quickly
+FIRST_BATCH_SIZE = 200
+BATCH_SIZE = 5000
+
+# Time to wait for more changes before listing directories again
+REFRESH_DELAY = 100  # ms
+
+# Colors of the entries by VCS status
+VCS_STATUS_COLORS = {
+    'added': SpyderPalette.COLOR_SUCCESS_2,
+    'untracked': SpyderPalette.COLOR_SUCCESS_2,
+    'modified': SpyderPalette.COLOR_WARN_2,
+    'renamed': SpyderPalette.COLOR_WARN_2,
+    'conflicted': SpyderPalette.COLOR_ERROR_1,
+    'deleted': SpyderPalette.COLOR_ERROR_1,
+}
+
+
+class FileSystemColumns:
+    Name = 0
+    Size = 1
+    Type = 2
+    Date = 3
+
+
+# ---- Helpers
+# ----------------------------------------------------------------------------
+def natural_sort_key(name):
+    """Key to sort names with numbers in natural order."""
+    # Numbers are at the odd positions of the split name
+    return [
+        int(part) if i % 2 else part.lower()
+        for i, part in enumerate(re.split(r'(\d+)', name))
+    ]
+
+
+def is_hidden_entry(entry):
+    """Check if an `os.DirEntry` is hidden."""
+    if os.name == 'nt':
+        try:
+            attributes = entry.stat(follow_symlinks=False).st_file_attributes
+        except OSError:
+            return False
+        return bool(attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+    else:
+        return entry.name.startswith('.')
+
+
+def read_directory_batch(listing, size):
+    """
+    Read the next `size` entries of a directory listing.
+
+    This is run in a worker thread. It returns a list of
+    `(name, is_dir, is_hidden, ignored)` lists and whether the listing
+    finished.
+    """
+    if listing.entries is None:
+        listing.entries = os.scandir(listing.path)
+
+    batch = []
+    for entry in itertools.islice(listing.entries, size):
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        batch.append([entry.name, is_dir, is_hidden_entry(entry), False])
+
+    finished = len(batch) < size
+    if finished:
+        listing.entries.close()
+
+    if listing.check_ignored and batch:
+        ignored = vcs.get_git_ignored(
+            listing.path, [entry[0] for entry in batch]
+        )
+        for entry in batch:
+            entry[3] = entry[0] in ignored
+
+    return batch, finished
+
+
+def stat_files(paths):
+    """
+    Return the size and modification time of `paths`, or None for the ones
+    that can't be read.
+
+    This is run in a worker thread.
+    """
+    metadata = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            metadata.append(None)
+        else:
+            metadata.append((st.st_size, st.st_mtime))
+    return metadata
+
+
+# ---- Model
+# ----------------------------------------------------------------------------
+class FileNode:
+    """File or directory in the model."""
+
+    __slots__ = ('name', 'parent', 'is_dir', 'is_hidden', 'ignored', 'row',
+                 'children', 'visible', 'loaded', 'metadata')
+
+    def __init__(self, name, parent, is_dir, is_hidden=False, ignored=False):
+        self.name = name
+        self.parent = parent
+        self.is_dir = is_dir
+        self.is_hidden = is_hidden
+        self.ignored = ignored
+
+        # Row in the visible children of the parent, or -1 if not visible
+        self.row = -1
+
+        # All the children of a directory, by name
+        self.children = {}
+
+        # Children shown, in order
+        self.visible = []
+
+        # Whether the directory was listed completely
+        self.loaded = False
+
+        # (size, mtime) tuple, False while reading it, an empty tuple if it
+        # can't be read or None if it wasn't requested
+        self.metadata = None
+
+    @property
+    def path(self):
+        names = []
+        node = self
+        while node.parent is not None:
+            names.append(node.name)
+            node = node.parent
+        return osp.join(*reversed(names)) if names else ''
+
+
+class DirectoryListing:
+    """State of a directory being listed."""
+
+    def __init__(self, node, refresh, check_ignored):
+        self.node = node
+        self.path = node.path
+        self.entries = None
+        self.check_ignored = check_ignored
+        self.worker = None
+
+        # When refreshing, entries are only applied to the model at the end
+        self.refresh = refresh
+        self.found = []
+
+        # Set if the directory changed while being listed
+        self.stale = False
+
+    def close(self):
+        if self.worker is not None:
+            self.worker.terminate()
+        if self.entries is not None:
+            try:
+                self.entries.close()
+            except OSError:
+                pass
+
+
+class AsyncFileSystemModel(QAbstractItemModel):
+    """
+    File system model that reads directories and file metadata in worker
+    threads.
+
+    It implements the parts of the `QFileSystemModel` API used by Spyder.
+    """
+
+    directoryLoaded = Signal(str)
+    """
+    This signal is emitted when a directory was listed completely.
+
+    Parameters
+    ----------
+    path: str
+        Path of the directory.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = FileNode('', None, True)
+        self._root_path = ''
+        self._bypass = set()
+        self._name_filters = []
+        self._show_hidden = False
+        self._hide_ignored = False
+        self._sort_column = FileSystemColumns.Name
+        self._sort_order = Qt.AscendingOrder
+
+        self._listings = {}
+        self._pending_metadata = []
+        self._changed_dirs = set()
+        self._watched = set()
+
+        self._worker_manager = WorkerManager(self, max_threads=2)
+
+        self._metadata_timer = QTimer(self)
+        self._metadata_timer.setSingleShot(True)
+        self._metadata_timer.setInterval(0)
+        self._metadata_timer.timeout.connect(self._read_metadata)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DELAY)
+        self._refresh_timer.timeout.connect(self._refresh_changed_dirs)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._vcs_status = get_vcs_status_service()
+        self._vcs_status.sig_status_changed.connect(
+            self._on_vcs_status_changed)
+
+    # ---- Qt methods
+    # ------------------------------------------------------------------------
+    def index(self, *args):
+        """
+        Return the index of a row, column and parent, or the index of a path
+        like `QFileSystemModel.index`.
+        """
+        if args and isinstance(args[0], str):
+            node = self._get_node(args[0])
+            column = args[1] if len(args) > 1 else 0
+            if node is None or not self._is_attached(node):
+                return QModelIndex()
+            return self.createIndex(node.row, column, node)
+
+        row, column = args[:2]
+        parent = args[2] if len(args) > 2 else QModelIndex()
+        node = self._node(parent)
+        if (
+            0 <= row < len(node.visible)
+            and 0 <= column < self.columnCount()
+        ):
+            return self.createIndex(row, column, node.visible[row])
+        return QModelIndex()
+
+    def parent(self, index=None):
+        if index is None:
+            # QObject.parent
+            return super().parent()
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 4
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return False
+        node = self._node(parent)
+        if node.loaded:
+            return len(node.visible) > 0
+        return node.is_dir
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return (
+            node is not self._root
+            and node.is_dir
+            and not node.loaded
+            and node not in self._listings
+        )
+
+    def fetchMore(self, parent):
+        if self.canFetchMore(parent):
+            self._list_directory(self._node(parent))
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return [_("Name"), _("Size"), _("Type"), _("Date Modified")][
+                section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        node = index.internalPointer()
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == FileSystemColumns.Name:
+                return node.name
+            elif column == FileSystemColumns.Type:
+                return self._type(node)
+            elif node.is_dir and column == FileSystemColumns.Size:
+                return ""
+
+            metadata = self._get_metadata(node)
+            if not metadata:
+                return ""
+            size, mtime = metadata
+            if column == FileSystemColumns.Size:
+                return QLocale().formattedDataSize(size)
+            else:
+                return QLocale().toString(
+                    QDateTime.fromSecsSinceEpoch(int(mtime)),
+                    QLocale.ShortFormat
+                )
+        elif role == Qt.DecorationRole and column == FileSystemColumns.Name:
+            if node.is_dir:
+                return ima.icon('DirClosedIcon')
+            return ima.get_icon_by_extension(node.name, scale_factor=1.0)
+        elif role == Qt.ForegroundRole and column == FileSystemColumns.Name:
+            color = VCS_STATUS_COLORS.get(
+                self._vcs_status.get_status(node.path))
+            if color is not None:
+                return QColor(color)
+        elif role == Qt.TextAlignmentRole and column == FileSystemColumns.Size:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self._relayout(lambda: self._update_visible(self._root))
+
+    # ---- QFileSystemModel API
+    # ------------------------------------------------------------------------
+    def setRootPath(self, path):
+        """Set the directory being shown and return its index."""
+        path = osp.normpath(osp.abspath(path))
+        node = self._get_node(path)
+        if node is None:
+            return QModelIndex()
+
+        self._root_path = path
+        self._bypass = set()
+        ancestor = node
+        while ancestor is not self._root:
+            self._bypass.add(ancestor)
+            ancestor = ancestor.parent
+
+        # Show the directories that lead to the root path even if they are
+        # filtered
+        self._relayout(self._update_bypassed)
+
+        if node.is_dir and not node.loaded:
+            self._list_directory(node)
+
+        return self.index(path)
+
+    def rootPath(self):
+        return self._root_path
+
+    def filePath(self, index):
+        if not index.isValid():
+            return ''
+        return index.internalPointer().path
+
+    def fileName(self, index):
+        if not index.isValid():
+            return ''
+        return index.internalPointer().name
+
+    def isDir(self, index):
+        if not index.isValid():
+            return True
+        return index.internalPointer().is_dir
+
+    def type(self, index):
+        if not index.isValid():
+            return ''
+        return self._type(index.internalPointer())
+
+    def setNameFilters(self, name_filters):
+        """Hide the files whose name doesn't match `name_filters`."""
+        self._name_filters = [f for f in name_filters if f]
+        self._relayout(lambda: self._update_visible(self._root))
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def set_show_hidden(self, state):
+        """Show or hide hidden files and directories."""
+        self._show_hidden = state
+        self._relayout(lambda: self._update_visible(self._root))
+
+    def set_hide_ignored(self, state):
+        """Show or hide the files and directories ignored by Git."""
+        if state == self._hide_ignored:
+            return
+        self._hide_ignored = state
+        if state:
+            # Whether files are ignored is only checked when this is enabled
+            for node in self._get_loaded_dirs(self._root):
+                self._list_directory(node, refresh=True)
+        else:
+            self._relayout(lambda: self._update_visible(self._root))
+
+    def refresh(self):
+        """List again all the directories loaded by the model."""
+        for node in self._get_loaded_dirs(self._root):
+            self._list_directory(node, refresh=True)
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _node(self, index):
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def _split_path(self, path):
+        """Split a path in the names of the nodes that lead to it."""
+        path = osp.normpath(osp.abspath(path))
+        drive, rest = osp.splitdrive(path)
+        return [drive + os.sep] + [name for name in rest.split(os.sep)
+                                   if name]
+
+    def _get_node(self, path):
+        """Get the node of `path`, adding it and its parents if needed."""
+        names = self._split_path(path)
+        node = self._root
+        for i, name in enumerate(names):
+            child = node.children.get(name)
+            if child is None:
+                child_path = osp.join(*names[:i + 1])
+                if not osp.exists(child_path):
+                    return None
+                child = FileNode(
+                    name,
+                    node,
+                    osp.isdir(child_path),
+                    is_hidden=(os.name != 'nt' and name.startswith('.'))
+                )
+                node.children[name] = child
+                if self._accepts(child):
+                    self._append_rows(node, [child])
+            node = child
+        return node
+
+    def _find_node(self, path):
+        """Get the node of `path` if it's in the model."""
+        node = self._root
+        for name in self._split_path(path):
+            node = node.children.get(name)
+            if node is None:
+                return None
+        return node
+
+    def _is_attached(self, node):
+        """Check if a node and its parents are visible."""
+        while node is not self._root:
+            if node.row < 0 or node.parent is None:
+                return False
+            node = node.parent
+        return True
+
+    def _get_loaded_dirs(self, node):
+        """Get the directories loaded under `node`."""
+        loaded = []
+        for child in node.children.values():
+            if child.loaded:
+                loaded.append(child)
+            if child.children:
+                loaded.extend(self._get_loaded_dirs(child))
+        return loaded
+
+    def _type(self, node):
+        if node.is_dir:
+            return _("Folder")
+        extension = osp.splitext(node.name)[1][1:]
+        if extension:
+            return _("{} File").format(extension)
+        return _("File")
+
+    def _accepts(self, node):
+        """Check if a node passes the filters."""
+        if node in self._bypass:
+            return True
+        if node.is_hidden and not self._show_hidden:
+            return False
+        if node.ignored and self._hide_ignored:
+            return False
+        if not node.is_dir and self._name_filters:
+            return any(fnmatch(node.name, f) for f in self._name_filters)
+        return True
+
+    def _sort_key(self):
+        column = self._sort_column
+
+        if column == FileSystemColumns.Size:
+            def key(node):
+                size = 0
+                if not node.is_dir and node.metadata:
+                    size = node.metadata[0]
+                return (not node.is_dir, size, natural_sort_key(node.name))
+        elif column == FileSystemColumns.Type:
+            def key(node):
+                return (not node.is_dir, self._type(node).lower(),
+                        natural_sort_key(node.name))
+        elif column == FileSystemColumns.Date:
+            def key(node):
+                mtime = node.metadata[1] if node.metadata else 0
+                return (not node.is_dir, mtime, natural_sort_key(node.name))
+        else:
+            def key(node):
+                return (not node.is_dir, natural_sort_key(node.name))
+
+        return key
+
+    def _sorts_by_metadata(self):
+        return self._sort_column in (FileSystemColumns.Size,
+                                     FileSystemColumns.Date)
+
+    def _renumber(self, node, start=0):
+        for row in range(start, len(node.visible)):
+            node.visible[row].row = row
+
+    def _update_visible(self, node, recursive=True):
+        """
+        Filter and sort the children of `node`.
+
+        This must be called through `_relayout`.
+        """
+        for child in node.visible:
+            child.row = -1
+        node.visible = [
+            child for child in node.children.values() if self._accepts(child)
+        ]
+        node.visible.sort(
+            key=self._sort_key(),
+            reverse=(self._sort_order == Qt.DescendingOrder)
+        )
+        self._renumber(node)
+
+        # All rows need their metadata to be sorted by it, so it's read now
+        # and they're sorted again when it arrives
+        if self._sorts_by_metadata():
+            for child in node.visible:
+                self._get_metadata(child)
+
+        if recursive:
+            for child in node.children.values():
+                if child.children:
+                    self._update_visible(child)
+
+    def _update_bypassed(self):
+        """Update the parents of the bypassed nodes."""
+        for node in set(node.parent for node in self._bypass):
+            self._update_visible(node, recursive=False)
+
+    def _relayout(self, func):
+        """
+        Call `func` to change the order or visibility of rows, updating the
+        persistent indexes of the views.
+        """
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        nodes = [index.internalPointer() for index in persistent]
+
+        func()
+
+        for index, node in zip(persistent, nodes):
+            if self._is_attached(node):
+                self.changePersistentIndex(
+                    index, self.createIndex(node.row, index.column(), node)
+                )
+            else:
+                self.changePersistentIndex(index, QModelIndex())
+        self.layoutChanged.emit()
+
+    def _append_rows(self, node, children):
+        """Show `children` at the end of the children of `node`."""
+        if not children or not self._is_attached(node):
+            # Rows of nodes that aren't shown don't need to be notified
+            for child in children:
+                child.row = len(node.visible)
+                node.visible.append(child)
+            return
+
+        parent = (
+            QModelIndex() if node is self._root
+            else self.createIndex(node.row, 0, node)
+        )
+        first = len(node.visible)
+        self.beginInsertRows(parent, first, first + len(children) - 1)
+        node.visible.extend(children)
+        self._renumber(node, first)
+        self.endInsertRows()
+
+    def _remove_children(self, node, names):
+        """Remove the children of `node` called `names`."""
+        removed = [node.children.pop(name) for name in names]
+        rows = sorted((child.row for child in removed if child.row >= 0),
+                      reverse=True)
+
+        parent = (
+            QModelIndex() if node is self._root
+            else self.createIndex(node.row, 0, node)
+        )
+        attached = self._is_attached(node)
+
+        # Remove consecutive rows together, starting from the last ones
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            if attached:
+                self.beginRemoveRows(parent, first, last)
+            del node.visible[first:last + 1]
+            self._renumber(node, first)
+            if attached:
+                self.endRemoveRows()
+
+        for child in removed:
+            child.row = -1
+            self._forget(child)
+
+    def _forget(self, node):
+        """Stop listing and watching a node and its children."""
+        listing = self._listings.pop(node, None)
+        if listing is not None:
+            listing.close()
+        path = node.path
+        if path in self._watched:
+            self._watched.discard(path)
+            self._watcher.removePath(path)
+        self._bypass.discard(node)
+        for child in node.children.values():
+            self._forget(child)
+
+    # ---- Listing directories
+    def _list_directory(self, node, refresh=False):
+        """Start listing a directory."""
+        listing = self._listings.get(node)
+        if listing is not None:
+            # List it again when done, because it could have changed after
+            # its entries were read
+            listing.stale = True
+            return
+
+        listing = DirectoryListing(node, refresh, self._hide_ignored)
+        self._listings[node] = listing
+        self._read_batch(listing, FIRST_BATCH_SIZE)
+
+    def _read_batch(self, listing, size):
+        worker = self._worker_manager.create_python_worker(
+            read_directory_batch, listing, size
+        )
+        worker.sig_finished.connect(
+            lambda worker, output, error:
+                self._on_batch_read(listing, output, error)
+        )
+        listing.worker = worker
+        worker.start()
+
+    def _on_batch_read(self, listing, output, error):
+        node = listing.node
+        if self._listings.get(node) is not listing:
+            # The listing was cancelled
+            return
+
+        if error is not None:
+            # The directory can't be read (e.g. because of its permissions)
+            batch, finished = [], True
+        else:
+            batch, finished = output
+
+        if listing.refresh:
+            listing.found.extend(batch)
+        else:
+            self._add_entries(node, batch)
+
+        if not finished:
+            self._read_batch(listing, BATCH_SIZE)
+            return
+
+        del self._listings[node]
+        if listing.refresh:
+            self._apply_refresh(node, listing.found)
+
+        node.loaded = True
+        self._relayout(lambda: self._update_visible(node, recursive=False))
+
+        path = node.path
+        if path not in self._watched and osp.isdir(path):
+            self._watched.add(path)
+            self._watcher.addPath(path)
+
+        self.directoryLoaded.emit(path)
+
+        if listing.stale:
+            self._list_directory(node, refresh=True)
+
+    def _add_entries(self, node, entries):
+        """Add the entries read from a directory to its node."""
+        new_children = []
+        for name, is_dir, is_hidden, ignored in entries:
+            child = node.children.get(name)
+            if child is None:
+                child = FileNode(name, node, is_dir, is_hidden, ignored)
+                node.children[name] = child
+                new_children.append(child)
+            else:
+                child.is_dir = is_dir
+                child.is_hidden = is_hidden
+                child.ignored = ignored
+
+        self._append_rows(
+            node, [child for child in new_children if self._accepts(child)]
+        )
+
+    def _apply_refresh(self, node, entries):
+        """Update the children of a directory that was listed again."""
+        names = set(entry[0] for entry in entries)
+        self._remove_children(
+            node, [name for name in node.children if name not in names]
+        )
+        self._add_entries(node, entries)
+
+        # Files could have changed too
+        for child in node.children.values():
+            child.metadata = None
+        if node.visible and self._is_attached(node):
+            self.dataChanged.emit(
+                self.createIndex(0, FileSystemColumns.Size, node.visible[0]),
+                self.createIndex(len(node.visible) - 1,
+                                 FileSystemColumns.Date, node.visible[-1])
+            )
+
+    def _on_directory_changed(self, path):
+        self._changed_dirs.add(path)
+        self._refresh_timer.start()
+        self._vcs_status.notify_changed(path)
+
+    def _refresh_changed_dirs(self):
+        changed_dirs = self._changed_dirs
+        self._changed_dirs = set()
+        for path in changed_dirs:
+            node = self._find_node(path)
+            if node is None:
+                continue
+            if osp.isdir(path):
+                self._list_directory(node, refresh=True)
+            elif node.parent is not None and node.parent.loaded:
+                # The directory was removed
+                self._list_directory(node.parent, refresh=True)
+
+    # ---- VCS status
+    def _on_vcs_status_changed(self, root):
+        """Update the colors of the entries shown in a repository."""
+        node = self._find_node(root)
+        if node is None or not self._is_attached(node):
+            return
+
+        for dir_node in [node] + self._get_loaded_dirs(node):
+            if dir_node.visible and self._is_attached(dir_node):
+                self.dataChanged.emit(
+                    self.createIndex(0, FileSystemColumns.Name,
+                                     dir_node.visible[0]),
+                    self.createIndex(len(dir_node.visible) - 1,
+                                     FileSystemColumns.Name,
+                                     dir_node.visible[-1]),
+                    [Qt.ForegroundRole]
+                )
+
+    # ---- File metadata
+    def _get_metadata(self, node):
+        """
+        Return the metadata of a node, or None if it's not read yet.
+
+        The metadata of nodes is only read when a view asks for it, i.e.
+        when the node is shown.
+        """
+        if node.metadata is None:
+            node.metadata = False
+            self._pending_metadata.append(node)
+            self._metadata_timer.start()
+        return node.metadata
+
+    def _read_metadata(self):
+        nodes = self._pending_metadata
+        self._pending_metadata = []
+        worker = self._worker_manager.create_python_worker(
+            stat_files, [node.path for node in nodes]
+        )
+        worker.sig_finished.connect(
+            lambda worker, output, error:
+                self._on_metadata_read(nodes, output, error)
+        )
+
+        # Rows being shown go before the directories being listed
+        worker.start(priority=1)
+
+    def _on_metadata_read(self, nodes, output, error):
+        if error is not None:
+            # Read the metadata again the next time it's requested
+            for node in nodes:
+                if node.metadata is False:
+                    node.metadata = None
+            return
+
+        parents = set()
+        for node, metadata in zip(nodes, output):
+            if node.parent.children.get(node.name) is not node:
+                # The node was removed
+                continue
+            node.metadata = metadata if metadata is not None else ()
+            if self._is_attached(node):
+                parents.add(node.parent)
+                self.dataChanged.emit(
+                    self.createIndex(node.row, FileSystemColumns.Size, node),
+                    self.createIndex(node.row, FileSystemColumns.Date, node)
+                )
+
+        # Rows are sorted again with the metadata that was read
+        if parents and self._sorts_by_metadata():
+            def update_parents():
+                for parent in parents:
+                    self._update_visible(parent, recursive=False)
+
+            self._relayout(update_parents)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""
+Tests for the asynchronous file system model.
+"""
+
+# Standard imports
+import os.path as osp
+import subprocess
+
+# Third party imports
+import pytest
+from qtpy.QtCore import Qt
+
+# Local imports
+from spyder.plugins.explorer.widgets import fsmodel
+from spyder.plugins.explorer.widgets.fsmodel import (
+    AsyncFileSystemModel, FileSystemColumns)
+from spyder.utils import programs
+
+
+def get_names(model, path):
+    index = model.index(path)
+    return [
+        model.data(model.index(row, 0, index))
+        for row in range(model.rowCount(index))
+    ]
+
+
+@pytest.fixture
+def model(qtbot):
+    model = AsyncFileSystemModel()
+    yield model
+    model._worker_manager.terminate_all()
+
+
+def test_list_directory(qtbot, tmp_path, model, monkeypatch):
+    """Test that directories are listed in batches and sorted."""
+    monkeypatch.setattr(fsmodel, 'FIRST_BATCH_SIZE', 2)
+    monkeypatch.setattr(fsmodel, 'BATCH_SIZE', 3)
+
+    for i in range(12):
+        (tmp_path / f'file{i}.py').write_text('')
+    (tmp_path / 'dir').mkdir()
+    (tmp_path / '.hidden').write_text('')
+
+    with qtbot.waitSignal(model.directoryLoaded, timeout=5000) as blocker:
+        model.setRootPath(str(tmp_path))
+    assert osp.normpath(blocker.args[0]) == str(tmp_path)
+
+    # Directories go first and numbers are sorted naturally
+    assert get_names(model, str(tmp_path)) == (
+        ['dir'] + [f'file{i}.py' for i in range(12)]
+    )
+
+    model.set_show_hidden(True)
+    assert '.hidden' in get_names(model, str(tmp_path))
+
+    model.setNameFilters(['*1.py'])
+    assert get_names(model, str(tmp_path)) == [
+        'dir', 'file1.py', 'file11.py'
+    ]
+
+
+def test_lazy_metadata(qtbot, tmp_path, model):
+    """Test that the size of files is only read when shown."""
+    (tmp_path / 'file.txt').write_text('x' * 2048)
+
+    with qtbot.waitSignal(model.directoryLoaded, timeout=5000):
+        model.setRootPath(str(tmp_path))
+
+    index = model.index(str(tmp_path / 'file.txt'))
+    node = index.internalPointer()
+    assert node.metadata is None
+
+    size_index = model.index(index.row(), 1, index.parent())
+    with qtbot.waitSignal(model.dataChanged, timeout=5000):
+        assert model.data(size_index) == ""
+    assert node.metadata[0] == 2048
+    assert model.data(size_index) != ""
+
+
+def test_metadata_read_again_after_error(qtbot, tmp_path, model, monkeypatch):
+    """Test that metadata that failed to be read is requested again."""
+    (tmp_path / 'file.txt').write_text('x' * 2048)
+
+    with qtbot.waitSignal(model.directoryLoaded, timeout=5000):
+        model.setRootPath(str(tmp_path))
+
+    index = model.index(str(tmp_path / 'file.txt'))
+    node = index.internalPointer()
+    size_index = model.index(index.row(), 1, index.parent())
+
+    def stat_files(paths):
+        raise OSError
+
+    with monkeypatch.context() as m:
+        m.setattr(fsmodel, 'stat_files', stat_files)
+        model.data(size_index)
+        assert node.metadata is False
+        qtbot.waitUntil(lambda: node.metadata is None)
+
+    with qtbot.waitSignal(model.dataChanged, timeout=5000):
+        model.data(size_index)
+    assert node.metadata[0] == 2048
+
+
+def test_sort_by_metadata(qtbot, tmp_path, model):
+    """Test that rows are sorted again when their metadata is read."""
+    for size in [100, 10, 1000]:
+        (tmp_path / f'file{size}.txt').write_text('x' * size)
+
+    with qtbot.waitSignal(model.directoryLoaded, timeout=5000):
+        model.setRootPath(str(tmp_path))
+
+    model.sort(FileSystemColumns.Size, Qt.DescendingOrder)
+    qtbot.waitUntil(lambda: get_names(model, str(tmp_path)) == [
+        'file1000.txt', 'file100.txt', 'file10.txt'
+    ])
+
+
+def test_directory_changes(qtbot, tmp_path, model):
+    """Test that files created or removed are shown."""
+    (tmp_path / 'old.txt').write_text('')
+
+    with qtbot.waitSignal(model.directoryLoaded, timeout=5000):
+        model.setRootPath(str(tmp_path))
+
+    with qtbot.waitSignal(model.directoryLoaded, timeout=5000):
+        (tmp_path / 'new.txt').write_text('')
+        (tmp_path / 'old.txt').unlink()
+
+    qtbot.waitUntil(lambda: get_names(model, str(tmp_path)) == ['new.txt'])
+
+
+@pytest.mark.skipif(programs.find_git() is None, reason="Needs Git")
+def test_hide_ignored(qtbot, tmp_path, model):
+    """Test that files ignored by Git can be hidden."""
+    subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+    (tmp_path / '.gitignore').write_text('build/\n*.log\n')
+    (tmp_path / 'build').mkdir()
+    (tmp_path / 'run.log').write_text('')
+    (tmp_path / 'script.py').write_text('')
+
+    with qtbot.waitSignal(model.directoryLoaded, timeout=5000):
+        model.setRootPath(str(tmp_path))
+    assert get_names(model, str(tmp_path)) == ['build', 'run.log', 'script.py']
+
+    with qtbot.waitSignal(model.directoryLoaded, timeout=5000):
+        model.set_hide_ignored(True)
+    assert get_names(model, str(tmp_path)) == ['script.py']
+
+
+if __name__ == "__main__":
+    pytest.main()
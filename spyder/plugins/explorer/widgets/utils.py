@@ -14,13 +14,11 @@
 import sys
 
 # Third-party imports
-from qtpy.QtCore import QFileInfo, Slot
-from qtpy.QtWidgets import QFileIconProvider, QMessageBox
+from qtpy.QtWidgets import QMessageBox
 
 # Local imports
 from spyder.api.translations import _
 from spyder.utils import encoding
-from spyder.utils.icon_manager import ima
 
 
 def open_file_in_external_explorer(filename):
@@ -90,25 +88,3 @@ def has_subdirectories(path, include, exclude):
     except (IOError, OSError):
         return False
 
-
-class IconProvider(QFileIconProvider):
-    """Project tree widget icon provider"""
-
-    @Slot(int)
-    @Slot(QFileInfo)
-    def icon(self, icontype_or_qfileinfo):
-        """Reimplement Qt method"""
-        if isinstance(icontype_or_qfileinfo, QFileIconProvider.IconType):
-            return super().icon(icontype_or_qfileinfo)
-        else:
-            qfileinfo = icontype_or_qfileinfo
-            fname = osp.normpath(str(qfileinfo.absoluteFilePath()))
-
-            if osp.isfile(fname) or osp.isdir(fname):
-                icon = ima.get_icon_by_extension_or_type(
-                    fname, scale_factor=1.0
-                )
-            else:
-                icon = ima.icon('binary')
-
-            return icon
@@ -104,7 +104,7 @@ def __init__(self, parent, path, filename, sorting, text_color):
 
         super().__init__(parent, [title], QTreeWidgetItem.Type)
 
-        self.setIcon(0, ima.get_icon_by_extension_or_type(filename, 1.0))
+        self.setIcon(0, ima.get_icon_by_extension(filename, 1.0))
         self.setToolTip(0, filename)
 
     def __lt__(self, x):
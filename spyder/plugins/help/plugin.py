@@ -100,6 +100,7 @@ def on_console_available(self):
     def on_editor_available(self):
         editor = self.get_plugin(Plugins.Editor)
         editor.sig_help_requested.connect(self.set_editor_doc)
+        editor.sig_help_prerender_requested.connect(self.prerender_editor_doc)
 
     @on_plugin_available(plugin=Plugins.IPythonConsole)
     def on_ipython_console_available(self):
@@ -148,6 +149,8 @@ def on_console_teardown(self):
     def on_editor_teardown(self):
         editor = self.get_plugin(Plugins.Editor)
         editor.sig_help_requested.disconnect(self.set_editor_doc)
+        editor.sig_help_prerender_requested.disconnect(
+            self.prerender_editor_doc)
 
     @on_plugin_teardown(plugin=Plugins.IPythonConsole)
     def on_ipython_console_teardown(self):
@@ -359,3 +362,15 @@ def set_editor_doc(self, help_data):
             help_data,
             force_refresh=force_refresh,
         )
+
+    def prerender_editor_doc(self, help_data):
+        """
+        Render help data sent from the editor in the background, without
+        showing it.
+
+        Parameters
+        ----------
+        help_data: dict
+            Dictionary of data. See `set_editor_doc` for the expected keys.
+        """
+        self.get_widget().prerender_editor_doc(help_data)
@@ -11,6 +11,8 @@
 import pytest
 
 # Local imports
+from spyder.plugins.help.utils import sphinxify as sphinxify_module
+from spyder.plugins.help.utils.sphinxify import generate_context, sphinxify
 from spyder.plugins.help.widgets import RichText, PlainText
 
 
@@ -40,5 +42,24 @@ def test_plaintext(plaintext):
     assert plaintext
 
 
+def test_sphinxify_cache(mocker):
+    """Check that rendered docstrings are cached and Sphinx is reused."""
+    sphinxify_module.clear_sphinxify_cache()
+    render = mocker.spy(sphinxify_module.SphinxRenderer, 'render')
+
+    html = sphinxify('Some *docs*', generate_context(name='foo'))
+    assert '<em>docs</em>' in html
+
+    # Rendering the same docstring and context again doesn't run Sphinx
+    assert sphinxify('Some *docs*', generate_context(name='foo')) == html
+    assert render.call_count == 1
+
+    # But rendering a different one does it with the same application
+    html = sphinxify('Other *docs*', generate_context(name='foo'))
+    assert 'Other' in html
+    assert render.call_count == 2
+    assert len(sphinxify_module._sphinx_renderers) == 1
+
+
 if __name__ == "__main__":
     pytest.main()
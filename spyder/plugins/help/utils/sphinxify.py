@@ -21,13 +21,17 @@
 """
 
 # Standard library imports
+import atexit
 import codecs
+from collections import OrderedDict
+import hashlib
 import os
 import os.path as osp
 import pathlib
 import shutil
 import sys
 from tempfile import mkdtemp
+import threading
 from xml.sax.saxutils import escape
 
 # Third party imports
@@ -66,6 +70,19 @@
                                                     JS_PATH),
                                    attr_name='JQUERYPATH')
 
+# Maximum number of rendered docstrings kept in memory
+SPHINXIFY_CACHE_SIZE = 128
+
+# Rendered docstrings, keyed by the docstring hash, its context and the
+# builder used to render it
+_sphinxify_cache = OrderedDict()
+
+# Sphinx applications reused between renders, keyed by builder name and math
+# option. Sphinx is not thread-safe, so they can only be used with this lock
+# acquired.
+_sphinx_renderers = {}
+_sphinxify_lock = threading.RLock()
+
 #-----------------------------------------------------------------------------
 # Utility functions
 #-----------------------------------------------------------------------------
@@ -159,10 +176,125 @@ def generate_context(name='', argspec='', note='', math=False, collapse=False,
     return context
 
 
+class SphinxRenderer:
+    """
+    Long-lived Sphinx application used to render docstrings.
+
+    Creating a Sphinx application (which reads its configuration and loads
+    extensions and templates) takes most of the time spent to render a
+    docstring, so we keep one around and only rebuild its single document
+    on each render.
+    """
+
+    def __init__(self, buildername='html'):
+        self.confdir = CONFDIR_PATH
+        self.srcdir = encoding.to_unicode_from_fs(mkdtemp())
+        self.temp_confdir = None
+
+        if os.name == 'nt':
+            # Check if confdir and srcdir are in the same drive
+            # See spyder-ide/spyder#11762
+            drive_confdir = pathlib.Path(self.confdir).parts[0]
+            drive_srcdir = pathlib.Path(self.srcdir).parts[0]
+
+            if drive_confdir != drive_srcdir:
+                self.temp_confdir = encoding.to_unicode_from_fs(mkdtemp())
+                generate_configuration(self.temp_confdir)
+                self.confdir = self.temp_confdir
+
+        destdir = osp.join(self.srcdir, '_build')
+        doctreedir = osp.join(self.srcdir, 'doctrees')
+        suffix = '.html' if buildername == 'html' else '.txt'
+        self.rst_name = osp.join(self.srcdir, 'docstring.rst')
+        self.output_name = osp.join(destdir, 'docstring' + suffix)
+
+        # Sphinx needs its master document to exist on creation
+        with codecs.open(self.rst_name, 'w', encoding='utf-8') as doc_file:
+            doc_file.write('')
+
+        self.app = Sphinx(self.srcdir, self.confdir, destdir, doctreedir,
+                          buildername, {'html_context': {}}, status=None,
+                          warning=None, freshenv=True, warningiserror=False,
+                          tags=None)
+
+    def render(self, docstring, context):
+        """
+        Render `docstring` with `context` and return the result, or None if
+        Sphinx didn't produce any output.
+        """
+        with codecs.open(self.rst_name, 'w', encoding='utf-8') as doc_file:
+            doc_file.write(docstring)
+
+        # Forget the previous read of the document so it's always read again,
+        # regardless of the modification time of its file.
+        self.app.env.all_docs.pop('docstring', None)
+        self.app.config.html_context = context
+
+        if osp.exists(self.output_name):
+            os.remove(self.output_name)
+
+        self.app.build(None, [self.rst_name])
+
+        if osp.exists(self.output_name):
+            with codecs.open(self.output_name, 'r',
+                             encoding='utf-8') as output_file:
+                return output_file.read()
+
+    def close(self):
+        """Remove the directories used by this renderer."""
+        if self.temp_confdir is not None:
+            shutil.rmtree(self.temp_confdir, ignore_errors=True)
+        shutil.rmtree(self.srcdir, ignore_errors=True)
+
+
+def _get_renderer(buildername, math_on):
+    """Get the Sphinx renderer for `buildername` and `math_on`."""
+    # The math option is read by our conf.py when the application is created,
+    # so we need a different one for each value.
+    key = (buildername, bool(math_on))
+    if key not in _sphinx_renderers:
+        _sphinx_renderers[key] = SphinxRenderer(buildername)
+    return _sphinx_renderers[key]
+
+
+def _discard_renderer(buildername, math_on):
+    """Discard a renderer that could have been left in a bad state."""
+    renderer = _sphinx_renderers.pop((buildername, bool(math_on)), None)
+    if renderer is not None:
+        renderer.close()
+
+
+@atexit.register
+def close_renderers():
+    """Close all Sphinx renderers."""
+    with _sphinxify_lock:
+        for renderer in _sphinx_renderers.values():
+            renderer.close()
+        _sphinx_renderers.clear()
+
+
+def clear_sphinxify_cache():
+    """Remove all rendered docstrings from the cache."""
+    with _sphinxify_lock:
+        _sphinxify_cache.clear()
+
+
+def _get_cache_key(docstring, context, buildername):
+    """Get the key used to cache the rendering of `docstring`."""
+    docstring_hash = hashlib.sha1(
+        docstring.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    # Context values are simple types, so their repr identifies them
+    return (docstring_hash, repr(sorted(context.items())), buildername)
+
+
 def sphinxify(docstring, context, buildername='html'):
     """
     Runs Sphinx on a docstring and outputs the processed documentation.
 
+    Results are cached, so rendering the same docstring with the same context
+    again doesn't run Sphinx.
+
     Parameters
     ----------
     docstring : str
@@ -180,84 +312,54 @@ def sphinxify(docstring, context, buildername='html'):
     An Sphinx-processed string, in either HTML or plain text format, depending
     on the value of `buildername`
     """
-
-    confdir = osp.join(get_module_source_path('spyder.plugins.help.utils'))
-    srcdir = mkdtemp()
-    srcdir = encoding.to_unicode_from_fs(srcdir)
-    destdir = osp.join(srcdir, '_build')
-    temp_confdir_needed = False
-
-    if os.name == 'nt':
-        # Check if confdir and srcdir are in the same drive
-        # See spyder-ide/spyder#11762
-        drive_confdir = pathlib.Path(confdir).parts[0]
-        drive_srcdir = pathlib.Path(srcdir).parts[0]
-        temp_confdir_needed = drive_confdir != drive_srcdir
-
-        if temp_confdir_needed:
-            # TODO: This may be inefficient. Find a faster way to do it.
-            confdir = mkdtemp()
-            confdir = encoding.to_unicode_from_fs(confdir)
-            generate_configuration(confdir)
-
-    rst_name = osp.join(srcdir, 'docstring.rst')
-    if buildername == 'html':
-        suffix = '.html'
-    else:
-        suffix = '.txt'
-    output_name = osp.join(destdir, 'docstring' + suffix)
-
-    # This is needed so users can type \\ on latex eqnarray envs inside raw
-    # docstrings
-    if context['right_sphinx_version'] and context['math_on']:
-        docstring = docstring.replace('\\\\', '\\\\\\\\')
-        # Needed to prevent MathJax render the '\*' red.
-        # Also the '\*' seems to actually by a simple '*'
-        # See spyder-ide/spyder#9785
-        docstring = docstring.replace("\\*", "*")
-
-    # Add a class to several characters on the argspec. This way we can
-    # highlight them using css, in a similar way to what IPython does.
-    # NOTE: Before doing this, we escape common html chars so that they
-    # don't interfere with the rest of html present in the page
-    argspec = escape(context['argspec'])
-    for char in ['=', ',', '(', ')', '*', '**']:
-        argspec = argspec.replace(char,
-                         '<span class="argspec-highlight">' + char + '</span>')
-    context['argspec'] = argspec
-
-    doc_file = codecs.open(rst_name, 'w', encoding='utf-8')
-    doc_file.write(docstring)
-    doc_file.close()
-
-    confoverrides = {'html_context': context}
-
-    doctreedir = osp.join(srcdir, 'doctrees')
-
-    sphinx_app = Sphinx(srcdir, confdir, destdir, doctreedir, buildername,
-                        confoverrides, status=None, warning=None,
-                        freshenv=True, warningiserror=False, tags=None)
-    try:
-        sphinx_app.build(None, [rst_name])
-    except SystemMessage:
-        output = _("It was not possible to generate rich text help for this "
-                    "object.</br>"
-                    "Please see it in plain text.")
-        return warning(output)
-
-    # TODO: Investigate if this is necessary/important for us
-    if osp.exists(output_name):
-        output = codecs.open(output_name, 'r', encoding='utf-8').read()
+    key = _get_cache_key(docstring, context, buildername)
+
+    with _sphinxify_lock:
+        if key in _sphinxify_cache:
+            _sphinxify_cache.move_to_end(key)
+            return _sphinxify_cache[key]
+
+        # This is needed so users can type \\ on latex eqnarray envs inside
+        # raw docstrings
+        if context['right_sphinx_version'] and context['math_on']:
+            docstring = docstring.replace('\\\\', '\\\\\\\\')
+            # Needed to prevent MathJax render the '\*' red.
+            # Also the '\*' seems to actually by a simple '*'
+            # See spyder-ide/spyder#9785
+            docstring = docstring.replace("\\*", "*")
+
+        # Add a class to several characters on the argspec. This way we can
+        # highlight them using css, in a similar way to what IPython does.
+        # NOTE: Before doing this, we escape common html chars so that they
+        # don't interfere with the rest of html present in the page
+        argspec = escape(context['argspec'])
+        for char in ['=', ',', '(', ')', '*', '**']:
+            argspec = argspec.replace(
+                char, '<span class="argspec-highlight">' + char + '</span>')
+        context['argspec'] = argspec
+
+        try:
+            renderer = _get_renderer(buildername, context['math_on'])
+            output = renderer.render(docstring, context)
+        except SystemMessage:
+            _discard_renderer(buildername, context['math_on'])
+            output = None
+        except Exception:
+            _discard_renderer(buildername, context['math_on'])
+            raise
+
+        if output is None:
+            output = _("It was not possible to generate rich text help for "
+                       "this object.</br>"
+                       "Please see it in plain text.")
+            return warning(output)
+
+        # TODO: Investigate if this is necessary/important for us
         output = output.replace('<pre>', '<pre class="literal-block">')
-    else:
-        output = _("It was not possible to generate rich text help for this "
-                    "object.</br>"
-                    "Please see it in plain text.")
-        return warning(output)
-
-    if temp_confdir_needed:
-        shutil.rmtree(confdir, ignore_errors=True)
-    shutil.rmtree(srcdir, ignore_errors=True)
+
+        _sphinxify_cache[key] = output
+        while len(_sphinxify_cache) > SPHINXIFY_CACHE_SIZE:
+            _sphinxify_cache.popitem(last=False)
 
     return output
 
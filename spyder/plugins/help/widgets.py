@@ -29,13 +29,15 @@
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.config.base import get_module_source_path
 from spyder.plugins.help.utils.sphinxify import (CSS_PATH, generate_context,
-                                                 loading, usage, warning)
+                                                 loading, sphinxify, usage,
+                                                 warning)
 from spyder.plugins.help.utils.sphinxthread import SphinxThread
 from spyder.py3compat import to_text_string
 from spyder.utils import programs
 from spyder.utils.image_path_manager import get_image_path
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.qthelpers import start_file
+from spyder.utils.workers import WorkerManager
 from spyder.widgets.comboboxes import EditableComboBox
 from spyder.widgets.findreplace import FindReplace
 from spyder.widgets.simplecodeeditor import SimpleCodeEditor
@@ -304,6 +306,8 @@ def __init__(self, name=None, plugin=None, parent=None):
         self._last_editor_doc = None
         self._last_console_cb = None
         self._last_editor_cb = None
+        self._prerender_worker = None
+        self._worker_manager = WorkerManager(max_threads=1)
         self.css_path = self.get_conf('css_path', CSS_PATH, 'appearance')
         self.no_docs = _("No documentation available")
         self.docstring = True  # TODO: What is this used for?
@@ -580,6 +584,9 @@ def update_actions(self):
                     except RuntimeError:
                         pass
 
+    def on_close(self):
+        self._worker_manager.terminate_all()
+
     def get_focus_widget(self):
         self.object_combo.lineEdit().selectAll()
         return self.object_combo
@@ -994,6 +1001,42 @@ def set_editor_doc(self, help_data, force_refresh=False):
         index = self.source_combo.currentIndex()
         self._last_texts[index] = help_data['docstring']
 
+    def prerender_editor_doc(self, help_data):
+        """
+        Render help data sent from the editor in the background.
+
+        This is done for the objects under the mouse cursor in the editor, so
+        their documentation is already rendered (and cached) if it's requested
+        afterwards.
+
+        Parameters
+        ----------
+        help_data: dict
+            Dictionary with editor introspection information. See
+            `set_editor_doc` for its keys.
+        """
+        if not self.get_conf('rich_mode') or not help_data['docstring']:
+            return
+
+        # This needs to be the same context used by the Sphinx thread so that
+        # the rendered docstring can be taken from the cache.
+        context = generate_context(
+            name=help_data['name'],
+            argspec=help_data['argspec'],
+            note=help_data['note'],
+            math=self.get_conf('math'),
+            img_path=os.path.dirname(help_data.get('path', '')),
+            css_path=self.css_path
+        )
+
+        # Only the last object is worth rendering
+        if self._prerender_worker is not None:
+            self._prerender_worker.terminate()
+
+        self._prerender_worker = self._worker_manager.create_python_worker(
+            sphinxify, help_data['docstring'], context)
+        self._prerender_worker.start()
+
     def set_shell(self, shell):
         """
         Bind to shell.
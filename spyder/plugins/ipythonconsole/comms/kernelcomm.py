@@ -7,13 +7,20 @@
 """
 In addition to the remote_call mechanism implemented in CommBase:
  - Send a message to a debugging kernel
+ - Send the non-blocking calls made in the same event loop iteration in a
+   single message
+ - Send identical calls only once while their reply is pending
+ - Return futures for the replies
 """
+from concurrent.futures import Future
 from contextlib import contextmanager
+import json
 import logging
 
 from qtpy.QtCore import QEventLoop, QObject, QTimer, Signal
 
-from spyder_kernels.comms.commbase import CommBase, CommsErrorWrapper
+from spyder_kernels.comms.commbase import (
+    CommBase, CommError, CommsErrorWrapper)
 
 from spyder.config.base import (
     get_debug_level, running_under_pytest)
@@ -36,6 +43,24 @@ def __init__(self):
         super(KernelComm, self).__init__()
         self.kernel_client = None
 
+        # Non-blocking calls to send in a single message, by comm id
+        self._pending_calls = {}
+        self._batch_supported = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_calls)
+
+        # Ids of the calls waiting for a reply, by signature, and ids of the
+        # identical calls that wait for the same reply
+        self._inflight_calls = {}
+        self._call_signatures = {}
+        self._duplicate_calls = {}
+
+        # Futures of the calls made with `future=True`, by call id
+        self._futures = {}
+        self._new_futures = {}
+
         # Register handlers
         self.register_call_handler('_async_error', self._async_error)
         self.register_call_handler('_comm_ready', self._comm_ready)
@@ -90,9 +115,11 @@ def remove(self, comm_id=None, only_closing=False):
             if only_closing and self._comms[comm_id]['status'] != 'closing':
                 continue
             del self._comms[comm_id]
+        self._clear_calls()
 
     def close(self, comm_id=None):
         """Ask kernel to close comm and send confirmation."""
+        self._flush_calls()
         id_list = self.get_comm_id_list(comm_id)
         for comm_id in id_list:
             # Send comm_close directly to avoid really closing the comm
@@ -103,6 +130,8 @@ def close(self, comm_id=None):
     def open_comm(self, kernel_client):
         """Open comm through the kernel client."""
         self.kernel_client = kernel_client
+        self._batch_supported = False
+        self._clear_calls()
         try:
             logger.debug(
                 f"Opening kernel comm for "
@@ -120,11 +149,29 @@ def open_comm(self, kernel_client):
             )
 
     def remote_call(self, interrupt=False, blocking=False, callback=None,
-                    comm_id=None, timeout=None, display_error=False):
-        """Get a handler for remote calls."""
-        return super(KernelComm, self).remote_call(
+                    comm_id=None, timeout=None, display_error=False,
+                    future=False, dedupe=False):
+        """
+        Get a handler for remote calls.
+
+        If `future` is True, calls return a `concurrent.futures.Future` that
+        gets the reply, or the error raised by the kernel, instead of
+        waiting for it.
+
+        If `dedupe` is True, calls that are identical to one still waiting
+        for its reply are not sent and get that reply instead. This must only
+        be used for calls that don't change the kernel state.
+        """
+        if future and blocking:
+            raise ValueError("Calls returning futures can't be blocking")
+        settings = dict(
             interrupt=interrupt, blocking=blocking, callback=callback,
             comm_id=comm_id, timeout=timeout, display_error=display_error)
+        if future:
+            settings['future'] = True
+        if dedupe:
+            settings['dedupe'] = True
+        return super(KernelComm, self).remote_call(**settings)
 
     def on_incoming_call(self, call_dict):
         """A call was received"""
@@ -137,8 +184,24 @@ def _comm_ready(self):
         """If this function is called, the comm is ready"""
         if self._comms[self.calling_comm_id]['status'] != 'ready':
             self._comms[self.calling_comm_id]['status'] = 'ready'
+            self._request_comm_features(self.calling_comm_id)
             self.sig_comm_ready.emit()
 
+    def _request_comm_features(self, comm_id):
+        """Ask the kernel for the optional message types it can handle."""
+        self.remote_call(
+            comm_id=comm_id,
+            future=True
+        )._get_comm_features().add_done_callback(self._set_comm_features)
+
+    def _set_comm_features(self, future):
+        """Enable the optional message types that the kernel can handle."""
+        # Kernels without this call can't handle batches
+        self._batch_supported = (
+            future.exception() is None
+            and 'remote_call_batch' in future.result()
+        )
+
     def _send_call(self, call_dict, comm_id, buffers):
         """Send call and interupt the kernel if needed."""
         settings = call_dict['settings']
@@ -155,7 +218,35 @@ def _send_call(self, call_dict, comm_id, buffers):
                     "Dropping message because kernel is dead: %s",
                     str(call_dict)
                 )
+                self._fail_call(call_dict, RuntimeError("Kernel is dead"))
+                return
+
+        # Wait for the reply of an identical call if there's one
+        signature = self._get_call_signature(call_dict, comm_id, buffers)
+        if signature is None:
+            # This call could change the replies of the calls sent before it
+            self._forget_comm_calls(comm_id)
+        else:
+            call_id = call_dict['call_id']
+            leader_id = self._inflight_calls.get(signature)
+            if leader_id is not None:
+                self._duplicate_calls.setdefault(leader_id, []).append(
+                    call_id)
                 return
+            self._inflight_calls[signature] = call_id
+            self._call_signatures[call_id] = signature
+
+        # Calls that go to the shell channel are sent together when control
+        # returns to the event loop
+        if queue_message and self._batch_supported:
+            self._pending_calls.setdefault(comm_id, []).append(
+                (call_dict, buffers or [])
+            )
+            self._flush_timer.start()
+            return
+
+        # Calls made before must be received first
+        self._flush_calls()
 
         with self.comm_channel_manager(
                 comm_id, queue_message=queue_message):
@@ -163,10 +254,137 @@ def _send_call(self, call_dict, comm_id, buffers):
                 call_dict, comm_id, buffers
             )
 
+    def _flush_calls(self):
+        """Send the pending non-blocking calls."""
+        self._flush_timer.stop()
+        pending_calls = self._pending_calls
+        self._pending_calls = {}
+
+        for comm_id, calls in pending_calls.items():
+            try:
+                if len(calls) == 1:
+                    call_dict, buffers = calls[0]
+                    super(KernelComm, self)._send_call(
+                        call_dict, comm_id, buffers)
+                    continue
+
+                content = {
+                    'calls': [
+                        self.on_outgoing_call(call_dict)
+                        for call_dict, __ in calls
+                    ],
+                    'buffer_counts': [len(buffers) for __, buffers in calls]
+                }
+                self._send_message(
+                    'remote_call_batch',
+                    content=content,
+                    comm_id=comm_id,
+                    buffers=[
+                        buffer for __, buffers in calls for buffer in buffers
+                    ]
+                )
+            except CommError as error:
+                logger.info(
+                    "Dropping messages because the comm is closed: %s",
+                    str(calls)
+                )
+                for call_dict, __ in calls:
+                    self._fail_call(call_dict, error)
+
+    def _get_call_signature(self, call_dict, comm_id, buffers):
+        """
+        Get a signature that is the same for identical calls, or None if the
+        call can't be deduplicated.
+        """
+        settings = call_dict['settings']
+        if (
+            not settings.get('dedupe')
+            or not settings.get('send_reply')
+            or buffers
+        ):
+            return None
+
+        try:
+            arguments = json.dumps(
+                [call_dict['call_args'], call_dict['call_kwargs']],
+                sort_keys=True
+            )
+        except (TypeError, ValueError):
+            return None
+
+        # Calls sent to different channels are not answered at the same time
+        queue_message = (
+            not settings.get('interrupt') and not settings.get('blocking')
+        )
+        return (comm_id, call_dict['call_name'], arguments, queue_message,
+                bool(settings.get('display_error')))
+
+    def _forget_call(self, call_id):
+        """Stop sending the calls identical to `call_id` to its reply."""
+        signature = self._call_signatures.pop(call_id, None)
+        if self._inflight_calls.get(signature) == call_id:
+            del self._inflight_calls[signature]
+
+    def _forget_comm_calls(self, comm_id):
+        """
+        Stop sending identical calls to the replies of the calls to `comm_id`
+        that were sent before.
+        """
+        self._inflight_calls = {
+            signature: call_id
+            for signature, call_id in self._inflight_calls.items()
+            if comm_id is not None and signature[0] not in (comm_id, None)
+        }
+
+    def _fail_call(self, call_dict, error):
+        """Pass an error to the future of a call that was not sent."""
+        call_id = call_dict['call_id']
+        self._forget_call(call_id)
+        self._reply_waitlist.pop(call_id, None)
+        future = self._futures.pop(call_id, None)
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def _clear_calls(self):
+        """Forget the calls sent to a comm that is not connected anymore."""
+        self._flush_timer.stop()
+        self._pending_calls = {}
+        self._inflight_calls = {}
+        self._call_signatures = {}
+        self._duplicate_calls = {}
+
+        futures = self._futures
+        self._futures = {}
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(
+                    CommError("The comm is not connected."))
+
+    def _register_call(self, call_dict, callback=None):
+        """Register the call, creating its future if it needs one."""
+        settings = call_dict['settings']
+        if settings.get('future'):
+            call_id = call_dict['call_id']
+            settings['send_reply'] = True
+            self._futures[call_id] = self._new_futures[call_id] = Future()
+        super(KernelComm, self)._register_call(call_dict, callback)
+
+    def _handle_unconnected_call(self, call_dict):
+        """Return a failed future if the call needs one."""
+        super(KernelComm, self)._handle_unconnected_call(call_dict)
+        if call_dict['settings'].get('future'):
+            future = Future()
+            future.set_exception(CommError("The comm is not connected."))
+            return future
+
     def _get_call_return_value(self, call_dict, comm_id):
         """
         Catch exception if call is not blocking.
         """
+        future = self._new_futures.pop(call_dict['call_id'], None)
+        if future is not None:
+            return future
+
         try:
             return super(KernelComm, self)._get_call_return_value(
                 call_dict, comm_id)
@@ -192,7 +410,12 @@ def got_reply():
 
         timeout_msg = "Timeout while waiting for {}".format(
             self._reply_waitlist)
-        self._wait(got_reply, self._sig_got_reply, timeout_msg, timeout)
+        try:
+            self._wait(got_reply, self._sig_got_reply, timeout_msg, timeout)
+        except TimeoutError:
+            # The reply could never come, so identical calls need to be sent
+            self._forget_call(call_id)
+            raise
 
     def _wait(self, condition, signal, timeout_msg, timeout):
         """
@@ -237,13 +460,54 @@ def _wait(self, condition, signal, timeout_msg, timeout):
         self.kernel_client.hb_channel.kernel_died.disconnect(
             wait_loop.quit)
 
-    def _handle_remote_call_reply(self, *args, **kwargs):
+    def _handle_remote_call_reply(self, msg_dict, buffers):
         """
         A blocking call received a reply.
         """
-        super(KernelComm, self)._handle_remote_call_reply(*args, **kwargs)
+        content = msg_dict['content']
+        call_id = content['call_id']
+        self._forget_call(call_id)
+        duplicates = self._duplicate_calls.pop(call_id, [])
+
+        # The reply is modified when it's handled, so it's copied to pass it
+        # to the identical calls.
+        if duplicates:
+            reply_content = dict(content)
+            reply_buffers = list(buffers or [])
+
+        future = self._futures.pop(call_id, None)
+        if future is not None:
+            self._set_future_result(future, content, buffers)
+        else:
+            super(KernelComm, self)._handle_remote_call_reply(
+                msg_dict, buffers)
+
+        for duplicate_id in duplicates:
+            duplicate_content = dict(reply_content, call_id=duplicate_id)
+            self._handle_remote_call_reply(
+                dict(msg_dict, content=duplicate_content),
+                list(reply_buffers)
+            )
+
         self._sig_got_reply.emit()
 
+    def _set_future_result(self, future, content, buffers):
+        """Pass the reply of a call to its future and callback."""
+        __, callback = self._reply_waitlist.pop(
+            content['call_id'], (False, None))
+        return_value = content['call_return_value']
+
+        if content['is_error']:
+            error_wrapper = CommsErrorWrapper.from_json(return_value)
+            future.set_exception(error_wrapper.etype(error_wrapper))
+            return
+
+        if buffers:
+            return_value = buffers[0]
+        if callback is not None:
+            callback(return_value)
+        future.set_result(return_value)
+
     def _async_error(self, error_wrapper):
         """
         Handle an error that was raised on the other side and sent back.
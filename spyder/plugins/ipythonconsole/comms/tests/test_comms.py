@@ -177,5 +177,104 @@ def handler(a, b):
     assert res == 'ab'
 
 
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_batched_calls(qtbot, comms, monkeypatch):
+    """Test that non-blocking calls are sent in a single message."""
+    kernel_comm, frontend_comm = comms
+    received = []
+    frontend_comm.register_call_handler('test_call', received.append)
+
+    sent_messages = []
+    send_message = kernel_comm._send_message
+
+    def _send_message(spyder_msg_type, *args, **kwargs):
+        sent_messages.append(spyder_msg_type)
+        return send_message(spyder_msg_type, *args, **kwargs)
+
+    monkeypatch.setattr(kernel_comm, '_send_message', _send_message)
+
+    for i in range(3):
+        kernel_comm.remote_call().test_call(i)
+    kernel_comm.remote_call().test_call(b'bytes')
+    assert received == []
+
+    qtbot.waitUntil(lambda: len(received) == 4)
+    assert received == [0, 1, 2, b'bytes']
+    assert sent_messages == ['remote_call_batch']
+
+    # Pending calls are sent before blocking ones
+    kernel_comm.remote_call().test_call(3)
+    kernel_comm.remote_call(blocking=True).test_call(4)
+    assert received[-2:] == [3, 4]
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_comm_features(qtbot, comms):
+    """Test that calls are only batched if the kernel can handle it."""
+    kernel_comm, frontend_comm = comms
+    assert kernel_comm._batch_supported
+
+    # Kernels that don't have the call to get their features
+    frontend_comm.unregister_call_handler('_get_comm_features')
+    kernel_comm._request_comm_features(kernel_comm.get_comm_id_list()[0])
+    qtbot.waitUntil(lambda: not kernel_comm._batch_supported)
+
+    received = []
+    frontend_comm.register_call_handler('test_call', received.append)
+    kernel_comm.remote_call().test_call(1)
+    assert received == [1]
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_future_calls(qtbot, comms):
+    """
+    Test that calls return futures and identical ones are sent once if they
+    can be deduplicated.
+    """
+    kernel_comm, frontend_comm = comms
+    received = []
+
+    def handler(value):
+        received.append(value)
+        return value * 2
+
+    frontend_comm.register_call_handler('test_call', handler)
+    frontend_comm.register_call_handler('test_error', lambda: 1 / 0)
+
+    first = kernel_comm.remote_call(future=True, dedupe=True).test_call(1)
+    duplicate = kernel_comm.remote_call(future=True, dedupe=True).test_call(1)
+    other = kernel_comm.remote_call(future=True, dedupe=True).test_call(2)
+    error = kernel_comm.remote_call(future=True).test_error()
+
+    qtbot.waitUntil(lambda: all(
+        future.done() for future in (first, duplicate, other, error)
+    ))
+    assert received == [1, 2]
+    assert first.result() == duplicate.result() == 2
+    assert other.result() == 4
+    assert isinstance(error.exception(), ZeroDivisionError)
+
+    # Calls are sent again once their reply arrived
+    assert kernel_comm.remote_call(
+        future=True, dedupe=True).test_call(1) is not None
+    qtbot.waitUntil(lambda: len(received) == 3)
+
+    # Calls that don't opt in are always sent
+    futures = [kernel_comm.remote_call(future=True).test_call(5)
+               for __ in range(2)]
+    qtbot.waitUntil(lambda: all(future.done() for future in futures))
+    assert received[3:] == [5, 5]
+
+    # Identical calls are sent again after any other call, which could
+    # change their result
+    futures = [
+        kernel_comm.remote_call(future=True, dedupe=True).test_call(6),
+        kernel_comm.remote_call(future=True).test_call(7),
+        kernel_comm.remote_call(future=True, dedupe=True).test_call(6),
+    ]
+    qtbot.waitUntil(lambda: all(future.done() for future in futures))
+    assert received[5:] == [6, 7, 6]
+
+
 if __name__ == "__main__":
     pytest.main()
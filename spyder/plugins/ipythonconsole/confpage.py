@@ -259,6 +259,40 @@ def setup_page(self):
         run_file_layout.addWidget(run_file_browser)
         run_file_group.setLayout(run_file_layout)
 
+        # Kernels Group
+        kernels_group = QGroupBox(_("Kernels"))
+        kernels_label = QLabel(_("Spyder starts kernels in advance so that "
+                                 "new consoles and restarts don't have to "
+                                 "wait for them."))
+        kernels_label.setWordWrap(True)
+        pool_spin = self.create_spinbox(
+            _("Kernels started in advance:"), "", 'kernel_pool_size',
+            min_=0, max_=10, step=1,
+            tip=_("Number of kernels kept ready for each interpreter.\n"
+                  "Each of them uses as much memory as an idle console."))
+        fork_server_box = newcb(
+            _("Fork new kernels from a process with preloaded modules"),
+            'fork_server',
+            tip=_("Kernels are started in a few milliseconds by forking a\n"
+                  "process that has already imported the modules below."))
+        preload_edit = self.create_lineedit(
+            _("Modules:"), 'fork_server/preload', alignment=Qt.Horizontal,
+            placeholder="numpy, pandas, matplotlib")
+        preload_edit.setEnabled(self.get_option('fork_server'))
+        fork_server_box.checkbox.toggled.connect(preload_edit.setEnabled)
+
+        # The fork server is only available on Linux
+        if not sys.platform.startswith('linux'):
+            fork_server_box.setEnabled(False)
+            preload_edit.setEnabled(False)
+
+        kernels_layout = QVBoxLayout()
+        kernels_layout.addWidget(kernels_label)
+        kernels_layout.addWidget(pool_spin)
+        kernels_layout.addWidget(fork_server_box)
+        kernels_layout.addWidget(preload_edit)
+        kernels_group.setLayout(kernels_layout)
+
         # ---- Advanced settings ----
         # Enable Jedi completion
         jedi_group = QGroupBox(_("Jedi completion"))
@@ -431,7 +465,7 @@ def setup_page(self):
 
         self.create_tab(
             _("Startup"),
-            [run_lines_group, run_file_group]
+            [run_lines_group, run_file_group, kernels_group]
         )
 
         self.create_tab(
@@ -2307,6 +2307,44 @@ def test_old_kernel_version(ipyconsole, qtbot):
     )
 
 
+def test_kernel_pool(ipyconsole, qtbot):
+    """
+    Check that several kernels are started in advance and used by new
+    consoles.
+    """
+    w = ipyconsole.get_widget()
+    ipyconsole.set_conf('kernel_pool_size', 2)
+
+    # Changing the pool size closes the kernels cached before
+    assert w._cached_kernel_properties is None
+
+    # Creating a console fills the pool
+    w.create_new_client()
+    pool = list(w._cached_kernels.values())[0]
+    assert len(pool) == 2
+    cached_kernel_handler = pool[0][-1]
+
+    # The next console uses the oldest kernel of the pool and another one is
+    # started to replace it.
+    w.create_new_client()
+    client = w.get_current_client()
+    assert client.kernel_handler is cached_kernel_handler
+    pool = list(w._cached_kernels.values())[0]
+    assert len(pool) == 2
+    assert cached_kernel_handler not in [properties[-1] for properties in pool]
+
+    # Check the console works
+    shell = client.shellwidget
+    qtbot.waitUntil(
+        lambda: shell.spyder_kernel_ready and shell._prompt_html is not None,
+        timeout=SHELL_TIMEOUT)
+    with qtbot.waitSignal(shell.executed):
+        shell.execute('a = 10')
+    assert shell.get_value('a') == 10
+
+    ipyconsole.set_conf('kernel_pool_size', 1)
+
+
 def test_run_script(ipyconsole, qtbot, tmp_path):
     """
     Test running multiple scripts at the same time.
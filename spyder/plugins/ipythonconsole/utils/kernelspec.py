@@ -12,6 +12,8 @@
 import logging
 import os
 import os.path as osp
+import re
+import sys
 
 # Third party imports
 from jupyter_client.kernelspec import KernelSpec
@@ -29,10 +31,10 @@
 from spyder.utils.environ import clean_env, get_user_environment_variables
 from spyder.utils.misc import get_python_executable
 from spyder.utils.programs import (
-    get_module_version,
+    check_version_range,
+    get_interpreter_capabilities,
     get_temp_dir,
     is_python_interpreter,
-    is_module_installed,
 )
 
 # Constants
@@ -59,19 +61,24 @@
 
 def has_spyder_kernels(pyexec):
     """Check if env has spyder kernels."""
-    if is_module_installed(
-        'spyder_kernels',
-        version=SPYDER_KERNELS_VERSION,
-        interpreter=pyexec
-    ):
+    # Try to not take a wrong decision if the interpreter check fails
+    if not is_python_interpreter(pyexec):
         return True
 
-    # Dev versions of Spyder-kernels are acceptable
-    try:
-        return "dev0" in get_module_version('spyder_kernels', pyexec)
-    except Exception:
+    capabilities = get_interpreter_capabilities(pyexec)
+    if capabilities is None:
+        return False
+
+    kernels_version = capabilities['packages'].get('spyder-kernels')
+    if kernels_version is None:
         return False
 
+    # Dev versions of Spyder-kernels are acceptable
+    return (
+        check_version_range(kernels_version, SPYDER_KERNELS_VERSION)
+        or "dev0" in kernels_version
+    )
+
 
 HERE = osp.dirname(os.path.realpath(__file__))
 
@@ -145,10 +152,23 @@ def argv(self):
             # This is necessary to avoid a spurious message on Windows.
             # Fixes spyder-ide/spyder#20800.
             '-Xfrozen_modules=off',
-            '-m', 'spyder_kernels.console',
-            '-f', '{connection_file}'
         ])
 
+        if self.get_conf('fork_server') and sys.platform.startswith('linux'):
+            # Fork kernels from a process that has already imported the
+            # modules selected by users.
+            preload = re.split(
+                r'[\s,]+', self.get_conf('fork_server/preload').strip())
+            kernel_cmd.extend([
+                '-m', 'spyder_kernels.console.forkserver',
+                '--preload', ','.join(name for name in preload if name),
+                '--parent-pid', str(os.getpid()),
+            ])
+        else:
+            kernel_cmd.extend(['-m', 'spyder_kernels.console'])
+
+        kernel_cmd.extend(['-f', '{connection_file}'])
+
         logger.info('Kernel command: {}'.format(kernel_cmd))
 
         return kernel_cmd
@@ -192,6 +212,8 @@ def env(self):
                 'umr/enabled', section='main_interpreter'),
             'SPY_UMR_VERBOSE': self.get_conf(
                 'umr/verbose', section='main_interpreter'),
+            'SPY_UMR_SMART': self.get_conf(
+                'umr/smart', section='main_interpreter'),
             'SPY_UMR_NAMELIST': ','.join(umr_namelist),
             'SPY_AUTOCALL_O': self.get_conf('autocall'),
             'SPY_GREEDY_O': self.get_conf('greedy_completer'),
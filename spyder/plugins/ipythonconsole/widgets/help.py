@@ -159,7 +159,8 @@ def is_defined(self, objtxt, force_import=False):
             return False
         try:
             return self.call_kernel(
-                blocking=True
+                blocking=True,
+                dedupe=True
                 ).is_defined(objtxt, force_import=force_import)
         except (TimeoutError, UnpicklingError, RuntimeError, CommError):
             return None
@@ -167,14 +168,16 @@ def is_defined(self, objtxt, force_import=False):
     def get_doc(self, objtxt):
         """Get object documentation dictionary"""
         try:
-            return self.call_kernel(blocking=True).get_doc(objtxt)
+            return self.call_kernel(
+                blocking=True, dedupe=True).get_doc(objtxt)
         except (TimeoutError, UnpicklingError, RuntimeError, CommError):
             return None
 
     def get_source(self, objtxt):
         """Get object source"""
         try:
-            return self.call_kernel(blocking=True).get_source(objtxt)
+            return self.call_kernel(
+                blocking=True, dedupe=True).get_source(objtxt)
         except (TimeoutError, UnpicklingError, RuntimeError, CommError):
             return None
 
@@ -861,6 +861,12 @@ def change_clients_out_prompt(self, value):
                     value)
 
     # ---- Advanced options
+    @on_conf_change(
+        option=['kernel_pool_size', 'fork_server', 'fork_server/preload'])
+    def change_kernels_started_in_advance(self, option, value):
+        # Kernels cached with the previous options are no longer useful
+        self.close_cached_kernel()
+
     @on_conf_change(option='greedy_completer')
     def change_clients_greedy_completer(self, value):
         for idx, client in enumerate(self.clients):
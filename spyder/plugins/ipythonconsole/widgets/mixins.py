@@ -13,30 +13,48 @@
 
 
 class CachedKernelMixin:
-    """Cached kernel mixin."""
+    """
+    Cached kernel mixin.
+
+    It keeps a pool of kernels started in advance for each interpreter, so
+    that new consoles and restarts don't have to wait for them.
+    """
+
+    # Maximum number of interpreters for which kernels are kept
+    MAX_CACHED_INTERPRETERS = 3
 
     def __init__(self):
         super().__init__()
-        self._cached_kernel_properties = None
+        # Lists of (kernel_spec, env, argv, kernel_handler) tuples, by argv.
+        # Interpreters are ordered from least to most recently used.
+        self._cached_kernels = {}
+
+    @property
+    def _cached_kernel_properties(self):
+        """Properties of the last kernel that was started in advance."""
+        if not self._cached_kernels:
+            return None
+        return list(self._cached_kernels.values())[-1][-1]
 
     def close_cached_kernel(self):
-        """Close the cached kernel."""
-        if self._cached_kernel_properties is None:
-            return
-        kernel = self._cached_kernel_properties[-1]
-        kernel.close(now=True)
-        self._cached_kernel_properties = None
-
-    def check_cached_kernel_spec(self, kernel_spec):
+        """Close all cached kernels."""
+        for pool in self._cached_kernels.values():
+            for properties in pool:
+                properties[-1].close(now=True)
+        self._cached_kernels = {}
+
+    def check_cached_kernel_spec(self, kernel_spec, cached_properties=None):
         """Test if kernel_spec corresponds to the cached kernel_spec."""
-        if self._cached_kernel_properties is None:
+        if cached_properties is None:
+            cached_properties = self._cached_kernel_properties
+        if cached_properties is None:
             return False
         (
             cached_spec,
             cached_env,
             cached_argv,
             _,
-        ) = self._cached_kernel_properties
+        ) = cached_properties
 
         # Call interrupt_mode so the dict will be the same
         kernel_spec.interrupt_mode
@@ -54,37 +72,57 @@ def check_cached_kernel_spec(self, kernel_spec):
         )
 
     def get_cached_kernel(self, kernel_spec, cache=True):
-        """Get a new kernel, and cache one for next time."""
-        # Cache another kernel for next time.
-        new_kernel_handler = KernelHandler.new_from_spec(kernel_spec)
-
+        """Get a new kernel, and cache others for next time."""
         if not cache:
             # remove/don't use cache if requested
             self.close_cached_kernel()
-            return new_kernel_handler
+            return KernelHandler.new_from_spec(kernel_spec)
+
+        # Take the pool of the interpreter out, so it's added back as the most
+        # recently used one.
+        argv = kernel_spec.argv
+        pool = self._cached_kernels.pop(tuple(argv), [])
 
-        # Check cached kernel has the same configuration as is being asked or
-        # it crashed.
-        cached_kernel_handler = None
-        if self._cached_kernel_properties is not None:
-            cached_kernel_handler = self._cached_kernel_properties[-1]
+        # Discard kernels that were started with a different configuration
+        # than the one being asked or that crashed.
+        valid_pool = []
+        for properties in pool:
             if (
-                not self.check_cached_kernel_spec(kernel_spec)
-                or cached_kernel_handler._init_stderr
+                self.check_cached_kernel_spec(kernel_spec, properties)
+                and not properties[-1]._init_stderr
             ):
-                # Close the kernel
-                self.close_cached_kernel()
-                cached_kernel_handler = None
-
-        # Cache the new kernel
-        self._cached_kernel_properties = (
-            kernel_spec,
-            kernel_spec.env,
-            kernel_spec.argv,
-            new_kernel_handler,
-        )
+                valid_pool.append(properties)
+            else:
+                properties[-1].close(now=True)
 
-        if cached_kernel_handler is None:
-            return KernelHandler.new_from_spec(kernel_spec)
+        if valid_pool:
+            kernel_handler = valid_pool.pop(0)[-1]
+        else:
+            kernel_handler = KernelHandler.new_from_spec(kernel_spec)
+
+        # Start kernels for next time
+        pool_size = max(self.get_conf('kernel_pool_size', default=1), 0)
+        for properties in valid_pool[pool_size:]:
+            properties[-1].close(now=True)
+        del valid_pool[pool_size:]
+
+        while len(valid_pool) < pool_size:
+            valid_pool.append(
+                (
+                    kernel_spec,
+                    kernel_spec.env,
+                    argv,
+                    KernelHandler.new_from_spec(kernel_spec),
+                )
+            )
+
+        if valid_pool:
+            self._cached_kernels[tuple(argv)] = valid_pool
+
+        # Close the kernels of the least recently used interpreters
+        while len(self._cached_kernels) > self.MAX_CACHED_INTERPRETERS:
+            oldest_argv = next(iter(self._cached_kernels))
+            for properties in self._cached_kernels.pop(oldest_argv):
+                properties[-1].close(now=True)
 
-        return cached_kernel_handler
+        return kernel_handler
@@ -349,7 +349,8 @@ def reset_kernel_state(self):
         self._reading = False
 
     def call_kernel(self, interrupt=False, blocking=False, callback=None,
-                    timeout=None, display_error=False):
+                    timeout=None, display_error=False, future=False,
+                    dedupe=False):
         """
         Send message to Spyder kernel connected to this console.
 
@@ -371,13 +372,28 @@ def call_kernel(self, interrupt=False, blocking=False, callback=None,
             used.
         display_error: bool
             If an error occurs, should it be printed to the console.
+        future: bool
+            Return a `concurrent.futures.Future` that gets the response
+            sent from the kernel, or the error raised by it, instead of
+            waiting for it. This can't be used with `blocking`.
+        dedupe: bool
+            Don't send the call if an identical one is still waiting for its
+            response, and get that response instead. Only use this for calls
+            that don't change the kernel state.
+
+        Notes
+        -----
+        Non-blocking calls made in the same event loop iteration are sent
+        to the kernel in a single message.
         """
         return self.kernel_handler.kernel_comm.remote_call(
             interrupt=interrupt,
             blocking=blocking,
             callback=callback,
             timeout=timeout,
-            display_error=display_error
+            display_error=display_error,
+            future=future,
+            dedupe=dedupe
         )
 
     @property
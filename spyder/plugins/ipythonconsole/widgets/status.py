@@ -15,7 +15,6 @@
 # Third-party imports
 from IPython.core import release as ipython_release
 from qtpy.QtCore import Signal
-from spyder_kernels.comms.frontendcomm import CommError
 from spyder_kernels.utils.pythonenv import PythonEnvInfo, PythonEnvType
 
 # Local imports
@@ -135,15 +134,45 @@ def on_kernel_start(self, shellwidget):
         # On Windows the following error appears:
         # `spyder_kernels.comms.commbase.CommError: The comm is not connected.`
         if running_in_ci() and not sys.platform.startswith("linux"):
-            mpl_backend = "inline"
+            self._set_matplotlib_backend(shellwidget, "inline")
         else:
-            # Needed when the comm is not connected.
-            # Fixes spyder-ide/spyder#22194
-            try:
-                mpl_backend = shellwidget.get_matplotlib_backend()
-            except CommError:
-                mpl_backend = None
+            # Get the backend without blocking the interface while the kernel
+            # replies
+            shellwidget.call_kernel(
+                interrupt=True,
+                future=True
+            ).get_matplotlib_backend().add_done_callback(
+                functools.partial(self._on_matplotlib_backend, shellwidget)
+            )
+
+    def remove_shellwidget(self, shellwidget):
+        """
+        Overridden method to remove the call handler registered by this widget.
+        """
+        shellwidget.kernel_handler.kernel_comm.unregister_call_handler(
+            "update_matplotlib_gui"
+        )
+        super().remove_shellwidget(shellwidget)
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _on_matplotlib_backend(self, shellwidget, future):
+        """Handle the backend sent by the kernel when it started."""
+        # The console could have been closed in the meantime
+        if shellwidget not in self.shellwidget_to_status:
+            return
+
+        # Needed when the comm is not connected.
+        # Fixes spyder-ide/spyder#22194
+        if future.exception() is None:
+            mpl_backend = future.result()
+        else:
+            mpl_backend = None
+
+        self._set_matplotlib_backend(shellwidget, mpl_backend)
 
+    def _set_matplotlib_backend(self, shellwidget, mpl_backend):
+        """Show the backend detected in a kernel that started."""
         # Associate detected backend to shellwidget
         self.shellwidget_to_status[shellwidget] = mpl_backend
 
@@ -158,15 +187,6 @@ def on_kernel_start(self, shellwidget):
         # Ask the kernel to update the current backend, in case it has changed
         shellwidget.set_kernel_configuration("update_gui", True)
 
-    def remove_shellwidget(self, shellwidget):
-        """
-        Overridden method to remove the call handler registered by this widget.
-        """
-        shellwidget.kernel_handler.kernel_comm.unregister_call_handler(
-            "update_matplotlib_gui"
-        )
-        super().remove_shellwidget(shellwidget)
-
 
 class PythonEnvironmentStatus(ShellConnectStatusBarWidget):
     """
@@ -150,6 +150,18 @@ def setup_page(self):
             msg_info=_("Please note that these changes will "
                        "be applied only to new consoles"),
         )
+        umr_smart_box = newcb(
+            _("Only reload modules that changed and the ones that "
+              "import them"),
+            'umr/smart',
+            tip=_("Modules that didn't change since they were imported are "
+                  "kept, which makes\nrunning files faster when they import "
+                  "large user packages."),
+            msg_info=_("Please note that these changes will "
+                       "be applied only to new consoles"),
+        )
+        umr_enabled_box.checkbox.toggled.connect(umr_smart_box.setEnabled)
+        umr_smart_box.setEnabled(self.get_option('umr/enabled'))
         umr_namelist_btn = QPushButton(
             _("Set UMR excluded (not reloaded) modules"))
         umr_namelist_btn.clicked.connect(self.set_umr_namelist)
@@ -158,6 +170,7 @@ def setup_page(self):
         umr_layout.addWidget(umr_label)
         umr_layout.addWidget(umr_enabled_box)
         umr_layout.addWidget(umr_verbose_box)
+        umr_layout.addWidget(umr_smart_box)
         umr_layout.addWidget(umr_namelist_btn)
         umr_group.setLayout(umr_layout)
 
@@ -24,7 +24,10 @@
 from spyder.config.base import is_conda_based_app
 from spyder.utils.envs import get_list_envs
 from spyder.utils.misc import get_python_executable
-from spyder.utils.programs import get_interpreter_info
+from spyder.utils.programs import (
+    get_interpreter_capabilities,
+    get_interpreters_info,
+)
 from spyder.utils.workers import WorkerManager
 
 
@@ -126,6 +129,7 @@ def on_executable_changed(self, value):
         # announce update
         interpreter = self.get_main_interpreter()
         self._update_interpreter(interpreter)
+        self._update_interpreter_capabilities()
         self.sig_interpreter_changed.emit(interpreter)
 
     def on_close(self):
@@ -184,6 +188,7 @@ def _update_envs(self):
         # Update custom envs
         last_envs: dict[str, tuple[str, str]] = self.get_conf("last_envs")
         if last_envs:
+            custom_envs = {}
             for env in last_envs:
                 if not(
                     last_envs[env][0] == self.internal_interpreter
@@ -192,10 +197,20 @@ def _update_envs(self):
                 ):
                     path = last_envs[env][0]
                     if osp.isfile(path):
-                        self._get_env_info(path)
+                        custom_envs[env] = path
                     else:
                         self.envs.pop(env)
 
+            # Get the version of all custom envs in parallel before updating
+            # their info.
+            versions = get_interpreters_info(list(custom_envs.values()))
+            for path in custom_envs.values():
+                self._get_env_info(path, versions[path])
+
+        # Keep the capabilities of the current interpreter up to date, so
+        # consoles don't have to wait to get them.
+        get_interpreter_capabilities(self._interpreter)
+
         # Update conda/pyenv envs
         return get_list_envs()
 
@@ -252,6 +267,14 @@ def _update_interpreter(self, interpreter=None):
             worker.start()
             worker.sig_finished.connect(self._finish_updating_interpreter)
 
+    def _update_interpreter_capabilities(self):
+        """Get the capabilities of the main interpreter in a thread."""
+        worker = self._worker_manager.create_python_worker(
+            get_interpreter_capabilities,
+            self._interpreter
+        )
+        worker.start()
+
     def _finish_updating_interpreter(self, worker, output, error):
         if output is None or error:
             return
@@ -260,8 +283,12 @@ def _finish_updating_interpreter(self, worker, output, error):
         # added in Preferences, which will update its info.
         self.sig_environments_updated.emit(self.envs)
 
-    def _get_env_info(self, path):
-        """Get environment information."""
+    def _get_env_info(self, path, version=None):
+        """
+        Get environment information.
+
+        The interpreter version is only computed if `version` is not given.
+        """
         with QMutexLocker(self._lock):
             original_path = path
             path = path.lower() if os.name == 'nt' else path
@@ -287,7 +314,10 @@ def _get_env_info(self, path):
                 else:
                     name = _("Custom") + ": " + env_name
 
-                version = get_interpreter_info(path)
+                if version is None:
+                    version = get_interpreters_info([original_path])[
+                        original_path
+                    ]
                 self.path_to_env[path] = name
                 self.envs[name] = (original_path, version)
 
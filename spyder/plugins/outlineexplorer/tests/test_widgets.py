@@ -248,6 +248,68 @@ def test_display_variables(create_outlineexplorer, qtbot):
         second_toggle_tree == initial_tree)
 
 
+def test_incremental_update(create_outlineexplorer, qtbot):
+    """
+    Test that only the symbols that changed are updated in the tree and the
+    rest of its items are kept.
+    """
+    outlineexplorer, expected_tree = create_outlineexplorer('text')
+    treewidget = outlineexplorer.treewidget
+    editor = treewidget.current_editor
+    root = treewidget.editor_items[editor.get_id()]
+
+    with open(CASES['text']['data'], 'r') as f:
+        symbol_info = json.load(f)
+
+    def get_symbol(parent, name):
+        return [c for c in parent.children if c.name == name][0]
+
+    # Expand an item and save the existing ones
+    d_symbol = get_symbol(root.children[0], 'd')
+    d_symbol.node.setExpanded(True)
+    d_item = d_symbol.node
+    inner_item = get_symbol(d_symbol, 'inner').node
+
+    # Remove a symbol and shift the lines of the rest
+    new_info = []
+    for symbol in symbol_info:
+        if symbol['name'] == 'inner':
+            continue
+        symbol_range = symbol['location']['range']
+        symbol_range['start']['line'] += 1
+        symbol_range['end']['line'] += 1
+        new_info.append(symbol)
+
+    editor.is_tree_updated = False
+    treewidget.update_editor(new_info, editor)
+    assert editor.is_tree_updated
+
+    # Items are the same, but with the updated position
+    d_symbol = get_symbol(root.children[0], 'd')
+    assert d_symbol.node is d_item
+    assert d_symbol.position == (14, 18)
+    assert d_item.isExpanded()
+
+    # The cached tree points to the displayed symbols
+    cached_tree = treewidget.editor_tree_cache[editor.get_id()]
+    assert any(interval.data is d_symbol for interval in cached_tree[14])
+    assert all(
+        interval.data.node is not inner_item for interval in cached_tree
+    )
+    assert len(cached_tree) == len(new_info)
+
+    # Removed symbols have no item anymore
+    assert d_symbol.children == []
+    assert d_item.childCount() == 0
+    assert inner_item.parent is None
+
+    # Tree is the same as the expected one when symbols are added back
+    treewidget.update_editor(symbol_info, editor)
+    d_symbol = get_symbol(root.children[0], 'd')
+    assert d_symbol.node is d_item
+    assert [c.name for c in d_symbol.children] == ['inner']
+
+
 if __name__ == "__main__":
     import os
     pytest.main(['-x', os.path.basename(__file__), '-v', '-rw'])
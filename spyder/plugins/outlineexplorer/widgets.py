@@ -316,6 +316,11 @@ def toggle_show_all_files(self, state):
             if self.show_all_files is False:
                 self.root_item_selected(
                     self.editor_items[self.editor_ids[current_editor]])
+            else:
+                # Update the trees of files that were not displayed before
+                for editor in self.editor_ids.keys():
+                    if editor.info is not None and not editor.is_tree_updated:
+                        self.update_editor(editor.info, editor)
             self.do_follow_cursor()
 
     @on_conf_change(option='show_comments')
@@ -541,40 +546,29 @@ def update_editor(self, items, editor=None):
             self.sig_hide_spinner.emit()
             return
 
+        # Only update the tree of the current file if it's the only one
+        # displayed. The others will be updated when they become current.
+        if not self.show_all_files and editor is not self.current_editor:
+            logger.debug(
+                f"Don't update tree of file {editor.fname} because it's not "
+                f"displayed"
+            )
+            editor.is_tree_updated = False
+            self.sig_hide_spinner.emit()
+            return
+
         update = self.update_tree(items, editor)
 
         if update:
-            self.save_expanded_state()
-            self.restore_expanded_state()
             self.do_follow_cursor()
 
-    def merge_interval(self, parent, node):
-        """Add node into an existing tree structure."""
-        match = False
-        start, end = node.position
-        while parent.parent is not None and not match:
-            parent_start, parent_end = parent.position
-            if parent_end <= start:
-                parent = parent.parent
-            else:
-                match = True
-
-        if node.parent is not None:
-            node.parent.remove_node(node)
-            node.parent = None
-            if node.node.parent is not None:
-                node.node.parent.remove_children(node.node)
-
-        parent.add_node(node)
-        node.refresh()
-        return node
-
     def update_tree(self, items, editor):
         """Update tree with new items that come from the LSP."""
         editor_id = editor.get_id()
         language = editor.get_language()
         current_tree = self.editor_tree_cache[editor_id]
         root = self.editor_items[editor_id]
+        symbols = []
         tree_info = []
 
         # Create tree with items that come from the LSP
@@ -597,6 +591,7 @@ def update_tree(self, items, editor):
             symbol_end = symbol_range['end']['line']
             symbol_repr = SymbolStatus(symbol_name, symbol_kind,
                                        (symbol_start, symbol_end), None)
+            symbols.append(symbol_repr)
             tree_info.append((symbol_start, symbol_end + 1, symbol_repr))
 
         tree = IntervalTree.from_tuples(tree_info)
@@ -619,29 +614,115 @@ def update_tree(self, items, editor):
 
         logger.debug(f"Updating tree for file {editor.fname}")
 
-        # Create nodes with new tree
-        for entry in sorted(tree):
-            entry.data.create_node()
-
-        # Remove previous tree to create the new one.
-        # NOTE: This is twice as fast as detecting the symbols that changed
-        # and updating only those in current_tree.
-        self.editor_items[editor_id].delete()
+        self.update_children(root, self.build_symbol_tree(root, symbols))
 
-        # Recreate tree structure
-        tree_copy = IntervalTree(tree)
-        tree_copy.merge_overlaps(
-            data_reducer=self.merge_interval,
-            data_initializer=root
+        # Save the tree of the symbols that are displayed now, which are the
+        # ones that have items, to find them from the cursor position.
+        self.editor_tree_cache[editor_id] = IntervalTree.from_tuples(
+            (symbol.position[0], symbol.position[1] + 1, symbol)
+            for symbol in self._iter_symbols(root)
         )
-
-        # Save new tree and finish
-        self.editor_tree_cache[editor_id] = tree
         editor.is_tree_updated = True
         self.sig_tree_updated.emit()
         self.sig_hide_spinner.emit()
         return True
 
+    def _iter_symbols(self, parent):
+        """Iterate over the symbols displayed under `parent`."""
+        for child in parent.children:
+            yield child
+            yield from self._iter_symbols(child)
+
+    def build_symbol_tree(self, root, symbols):
+        """
+        Nest `symbols` (SymbolStatus instances without nodes) according to
+        their positions and return the ones at the top level of `root`.
+
+        A symbol is a child of the closest previous symbol whose range
+        contains its first line.
+        """
+        top_level = []
+        last = None
+        for symbol in sorted(symbols, key=lambda s: s.position):
+            parent = last
+            start, __ = symbol.position
+            while parent is not None and (
+                parent.position[1] <= start
+                or parent.position == symbol.position
+            ):
+                parent = parent.parent
+
+            symbol.path = root.path
+            if parent is None:
+                top_level.append(symbol)
+            else:
+                symbol.parent = parent
+                parent.children.append(symbol)
+
+            last = symbol
+
+        # Parents are not needed anymore and they'd be outdated after
+        # updating the tree.
+        def clear_parents(symbols):
+            for symbol in symbols:
+                symbol.parent = None
+                clear_parents(symbol.children)
+
+        clear_parents(top_level)
+        return top_level
+
+    def update_children(self, parent, new_children):
+        """
+        Update the children of `parent` (a SymbolStatus already displayed in
+        the tree) to match `new_children`.
+
+        Symbols are matched by (name, kind) among siblings, so existing items
+        are kept, moved or updated, and only new symbols get new items.
+        """
+        old_children = {}
+        for child in parent.children:
+            old_children.setdefault((child.name, child.kind), []).append(child)
+
+        children = []
+        for new_child in new_children:
+            new_grandchildren = new_child.children
+            candidates = old_children.get((new_child.name, new_child.kind))
+
+            if candidates:
+                child = candidates.pop(0)
+                if child.position != new_child.position:
+                    child.position = new_child.position
+                    child.refresh()
+            else:
+                child = new_child
+                child.children = []
+                child.create_node()
+
+            child.parent = parent
+            child.path = parent.path
+            self.update_children(child, new_grandchildren)
+            children.append(child)
+
+        # Remove symbols that are not present anymore
+        for candidates in old_children.values():
+            for child in candidates:
+                child.parent = None
+                parent.node.remove_children(child.node)
+
+        # Put items in the right order
+        for index, child in enumerate(children):
+            child.index = index
+            current_index = parent.node.indexOfChild(child.node)
+            if current_index != index:
+                if current_index != -1:
+                    parent.node.takeChild(current_index)
+                parent.node.append_children(index, child.node)
+
+                # Items lose their expanded state when they are moved
+                child.node.setExpanded(child.status)
+
+        parent.children = children
+
     def remove_editor(self, editor):
         if editor in self.editor_ids:
             if self.current_editor is editor:
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Plots Plugin Configuration Page."""
+
+# Third party imports
+from qtpy.QtWidgets import QGridLayout, QGroupBox, QVBoxLayout
+
+# Local imports
+from spyder.config.base import _
+from spyder.api.preferences import PluginConfigPage
+
+
+class PlotsConfigPage(PluginConfigPage):
+
+    def setup_page(self):
+        newcb = self.create_checkbox
+
+        # Display group
+        display_group = QGroupBox(_("Display"))
+        mute_box = newcb(
+            _("Mute inline plotting"), 'mute_inline_plotting',
+            tip=_("Mute inline plotting in the ipython console."))
+        outline_box = newcb(_("Show plot outline"), 'show_plot_outline')
+
+        display_layout = QVBoxLayout()
+        display_layout.addWidget(mute_box)
+        display_layout.addWidget(outline_box)
+        display_group.setLayout(display_layout)
+
+        # Memory group
+        memory_group = QGroupBox(_("Memory"))
+        spill_box = newcb(
+            _("Save old plots to disk when they use more than:"),
+            'spill_to_disk',
+            tip=_("The figures of the oldest plots are saved to a temporary "
+                  "directory and loaded again when they are shown."))
+        budget_spin = self.create_spinbox(
+            "", _("MB"), 'memory_budget', min_=0, max_=65536, step=64)
+        spill_box.checkbox.toggled.connect(budget_spin.spinbox.setEnabled)
+        spill_box.checkbox.toggled.connect(budget_spin.slabel.setEnabled)
+        budget_spin.spinbox.setEnabled(self.get_option('spill_to_disk'))
+        budget_spin.slabel.setEnabled(self.get_option('spill_to_disk'))
+
+        memory_layout = QGridLayout()
+        memory_layout.addWidget(spill_box, 0, 0)
+        memory_layout.addWidget(budget_spin.spinbox, 0, 1)
+        memory_layout.addWidget(budget_spin.slabel, 0, 2)
+        memory_layout.setColumnStretch(3, 1)
+        memory_group.setLayout(memory_layout)
+
+        vlayout = QVBoxLayout()
+        vlayout.addWidget(display_group)
+        vlayout.addWidget(memory_group)
+        vlayout.addStretch(1)
+        self.setLayout(vlayout)
@@ -10,8 +10,11 @@
 
 # Local imports
 from spyder.api.plugins import Plugins, SpyderDockablePlugin
+from spyder.api.plugin_registration.decorators import (
+    on_plugin_available, on_plugin_teardown)
 from spyder.api.shellconnect.mixins import ShellConnectPluginMixin
 from spyder.api.translations import _
+from spyder.plugins.plots.confpage import PlotsConfigPage
 from spyder.plugins.plots.widgets.main_widget import PlotsWidget
 
 
@@ -21,10 +24,12 @@ class Plots(SpyderDockablePlugin, ShellConnectPluginMixin):
     """
     NAME = 'plots'
     REQUIRES = [Plugins.IPythonConsole]
+    OPTIONAL = [Plugins.Preferences]
     TABIFY = [Plugins.VariableExplorer, Plugins.Help]
     WIDGET_CLASS = PlotsWidget
     CONF_SECTION = NAME
     CONF_FILE = False
+    CONF_WIDGET_CLASS = PlotsConfigPage
     DISABLE_ACTIONS_WHEN_HIDDEN = False
 
     # ---- SpyderDockablePlugin API
@@ -46,6 +51,16 @@ def on_initialize(self):
         # a plot is generated.
         self.get_widget().sig_figure_loaded.connect(self._on_first_plot)
 
+    @on_plugin_available(plugin=Plugins.Preferences)
+    def on_preferences_available(self):
+        preferences = self.get_plugin(Plugins.Preferences)
+        preferences.register_plugin_preferences(self)
+
+    @on_plugin_teardown(plugin=Plugins.Preferences)
+    def on_preferences_teardown(self):
+        preferences = self.get_plugin(Plugins.Preferences)
+        preferences.deregister_plugin_preferences(self)
+
     # ---- Public API
     # ------------------------------------------------------------------------
     def add_plot(self, fig, fmt, shellwidget):
@@ -11,16 +11,20 @@
 """
 
 # Standard library imports
+from collections import OrderedDict
 import datetime
 import math
+import os
 import os.path as osp
 import sys
+import tempfile
 
 # Third library imports
 from qtconsole.svg import svg_to_clipboard, svg_to_image
 from qtpy import PYQT5, PYQT6
 from qtpy.compat import getexistingdirectory, getsavefilename
 from qtpy.QtCore import (
+    QByteArray,
     QEvent,
     QMimeData,
     QPoint,
@@ -31,7 +35,8 @@
     Signal,
     Slot,
 )
-from qtpy.QtGui import QDrag, QPainter, QPixmap
+from qtpy.QtGui import QDrag, QImage, QPainter, QPixmap
+from qtpy.QtSvg import QSvgRenderer
 from qtpy.QtWidgets import (QApplication, QFrame, QGridLayout, QLayout,
                             QScrollArea, QScrollBar, QSplitter, QStyle,
                             QVBoxLayout, QWidget, QStackedLayout)
@@ -41,7 +46,9 @@
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.palette import SpyderPalette
+from spyder.utils.programs import get_temp_dir
 from spyder.utils.stylesheet import AppStyle
+from spyder.utils.workers import WorkerManager
 from spyder.widgets.helperwidgets import PaneEmptyWidget
 
 
@@ -49,6 +56,49 @@
 # - [ ] Generalize style updates, handle dark_interface with widget option
 
 
+def render_figure(fig, fmt, width, fname=None):
+    """
+    Rasterize a figure to a QImage of the given width.
+
+    This only uses classes that are safe to use outside the main thread, so
+    it can be called from a worker.
+
+    Parameters
+    ----------
+    fig: bytes or str
+        The figure contents.
+    fmt: str
+        One of "image/png", "image/jpeg" and "image/svg+xml".
+    width: int
+        The width of the image.
+    fname: str, optional
+        If given, the figure contents are read from this file instead.
+    """
+    if fname is not None:
+        with open(fname, 'rb') as f:
+            fig = f.read()
+
+    if isinstance(fig, str):
+        fig = fig.encode('utf-8')
+
+    if fmt in ['image/png', 'image/jpeg']:
+        image = QImage.fromData(fig)
+        if not image.isNull():
+            image = image.scaledToWidth(width, mode=Qt.SmoothTransformation)
+    elif fmt == 'image/svg+xml':
+        renderer = QSvgRenderer(QByteArray(fig))
+        size = renderer.defaultSize()
+        if renderer.isValid() and size.width() > 0:
+            size = size.scaled(width, 0, Qt.KeepAspectRatioByExpanding)
+            image = svg_to_image(fig, size)
+        else:
+            image = QImage()
+    else:
+        image = QImage()
+
+    return image
+
+
 def save_figure_tofile(fig, fmt, fname):
     """Save fig to fname in the format specified by fmt."""
     root, ext = osp.splitext(fname)
@@ -161,6 +211,9 @@ def __init__(self, parent=None, background_color=None):
         self.zoom_disp_value = None
         self._update_when_shown = True
 
+        # To rasterize figures in threads
+        self._worker_manager = WorkerManager(self)
+
         # Setup the figure viewer.
         self.figviewer = FigureViewer(parent=self,
                                       background_color=self.background_color)
@@ -169,6 +222,7 @@ def __init__(self, parent=None, background_color=None):
         self.figviewer.sig_figure_loaded.connect(self.sig_figure_loaded)
         self.figviewer.sig_zoom_changed.connect(self.sig_zoom_changed)
         self.figviewer.sig_zoom_changed.connect(self._update_zoom_value)
+        self.figviewer.figcanvas.worker_manager = self._worker_manager
 
         # Setup the thumbnail scrollbar.
         self.thumbnails_sb = ThumbnailScrollBar(
@@ -176,6 +230,7 @@ def __init__(self, parent=None, background_color=None):
             parent=self,
             background_color=self.background_color,
         )
+        self.thumbnails_sb.worker_manager = self._worker_manager
         self.thumbnails_sb.sig_context_menu_requested.connect(
             self.sig_thumbnail_menu_requested)
         self.thumbnails_sb.sig_save_dir_changed.connect(
@@ -230,6 +285,12 @@ def setup(self, options):
                 self.show_fig_outline_in_viewer(value)
             elif option == 'save_dir':
                 self.thumbnails_sb.save_dir = value
+            elif option == 'spill_to_disk':
+                self.thumbnails_sb.spill_to_disk = value
+                self.thumbnails_sb.check_memory_budget()
+            elif option == 'memory_budget':
+                self.thumbnails_sb.memory_budget = value
+                self.thumbnails_sb.check_memory_budget()
 
     def set_pane_empty(self, empty):
         if empty:
@@ -336,6 +397,12 @@ def showEvent(self, event):
 
         super().showEvent(event)
 
+    def closeEvent(self, event):
+        """Release resources when the widget is closed."""
+        self.thumbnails_sb.remove_all_thumbnails()
+        self._worker_manager.terminate_all()
+        super().closeEvent(event)
+
 
 class FigureViewer(QScrollArea, SpyderWidgetMixin):
     """
@@ -721,6 +788,12 @@ def __init__(self, figure_viewer, parent=None, background_color=None):
         self.background_color = background_color
         self.save_dir = getcwd_or_home()
         self.current_thumbnail = None
+        self.worker_manager = None
+
+        # Save the figures of old thumbnails to disk when the ones kept in
+        # memory use more than memory_budget megabytes.
+        self.spill_to_disk = False
+        self.memory_budget = 512
         self.set_figureviewer(figure_viewer)
         self.setup_gui()
 
@@ -977,6 +1050,7 @@ def add_thumbnail(self, fig, fmt):
         thumbnail = FigureThumbnail(
             parent=self, background_color=self.background_color
         )
+        thumbnail.canvas.worker_manager = self.worker_manager
         thumbnail.canvas.load_figure(fig, fmt)
         thumbnail.sig_canvas_clicked.connect(self.set_current_thumbnail)
         thumbnail.sig_remove_figure_requested.connect(self.remove_thumbnail)
@@ -1004,6 +1078,37 @@ def add_thumbnail(self, fig, fmt):
         if not is_first and not stick_at_end:
             self._scroll_to_last_thumbnail = False
 
+        self.check_memory_budget()
+
+    def get_memory_usage(self):
+        """Return the memory used by the thumbnails' figures, in bytes."""
+        return sum(
+            thumbnail.canvas.get_memory_usage()
+            for thumbnail in self._thumbnails
+        )
+
+    def check_memory_budget(self):
+        """
+        Save the figures of the oldest thumbnails to disk until the memory
+        used by them is below the budget.
+        """
+        if not self.spill_to_disk or self.memory_budget is None:
+            return
+
+        budget = self.memory_budget * 1024 ** 2
+        usage = self.get_memory_usage()
+        for thumbnail in self._thumbnails:
+            if usage <= budget:
+                break
+
+            canvas = thumbnail.canvas
+            if thumbnail is self.current_thumbnail or canvas.is_spilled():
+                continue
+
+            previous_usage = canvas.get_memory_usage()
+            canvas.spill(get_temp_dir(suffix='plots'))
+            usage -= previous_usage - canvas.get_memory_usage()
+
     def remove_current_thumbnail(self):
         """Remove the currently selected thumbnail."""
         if self.current_thumbnail is not None:
@@ -1019,6 +1124,7 @@ def remove_all_thumbnails(self):
             thumbnail.setParent(None)
             thumbnail.hide()
             thumbnail.close()
+            thumbnail.canvas.clear_canvas()
 
         self._thumbnails = []
         self.current_thumbnail = None
@@ -1055,6 +1161,7 @@ def remove_thumbnail(self, thumbnail):
         self.layout().removeWidget(thumbnail)
         thumbnail.hide()
         thumbnail.close()
+        thumbnail.canvas.clear_canvas()
 
         # See: spyder-ide/spyder#12459
         QTimer.singleShot(
@@ -1290,6 +1397,9 @@ class FigureCanvas(QFrame):
     A basic widget on which can be painted a custom png, jpg, or svg image.
     """
 
+    # Maximum number of rasterized sizes kept in memory for a figure
+    MAX_RASTERS = 3
+
     sig_context_menu_requested = Signal(QPoint)
     """
     This signal is emitted to request a context menu.
@@ -1308,15 +1418,41 @@ def __init__(self, parent=None, background_color=None):
         self.setStyleSheet(
             "#figcanvas {background-color:" + str(background_color) + "}")
 
-        self.fig = None
         self.fmt = None
         self.fwidth, self.fheight = 200, 200
+        self.worker_manager = None
+        self._fig = None
+        self._fig_file = None
+        self._fig_is_text = False
         self._blink_flag = False
+        self._qpix_orig = None
+
+        # Images of the figure rasterized at different widths
+        self._rasters = OrderedDict()
+        self._pending_rasters = set()
+
+        # Used to discard rasters of previous figures that are received after
+        # a new one was loaded.
+        self._generation = 0
 
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(
             self.sig_context_menu_requested)
 
+    @property
+    def fig(self):
+        """The figure contents, which are read from disk if spilled."""
+        if self._fig is None and self._fig_file is not None:
+            try:
+                with open(self._fig_file, 'rb') as f:
+                    fig = f.read()
+            except OSError:
+                return None
+
+            return fig.decode('utf-8') if self._fig_is_text else fig
+
+        return self._fig
+
     @Slot()
     def copy_figure(self):
         """Copy figure to clipboard."""
@@ -1333,7 +1469,7 @@ def copy_figure(self):
 
     def blink_figure(self):
         """Blink figure once."""
-        if self.fig:
+        if self.fmt is not None:
             self._blink_flag = not self._blink_flag
             self.repaint()
             if self._blink_flag:
@@ -1342,28 +1478,84 @@ def blink_figure(self):
 
     def clear_canvas(self):
         """Clear the figure that was painted on the widget."""
-        self.fig = None
+        self._remove_fig_file()
+        self._fig = None
         self.fmt = None
-        self._qpix_scaled = None
+        self._qpix_orig = None
+        self._clear_rasters()
         self.repaint()
 
     def load_figure(self, fig, fmt):
         """
-        Load the figure from a png, jpg, or svg image, convert it in
-        a QPixmap, and force a repaint of the widget.
+        Load the figure from a png, jpg, or svg image and force a repaint of
+        the widget.
+
+        The figure is rasterized at the size it's painted when that's
+        necessary.
         """
-        self.fig = fig
+        self._remove_fig_file()
+        self._fig = fig
         self.fmt = fmt
+        self._qpix_orig = None
+        self._clear_rasters()
 
         if fmt in ['image/png', 'image/jpeg']:
             self._qpix_orig = QPixmap()
             self._qpix_orig.loadFromData(fig, fmt.upper())
+            self.fwidth = self._qpix_orig.width()
+            self.fheight = self._qpix_orig.height()
         elif fmt == 'image/svg+xml':
-            self._qpix_orig = QPixmap(svg_to_image(fig))
+            # Only get the figure size here, which doesn't require to render
+            # it.
+            svg = fig.encode('utf-8') if isinstance(fig, str) else fig
+            size = QSvgRenderer(QByteArray(svg)).defaultSize()
+            self.fwidth = max(size.width(), 0)
+            self.fheight = max(size.height(), 0)
+
+    def is_spilled(self):
+        """Return True if the figure contents were saved to disk."""
+        return self._fig_file is not None
+
+    def spill(self, dirname):
+        """
+        Save the figure contents to a file in dirname and only keep in memory
+        the image currently painted on the widget.
+        """
+        if self._fig is None or self.is_spilled():
+            return
+
+        fext = {'image/png': '.png',
+                'image/jpeg': '.jpg',
+                'image/svg+xml': '.svg'}.get(self.fmt, '')
+        self._fig_is_text = isinstance(self._fig, str)
+        try:
+            fd, fname = tempfile.mkstemp(suffix=fext, dir=dirname)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(
+                    self._fig.encode('utf-8') if self._fig_is_text
+                    else self._fig
+                )
+        except OSError:
+            return
 
-        self._qpix_scaled = self._qpix_orig
-        self.fwidth = self._qpix_orig.width()
-        self.fheight = self._qpix_orig.height()
+        self._fig_file = fname
+        self._fig = None
+        self._qpix_orig = None
+        while len(self._rasters) > 1:
+            self._rasters.popitem(last=False)
+
+    def get_memory_usage(self):
+        """Return an estimate of the memory used by the figure, in bytes."""
+        usage = len(self._fig) if self._fig is not None else 0
+
+        pixmaps = list(self._rasters.values())
+        if self._qpix_orig is not None:
+            pixmaps.append(self._qpix_orig)
+
+        for pixmap in pixmaps:
+            usage += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+        return usage
 
     def paintEvent(self, event):
         """Qt method override to paint a custom image on the Widget."""
@@ -1374,22 +1566,105 @@ def paintEvent(self, event):
                      self.size().width() - 2 * fw,
                      self.size().height() - 2 * fw)
 
-        if self.fig is None or self._blink_flag:
+        if self.fmt is None or self._blink_flag:
             return
 
-        # Prepare the scaled qpixmap to paint on the widget.
-        if (self._qpix_scaled is None or
-                self._qpix_scaled.size().width() != rect.width()):
-            if self.fmt in ['image/png', 'image/jpeg']:
-                self._qpix_scaled = self._qpix_orig.scaledToWidth(
-                    rect.width(), mode=Qt.SmoothTransformation)
-            elif self.fmt == 'image/svg+xml':
-                self._qpix_scaled = QPixmap(svg_to_image(
-                    self.fig, rect.size()))
-
-        if self._qpix_scaled is not None:
+        # Get the scaled qpixmap to paint on the widget.
+        qpix_scaled = self._get_raster(rect.width())
+
+        if qpix_scaled is not None and not qpix_scaled.isNull():
             # Paint the image on the widget.
             qp = QPainter()
             qp.begin(self)
-            qp.drawPixmap(rect, self._qpix_scaled)
+            qp.drawPixmap(rect, qpix_scaled)
             qp.end()
+
+    # ---- Private API
+    def _remove_fig_file(self):
+        """Remove the file where the figure was spilled, if any."""
+        if self._fig_file is not None:
+            try:
+                os.remove(self._fig_file)
+            except OSError:
+                pass
+            self._fig_file = None
+
+    def _clear_rasters(self):
+        """Remove all rasterized images of the current figure."""
+        self._generation += 1
+        self._rasters = OrderedDict()
+        self._pending_rasters = set()
+
+    def _get_raster(self, width):
+        """
+        Return the figure rasterized at width.
+
+        If it's not available, it's rendered in a thread and the closest
+        image we have is returned in the meantime.
+        """
+        if width in self._rasters:
+            self._rasters.move_to_end(width)
+            pixmap = self._rasters[width]
+
+            # This happens for broken images. In that case we show the
+            # original pixmap, which is replaced by a broken image icon.
+            if pixmap.isNull() and self._qpix_orig is not None:
+                return self._qpix_orig
+
+            return pixmap
+
+        if width not in self._pending_rasters:
+            self._pending_rasters.add(width)
+            generation = self._generation
+
+            if self.worker_manager is None:
+                self._add_raster(
+                    generation,
+                    width,
+                    render_figure(self._fig, self.fmt, width,
+                                  fname=self._fig_file)
+                )
+                return self._get_raster(width)
+            else:
+                worker = self.worker_manager.create_python_worker(
+                    render_figure, self._fig, self.fmt, width,
+                    fname=self._fig_file
+                )
+                worker.generation = generation
+                worker.width = width
+                worker.sig_finished.connect(self._on_raster_finished)
+                worker.start()
+
+        # Use the closest image we have while the figure is rasterized
+        if self._rasters:
+            return next(reversed(self._rasters.values()))
+        else:
+            return self._qpix_orig
+
+    def _on_raster_finished(self, worker, output, error):
+        """Handle a figure rasterized in a thread."""
+        try:
+            self._add_raster(
+                worker.generation,
+                worker.width,
+                output if error is None else QImage()
+            )
+            self.update()
+        except RuntimeError:
+            # The widget was removed before the figure was rasterized
+            pass
+
+    def _add_raster(self, generation, width, image):
+        """Save an image of the figure rasterized at width."""
+        if generation != self._generation:
+            return
+
+        self._pending_rasters.discard(width)
+        if image is None or image.isNull():
+            pixmap = QPixmap()
+        else:
+            pixmap = QPixmap.fromImage(image)
+
+        self._rasters[width] = pixmap
+        while len(self._rasters) > self.MAX_RASTERS:
+            self._rasters.popitem(last=False)
@@ -282,7 +282,13 @@ def update_actions(self):
         self.zoom_disp.setEnabled(value)
 
     @on_conf_change(
-        option=["mute_inline_plotting", "show_plot_outline", "save_dir"]
+        option=[
+            "mute_inline_plotting",
+            "show_plot_outline",
+            "save_dir",
+            "spill_to_disk",
+            "memory_budget",
+        ]
     )
     def on_section_conf_change(self, option, value):
         for index in range(self.count()):
@@ -329,6 +335,8 @@ def switch_widget(self, fig_browser, old_fig_browser):
             ("mute_inline_plotting", True),
             ("show_plot_outline", True),
             ("save_dir", getcwd_or_home()),
+            ("spill_to_disk", False),
+            ("memory_budget", 512),
         ]
 
         conf_values = {k: self.get_conf(k, d) for k, d in option_keys}
@@ -223,6 +223,31 @@ def test_close_current_figure(figbrowser, tmpdir, fmt):
     assert figbrowser.figviewer.figcanvas.fig is None
 
 
+@pytest.mark.parametrize("fmt", ['image/png', 'image/svg+xml'])
+def test_spill_figures_to_disk(figbrowser, tmpdir, fmt):
+    """
+    Test that figures of old thumbnails are saved to disk when they use more
+    memory than the budget.
+    """
+    figbrowser.setup({'spill_to_disk': True, 'memory_budget': 0})
+    figs = add_figures_to_browser(figbrowser, 3, tmpdir, fmt)
+    thumbnails = figbrowser.thumbnails_sb._thumbnails
+
+    # Only the current figure is kept in memory
+    assert [t.canvas.is_spilled() for t in thumbnails] == [True, True, False]
+    assert [t.canvas.fig for t in thumbnails] == figs
+
+    # Spilled figures can be displayed in the viewer
+    figbrowser.go_next_thumbnail()
+    assert figbrowser.figviewer.figcanvas.fig == figs[0]
+
+    # Files are removed when figures are closed
+    spilled_file = thumbnails[1].canvas._fig_file
+    assert osp.isfile(spilled_file)
+    figbrowser.close_all_figures()
+    assert not osp.isfile(spilled_file)
+
+
 @pytest.mark.parametrize("fmt", ['image/png', 'image/svg+xml'])
 def test_close_all_figures(figbrowser, tmpdir, fmt):
     """
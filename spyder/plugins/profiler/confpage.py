@@ -35,7 +35,20 @@ def setup_page(self):
         results_layout.addWidget(results_label2)
         results_group.setLayout(results_layout)
 
+        run_group = QGroupBox(_("Run"))
+        console_box = self.create_checkbox(
+            _("Profile files in the current console"),
+            'profile_in_console',
+            tip=_("Profile files in the IPython console, with the variables "
+                  "defined in it, instead of a separate process")
+        )
+
+        run_layout = QVBoxLayout()
+        run_layout.addWidget(console_box)
+        run_group.setLayout(run_layout)
+
         vlayout = QVBoxLayout()
+        vlayout.addWidget(run_group)
         vlayout.addWidget(results_group)
         vlayout.addStretch(1)
         self.setLayout(vlayout)
@@ -19,7 +19,7 @@
 from spyder.api.plugin_registration.decorators import (
     on_plugin_available, on_plugin_teardown)
 from spyder.api.translations import _
-from spyder.plugins.editor.api.run import FileRun
+from spyder.plugins.editor.api.run import CellRun, FileRun
 from spyder.plugins.mainmenu.api import ApplicationMenus, RunMenuSections
 from spyder.plugins.profiler.api import ProfilerPyConfiguration
 from spyder.plugins.profiler.confpage import ProfilerConfigPage
@@ -39,7 +39,7 @@ class Profiler(SpyderDockablePlugin, RunExecutor):
 
     NAME = 'profiler'
     REQUIRES = [Plugins.Preferences, Plugins.Editor, Plugins.Run]
-    OPTIONAL = []
+    OPTIONAL = [Plugins.IPythonConsole]
     TABIFY = [Plugins.VariableExplorer, Plugins.Help]
     WIDGET_CLASS = ProfilerWidget
     CONF_SECTION = NAME
@@ -90,6 +90,22 @@ def on_initialize(self):
                 'requires_cwd': True,
                 'priority': 3
             },
+            {
+                'input_extension': 'py',
+                'context': {'name': 'Cell'},
+                'output_formats': [],
+                'configuration_widget': None,
+                'requires_cwd': True,
+                'priority': 3
+            },
+            {
+                'input_extension': 'ipy',
+                'context': {'name': 'Cell'},
+                'output_formats': [],
+                'configuration_widget': None,
+                'requires_cwd': True,
+                'priority': 3
+            },
         ]
 
     @on_plugin_available(plugin=Plugins.Editor)
@@ -124,6 +140,25 @@ def on_run_available(self):
                 shortcut_widget_context=Qt.ApplicationShortcut,
             )
 
+            run.create_run_in_executor_button(
+                RunContext.Cell,
+                self.NAME,
+                text=_("Run profiler on cell"),
+                tip=_("Profile the current cell in the console"),
+                icon=self.create_icon('profiler'),
+                add_to_menu={
+                    "menu": ApplicationMenus.Run,
+                    "section": RunMenuSections.RunInExecutors
+                },
+            )
+
+    @on_plugin_available(plugin=Plugins.IPythonConsole)
+    def on_ipyconsole_available(self):
+        ipyconsole = self.get_plugin(Plugins.IPythonConsole)
+        ipyconsole.register_spyder_kernel_call_handler(
+            'show_profile_data', self._show_profile_data
+        )
+
     @on_plugin_teardown(plugin=Plugins.Editor)
     def on_editor_teardown(self):
         widget = self.get_widget()
@@ -142,6 +177,13 @@ def on_run_teardown(self):
             self, self.executor_configuration)
         run.destroy_run_in_executor_button(
             RunContext.File, self.NAME)
+        run.destroy_run_in_executor_button(
+            RunContext.Cell, self.NAME)
+
+    @on_plugin_teardown(plugin=Plugins.IPythonConsole)
+    def on_ipyconsole_teardown(self):
+        ipyconsole = self.get_plugin(Plugins.IPythonConsole)
+        ipyconsole.unregister_spyder_kernel_call_handler('show_profile_data')
 
     # ---- Public API
     # -------------------------------------------------------------------------
@@ -182,8 +224,53 @@ def run_file(
         wdir = cwd_opts['path']
         args = params['args']
 
+        console = self.get_plugin(Plugins.IPythonConsole)
+        if self.get_conf('profile_in_console') and console is not None:
+            # Results are sent back by the kernel to _show_profile_data
+            console.run_script(
+                filename,
+                wdir,
+                args,
+                post_mortem=False,
+                current_client=True,
+                clear_variables=False,
+                console_namespace=True,
+                method="profilefile",
+            )
+            return
+
         self.get_widget().analyze(
             filename,
             wdir=wdir,
             args=args
         )
+
+    @run_execute(context=RunContext.Cell)
+    def run_cell(
+        self,
+        input: RunConfiguration,
+        conf: ExtendedRunExecutionParameters
+    ) -> List[PossibleRunResult]:
+        console = self.get_plugin(Plugins.IPythonConsole)
+        if console is None:
+            return
+
+        run_input: CellRun = input['run_input']
+        if run_input['copy']:
+            # Cells are only profiled when run from their file
+            return
+
+        self.switch_to_plugin()
+        console.run_cell(
+            run_input['cell'],
+            run_input['cell_name'],
+            run_input['path'],
+            method="profilecell",
+        )
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _show_profile_data(self, profile_data, filename):
+        """Show profiling data sent by a kernel."""
+        self.switch_to_plugin()
+        self.get_widget().show_profile_data(profile_data, filename)
@@ -9,6 +9,10 @@
 """
 
 
+# Standard library imports
+import cProfile
+import marshal
+
 # Third party imports
 from qtpy.QtGui import QIcon
 import pytest
@@ -101,5 +105,26 @@ class Stats:
                                   ['2.00 s', ['-400.00 ms', SUCESS]]]
 
 
+def test_load_kernel_profile_data(profiler_datatree_bot, tmp_path):
+    """
+    Test that the profiling data sent by kernels can be loaded in the tree.
+    """
+    tree = profiler_datatree_bot
+
+    # This is what kernels send after profiling files or cells
+    profiler = cProfile.Profile()
+    profiler.runctx("sorted(range(1000), key=str)", {}, {})
+    profiler.create_stats()
+    datafile = tmp_path / "profile.results"
+    datafile.write_bytes(marshal.dumps(profiler.stats))
+
+    tree.compare_file = None
+    tree.load_data(str(datafile))
+    tree.show_tree()
+
+    assert tree.profdata is not None
+    assert tree.get_top_level_items()
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -453,6 +453,35 @@ def analyze(self, filename, wdir=None, args=None):
 
             self.start(wdir, args)
 
+    def show_profile_data(self, profile_data, filename):
+        """
+        Show the results of profiling code in a console.
+
+        Parameters
+        ----------
+        profile_data: bytes
+            Profiling data, in the format cProfile saves it to a file.
+        filename: str
+            Path to the file whose code was profiled.
+        """
+        self._kill_if_running()
+
+        try:
+            with open(self.DATAPATH, 'wb') as f:
+                f.write(profile_data)
+        except OSError as error:
+            logger.debug(f"Could not save profiling data: {error}")
+            return
+
+        if filename not in [self.filecombo.itemText(idx)
+                            for idx in range(self.filecombo.count())]:
+            self.filecombo.addItem(filename)
+        self.filecombo.setCurrentIndex(self.filecombo.findText(filename))
+
+        self.show_data()
+        self.save_action.setEnabled(True)
+        self.update_actions()
+
     def select_file(self, filename=None):
         """
         Select filename to profile.
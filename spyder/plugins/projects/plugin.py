@@ -147,6 +147,7 @@ def on_editor_available(self):
         widget.sig_project_closed.connect(self._unset_path_in_editor)
         # To handle switcher open request
         widget.sig_open_file_requested.connect(editor.load)
+        widget.sig_open_symbol_requested.connect(self._open_symbol)
 
     @on_plugin_available(plugin=Plugins.Completions)
     def on_completions_available(self):
@@ -214,6 +215,11 @@ def on_switcher_available(self):
             self._handle_switcher_selection)
         self._switcher.sig_search_text_available.connect(
             self._handle_switcher_search)
+        self._switcher.sig_mode_search_text_available.connect(
+            self._handle_switcher_mode_search)
+        self._switcher.add_mode(
+            self.get_widget().SYMBOLS_MODE, _('Go to Symbol in Project')
+        )
 
     @on_plugin_teardown(plugin=Plugins.Editor)
     def on_editor_teardown(self):
@@ -236,6 +242,7 @@ def on_editor_teardown(self):
         widget.sig_project_closed.disconnect(self._unset_path_in_editor)
         # To handle switcher open request
         widget.sig_open_file_requested.disconnect(editor.load)
+        widget.sig_open_symbol_requested.disconnect(self._open_symbol)
 
     @on_plugin_teardown(plugin=Plugins.Completions)
     def on_completions_teardown(self):
@@ -278,12 +285,16 @@ def on_switcher_teardown(self):
             self._handle_switcher_selection)
         self._switcher.sig_search_text_available.disconnect(
             self._handle_switcher_search)
+        self._switcher.sig_mode_search_text_available.disconnect(
+            self._handle_switcher_mode_search)
+        self._switcher.remove_mode(self.get_widget().SYMBOLS_MODE)
         self._switcher = None
 
     def on_close(self, cancelable=False):
         """Perform actions before parent main window is closed"""
         self.get_widget().save_config()
         self.get_widget().watcher.stop()
+        self.get_widget().symbol_indexer.stop()
         return True
 
     def on_mainwindow_visible(self):
@@ -497,14 +508,19 @@ def _handle_switcher_modes(self, mode):
         Populate switcher with files in active project.
 
         List the file names of the current active project with their
-        directories in the switcher. It only handles the files mode, i.e.
-        an empty string.
+        directories in the switcher. It handles the files mode, i.e. an
+        empty string, and clears the switcher for the project symbols mode.
 
         Parameters
         ----------
         mode: str
             The selected mode (open files "", symbol "@" or line ":").
         """
+        if mode == self.get_widget().SYMBOLS_MODE:
+            self._switcher.clear()
+            self._switcher.set_placeholder_text(_('Search symbols by name'))
+            return
+
         # Don't compute anything if we're not in files mode
         if mode != "":
             return
@@ -542,6 +558,45 @@ def _handle_switcher_search(self, search_text):
         """
         self.get_widget().handle_switcher_search(search_text)
 
+    def _handle_switcher_mode_search(self, mode, search_text):
+        """
+        Handle user typing in switcher to filter results in other modes.
+
+        Parameters
+        ----------
+        mode: str
+            The current mode.
+        search_text: str
+            The current search text in the switcher dialog box.
+        """
+        if mode == self.get_widget().SYMBOLS_MODE:
+            self.get_widget().display_switcher_symbols(search_text)
+
+    def _display_symbols_in_switcher(self, items):
+        """
+        Display a list of symbols in the switcher, replacing the ones that
+        were shown.
+
+        Parameters
+        ----------
+        items: list
+            Items to display.
+        """
+        self._switcher.clear()
+        for (title, description, icon, data, is_last_item) in items:
+            self._switcher.add_item(
+                title=title,
+                description=description,
+                icon=icon,
+                section=_("Symbols in project"),
+                data=data,
+                last_item=is_last_item,
+            )
+
+    def _open_symbol(self, path, line):
+        editor = self.get_plugin(Plugins.Editor)
+        editor.load(path, goto=line)
+
     def _display_items_in_switcher(self, items, setup, clear_section):
         """
         Display a list of items in the switcher.
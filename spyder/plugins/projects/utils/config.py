@@ -18,6 +18,14 @@
 ENCODING = 'encoding'
 VCS = 'vcs'
 
+# Folders that are neither watched nor indexed, in addition to the hidden ones
+FOLDERS_TO_IGNORE = [
+    "__pycache__",
+    "build",
+    "node_modules",
+    "site-packages",
+]
+
 
 # Project configuration defaults
 PROJECT_DEFAULTS = [
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Background indexer of the symbols defined in a project."""
+
+# Standard lib imports
+import hashlib
+import logging
+import os
+import os.path as osp
+
+# Third-party imports
+from qtpy.QtCore import QObject, QTimer, Signal
+
+# Local imports
+from spyder.config.base import get_conf_path
+from spyder.plugins.projects.utils.symbols import (
+    SymbolIndex, update_symbol_index)
+from spyder.utils.workers import WorkerManager
+
+
+# ---- Constants
+# -----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+# Time to wait for more changes before updating the index, in milliseconds
+UPDATE_DELAY = 1000
+
+
+def get_index_path(root_path):
+    """Return the path of the symbol index of a project."""
+    index_dir = get_conf_path('symbols')
+    os.makedirs(index_dir, exist_ok=True)
+    name = hashlib.sha1(
+        osp.normcase(osp.abspath(root_path)).encode('utf-8', 'surrogatepass')
+    ).hexdigest()
+    return osp.join(index_dir, name + '.sqlite')
+
+
+# ---- Indexer
+# -----------------------------------------------------------------------------
+class ProjectSymbolIndexer(QObject):
+    """
+    Keep the symbol index of a project up to date.
+
+    Files are parsed in a worker thread, which uses several processes when
+    many files changed, and searches are answered from the index on disk.
+    """
+
+    sig_index_updated = Signal()
+    """This signal is emitted when the symbols of some files changed."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root_path = None
+        self._index = None
+        self._pending = set()
+        self._full_update = False
+        self._running = False
+
+        self._worker_manager = WorkerManager(self, max_threads=1)
+
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(UPDATE_DELAY)
+        self._update_timer.timeout.connect(self._update)
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def start(self, root_path):
+        """Index the files of the project at `root_path`."""
+        self.stop()
+        try:
+            self._index = SymbolIndex(get_index_path(root_path))
+        except Exception:
+            logger.debug(f"Symbol index could not be opened for {root_path}")
+            return
+
+        self._root_path = root_path
+        self._full_update = True
+        self._update()
+
+    def stop(self):
+        """Stop indexing the current project."""
+        self._update_timer.stop()
+        self._worker_manager.terminate_all()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        self._root_path = None
+        self._pending = set()
+        self._full_update = False
+        self._running = False
+
+    def update_paths(self, paths):
+        """Update the symbols of files or directories that changed."""
+        if self._root_path is None:
+            return
+        self._pending.update(paths)
+        self._update_timer.start()
+
+    def search(self, text, limit=100):
+        """
+        Return the symbols whose name contains `text`.
+
+        See `SymbolIndex.search` for the format of the results.
+        """
+        if self._index is None:
+            return []
+        return self._index.search(text, limit)
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _update(self):
+        # Changes made while updating are applied when the update finishes
+        if self._running or not (self._full_update or self._pending):
+            return
+
+        paths = None if self._full_update else sorted(self._pending)
+        self._full_update = False
+        self._pending = set()
+        self._running = True
+
+        worker = self._worker_manager.create_python_worker(
+            update_symbol_index, self._index.db_path, self._root_path, paths
+        )
+        worker.sig_finished.connect(self._on_updated)
+        worker.start()
+
+    def _on_updated(self, worker, output, error):
+        self._running = False
+        if error is not None:
+            logger.debug(f"Error while indexing symbols: {error}")
+        elif output:
+            self.sig_index_updated.emit()
+        self._update()
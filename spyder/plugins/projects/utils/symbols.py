@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the symbols defined in the Python files of a project.
+
+This module is imported by the processes that parse files, so it must not
+import Qt.
+"""
+
+# Standard library imports
+import ast
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import multiprocessing
+import os
+import os.path as osp
+import sqlite3
+
+# Local imports
+from spyder.plugins.projects.utils.config import FOLDERS_TO_IGNORE
+
+
+# ---- Constants
+# -----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+PYTHON_EXTENSIONS = ('.py', '.pyw', '.ipy')
+
+# Number of files to parse before using several processes
+PARALLEL_THRESHOLD = 50
+
+# Number of files parsed by a process at once
+CHUNK_SIZE = 20
+
+# Version of the database schema. Indexes with a different one are rebuilt.
+SCHEMA_VERSION = 1
+
+
+class SymbolKinds:
+    Class = 'class'
+    Function = 'function'
+    Method = 'method'
+    Variable = 'variable'
+
+
+# ---- Parsing
+# -----------------------------------------------------------------------------
+def _get_target_names(target):
+    if isinstance(target, ast.Name):
+        return [target.id]
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        names = []
+        for element in target.elts:
+            names.extend(_get_target_names(element))
+        return names
+    return []
+
+
+def _get_symbols(nodes, container, in_class):
+    """Get the symbols defined in the module or class body `nodes`."""
+    symbols = []
+    for node in nodes:
+        if isinstance(node, ast.ClassDef):
+            symbols.append(
+                (node.name, SymbolKinds.Class, node.lineno, container)
+            )
+            name = f'{container}.{node.name}' if container else node.name
+            symbols.extend(_get_symbols(node.body, name, True))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            kind = SymbolKinds.Method if in_class else SymbolKinds.Function
+            symbols.append((node.name, kind, node.lineno, container))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = (
+                node.targets if isinstance(node, ast.Assign)
+                else [node.target]
+            )
+            for target in targets:
+                for name in _get_target_names(target):
+                    symbols.append(
+                        (name, SymbolKinds.Variable, node.lineno, container)
+                    )
+        elif isinstance(node, (ast.If, ast.Try, ast.With, ast.AsyncWith)):
+            # Definitions made conditionally or in context managers
+            bodies = [node.body, getattr(node, 'orelse', [])]
+            if isinstance(node, ast.Try):
+                bodies.append(node.finalbody)
+                bodies.extend(handler.body for handler in node.handlers)
+            for body in bodies:
+                symbols.extend(_get_symbols(body, container, in_class))
+    return symbols
+
+
+def parse_file(path):
+    """
+    Get the classes, functions and assignments of a Python file.
+
+    Returns a list of (name, kind, line, container) tuples, where container
+    is the dotted name of the class that contains the symbol, or an empty
+    string for module level symbols. Files that can't be read or parsed
+    have no symbols.
+    """
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), path)
+    except Exception:
+        return []
+    return _get_symbols(tree.body, '', False)
+
+
+def parse_files(paths):
+    """Parse several files, returning their paths and symbols."""
+    return [(path, parse_file(path)) for path in paths]
+
+
+# ---- Index
+# -----------------------------------------------------------------------------
+class SymbolIndex:
+    """
+    SQLite database with the symbols of the files of a project.
+
+    Symbol names are indexed with a full text search table, so that
+    searching for part of a name doesn't need to scan all symbols.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self.has_fts = True
+        self._create_tables()
+
+    def _create_tables(self):
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            with self._conn:
+                for table in ('files', 'symbols', 'symbols_fts'):
+                    self._conn.execute(f'DROP TABLE IF EXISTS {table}')
+
+        with self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS files '
+                '(path TEXT PRIMARY KEY, mtime REAL, size INTEGER)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS symbols '
+                '(id INTEGER PRIMARY KEY, path TEXT, name TEXT, kind TEXT, '
+                'line INTEGER, container TEXT)'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS symbols_path ON symbols (path)'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS symbols_name '
+                'ON symbols (name COLLATE NOCASE)'
+            )
+
+            # The trigram tokenizer allows to search for any part of a name.
+            # It needs SQLite 3.34 or newer.
+            try:
+                self._conn.execute(
+                    'CREATE VIRTUAL TABLE IF NOT EXISTS symbols_fts '
+                    'USING fts5(name, tokenize="trigram")'
+                )
+            except sqlite3.OperationalError:
+                self.has_fts = False
+
+            self._conn.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+
+    def close(self):
+        self._conn.close()
+
+    def get_files(self):
+        """Return the modification time and size of the indexed files."""
+        return {
+            path: (mtime, size)
+            for path, mtime, size in self._conn.execute(
+                'SELECT path, mtime, size FROM files'
+            )
+        }
+
+    def update(self, parsed, removed=()):
+        """
+        Update the index.
+
+        Parameters
+        ----------
+        parsed: list
+            List of (path, stat, symbols) tuples of the files that were
+            parsed, where stat is a (mtime, size) tuple.
+        removed: list
+            Paths of the files that don't exist anymore.
+        """
+        with self._conn:
+            for path in removed:
+                self._remove_file(path)
+                self._conn.execute('DELETE FROM files WHERE path=?', (path,))
+
+            for path, (mtime, size), symbols in parsed:
+                self._remove_file(path)
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO files VALUES (?, ?, ?)',
+                    (path, mtime, size)
+                )
+                for name, kind, line, container in symbols:
+                    cursor = self._conn.execute(
+                        'INSERT INTO symbols (path, name, kind, line, '
+                        'container) VALUES (?, ?, ?, ?, ?)',
+                        (path, name, kind, line, container)
+                    )
+                    if self.has_fts:
+                        self._conn.execute(
+                            'INSERT INTO symbols_fts (rowid, name) '
+                            'VALUES (?, ?)',
+                            (cursor.lastrowid, name)
+                        )
+
+    def _remove_file(self, path):
+        if self.has_fts:
+            self._conn.execute(
+                'DELETE FROM symbols_fts WHERE rowid IN '
+                '(SELECT id FROM symbols WHERE path=?)',
+                (path,)
+            )
+        self._conn.execute('DELETE FROM symbols WHERE path=?', (path,))
+
+    def search(self, text, limit=100):
+        """
+        Return the symbols whose name contains `text`.
+
+        Returns a list of (path, name, kind, line, container) tuples, with
+        the names that start with `text` first.
+        """
+        text = text.strip()
+        if not text:
+            return []
+
+        columns = 's.path, s.name, s.kind, s.line, s.container'
+        if self.has_fts and len(text) >= 3:
+            # Get more results than needed to sort them by relevance
+            rows = self._conn.execute(
+                f'SELECT {columns} FROM symbols_fts f '
+                'JOIN symbols s ON s.id = f.rowid '
+                'WHERE symbols_fts MATCH ? LIMIT ?',
+                ('"{}"'.format(text.replace('"', '""')), limit * 10)
+            ).fetchall()
+        else:
+            # Short texts can't be searched with trigrams, so only names
+            # that start with them are found, using the index of names.
+            escaped = (
+                text.replace('\\', '\\\\').replace('%', '\\%')
+                .replace('_', '\\_')
+            )
+            pattern = escaped + '%' if len(text) < 3 else f'%{escaped}%'
+            rows = self._conn.execute(
+                f'SELECT {columns} FROM symbols s '
+                "WHERE s.name LIKE ? ESCAPE '\\' LIMIT ?",
+                (pattern, limit * 10)
+            ).fetchall()
+
+        lower_text = text.lower()
+        rows.sort(
+            key=lambda row: (
+                not row[1].lower().startswith(lower_text),
+                len(row[1]),
+                row[1],
+                row[0],
+                row[3]
+            )
+        )
+        return rows[:limit]
+
+
+# ---- Updates
+# -----------------------------------------------------------------------------
+def is_python_file(path):
+    return osp.splitext(path)[1] in PYTHON_EXTENSIONS
+
+
+def get_python_files(root_path):
+    """Return the modification time and size of the project Python files."""
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames[:] = [
+            name for name in dirnames
+            if not name.startswith('.') and name not in FOLDERS_TO_IGNORE
+        ]
+        for name in filenames:
+            if not is_python_file(name):
+                continue
+            path = osp.join(dirpath, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files[path] = (stat.st_mtime, stat.st_size)
+    return files
+
+
+def parse_changed_files(paths):
+    """
+    Parse files, using several processes if there are many of them.
+
+    Returns a dictionary with the symbols of each file.
+    """
+    if len(paths) < PARALLEL_THRESHOLD:
+        return dict(parse_files(paths))
+
+    chunks = [
+        paths[i:i + CHUNK_SIZE] for i in range(0, len(paths), CHUNK_SIZE)
+    ]
+
+    # Spawn the processes because forking a process that runs Qt threads
+    # is not safe.
+    symbols = {}
+    with ProcessPoolExecutor(
+        max_workers=min(len(chunks), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context('spawn')
+    ) as executor:
+        for result in executor.map(parse_files, chunks):
+            symbols.update(result)
+    return symbols
+
+
+def update_symbol_index(db_path, root_path, paths=None):
+    """
+    Parse the Python files of a project that changed since they were indexed.
+
+    Parameters
+    ----------
+    db_path: str
+        Path of the index database.
+    root_path: str
+        Root directory of the project.
+    paths: list, optional
+        Files or directories that changed. All the project files are checked
+        if this is None.
+
+    Returns
+    -------
+    int
+        Number of files whose symbols were updated or removed.
+    """
+    index = SymbolIndex(db_path)
+    try:
+        indexed = index.get_files()
+
+        if paths is None:
+            current = get_python_files(root_path)
+            checked = set(indexed) | set(current)
+        else:
+            current = {}
+            checked = set()
+            for path in paths:
+                path = osp.normpath(path)
+                if osp.isdir(path):
+                    subdir_files = get_python_files(path)
+                    current.update(subdir_files)
+                    checked.update(subdir_files)
+
+                # Files of directories that were removed or moved are
+                # removed too
+                prefix = path + os.sep
+                checked.update(
+                    indexed_path for indexed_path in indexed
+                    if indexed_path == path
+                    or indexed_path.startswith(prefix)
+                )
+
+                if is_python_file(path) and osp.isfile(path):
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    current[path] = (stat.st_mtime, stat.st_size)
+                    checked.add(path)
+
+        removed = [path for path in checked if path not in current]
+        changed = [
+            path for path in sorted(checked)
+            if path in current and indexed.get(path) != current[path]
+        ]
+
+        symbols = parse_changed_files(changed)
+        index.update(
+            [(path, current[path], symbols[path]) for path in changed],
+            removed
+        )
+    finally:
+        index.close()
+
+    return len(changed) + len(removed)
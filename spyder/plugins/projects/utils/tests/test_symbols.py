@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the project symbol index.
+"""
+
+# Standard library imports
+import os
+import textwrap
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils import symbols
+from spyder.plugins.projects.utils.symbols import (
+    parse_file, SymbolIndex, SymbolKinds, update_symbol_index)
+
+
+CODE = textwrap.dedent("""
+    import os
+
+    CONSTANT = 1
+    first, (second, third) = 1, (2, 3)
+
+    class Foo:
+        attr: int = 0
+
+        def method(self):
+            local = 1
+
+        class Inner:
+            async def deep(self):
+                pass
+
+    if os.name == 'nt':
+        def conditional():
+            pass
+""")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / 'package').mkdir()
+    (tmp_path / 'package' / 'module.py').write_text(CODE)
+    (tmp_path / 'package' / 'broken.py').write_text('def broken(:')
+    (tmp_path / '.hidden').mkdir()
+    (tmp_path / '.hidden' / 'hidden.py').write_text('def hidden(): pass')
+    return tmp_path
+
+
+def test_parse_file(project):
+    """Test that classes, functions and assignments are found."""
+    assert parse_file(str(project / 'package' / 'module.py')) == [
+        ('CONSTANT', SymbolKinds.Variable, 4, ''),
+        ('first', SymbolKinds.Variable, 5, ''),
+        ('second', SymbolKinds.Variable, 5, ''),
+        ('third', SymbolKinds.Variable, 5, ''),
+        ('Foo', SymbolKinds.Class, 7, ''),
+        ('attr', SymbolKinds.Variable, 8, 'Foo'),
+        ('method', SymbolKinds.Method, 10, 'Foo'),
+        ('Inner', SymbolKinds.Class, 13, 'Foo'),
+        ('deep', SymbolKinds.Method, 14, 'Foo.Inner'),
+        ('conditional', SymbolKinds.Function, 18, ''),
+    ]
+    assert parse_file(str(project / 'package' / 'broken.py')) == []
+
+
+@pytest.mark.parametrize('threshold', [1000, 1])
+def test_update_symbol_index(project, tmp_path, monkeypatch, threshold):
+    """Test that the index is updated incrementally."""
+    monkeypatch.setattr(symbols, 'PARALLEL_THRESHOLD', threshold)
+    db_path = str(tmp_path / 'symbols.sqlite')
+    module = str(project / 'package' / 'module.py')
+
+    assert update_symbol_index(db_path, str(project)) == 2
+    assert update_symbol_index(db_path, str(project)) == 0
+
+    index = SymbolIndex(db_path)
+    assert index.search('inn') == [
+        (module, 'Inner', SymbolKinds.Class, 13, 'Foo')
+    ]
+    assert index.search('hidden') == []
+
+    # Names that start with the search text go first
+    assert [row[1] for row in index.search('con')] == [
+        'CONSTANT', 'conditional', 'second'
+    ]
+
+    # Modified files
+    other = project / 'package' / 'other.py'
+    other.write_text('def other_function(): pass')
+    assert update_symbol_index(db_path, str(project), [str(other)]) == 1
+    assert index.search('other')[0][:2] == (str(other), 'other_function')
+
+    # Removed directories
+    os.remove(str(other))
+    os.remove(module)
+    assert update_symbol_index(
+        db_path, str(project), [str(project / 'package')]) == 2
+    assert index.search('con') == []
+    index.close()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -20,17 +20,13 @@
 
 # Local imports
 from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.plugins.projects.utils.config import FOLDERS_TO_IGNORE
 
 
 # ---- Constants
 # -----------------------------------------------------------------------------
 logger = logging.getLogger(__name__)
 
-FOLDERS_TO_IGNORE = [
-    "__pycache__",
-    "build",
-]
-
 
 # ---- Monkey patches
 # -----------------------------------------------------------------------------
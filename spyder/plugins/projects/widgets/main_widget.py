@@ -30,18 +30,21 @@
     get_home_dir, get_project_config_folder, running_under_pytest)
 from spyder.config.utils import EDIT_EXTENSIONS
 from spyder.plugins.completion.api import (
-    CompletionRequestTypes, FileChangeType)
+    CompletionRequestTypes, FileChangeType, SymbolKind, SYMBOL_KIND_ICON)
 from spyder.plugins.completion.decorators import (
     class_register, handles, request)
 from spyder.plugins.explorer.api import DirViewActions
 from spyder.plugins.projects.api import (
     BaseProjectType, EmptyProject, WORKSPACE)
+from spyder.plugins.projects.utils.indexer import ProjectSymbolIndexer
+from spyder.plugins.projects.utils.symbols import SymbolKinds
 from spyder.plugins.projects.utils.watcher import WorkspaceWatcher
 from spyder.plugins.projects.widgets.projectdialog import ProjectDialog
 from spyder.plugins.projects.widgets.projectexplorer import (
     ProjectExplorerTreeWidget)
 from spyder.plugins.switcher.utils import get_file_icon, shorten_paths
 from spyder.utils import encoding
+from spyder.utils.icon_manager import ima
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.programs import find_program
 from spyder.utils.workers import WorkerManager
@@ -85,6 +88,7 @@ class ProjectExplorerWidget(PluginMainWidget):
     # ---- Constants
     # -------------------------------------------------------------------------
     MAX_SWITCHER_RESULTS = 50
+    SYMBOLS_MODE = '#'
 
     # ---- Signals
     # -------------------------------------------------------------------------
@@ -98,6 +102,18 @@ class ProjectExplorerWidget(PluginMainWidget):
         The path to the requested file.
     """
 
+    sig_open_symbol_requested = Signal(str, int)
+    """
+    This signal is emitted when a symbol is requested to be shown.
+
+    Parameters
+    ----------
+    path: str
+        The path of the file that defines the symbol.
+    line: int
+        The line where the symbol is defined.
+    """
+
     sig_project_created = Signal(str, str)
     """
     This signal is emitted to request the Projects plugin the creation of a
@@ -193,6 +209,9 @@ def __init__(self, name, plugin, parent=None):
         self.watcher = WorkspaceWatcher(self)
         self.watcher.connect_signals(self)
 
+        # -- Symbol indexer for the switcher
+        self.symbol_indexer = ProjectSymbolIndexer(self)
+
         # -- Worker manager for calls to fzf
         self._worker_manager = WorkerManager(self)
 
@@ -289,6 +308,7 @@ def update_actions(self):
 
     def on_close(self):
         self._worker_manager.terminate_all()
+        self.symbol_indexer.stop()
 
     # ---- Public API
     # -------------------------------------------------------------------------
@@ -408,6 +428,7 @@ def open_project(self, path=None, project_type=None, restart_console=True,
                 self.sig_project_loaded.emit(path)
 
         self.watcher.start(path)
+        self.symbol_indexer.start(path)
 
         if restart_console:
             self.sig_restart_console_requested.emit()
@@ -450,6 +471,7 @@ def close_project(self):
             self._clear()
             self.sig_restart_console_requested.emit()
             self.watcher.stop()
+            self.symbol_indexer.stop()
 
     def delete_project(self):
         """
@@ -670,6 +692,14 @@ def handle_switcher_selection(self, item, mode, search_text):
         search_text: str
             Cleaned search/filter text.
         """
+        if mode == self.SYMBOLS_MODE:
+            data = item.get_data()
+            if isinstance(data, dict) and 'line_number' in data:
+                self.sig_open_symbol_requested.emit(
+                    data['path'], data['line_number']
+                )
+            return
+
         if item.get_section() != self.get_title():
             return
 
@@ -688,6 +718,24 @@ def handle_switcher_search(self, search_text):
         """
         self._call_fzf(search_text)
 
+    def display_switcher_symbols(self, search_text):
+        """
+        Populate switcher with the project symbols that match `search_text`.
+
+        Symbols are read from the project index, so this doesn't need to
+        wait for the files to be parsed.
+
+        Parameters
+        ----------
+        search_text: str
+            The current search text in the switcher dialog box.
+        """
+        symbols = self.symbol_indexer.search(
+            search_text, limit=self.MAX_SWITCHER_RESULTS
+        )
+        items = self._convert_symbols_to_switcher_items(symbols)
+        self._plugin._display_symbols_in_switcher(items)
+
     # ---- Public API for the LSP
     # -------------------------------------------------------------------------
     def start_workspace_services(self):
@@ -721,6 +769,7 @@ def handle_response(self, method, params):
     def file_created(self, src_file, is_dir):
         """Notify LSP server about file creation."""
         self._update_default_switcher_paths()
+        self.symbol_indexer.update_paths([src_file])
 
         # LSP specification only considers file updates
         if is_dir:
@@ -740,6 +789,7 @@ def file_created(self, src_file, is_dir):
     def file_moved(self, src_file, dest_file, is_dir):
         """Notify LSP server about a file that is moved."""
         self._update_default_switcher_paths()
+        self.symbol_indexer.update_paths([src_file, dest_file])
 
         if is_dir:
             return
@@ -766,6 +816,7 @@ def file_moved(self, src_file, dest_file, is_dir):
     def file_deleted(self, src_file, is_dir):
         """Notify LSP server about file deletion."""
         self._update_default_switcher_paths()
+        self.symbol_indexer.update_paths([src_file])
 
         if is_dir:
             return
@@ -786,6 +837,8 @@ def file_modified(self, src_file, is_dir):
         if is_dir:
             return
 
+        self.symbol_indexer.update_paths([src_file])
+
         params = {
             'params': [{
                 'file': src_file,
@@ -1117,6 +1170,36 @@ def _convert_paths_to_switcher_items(self, paths):
 
         return items
 
+    def _convert_symbols_to_switcher_items(self, symbols):
+        """
+        Convert a list of symbols from the index to items that can be shown
+        in the switcher.
+        """
+        kinds = {
+            SymbolKinds.Class: SymbolKind.CLASS,
+            SymbolKinds.Function: SymbolKind.FUNCTION,
+            SymbolKinds.Method: SymbolKind.METHOD,
+            SymbolKinds.Variable: SymbolKind.VARIABLE,
+        }
+        project_path = self.get_active_project_path()
+
+        items = []
+        for i, (path, name, kind, line, container) in enumerate(symbols):
+            title = f'{container}.{name}' if container else name
+            icon = ima.icon(
+                SYMBOL_KIND_ICON.get(kinds.get(kind), 'no_match')
+            )
+            description = '{}:{}'.format(
+                osp.relpath(path, project_path) if project_path else path,
+                line
+            )
+            data = {'path': path, 'line_number': line}
+            is_last_item = (i + 1 == len(symbols))
+
+            items.append((title, description, icon, data, is_last_item))
+
+        return items
+
     def _display_paths_in_switcher(self, paths, setup, clear_section):
         """Display a list of paths in the switcher."""
         items = self._convert_paths_to_switcher_items(paths)
@@ -25,6 +25,17 @@ def setup_page(self):
         save_box = self.create_checkbox(_("Save file before analyzing it"),
                                         'save_before', default=True)
 
+        jobs_spin = self.create_spinbox(
+            _("Parallel jobs for project analysis: "),
+            "",
+            "project_jobs",
+            min_=0,
+            max_=64,
+            step=1,
+            tip=_("Number of processes used by Pylint to analyze a project. "
+                  "Set it to 0 to use all available processors."),
+        )
+
         hist_group = QGroupBox(_("History"))
         hist_label1 = QLabel(_("The following option will be applied at next "
                                "startup."))
@@ -53,6 +64,7 @@ def setup_page(self):
 
         settings_layout = QVBoxLayout()
         settings_layout.addWidget(save_box)
+        settings_layout.addWidget(jobs_spin)
         settings_group.setLayout(settings_layout)
 
         hist_layout = QVBoxLayout()
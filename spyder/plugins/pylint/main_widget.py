@@ -12,6 +12,7 @@
 # pylint: disable=R0201
 
 # Standard library imports
+import json
 import os
 import os.path as osp
 import pickle
@@ -33,7 +34,8 @@
 from spyder.api.translations import _
 from spyder.api.widgets.main_widget import PluginMainWidget
 from spyder.config.base import get_conf_path
-from spyder.plugins.pylint.utils import get_pylintrc_path
+from spyder.plugins.pylint.utils import (get_file_hash, get_pylintrc_path,
+                                         get_python_files)
 from spyder.plugins.variableexplorer.widgets.texteditor import TextEditor
 from spyder.utils.icon_manager import ima
 from spyder.utils.misc import getcwd_or_home, get_home_dir
@@ -54,6 +56,19 @@
 WARNING_COLOR = SpyderPalette.COLOR_WARN_1
 SUCCESS_COLOR = SpyderPalette.COLOR_SUCCESS_1
 
+# Minimum number of files analyzed by each Pylint process in project mode.
+# Results are shown after each process finishes.
+PROJECT_BATCH_MIN_SIZE = 20
+
+# Results categories for the message types of Pylint's JSON output
+JSON_MESSAGE_CATEGORIES = {
+    "convention": "C:",
+    "refactor": "R:",
+    "warning": "W:",
+    "error": "E:",
+    "fatal": "E:",
+}
+
 
 # TODO: There should be some palette from the appearance plugin so this
 # is easier to use
@@ -64,6 +79,7 @@
 class PylintWidgetActions:
     ChangeHistory = "change_history_depth_action"
     RunCodeAnalysis = "run_analysis_action"
+    RunProjectAnalysis = "run_project_analysis_action"
     BrowseFile = "browse_action"
     ShowLog = "log_action"
 
@@ -71,6 +87,7 @@ class PylintWidgetActions:
 class PylintWidgetOptionsMenuSections:
     Global = "global_section"
     Section = "section_section"
+    Project = "project_section"
     History = "history_section"
 
 
@@ -116,6 +133,16 @@ class CategoryItem(QTreeWidgetItem):
     }
 
     def __init__(self, parent, category, number_of_messages):
+        super().__init__(parent, [], QTreeWidgetItem.Type)
+        self.category = category
+        self.set_number_of_messages(number_of_messages)
+
+        # Set icon
+        icon = self.CATEGORIES[category]['icon']
+        self.setIcon(0, icon)
+
+    def set_number_of_messages(self, number_of_messages):
+        """Show the number of messages of the category in its title."""
         # Messages string to append to category.
         if number_of_messages > 1 or number_of_messages == 0:
             messages = _('messages')
@@ -123,14 +150,9 @@ def __init__(self, parent, category, number_of_messages):
             messages = _('message')
 
         # Category title.
-        title = self.CATEGORIES[category]['translation_string']
+        title = self.CATEGORIES[self.category]['translation_string']
         title += f" ({number_of_messages} {messages})"
-
-        super().__init__(parent, [title], QTreeWidgetItem.Type)
-
-        # Set icon
-        icon = self.CATEGORIES[category]['icon']
-        self.setIcon(0, icon)
+        self.setText(0, title)
 
 
 # ---- Widgets
@@ -158,6 +180,8 @@ def __init__(self, parent):
         self.filename = None
         self.results = None
         self.data = None
+        self._category_items = {}
+        self._module_items = {}
         self.set_title("")
 
     def activated(self, item):
@@ -186,78 +210,112 @@ def set_results(self, filename, results):
         self.results = results
         self.refresh()
 
+    def add_results(self, results):
+        """
+        Add `results` to the ones already shown, without rebuilding the tree.
+        """
+        self.results = {key: self.results[key] + results.get(key, [])
+                        for key in self.results}
+
+        for key, messages in results.items():
+            for message_data in messages:
+                self._add_message(key, message_data)
+
+            title_item = self._category_items[key]
+            title_item.set_number_of_messages(len(self.results[key]))
+            title_item.setDisabled(not self.results[key])
+
     def refresh(self):
         title = _("Results for ") + self.filename
         self.set_title(title)
         self.clear()
         self.data = {}
+        self._category_items = {}
+        self._module_items = {}
 
         # Populating tree
         results = (
-            ("Convention", self.results["C:"]),
-            ("Refactor", self.results["R:"]),
-            ("Warning", self.results["W:"]),
-            ("Error", self.results["E:"]),
+            ("Convention", "C:"),
+            ("Refactor", "R:"),
+            ("Warning", "W:"),
+            ("Error", "E:"),
         )
 
-        for category, messages in results:
+        for category, key in results:
+            messages = self.results[key]
             title_item = CategoryItem(self, category, len(messages))
             if not messages:
                 title_item.setDisabled(True)
 
-            modules = {}
+            self._category_items[key] = title_item
             for message_data in messages:
-                # If message data is legacy version without message_name
-                if len(message_data) == 4:
-                    message_data = tuple(list(message_data) + [None])
+                self._add_message(key, message_data)
+
+    def _get_module_filename(self, module):
+        """Get the name and file of `module`, as reported by Pylint."""
+        basename = osp.splitext(osp.basename(self.filename))[0]
+        if not module.startswith(basename):
+            # Pylint bug
+            i_base = module.find(basename)
+            module = module[i_base:]
+
+        dirname = osp.dirname(self.filename)
+        if module.startswith(".") or module == basename:
+            modname = osp.join(dirname, module)
+        else:
+            modname = osp.join(dirname, *module.split("."))
 
-                module, lineno, message, msg_id, message_name = message_data
+        if osp.isdir(modname):
+            modname = osp.join(modname, "__init__")
 
-                basename = osp.splitext(osp.basename(self.filename))[0]
-                if not module.startswith(basename):
-                    # Pylint bug
-                    i_base = module.find(basename)
-                    module = module[i_base:]
+        for ext in (".py", ".pyw"):
+            if osp.isfile(modname + ext):
+                modname = modname + ext
+                break
 
-                dirname = osp.dirname(self.filename)
-                if module.startswith(".") or module == basename:
-                    modname = osp.join(dirname, module)
-                else:
-                    modname = osp.join(dirname, *module.split("."))
-
-                if osp.isdir(modname):
-                    modname = osp.join(modname, "__init__")
-
-                for ext in (".py", ".pyw"):
-                    if osp.isfile(modname + ext):
-                        modname = modname + ext
-                        break
-
-                if osp.isdir(self.filename):
-                    parent = modules.get(modname)
-                    if parent is None:
-                        item = QTreeWidgetItem(title_item, [module],
-                                               QTreeWidgetItem.Type)
-                        item.setIcon(0, ima.icon("python"))
-                        modules[modname] = item
-                        parent = item
-                else:
-                    parent = title_item
+        return module, modname
 
-                if len(msg_id) > 1:
-                    if not message_name:
-                        message_string = "{msg_id} "
-                    else:
-                        message_string = "{msg_id} ({message_name}) "
+    def _add_message(self, key, message_data):
+        """Add an item for `message_data` to the category of `key`."""
+        title_item = self._category_items[key]
 
-                message_string += "line {lineno}: {message}"
-                message_string = message_string.format(
-                    msg_id=msg_id, message_name=message_name,
-                    lineno=lineno, message=message)
-                msg_item = QTreeWidgetItem(
-                    parent, [message_string], QTreeWidgetItem.Type)
-                msg_item.setIcon(0, ima.icon("arrow"))
-                self.data[id(msg_item)] = (modname, lineno)
+        # If message data is legacy version without message_name
+        if len(message_data) == 4:
+            message_data = tuple(list(message_data) + [None])
+
+        if len(message_data) == 6:
+            # Project analysis results include the file of each message
+            (module, lineno, message, msg_id, message_name,
+             modname) = message_data
+        else:
+            module, lineno, message, msg_id, message_name = message_data
+            module, modname = self._get_module_filename(module)
+
+        if osp.isdir(self.filename):
+            parent = self._module_items.get((key, modname))
+            if parent is None:
+                item = QTreeWidgetItem(title_item, [module],
+                                       QTreeWidgetItem.Type)
+                item.setIcon(0, ima.icon("python"))
+                self._module_items[(key, modname)] = item
+                parent = item
+        else:
+            parent = title_item
+
+        if len(msg_id) > 1:
+            if not message_name:
+                message_string = "{msg_id} "
+            else:
+                message_string = "{msg_id} ({message_name}) "
+
+        message_string += "line {lineno}: {message}"
+        message_string = message_string.format(
+            msg_id=msg_id, message_name=message_name,
+            lineno=lineno, message=message)
+        msg_item = QTreeWidgetItem(
+            parent, [message_string], QTreeWidgetItem.Type)
+        msg_item.setIcon(0, ima.icon("arrow"))
+        self.data[id(msg_item)] = (modname, lineno)
 
 
 class PylintWidget(PluginMainWidget):
@@ -267,6 +325,7 @@ class PylintWidget(PluginMainWidget):
     ENABLE_SPINNER = True
 
     DATAPATH = get_conf_path("pylint.results")
+    PROJECT_DATAPATH = get_conf_path("pylint.project_results")
     VERSION = "1.1.0"
 
     # --- Signals
@@ -292,6 +351,12 @@ class PylintWidget(PluginMainWidget):
     level.
     """
 
+    sig_start_project_analysis_requested = Signal()
+    """
+    This signal will request the plugin to start the analysis of the current
+    project.
+    """
+
     def __init__(self, name=None, plugin=None, parent=None):
         super().__init__(name, plugin, parent)
 
@@ -303,8 +368,20 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.rdata = []
         self.curr_filenames = self.get_conf("history_filenames")
         self.code_analysis_action = None
+        self.project_analysis_action = None
         self.browse_action = None
 
+        # Project analysis
+        self._project_dir = None
+        self._project_pylintrc = None
+        self._project_batches = []
+        self._project_batch = None
+        self._project_keys = {}
+        self._project_cache = None
+        self._project_log = ""
+        self._project_total = 0
+        self._project_analyzed = 0
+
         # Widgets
         self.filecombo = PythonModulesComboBox(
             self, id_=PylintWidgetToolbarItems.FileComboBox)
@@ -359,20 +436,27 @@ def __init__(self, name=None, plugin=None, parent=None):
     @Slot()
     def _start(self):
         """Start the code analysis."""
+        self._start_process(
+            self.get_command(self.get_filename()), self._finished)
+
+    def _start_process(self, command_args, finished_callback, cwd=None):
+        """
+        Start a Pylint process with `command_args` and call
+        `finished_callback` when it finishes.
+        """
         self.start_spinner()
         self.output = ""
         self.error_output = ""
         self._process = process = QProcess(self)
 
         process.setProcessChannelMode(QProcess.SeparateChannels)
-        process.setWorkingDirectory(getcwd_or_home())
+        process.setWorkingDirectory(cwd or getcwd_or_home())
         process.readyReadStandardOutput.connect(self._read_output)
         process.readyReadStandardError.connect(
             lambda: self._read_output(error=True))
         process.finished.connect(
-            lambda ec, es=QProcess.ExitStatus: self._finished(ec, es))
+            lambda ec, es=QProcess.ExitStatus: finished_callback(ec, es))
 
-        command_args = self.get_command(self.get_filename())
         processEnvironment = QProcessEnvironment()
         processEnvironment.insert("PYTHONIOENCODING", "utf8")
 
@@ -398,6 +482,8 @@ def _start(self):
                 _("Process failed to start"),
             )
 
+        return running
+
     def _read_output(self, error=False):
         process = self._process
         if error:
@@ -452,10 +538,106 @@ def _is_running(self):
         return process is not None and process.state() == QProcess.Running
 
     def _kill_process(self):
+        self._project_batches = []
         self._process.close()
         self._process.waitForFinished(1000)
         self.stop_spinner()
 
+    def _load_project_cache(self):
+        """Load the results of previous project analyses."""
+        if self._project_cache is not None:
+            return
+
+        self._project_cache = {}
+        if osp.isfile(self.PROJECT_DATAPATH):
+            try:
+                with open(self.PROJECT_DATAPATH, "rb") as fh:
+                    data = pickle.loads(fh.read())
+
+                if data[0] == self.VERSION:
+                    self._project_cache = data[1]
+            except (EOFError, ImportError):
+                pass
+
+    def _save_project_cache(self):
+        """Save the results of project analyses for files that still exist."""
+        self._project_cache = {
+            filename: data for filename, data in self._project_cache.items()
+            if osp.isfile(filename)
+        }
+
+        with open(self.PROJECT_DATAPATH, "wb") as fh:
+            pickle.dump([self.VERSION, self._project_cache], fh, 2)
+
+    def _start_next_project_batch(self):
+        """Analyze the next batch of project files, if there's any left."""
+        if not self._project_batches:
+            self._project_finished()
+            return
+
+        self._project_batch = self._project_batches.pop(0)
+        command_args = self.get_project_command(
+            self._project_batch, self._project_pylintrc)
+
+        if not self._start_process(command_args, self._project_batch_finished,
+                                   cwd=self._project_dir):
+            self._project_batches = []
+            self._project_finished()
+
+    def _project_batch_finished(self, exit_code, exit_status):
+        """Show and cache the results of a batch of project files."""
+        self._project_log += self.error_output
+
+        # Pylint exits with a non-zero code when it finds any message, so we
+        # can only tell it failed by its output.
+        try:
+            messages = json.loads(self.output)
+        except ValueError:
+            messages = None
+            self._project_log += self.output
+
+        if messages is not None:
+            file_results = self.parse_json_output(messages, self._project_dir)
+            results = {"C:": [], "R:": [], "W:": [], "E:": []}
+
+            for filename in self._project_batch:
+                # Files without messages are not part of Pylint's output
+                file_result = file_results.get(
+                    filename, {"C:": [], "R:": [], "W:": [], "E:": []})
+                self._project_cache[filename] = (
+                    self._project_keys[filename], file_result)
+
+                for key, file_messages in file_result.items():
+                    results[key] += file_messages
+
+            self.treewidget.add_results(results)
+
+        self._project_analyzed += len(self._project_batch)
+        self._update_project_labels()
+        self._start_next_project_batch()
+
+    def _project_finished(self):
+        """Finish the analysis of the current project."""
+        self._project_batch = None
+        self._save_project_cache()
+        self.output = self._project_log
+        self.log_action.setEnabled(len(self.output) > 0)
+        self._update_project_labels()
+        self.update_actions()
+        self.stop_spinner()
+
+    def _update_project_labels(self):
+        """Show the progress of the project analysis."""
+        text_style = "<span style=\"color: %s\"><b>%s </b></span>"
+        text = _("Project analysis:")
+        progress = _("{0} of {1} files analyzed").format(
+            self._project_analyzed, self._project_total)
+        date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
+        self.ratelabel.setText(
+            (text_style % (MAIN_TEXT_COLOR, text)) + progress)
+        self.datelabel.setText(text_style % (MAIN_TEXT_COLOR, date))
+
     def _update_combobox_history(self):
         """Change the number of files listed in the history combobox."""
         max_entries = self.get_conf("max_entries")
@@ -512,6 +694,13 @@ def setup(self):
             icon=self.create_icon("run"),
             triggered=self.sig_start_analysis_requested,
         )
+        self.project_analysis_action = self.create_action(
+            PylintWidgetActions.RunProjectAnalysis,
+            text=_("Run code analysis on project"),
+            tip=_("Run code analysis on all files of the current project"),
+            icon=self.create_icon("project"),
+            triggered=self.sig_start_project_analysis_requested,
+        )
         self.browse_action = self.create_action(
             PylintWidgetActions.BrowseFile,
             text=_("Select Python file"),
@@ -552,6 +741,11 @@ def setup(self):
             menu=options_menu,
             section=PylintWidgetOptionsMenuSections.Section,
         )
+        self.add_item_to_menu(
+            self.project_analysis_action,
+            menu=options_menu,
+            section=PylintWidgetOptionsMenuSections.Project,
+        )
         self.add_item_to_menu(
             change_history_depth_action,
             menu=options_menu,
@@ -591,6 +785,9 @@ def setup(self):
 
         self.show_data()
 
+        self.project_analysis_action.setEnabled(
+            bool(self.get_conf("project_dir")))
+
         if self.rdata:
             self.remove_obsolete_items()
             self.filecombo.insertItems(0, self.get_filenames())
@@ -601,6 +798,10 @@ def setup(self):
         # Signals
         self.filecombo.valid.connect(self.code_analysis_action.setEnabled)
 
+    @on_conf_change(option='project_dir')
+    def on_project_dir_update(self, value):
+        self.project_analysis_action.setEnabled(bool(value))
+
     @on_conf_change(option=['max_entries', 'history_filenames'])
     def on_conf_update(self, option, value):
         if option == "max_entries":
@@ -727,6 +928,80 @@ def stop_code_analysis(self):
         if self._is_running():
             self._kill_process()
 
+    def start_project_analysis(self, project_dir=None):
+        """
+        Perform code analysis for all Python files in `project_dir`.
+
+        Only files that changed since they were last analyzed (or whose
+        pylintrc changed) are analyzed again, in batches run with Pylint's
+        parallel mode. Results are shown as each batch finishes.
+
+        If `project_dir` is None default to the current project.
+
+        If this method is called while still running it will stop the code
+        analysis.
+        """
+        if self._is_running():
+            self._kill_process()
+            self.update_actions()
+            return
+
+        if project_dir is None:
+            project_dir = self.get_conf("project_dir")
+
+        if not project_dir or not osp.isdir(project_dir):
+            return
+
+        project_dir = osp.normpath(project_dir)
+        self._load_project_cache()
+
+        pylintrc_path = get_pylintrc_path(
+            search_paths=[project_dir, getcwd_or_home(),
+                          osp.expanduser("~")]
+        )
+        config_key = (
+            PYLINT_VER,
+            get_file_hash(pylintrc_path) if pylintrc_path else None,
+            self.test_for_custom_interpreter(),
+        )
+
+        # Reuse the results of files that didn't change
+        results = {"C:": [], "R:": [], "W:": [], "E:": []}
+        stale_filenames = []
+        self._project_keys = {}
+        filenames = get_python_files(project_dir)
+
+        for filename in filenames:
+            key = (get_file_hash(filename),) + config_key
+            cached = self._project_cache.get(filename)
+
+            if cached is not None and cached[0] == key:
+                for category, messages in cached[1].items():
+                    results[category] += messages
+            else:
+                stale_filenames.append(filename)
+                self._project_keys[filename] = key
+
+        self._project_dir = project_dir
+        self._project_pylintrc = pylintrc_path
+        self._project_log = ""
+        self._project_total = len(filenames)
+        self._project_analyzed = len(filenames) - len(stale_filenames)
+
+        self.stacked_widget.setCurrentWidget(self.treewidget)
+        self.treewidget.set_results(project_dir, results)
+        self._update_project_labels()
+
+        jobs = self.get_conf("project_jobs") or os.cpu_count() or 1
+        batch_size = max(PROJECT_BATCH_MIN_SIZE, 4 * jobs)
+        self._project_batches = [
+            stale_filenames[i:i + batch_size]
+            for i in range(0, len(stale_filenames), batch_size)
+        ]
+
+        self._start_next_project_batch()
+        self.update_actions()
+
     def remove_obsolete_items(self):
         """
         Removing obsolete items.
@@ -915,6 +1190,23 @@ def test_for_custom_interpreter(self):
 
         return path_of_custom_interpreter
 
+    def _get_custom_interpreter_args(self):
+        """
+        Return the arguments needed to analyze code with the custom
+        interpreter, if it's active.
+        """
+        path_of_custom_interpreter = self.test_for_custom_interpreter()
+        if path_of_custom_interpreter is None:
+            return []
+
+        return [
+            "--init-hook="
+            'import pylint_venv; \
+                pylint_venv.inithook(\'{}\',\
+                force_venv_activation=True)'.format(
+                    path_of_custom_interpreter.replace("\\", "\\\\")),
+        ]
+
     def get_command(self, filename):
         """
         Return command to use to run code analysis on given filename
@@ -929,15 +1221,7 @@ def get_command(self, filename):
                 '{msg_id}:{symbol}:{line:3d},{column}: {msg}"',
             ]
 
-        path_of_custom_interpreter = self.test_for_custom_interpreter()
-        if path_of_custom_interpreter is not None:
-            command_args += [
-                "--init-hook="
-                'import pylint_venv; \
-                    pylint_venv.inithook(\'{}\',\
-                    force_venv_activation=True)'.format(
-                        path_of_custom_interpreter.replace("\\", "\\\\")),
-            ]
+        command_args += self._get_custom_interpreter_args()
 
         pylintrc_path = self.get_pylintrc_path(filename=filename)
         if pylintrc_path is not None:
@@ -946,6 +1230,48 @@ def get_command(self, filename):
         command_args.append(filename)
         return command_args
 
+    def get_project_command(self, filenames, pylintrc_path=None):
+        """
+        Return command to use to run code analysis on the given project
+        filenames, with JSON output and Pylint's parallel mode.
+        """
+        command_args = [
+            "-m",
+            "pylint",
+            "--output-format=json",
+            "--jobs={}".format(self.get_conf("project_jobs")),
+        ]
+
+        command_args += self._get_custom_interpreter_args()
+
+        if pylintrc_path is not None:
+            command_args += ["--rcfile={}".format(pylintrc_path)]
+
+        command_args += filenames
+        return command_args
+
+    def parse_json_output(self, messages, project_dir):
+        """
+        Parse the messages of Pylint's JSON output and return results per
+        file.
+        """
+        file_results = {}
+        for message in messages:
+            key = JSON_MESSAGE_CATEGORIES.get(message["type"])
+            if key is None:
+                continue
+
+            # Paths are relative to the directory Pylint was run from
+            filename = osp.normpath(osp.join(project_dir, message["path"]))
+            results = file_results.setdefault(
+                filename, {"C:": [], "R:": [], "W:": [], "E:": []})
+            results[key].append(
+                (message["module"], message["line"], message["message"],
+                 message["message-id"], message["symbol"], filename)
+            )
+
+        return file_results
+
     def parse_output(self, output):
         """
         Parse output and return current revious rate and results.
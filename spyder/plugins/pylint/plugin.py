@@ -82,6 +82,8 @@ def on_initialize(self):
         # Expose widget signals at the plugin level
         widget.sig_edit_goto_requested.connect(self.sig_edit_goto_requested)
         widget.sig_start_analysis_requested.connect(self.start_code_analysis)
+        widget.sig_start_project_analysis_requested.connect(
+            self.start_project_analysis)
 
         # To have a reference to the run action of this plugin
         self.run_action = None
@@ -251,3 +253,14 @@ def stop_code_analysis(self):
         Stop the code analysis process.
         """
         self.get_widget().stop_code_analysis()
+
+    @Slot()
+    def start_project_analysis(self):
+        """
+        Perform code analysis for all files of the current project.
+
+        If this method is called while still running it will stop the code
+        analysis.
+        """
+        self.switch_to_plugin(force_focus=True)
+        self.get_widget().start_project_analysis()
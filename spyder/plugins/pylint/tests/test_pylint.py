@@ -293,6 +293,41 @@ def test_pylint_max_history_conf(pylint_plugin, pylint_test_scripts):
     assert 'test_script_2.py' in pylint_widget.curr_filenames[0]
 
 
+def test_pylint_project_analysis(pylint_plugin, tmp_path, mocker, qtbot):
+    """
+    Test that project analyses show results for all files and only analyze
+    again the files that changed.
+    """
+    pylint_widget = pylint_plugin.get_widget()
+    mocker.patch.object(pylint_widget, "PROJECT_DATAPATH",
+                        str(tmp_path / "pylint.project_results"))
+
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "module_1.py").write_text(PYLINT_TEST_SCRIPT)
+    (project_dir / "module_2.py").write_text(PYLINT_TEST_SCRIPT)
+
+    # First run analyzes all files
+    get_project_command = mocker.spy(pylint_widget, "get_project_command")
+    pylint_widget.start_project_analysis(str(project_dir))
+    qtbot.waitUntil(lambda: not pylint_widget._is_running(), timeout=20000)
+
+    assert len(get_project_command.call_args[0][0]) == 2
+    conventions = pylint_widget.treewidget.results["C:"]
+    assert {message[5] for message in conventions} == {
+        str(project_dir / "module_1.py"), str(project_dir / "module_2.py")}
+
+    # Second run only analyzes the changed file
+    (project_dir / "module_2.py").write_text(
+        PYLINT_TEST_SCRIPT + "def f():\n    pass\n")
+    pylint_widget.start_project_analysis(str(project_dir))
+    qtbot.waitUntil(lambda: not pylint_widget._is_running(), timeout=20000)
+
+    assert get_project_command.call_args[0][0] == [
+        str(project_dir / "module_2.py")]
+    assert len(pylint_widget.treewidget.results["C:"]) > len(conventions)
+
+
 @flaky(max_runs=3)
 @pytest.mark.parametrize("custom_interpreter", [True, False])
 @pytest.mark.skipif(
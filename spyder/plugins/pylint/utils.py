@@ -9,6 +9,7 @@
 
 
 # Standard library imports
+import hashlib
 import os
 import os.path as osp
 
@@ -56,3 +57,34 @@ def get_pylintrc_path(search_paths=None, home_path=None):
         os.chdir(current_cwd)
 
     return pylintrc_path
+
+
+def get_python_files(path):
+    """
+    Get the Python files under `path`.
+
+    Hidden directories and virtual environments are skipped.
+    """
+    filenames = []
+    for dirpath, dirnames, files in os.walk(path):
+        dirnames[:] = sorted(
+            dirname for dirname in dirnames
+            if not dirname.startswith('.')
+            and dirname != '__pycache__'
+            and not osp.isfile(osp.join(dirpath, dirname, 'pyvenv.cfg'))
+        )
+        filenames += [
+            osp.join(dirpath, filename) for filename in sorted(files)
+            if osp.splitext(filename)[1] in ('.py', '.pyw')
+        ]
+
+    return filenames
+
+
+def get_file_hash(filename):
+    """Get a hash of the contents of `filename`, or None if it's missing."""
+    try:
+        with open(filename, 'rb') as fh:
+            return hashlib.sha1(fh.read()).hexdigest()
+    except OSError:
+        return None
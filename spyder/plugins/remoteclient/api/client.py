@@ -8,12 +8,15 @@
 import asyncio
 import json
 import logging
+import os.path as osp
 import socket
 
+import aiohttp
 import asyncssh
 
 from spyder.api.translations import _
-from spyder.config.base import get_debug_level
+from spyder.config.base import get_conf_path, get_debug_level
+from spyder.plugins.remoteclient.api.filesystem import RemoteFileSystem
 from spyder.plugins.remoteclient.api.jupyterhub import JupyterAPI
 from spyder.plugins.remoteclient.api.protocol import (
     ConnectionInfo,
@@ -57,16 +60,30 @@ class SpyderRemoteClient:
 
     JUPYTER_SERVER_TIMEOUT = 5  # seconds
 
+    # Time to keep idle HTTP connections to the server open
+    KEEPALIVE_TIMEOUT = 60  # seconds
+
+    # Time to wait for other kernel status polls to batch them in a single
+    # request, if batching is enabled
+    STATUS_POLLS_BATCH_INTERVAL = 0.05  # seconds
+
     _extra_options = ["platform", "id"]
 
     START_SERVER_COMMAND = f"/${{HOME}}/.local/bin/micromamba run -n {SERVER_ENV} spyder-server --jupyter-server"
     CHECK_SERVER_COMMAND = f"/${{HOME}}/.local/bin/micromamba run -n {SERVER_ENV} spyder-server -h"
     GET_SERVER_INFO_COMMAND = f"/${{HOME}}/.local/bin/micromamba run -n {SERVER_ENV} spyder-server --get-running-info"
 
-    def __init__(self, conf_id, options: SSHClientOptions, _plugin=None):
+    def __init__(
+        self,
+        conf_id,
+        options: SSHClientOptions,
+        _plugin=None,
+        batch_status_polls=False,
+    ):
         self._config_id = conf_id
         self.options = options
         self._plugin = _plugin
+        self.batch_status_polls = batch_status_polls
 
         self.__server_installed = asyncio.Event()
         self.__server_started = asyncio.Event()
@@ -80,6 +97,19 @@ def __init__(self, conf_id, options: SSHClientOptions, _plugin=None):
         self._port_forwarder: asyncssh.SSHListener = None
         self._server_info = {}
 
+        # Session used for all requests to the server
+        self._jupyter_api: JupyterAPI = None
+        self.__jupyter_api_lock = asyncio.Lock()
+        self.__jupyter_api_expired = False
+
+        # Request shared by batched kernel status polls
+        self.__kernels_request: asyncio.Future = None
+
+        # Files on the server
+        self.filesystem = RemoteFileSystem(
+            self, get_conf_path(osp.join("remoteclient", "files", conf_id))
+        )
+
         # For logging
         self._logger = logging.getLogger(
             f"{__name__}.{self.__class__.__name__}({self.config_id})"
@@ -194,6 +224,7 @@ async def close(self):
         )
 
         await self.stop_remote_server()
+        await self._close_jupyter_api()
         await self.close_port_forwarder()
         await self.close_ssh_connection()
 
@@ -201,6 +232,12 @@ def _handle_connection_lost(self, exc: Exception | None = None):
         self.__connection_established.clear()
         self.__server_started.clear()
         self._port_forwarder = None
+
+        # The port needs to be forwarded again after reconnecting, and the
+        # connections of the current session can't be reused.
+        self._server_info = {}
+        self.__jupyter_api_expired = True
+
         if exc:
             self._logger.error(
                 f"Connection to {self.peer_host} was lost",
@@ -631,15 +668,15 @@ async def stop_remote_server(self):
             f"{self._server_info['pid']}"
         )
         try:
-            async with JupyterAPI(
-                self.server_url, api_token=self.api_token
-            ) as jupyter:
-                await jupyter.shutdown_server()
+            jupyter = await self._get_jupyter_api()
+            await jupyter.shutdown_server()
         except Exception as err:
             self._logger.exception(
                 "Error stopping remote server", exc_info=err
             )
 
+        await self._close_jupyter_api()
+
         if (
             self._remote_server_process
             and not self._remote_server_process.is_closing()
@@ -748,63 +785,141 @@ async def get_kernel_info_ensure_server(
 
     async def start_new_kernel(self, kernel_spec=None) -> KernelInfo:
         """Start new kernel."""
-        async with JupyterAPI(
-            self.server_url, api_token=self.api_token
-        ) as jupyter:
-            response = await jupyter.create_kernel(kernel_spec=kernel_spec)
+        response = await self._call_jupyter_api(
+            "create_kernel", kernel_spec=kernel_spec
+        )
         self._logger.info(f"Kernel started with ID {response['id']}")
         return response
 
     async def list_kernels(self) -> list[KernelInfo]:
         """List kernels."""
-        async with JupyterAPI(
-            self.server_url, api_token=self.api_token
-        ) as jupyter:
-            response = await jupyter.list_kernels()
+        response = await self._call_jupyter_api("list_kernels")
 
         self._logger.info(f"Kernels listed for {self.peer_host}")
         return response
 
     async def get_kernel_info(self, kernel_id) -> KernelInfo:
         """Get kernel info."""
-        async with JupyterAPI(
-            self.server_url, api_token=self.api_token
-        ) as jupyter:
-            response = await jupyter.get_kernel(kernel_id=kernel_id)
+        if self.batch_status_polls:
+            kernels = await self._list_kernels_batched()
+            response = next(
+                (kernel for kernel in kernels if kernel["id"] == kernel_id),
+                {},
+            )
+        else:
+            response = await self._call_jupyter_api(
+                "get_kernel", kernel_id=kernel_id
+            )
 
         self._logger.info(f"Kernel info retrieved for ID {kernel_id}")
         return response
 
     async def terminate_kernel(self, kernel_id) -> bool:
         """Terminate kernel."""
-        async with JupyterAPI(
-            self.server_url, api_token=self.api_token
-        ) as jupyter:
-            response = await jupyter.delete_kernel(kernel_id=kernel_id)
+        response = await self._call_jupyter_api(
+            "delete_kernel", kernel_id=kernel_id
+        )
 
         self._logger.info(f"Kernel terminated for ID {kernel_id}")
         return response
 
     async def interrupt_kernel(self, kernel_id) -> bool:
         """Interrupt kernel."""
-        async with JupyterAPI(
-            self.server_url, api_token=self.api_token
-        ) as jupyter:
-            response = await jupyter.interrupt_kernel(kernel_id=kernel_id)
+        response = await self._call_jupyter_api(
+            "interrupt_kernel", kernel_id=kernel_id
+        )
 
         self._logger.info(f"Kernel interrupted for ID {kernel_id}")
         return response
 
     async def restart_kernel(self, kernel_id) -> bool:
         """Restart kernel."""
-        async with JupyterAPI(
-            self.server_url, api_token=self.api_token
-        ) as jupyter:
-            response = await jupyter.restart_kernel(kernel_id=kernel_id)
+        response = await self._call_jupyter_api(
+            "restart_kernel", kernel_id=kernel_id
+        )
 
         self._logger.info(f"Kernel restarted for ID {kernel_id}")
         return response
 
+    # --- Jupyter API session
+    async def _get_jupyter_api(self) -> JupyterAPI:
+        """
+        Get the session used for all requests to the server.
+
+        It's kept open (with its connections alive) between requests, and
+        created again if the server URL or token changed or the connection
+        was lost.
+        """
+        async with self.__jupyter_api_lock:
+            jupyter = self._jupyter_api
+            if jupyter is not None and (
+                self.__jupyter_api_expired
+                or jupyter.closed
+                or jupyter.notebook_url != self.server_url
+                or jupyter.api_token != self.api_token
+            ):
+                await self._close_jupyter_api()
+
+            if self._jupyter_api is None:
+                self._jupyter_api = JupyterAPI(
+                    self.server_url,
+                    api_token=self.api_token,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                )
+                await self._jupyter_api.connect()
+                self.__jupyter_api_expired = False
+
+            return self._jupyter_api
+
+    async def _close_jupyter_api(self):
+        """Close the session used for requests to the server."""
+        if self._jupyter_api is not None:
+            jupyter, self._jupyter_api = self._jupyter_api, None
+            await jupyter.close()
+
+    async def _call_jupyter_api(self, method, **kwargs):
+        """
+        Call `method` of the Jupyter API with the current session.
+
+        If the server can't be reached, the connection and server are
+        ensured again (which reconnects after a lost connection) and the
+        call is retried once.
+        """
+        try:
+            jupyter = await self._get_jupyter_api()
+            return await getattr(jupyter, method)(**kwargs)
+        except aiohttp.ClientConnectorError as err:
+            # Requests are not sent when this error is raised, so it's safe
+            # to retry them.
+            self._logger.debug(
+                f"Failed to reach the remote server ({err}), reconnecting"
+            )
+            self.__jupyter_api_expired = True
+            if not await self.ensure_connection_and_server():
+                raise
+
+        jupyter = await self._get_jupyter_api()
+        return await getattr(jupyter, method)(**kwargs)
+
+    async def _list_kernels_batched(self) -> list[KernelInfo]:
+        """
+        List kernels, sharing the request with the status polls done by
+        other callers in the meantime.
+        """
+        if self.__kernels_request is None:
+            self.__kernels_request = asyncio.ensure_future(
+                self.__list_kernels_for_batch()
+            )
+
+        return await asyncio.shield(self.__kernels_request)
+
+    async def __list_kernels_for_batch(self) -> list[KernelInfo]:
+        try:
+            await asyncio.sleep(self.STATUS_POLLS_BATCH_INTERVAL)
+            return await self._call_jupyter_api("list_kernels")
+        finally:
+            self.__kernels_request = None
+
     @staticmethod
     def get_free_port():
         """Request a free port from the OS."""
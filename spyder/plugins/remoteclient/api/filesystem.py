@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""File system of remote servers, with a local cache."""
+
+from __future__ import annotations
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import os.path as osp
+import posixpath
+import shutil
+import time
+import typing
+
+from spyder.plugins.remoteclient.api.protocol import RemoteFileEntry
+
+if typing.TYPE_CHECKING:
+    from spyder.plugins.remoteclient.api.client import SpyderRemoteClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteFileSystem:
+    """
+    File system of a remote server, accessed through the contents API of its
+    Jupyter server.
+
+    Files are cached locally along with their modification time and size on
+    the server, so they are only downloaded again when they change there.
+    Directory listings are kept for a few seconds and the ones of
+    subdirectories are prefetched in the background, so browsing feels as
+    fast as with local directories.
+    """
+
+    # Maximum size of the pieces files are uploaded in, before base64 encoding
+    CHUNK_SIZE = 1024 * 1024  # bytes
+
+    # Time directory listings are reused without asking the server again
+    LISTING_TIMEOUT = 5  # seconds
+
+    # Maximum number of subdirectories prefetched for each listing
+    MAX_PREFETCHED_DIRECTORIES = 20
+
+    def __init__(self, client: SpyderRemoteClient, cache_dir: str):
+        self._client = client
+        self._cache_dir = cache_dir
+        self._listings = {}
+        self._prefetch_tasks = set()
+
+    # ---- Directories
+    async def listdir(self, path="", prefetch=True) -> list[RemoteFileEntry]:
+        """
+        List the contents of directory `path`.
+
+        If `prefetch` is True, the contents of its subdirectories are listed
+        in the background too.
+        """
+        path = self._normalize_path(path)
+        listing = self._listings.get(path)
+        if (
+            listing is not None
+            and time.monotonic() - listing[0] < self.LISTING_TIMEOUT
+        ):
+            entries = listing[1]
+        else:
+            model = await self._client._call_jupyter_api(
+                "get_contents", path=path, type="directory"
+            )
+            entries = [self._get_entry(item) for item in model["content"]]
+            self._listings[path] = (time.monotonic(), entries)
+
+        if prefetch:
+            directories = [
+                entry["path"] for entry in entries
+                if entry["type"] == "directory"
+                and entry["path"] not in self._listings
+            ]
+            for directory in directories[:self.MAX_PREFETCHED_DIRECTORIES]:
+                task = asyncio.ensure_future(self._prefetch(directory))
+                self._prefetch_tasks.add(task)
+                task.add_done_callback(self._prefetch_tasks.discard)
+
+        return entries
+
+    async def mkdir(self, path) -> RemoteFileEntry:
+        """Create directory `path`."""
+        path = self._normalize_path(path)
+        model = await self._client._call_jupyter_api(
+            "save_contents", path=path, model={"type": "directory"}
+        )
+        self._invalidate_listing(path)
+        return self._get_entry(model)
+
+    async def stat(self, path) -> RemoteFileEntry:
+        """Get the entry of file or directory `path`."""
+        model = await self._client._call_jupyter_api(
+            "get_contents", path=self._normalize_path(path), content=False
+        )
+        return self._get_entry(model)
+
+    async def remove(self, path):
+        """Remove file or empty directory `path`."""
+        path = self._normalize_path(path)
+        await self._client._call_jupyter_api("delete_contents", path=path)
+        self._invalidate_listing(path)
+        self._listings.pop(path, None)
+
+        cache_path = self._get_cache_path(path)
+        for filename in (cache_path, cache_path + ".json"):
+            if osp.isfile(filename):
+                os.remove(filename)
+
+    # ---- Files
+    async def read_file(self, path) -> bytes:
+        """
+        Read the contents of file `path`.
+
+        They're taken from the local cache if the file didn't change on the
+        server since it was cached.
+        """
+        path = self._normalize_path(path)
+        model = await self._client._call_jupyter_api(
+            "get_contents", path=path, type="file", content=False
+        )
+
+        data = self._read_cache(path, model)
+        if data is not None:
+            logger.debug(f"Reading cached contents of {path}")
+            return data
+
+        model = await self._client._call_jupyter_api(
+            "get_contents", path=path, type="file", format="base64"
+        )
+        data = base64.b64decode(model["content"])
+        self._write_cache(path, data, model)
+
+        return data
+
+    async def write_file(self, path, data: bytes) -> RemoteFileEntry:
+        """
+        Write `data` to file `path`.
+
+        Large files are uploaded in chunks of `CHUNK_SIZE` bytes.
+        """
+        path = self._normalize_path(path)
+        chunks = [
+            data[i:i + self.CHUNK_SIZE]
+            for i in range(0, len(data), self.CHUNK_SIZE)
+        ] or [b""]
+
+        for number, chunk in enumerate(chunks, start=1):
+            model = {
+                "type": "file",
+                "format": "base64",
+                "content": base64.b64encode(chunk).decode("ascii"),
+            }
+
+            # The contents API numbers chunks from 1, with -1 for the last one
+            if len(chunks) > 1:
+                model["chunk"] = -1 if number == len(chunks) else number
+
+            model = await self._client._call_jupyter_api(
+                "save_contents", path=path, model=model
+            )
+
+        self._write_cache(path, data, model)
+        self._invalidate_listing(path)
+
+        return self._get_entry(model)
+
+    # ---- Cache
+    def clear_cache(self):
+        """Remove all cached files and directory listings."""
+        self._listings.clear()
+        shutil.rmtree(self._cache_dir, ignore_errors=True)
+
+    def _get_cache_path(self, path):
+        name = hashlib.sha1(path.encode("utf-8")).hexdigest()
+        return osp.join(self._cache_dir, name)
+
+    def _read_cache(self, path, model):
+        """
+        Get the cached contents of `path` if they correspond to the version
+        of the file described by `model`, or None otherwise.
+        """
+        cache_path = self._get_cache_path(path)
+        try:
+            with open(cache_path + ".json", "r") as fh:
+                info = json.load(fh)
+
+            if info != self._get_cache_info(path, model):
+                return None
+
+            with open(cache_path, "rb") as fh:
+                return fh.read()
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, path, data, model):
+        cache_path = self._get_cache_path(path)
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(cache_path, "wb") as fh:
+                fh.write(data)
+            with open(cache_path + ".json", "w") as fh:
+                json.dump(self._get_cache_info(path, model), fh)
+        except OSError as err:
+            logger.debug(f"Failed to cache {path}: {err}")
+
+    def _get_cache_info(self, path, model):
+        return {
+            "path": path,
+            "last_modified": model.get("last_modified"),
+            "size": model.get("size"),
+        }
+
+    # ---- Helpers
+    async def _prefetch(self, path):
+        try:
+            await self.listdir(path, prefetch=False)
+        except Exception as err:
+            logger.debug(f"Failed to prefetch listing of {path}: {err}")
+
+    def _invalidate_listing(self, path):
+        """Forget the listing of the directory that contains `path`."""
+        self._listings.pop(posixpath.dirname(path), None)
+
+    @staticmethod
+    def _normalize_path(path):
+        path = posixpath.normpath("/" + path.strip("/"))
+        return path.lstrip("/")
+
+    @staticmethod
+    def _get_entry(model) -> RemoteFileEntry:
+        return RemoteFileEntry(
+            name=model["name"],
+            path=model["path"],
+            type=model["type"],
+            size=model.get("size"),
+            last_modified=model["last_modified"],
+        )
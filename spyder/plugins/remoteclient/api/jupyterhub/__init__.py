@@ -19,6 +19,11 @@
 
 
 REQUEST_TIMEOUT = 5  # seconds
+KEEPALIVE_TIMEOUT = 15  # seconds
+
+# File transfers can take longer than other requests, so they only time out
+# if the server stops sending data.
+TRANSFER_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_read=REQUEST_TIMEOUT)
 
 
 class JupyterHubAPI:
@@ -272,23 +277,50 @@ async def execute_delete_service(self, service_name, url=""):
 
 
 class JupyterAPI:
-    def __init__(self, notebook_url, api_token, verify_ssl=True):
+    def __init__(
+        self,
+        notebook_url,
+        api_token,
+        verify_ssl=True,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    ):
+        self.notebook_url = notebook_url
         self.api_url = yarl.URL(notebook_url) / "api"
         self.api_token = api_token
         self.verify_ssl = verify_ssl
+        self.keepalive_timeout = keepalive_timeout
+        self.session = None
 
     async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def closed(self):
+        return self.session is None or self.session.closed
+
+    async def connect(self):
+        """
+        Open the session used for requests.
+
+        Its connections are kept alive between requests, so this can be
+        used for as long as the server is reachable.
+        """
         self.session = aiohttp.ClientSession(
             headers={"Authorization": f"token {self.api_token}"},
             connector=aiohttp.TCPConnector(
-                ssl=None if self.verify_ssl else False
+                ssl=None if self.verify_ssl else False,
+                keepalive_timeout=self.keepalive_timeout,
             ),
             timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
         )
-        return self
 
-    async def __aexit__(self, exc_type, exc, tb):
-        await self.session.close()
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
 
     async def create_kernel(self, kernel_spec=None):
         data = {"name": kernel_spec} if kernel_spec else None
@@ -393,6 +425,50 @@ async def shutdown_server(self):
             else:
                 return False
 
+    def _contents_url(self, path):
+        url = self.api_url / "contents"
+        for part in path.strip("/").split("/"):
+            if part:
+                url = url / part
+        return url
+
+    async def get_contents(self, path, content=True, type=None, format=None):
+        params = {"content": int(content)}
+        if type is not None:
+            params["type"] = type
+        if format is not None:
+            params["format"] = format
+
+        async with self.session.get(
+            self._contents_url(path), params=params, timeout=TRANSFER_TIMEOUT
+        ) as response:
+            if response.status == 404:
+                raise FileNotFoundError(f"path={path} does not exist")
+            elif response.status != 200:
+                raise ValueError(await response.text())
+            return await response.json()
+
+    async def save_contents(self, path, model):
+        async with self.session.put(
+            self._contents_url(path), json=model, timeout=TRANSFER_TIMEOUT
+        ) as response:
+            if response.status not in {200, 201}:
+                logger.error(f"failed to save path={path}")
+                raise ValueError(await response.text())
+            return await response.json()
+
+    async def delete_contents(self, path):
+        async with self.session.delete(
+            self._contents_url(path)
+        ) as response:
+            if response.status == 404:
+                raise FileNotFoundError(f"path={path} does not exist")
+            elif response.status == 204:
+                logger.info(f"deleted path={path} for jupyter")
+                return True
+            else:
+                raise ValueError(await response.text())
+
 
 class JupyterKernelAPI:
     def __init__(self, kernel_url, api_token, verify_ssl=True):
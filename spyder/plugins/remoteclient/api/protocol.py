@@ -34,6 +34,14 @@ class KernelConnectionInfo(typing.TypedDict):
     key: str
 
 
+class RemoteFileEntry(typing.TypedDict):
+    name: str
+    path: str
+    type: str
+    size: int | None
+    last_modified: str
+
+
 class SSHClientOptions(typing.TypedDict):
     host: str
     port: int | None
@@ -208,6 +208,28 @@ def restart_remote_server(self, config_id):
         self.stop_remote_server(config_id)
         self.start_remote_server(config_id)
 
+    # --- Remote File System Methods
+    @AsyncDispatcher.dispatch(loop="asyncssh")
+    async def list_remote_directory(self, config_id, path="") -> list:
+        """List the contents of a directory on a remote server."""
+        client = self._remote_clients[config_id]
+        await client.ensure_connection_and_server()
+        return await client.filesystem.listdir(path)
+
+    @AsyncDispatcher.dispatch(loop="asyncssh")
+    async def read_remote_file(self, config_id, path) -> bytes:
+        """Read the contents of a file on a remote server."""
+        client = self._remote_clients[config_id]
+        await client.ensure_connection_and_server()
+        return await client.filesystem.read_file(path)
+
+    @AsyncDispatcher.dispatch(loop="asyncssh")
+    async def write_remote_file(self, config_id, path, data: bytes) -> dict:
+        """Write the contents of a file on a remote server."""
+        client = self._remote_clients[config_id]
+        await client.ensure_connection_and_server()
+        return await client.filesystem.write_file(path, data)
+
     # --- Configuration Methods
     def load_client_from_id(self, config_id):
         """Load remote server from configuration id."""
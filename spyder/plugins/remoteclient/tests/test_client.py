@@ -0,0 +1,244 @@
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for the requests done by SpyderRemoteClient to the remote server.
+
+These use a local stand-in for the Jupyter server of spyder-remote-services
+with an artificial latency, so they don't need an SSH server.
+"""
+
+# Standard library imports
+import asyncio
+import base64
+import time
+
+# Third party imports
+from aiohttp import web
+import pytest
+
+# Local imports
+from spyder.plugins.remoteclient.api.client import SpyderRemoteClient
+from spyder.plugins.remoteclient.api.jupyterhub import JupyterAPI
+
+
+# Latency added to each request handled by the stand-in server
+LATENCY = 0.02  # seconds
+KERNEL = {"id": "kernel-id", "name": "python3", "execution_state": "idle"}
+
+
+# =============================================================================
+# ---- Helpers
+# =============================================================================
+class JupyterServerStandIn:
+    """Jupyter server with the kernel endpoints used by the client."""
+
+    def __init__(self):
+        self.connections = set()
+        self.requests = []
+
+        app = web.Application()
+        app.router.add_get("/api/kernels", self.list_kernels)
+        app.router.add_get("/api/kernels/{kernel_id}", self.get_kernel)
+        app.router.add_get("/api/contents/{path:.*}", self.get_contents)
+        app.router.add_put("/api/contents/{path:.*}", self.save_contents)
+        self.files = {}
+        self.chunks = {}
+        self.runner = web.AppRunner(app)
+        self.port = SpyderRemoteClient.get_free_port()
+
+    async def start(self):
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", self.port)
+        await site.start()
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def _handle(self, request, response):
+        self.connections.add(request.transport.get_extra_info("peername"))
+        self.requests.append(request.path)
+        await asyncio.sleep(LATENCY)
+        return web.json_response(response)
+
+    async def list_kernels(self, request):
+        return await self._handle(request, [KERNEL])
+
+    async def get_kernel(self, request):
+        return await self._handle(request, KERNEL)
+
+    def _get_model(self, path, content):
+        data, version = self.files[path]
+        model = {
+            "name": path.split("/")[-1],
+            "path": path,
+            "type": "file",
+            "size": len(data),
+            "last_modified": f"2024-01-01T00:00:{version:02d}Z",
+        }
+        if content:
+            model["format"] = "base64"
+            model["content"] = base64.b64encode(data).decode("ascii")
+        return model
+
+    async def get_contents(self, request):
+        path = request.match_info["path"]
+        if path not in self.files:
+            return web.json_response({}, status=404)
+
+        content = request.query.get("content") == "1"
+        return await self._handle(request, self._get_model(path, content))
+
+    async def save_contents(self, request):
+        path = request.match_info["path"]
+        model = await request.json()
+        chunk = model.get("chunk")
+        data = self.chunks.pop(path, b"") + base64.b64decode(model["content"])
+
+        self.requests.append(request.path)
+        if chunk is not None and chunk > 0:
+            self.chunks[path] = data
+            return web.json_response({"path": path}, status=201)
+
+        version = self.files.get(path, (b"", 0))[1] + 1
+        self.files[path] = (data, version)
+        return web.json_response(self._get_model(path, False), status=201)
+
+
+def create_client(port):
+    """Create a client connected to the stand-in server on `port`."""
+    client = SpyderRemoteClient("test", {})
+    client._server_info = {"token": "test-token"}
+    client.local_port = port
+    return client
+
+
+# =============================================================================
+# ---- Tests
+# =============================================================================
+def test_pooled_session_latency():
+    """
+    Compare the latency of kernel requests done with the pooled session
+    against opening a session for each of them.
+    """
+    n_requests = 20
+
+    async def run():
+        server = JupyterServerStandIn()
+        await server.start()
+        client = create_client(server.port)
+
+        try:
+            # A session per request (what the client used to do)
+            start = time.perf_counter()
+            for __ in range(n_requests):
+                async with JupyterAPI(
+                    client.server_url, api_token=client.api_token
+                ) as jupyter:
+                    await jupyter.get_kernel(KERNEL["id"])
+            per_request_time = time.perf_counter() - start
+            per_request_connections = len(server.connections)
+
+            # Pooled session
+            server.connections.clear()
+            start = time.perf_counter()
+            for __ in range(n_requests):
+                assert await client.get_kernel_info(KERNEL["id"]) == KERNEL
+            pooled_time = time.perf_counter() - start
+            pooled_connections = len(server.connections)
+        finally:
+            await client._close_jupyter_api()
+            await server.stop()
+
+        return (per_request_time, per_request_connections, pooled_time,
+                pooled_connections)
+
+    (per_request_time, per_request_connections, pooled_time,
+     pooled_connections) = asyncio.run(run())
+
+    print(f"Session per request: {per_request_time / n_requests:.4f} s "
+          f"per request, {per_request_connections} connections")
+    print(f"Pooled session: {pooled_time / n_requests:.4f} s per request, "
+          f"{pooled_connections} connections")
+
+    assert per_request_connections == n_requests
+    assert pooled_connections == 1
+
+
+def test_batched_status_polls():
+    """Test that concurrent kernel status polls are done in one request."""
+
+    async def run():
+        server = JupyterServerStandIn()
+        await server.start()
+        client = create_client(server.port)
+        client.batch_status_polls = True
+
+        try:
+            infos = await asyncio.gather(
+                *[client.get_kernel_info(KERNEL["id"]) for __ in range(10)],
+                client.get_kernel_info("unknown-id"),
+            )
+        finally:
+            await client._close_jupyter_api()
+            await server.stop()
+
+        return infos, server.requests
+
+    infos, requests = asyncio.run(run())
+
+    assert infos == [KERNEL] * 10 + [{}]
+    assert requests == ["/api/kernels"]
+
+
+def test_remote_filesystem(tmp_path):
+    """
+    Test that remote files are uploaded in chunks and only downloaded again
+    when they change on the server.
+    """
+    data = b"x" * 2500
+
+    async def run():
+        server = JupyterServerStandIn()
+        await server.start()
+        client = create_client(server.port)
+        filesystem = client.filesystem
+        filesystem._cache_dir = str(tmp_path)
+        filesystem.CHUNK_SIZE = 1000
+
+        try:
+            # Chunked upload
+            await filesystem.write_file("dir/file.py", data)
+            uploads = len(server.requests)
+
+            # The contents written are cached, so only their version is
+            # requested when reading them
+            server.requests.clear()
+            assert await filesystem.read_file("dir/file.py") == data
+            cached_reads = len(server.requests)
+
+            # Files changed on the server are downloaded again
+            server.files["dir/file.py"] = (b"new", 10)
+            server.requests.clear()
+            assert await filesystem.read_file("/dir//file.py") == b"new"
+            changed_reads = len(server.requests)
+        finally:
+            await client._close_jupyter_api()
+            await server.stop()
+
+        return uploads, cached_reads, changed_reads, server.files
+
+    uploads, cached_reads, changed_reads, files = asyncio.run(run())
+
+    assert uploads == 3
+    assert cached_reads == 1
+    assert changed_reads == 2
+    assert files["dir/file.py"][0] == b"new"
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -82,6 +82,19 @@ class Switcher(SpyderPluginV2):
         The current search/filter text.
     """
 
+    sig_mode_search_text_available = Signal(str, str)
+    """
+    This signal is emitted when the user stops typing the search/filter text
+    in a mode other than the files one, before the list is filtered.
+
+    Parameters
+    ----------
+    mode: str
+        The current mode (symbol "@" or line ":").
+    search_text: str
+        The current search/filter text, without the mode.
+    """
+
     # ---- SpyderPluginV2 API
     # -------------------------------------------------------------------------
     @staticmethod
@@ -107,6 +120,9 @@ def on_initialize(self):
         self._switcher.sig_search_text_available.connect(
             self.sig_search_text_available
         )
+        self._switcher.sig_mode_search_text_available.connect(
+            self.sig_mode_search_text_available
+        )
 
     def on_close(self, cancellable=True):
         """Close switcher widget."""
@@ -139,7 +139,7 @@ def get_file_icon(path):
     else:
         scale_factor = 0.6
 
-    return ima.get_icon_by_extension_or_type(path, scale_factor)
+    return ima.get_icon_by_extension(path, scale_factor)
 
 
 def clean_string(text):
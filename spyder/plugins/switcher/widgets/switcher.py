@@ -122,6 +122,19 @@ class Switcher(QDialog, SpyderFontsMixin):
         The current search text.
     """
 
+    sig_mode_search_text_available = Signal(str, str)
+    """
+    This signal is emitted when the user stops typing in the filter line edit
+    in a mode other than the files one, before the list is filtered.
+
+    Parameters
+    ----------
+    mode: str
+        The current mode (symbol "@" or line ":").
+    search_text: str
+        The current search text, without the mode.
+    """
+
     _MAX_NUM_ITEMS = 15
     _MIN_WIDTH = 580
     _MIN_HEIGHT = 200
@@ -489,6 +502,12 @@ def _on_search_text_changed(self):
             if self._mode_on == "":
                 self.sig_search_text_available.emit(clean_string(search_text))
             else:
+                # Modes can add the items that match the search text before
+                # they are filtered.
+                self.sig_mode_search_text_available.emit(
+                    self._mode_on,
+                    clean_string(self.search_text_without_mode())
+                )
                 self.setup()
         else:
             self.setup()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Dialog to show the top memory allocations done by the last cell run in a
+kernel.
+"""
+
+# Third party imports
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import (
+    QAbstractItemView, QDialogButtonBox, QHeaderView, QLabel, QTableWidget,
+    QTableWidgetItem, QVBoxLayout)
+
+# Local imports
+from spyder.api.translations import _
+from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
+from spyder.widgets.collectionseditor import memory_to_display
+
+
+class NumericTableWidgetItem(QTableWidgetItem):
+    """Table item that is sorted by a number instead of its text."""
+
+    def __init__(self, text, number):
+        super().__init__(text)
+        self.number = number
+
+    def __lt__(self, other):
+        return self.number < other.number
+
+
+class TopAllocationsDialog(BaseDialog):
+    """
+    Dialog with the lines of code that allocated most memory since the last
+    cell started running.
+    """
+
+    COLUMNS = [_("File"), _("Line"), _("Memory allocated"), _("Blocks")]
+
+    def __init__(self, parent, allocations):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setWindowTitle(_("Top memory allocations"))
+
+        label = QLabel(
+            _("Lines of code that allocated the most memory since the last "
+              "cell started running:")
+        )
+        label.setWordWrap(True)
+
+        self.table = QTableWidget(len(allocations), len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().hide()
+
+        for row, allocation in enumerate(allocations):
+            items = [
+                QTableWidgetItem(allocation['filename']),
+                NumericTableWidgetItem(
+                    str(allocation['lineno']), allocation['lineno']),
+                NumericTableWidgetItem(
+                    memory_to_display(allocation['size_diff']),
+                    allocation['size_diff']),
+                NumericTableWidgetItem(
+                    '{:+d}'.format(allocation['count_diff']),
+                    allocation['count_diff']),
+            ]
+            items[0].setToolTip(allocation['filename'])
+            for column, item in enumerate(items):
+                self.table.setItem(row, column, item)
+
+        self.table.setSortingEnabled(True)
+        self.table.sortItems(2, Qt.DescendingOrder)
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.Stretch)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout()
+        layout.addWidget(label)
+        layout.addWidget(self.table)
+        layout.addWidget(buttons)
+        self.setLayout(layout)
@@ -144,7 +144,9 @@ def createEditor(self, parent, option, index, object_explorer=False):
         """Overriding method createEditor"""
         val_type = index.sibling(index.row(), 1).data()
         self.sig_editor_creation_started.emit()
-        if index.column() < 3:
+        # Only values can be edited, not the columns that describe them
+        # (name, type, size and memory)
+        if index.column() < 3 or index.column() == 5:
             return None
         if self.show_warning(index):
             answer = QMessageBox.warning(
@@ -33,6 +33,7 @@ class VariableExplorerWidgetActions:
     ResetNamespace = 'reset_namespaces_action'
     Search = 'search'
     Refresh = 'refresh'
+    ShowTopAllocations = 'show_top_allocations_action'
 
     # Toggles
     ToggleExcludePrivate = 'toggle_exclude_private_action'
@@ -43,6 +44,8 @@ class VariableExplorerWidgetActions:
         'toggle_exclude_callables_and_modules_action')
     ToggleMinMax = 'toggle_minmax_action'
     ToggleFilter = 'toggle_filter_variable_action'
+    ToggleShowMemory = 'toggle_show_memory_action'
+    ToggleTraceAllocations = 'toggle_trace_allocations_action'
 
     # Resize
     ResizeRowsAction = 'resize_rows_action'
@@ -52,6 +55,7 @@ class VariableExplorerWidgetActions:
 class VariableExplorerWidgetOptionsMenuSections:
     Display = 'excludes_section'
     Highlight = 'highlight_section'
+    Memory = 'memory_section'
     Resize = 'resize_section'
 
 
@@ -146,6 +150,31 @@ def setup(self):
             option='minmax'
         )
 
+        show_memory_action = self.create_action(
+            VariableExplorerWidgetActions.ToggleShowMemory,
+            text=_("Show memory usage"),
+            tip=_("Show the memory used by each variable"),
+            toggled=True,
+            option='show_memory'
+        )
+
+        trace_allocations_action = self.create_action(
+            VariableExplorerWidgetActions.ToggleTraceAllocations,
+            text=_("Trace memory allocations"),
+            tip=_("Trace the memory allocated by the code that runs in the "
+                  "console. This makes it run slower."),
+            toggled=self._enable_top_allocations_action,
+            option='trace_allocations'
+        )
+
+        self.top_allocations_action = self.create_action(
+            VariableExplorerWidgetActions.ShowTopAllocations,
+            text=_("Show top allocations of last cell"),
+            tip=_("Show the lines of code that allocated most memory since "
+                  "the last cell started running"),
+            triggered=self.show_top_allocations
+        )
+
         # ---- Toolbar actions
         import_data_action = self.create_action(
             VariableExplorerWidgetActions.ImportData,
@@ -301,6 +330,18 @@ def setup(self):
 
         self._enable_filter_actions(self.get_conf('filter_on'))
 
+        # Memory
+        for item in [show_memory_action, trace_allocations_action,
+                     self.top_allocations_action]:
+            self.add_item_to_menu(
+                item,
+                menu=options_menu,
+                section=VariableExplorerWidgetOptionsMenuSections.Memory,
+            )
+
+        self._enable_top_allocations_action(
+            self.get_conf('trace_allocations'))
+
         # Resize
         for item in [resize_rows_action, resize_columns_action]:
             self.add_item_to_menu(
@@ -596,6 +637,11 @@ def free_memory(self):
         QTimer.singleShot(self.SECONDARY_FREE_MEMORY_TIME_TRIGGER,
                           self.sig_free_memory_requested)
 
+    def show_top_allocations(self):
+        if not self.is_current_widget_empty():
+            nsb = self.current_widget()
+            nsb.show_top_allocations()
+
     def resize_rows(self):
         if self._current_editor is not None:
             self._current_editor.resizeRowsToContents()
@@ -692,6 +738,10 @@ def _enable_filter_actions(self, value):
         self.exclude_unsupported_action.setEnabled(value)
         self.exclude_callables_and_modules_action.setEnabled(value)
 
+    def _enable_top_allocations_action(self, value):
+        """Handle the change of the trace allocations state."""
+        self.top_allocations_action.setEnabled(value)
+
     def _set_main_toolbar_state(self, enabled):
         """Set main toolbar enabled state."""
         main_toolbar = self.get_main_toolbar()
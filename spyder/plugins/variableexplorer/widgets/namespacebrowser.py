@@ -33,6 +33,8 @@
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.config.utils import IMPORT_EXT
 from spyder.widgets.collectionseditor import RemoteCollectionsEditorTableView
+from spyder.plugins.variableexplorer.widgets.allocationsdialog import (
+    TopAllocationsDialog)
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
 from spyder.utils import encoding
 from spyder.utils.misc import getcwd_or_home, remove_backslashes
@@ -220,12 +222,14 @@ def refresh_namespacebrowser(self, *, interrupt=True):
             return
         self.shellwidget.call_kernel(
             interrupt=interrupt,
-            callback=self.process_remote_view
+            callback=self.process_remote_view,
+            dedupe=True
         ).get_namespace_view()
 
         self.shellwidget.call_kernel(
             interrupt=interrupt,
-            callback=self.set_var_properties
+            callback=self.set_var_properties,
+            dedupe=True
         ).get_var_properties()
 
     def set_namespace_view_settings(self):
@@ -236,6 +240,9 @@ def set_namespace_view_settings(self):
         self.shellwidget.set_kernel_configuration(
             "namespace_view_settings", settings
         )
+        self.shellwidget.set_kernel_configuration(
+            "trace_allocations", self.get_conf('trace_allocations')
+        )
 
     def process_remote_view(self, remote_view):
         """Process remote view"""
@@ -392,6 +399,29 @@ def reset_namespace(self):
         self.shellwidget.reset_namespace(warning=warning, message=True)
         self.editor.automatic_column_width = True
 
+    def show_top_allocations(self):
+        """Show the top memory allocations done by the last cell."""
+        if not self.shellwidget.spyder_kernel_ready:
+            return
+        self.shellwidget.call_kernel(
+            interrupt=True,
+            callback=self._show_top_allocations
+        ).get_top_allocations()
+
+    def _show_top_allocations(self, allocations):
+        """Show the allocations received from the kernel in a dialog."""
+        if not allocations:
+            QMessageBox.information(
+                self,
+                _("Top memory allocations"),
+                _("No memory was allocated since the last cell started "
+                  "running, or memory allocations are not being traced.")
+            )
+            return
+
+        dialog = TopAllocationsDialog(self, allocations)
+        dialog.show()
+
     def save_data(self):
         """Save data"""
         if not self.shellwidget.spyder_kernel_ready:
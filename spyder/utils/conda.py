@@ -21,7 +21,11 @@
 )
 
 # Local imports
-from spyder.utils.programs import find_program, run_program, run_shell_command
+from spyder.utils.programs import (
+    find_program,
+    get_interpreters_info,
+    run_shell_command,
+)
 from spyder.config.base import is_conda_based_app
 
 WINDOWS = os.name == 'nt'
@@ -119,6 +123,7 @@ def get_list_conda_envs():
     except Exception:
         out = {'envs': []}
 
+    envs = {}
     for env in out['envs']:
         name = env.split(osp.sep)[-1]
         path = osp.join(env, 'python.exe') if WINDOWS else osp.join(
@@ -132,16 +137,16 @@ def get_list_conda_envs():
         ):
             continue
 
-        try:
-            version, __ = run_program(path, ['--version']).communicate()
-            version = version.decode()
-        except Exception:
-            version = ''
-
         name = ('base' if name.lower().startswith('anaconda') or
                 name.lower().startswith('miniconda') else name)
         name = 'Conda: {}'.format(name)
-        env_list[name] = (path, version.strip())
+        envs[name] = path
+
+    # Get versions of all envs at once because that can take a long time if
+    # there are many of them.
+    versions = get_interpreters_info(list(envs.values()))
+    for name, path in envs.items():
+        env_list[name] = (path, versions[path])
 
     CONDA_ENV_LIST_CACHE = env_list
     return env_list
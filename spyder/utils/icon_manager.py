@@ -11,8 +11,9 @@
 import sys
 
 # Third party imports
-from qtpy.QtCore import QBuffer, QByteArray
-from qtpy.QtGui import QColor, QIcon, QImage, QPainter
+from qtpy.QtCore import QBuffer, QByteArray, QPoint, QRect, Qt
+from qtpy.QtGui import (QColor, QIcon, QIconEngine, QImage, QPainter,
+                        QPixmap)
 from qtpy.QtWidgets import QStyle, QWidget
 
 # Local imports
@@ -23,6 +24,36 @@
 import qtawesome as qta
 
 
+class CachedIconEngine(QIconEngine):
+    """
+    Icon engine that rasterizes the pixmaps of another icon only once per
+    size, mode and state.
+    """
+
+    def __init__(self, icon, pixmaps=None):
+        super().__init__()
+        self._icon = icon
+        self._pixmaps = {} if pixmaps is None else pixmaps
+
+    def paint(self, painter, rect, mode, state):
+        self._icon.paint(painter, rect, Qt.AlignCenter, mode, state)
+
+    def pixmap(self, size, mode, state):
+        key = (size.width(), size.height(), mode, state)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(size)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            self.paint(painter, QRect(QPoint(0, 0), size), mode, state)
+            painter.end()
+            self._pixmaps[key] = pixmap
+        return QPixmap(pixmap)
+
+    def clone(self):
+        return CachedIconEngine(self._icon, self._pixmaps)
+
+
 class IconManager():
     """Class that manages all the icons."""
     def __init__(self):
@@ -49,6 +80,12 @@ def __init__(self):
 
         self.ICONS_BY_EXTENSION = {}
 
+        # Icons already created, by name, scale factor, icon theme and
+        # palette. They are discarded when the icon theme changes.
+        self._icons = {}
+        self._theme = CONF.get('appearance', 'icon_theme')
+        CONF.observe_configuration(self, 'appearance', 'icon_theme')
+
         # Magnification factors for attribute icons per platform
         if sys.platform.startswith('linux'):
             self.BIG_ATTR_FACTOR = 1.0
@@ -446,9 +483,22 @@ def get_icon(self, name, resample=False):
 
             return icon
 
+    def on_configuration_change(self, option, section, value):
+        """Discard the icons created for the previous icon theme."""
+        if section == 'appearance' and option == 'icon_theme':
+            self._theme = value
+            self._icons = {}
+            self.ICONS_BY_EXTENSION = {}
+
     def icon(self, name, scale_factor=None, resample=False):
-        theme = CONF.get('appearance', 'icon_theme')
-        if theme == 'spyder 3':
+        key = (name, scale_factor, self._theme, SpyderPalette.__name__)
+        if key not in self._icons:
+            self._icons[key] = self._create_icon(name, scale_factor)
+        return self._icons[key]
+
+    def _create_icon(self, name, scale_factor=None):
+        """Create the icon called `name` for the current icon theme."""
+        if self._theme == 'spyder 3':
             try:
                 # Try to load the icons from QtAwesome
                 if not self._resource['loaded']:
@@ -456,10 +506,14 @@ def icon(self, name, scale_factor=None, resample=False):
                                 directory=self._resource['directory'])
                     self._resource['loaded'] = True
                 args, kwargs = self._qtaargs[name]
+                kwargs = dict(kwargs)
                 if scale_factor is not None:
                     kwargs['scale_factor'] = scale_factor
                 kwargs['color_disabled'] = SpyderPalette.COLOR_DISABLED
-                return qta.icon(*args, **kwargs)
+
+                # QtAwesome paints its icons every time a pixmap is
+                # requested, so we keep the pixmaps it renders.
+                return QIcon(CachedIconEngine(qta.icon(*args, **kwargs)))
             except KeyError:
                 # Load custom icons
                 icon = QIcon(self.get_icon(name))
@@ -467,13 +521,31 @@ def icon(self, name, scale_factor=None, resample=False):
 
     def get_icon_by_extension_or_type(self, fname, scale_factor):
         """Return the icon depending on the file extension"""
-        application_icons = {}
-        application_icons.update(self.BIN_FILES)
-        application_icons.update(self.DOCUMENT_FILES)
+        if osp.isdir(fname):
+            if ("Folder", scale_factor) not in self.ICONS_BY_EXTENSION:
+                self.ICONS_BY_EXTENSION[("Folder", scale_factor)] = self.icon(
+                    'DirClosedIcon', scale_factor)
+            return self.ICONS_BY_EXTENSION[("Folder", scale_factor)]
+
+        return self.get_icon_by_extension(fname, scale_factor)
+
+    def get_icon_by_extension(self, fname, scale_factor):
+        """
+        Return the icon of a file depending on its extension.
 
+        Unlike `get_icon_by_extension_or_type`, this doesn't access the
+        file system, so it must only be used for files.
+        """
         basename = osp.basename(fname)
         __, extension = osp.splitext(basename.lower())
 
+        if (extension, scale_factor) in self.ICONS_BY_EXTENSION:
+            return self.ICONS_BY_EXTENSION[(extension, scale_factor)]
+
+        application_icons = {}
+        application_icons.update(self.BIN_FILES)
+        application_icons.update(self.DOCUMENT_FILES)
+
         # Catch error when it's not possible to access the Windows registry to
         # check for this.
         # Fixes spyder-ide/spyder#21304
@@ -482,57 +554,48 @@ def get_icon_by_extension_or_type(self, fname, scale_factor):
         except PermissionError:
             mime_type = None
 
-        if osp.isdir(fname):
-            extension = "Folder"
-
-        if (extension, scale_factor) in self.ICONS_BY_EXTENSION:
-            return self.ICONS_BY_EXTENSION[(extension, scale_factor)]
+        icon_by_extension = self.icon('GenericFileIcon')
 
-        if osp.isdir(fname):
-            icon_by_extension = self.icon('DirClosedIcon', scale_factor)
+        if extension in self.OFFICE_FILES:
+            icon_by_extension = self.icon(
+                self.OFFICE_FILES[extension], scale_factor)
+        elif extension in self.LANGUAGE_ICONS:
+            icon_by_extension = self.icon(
+                self.LANGUAGE_ICONS[extension], scale_factor)
         else:
-            icon_by_extension = self.icon('GenericFileIcon')
-
-            if extension in self.OFFICE_FILES:
-                icon_by_extension = self.icon(
-                    self.OFFICE_FILES[extension], scale_factor)
-            elif extension in self.LANGUAGE_ICONS:
-                icon_by_extension = self.icon(
-                    self.LANGUAGE_ICONS[extension], scale_factor)
-            else:
-                if extension == '.ipynb':
-                    icon_by_extension = self.icon('notebook')
-                elif extension == '.tex':
-                    icon_by_extension = self.icon('file_type_tex')
-                elif extension in EDIT_EXTENSIONS:
-                    icon_by_extension = self.icon('TextFileIcon', scale_factor)
-                elif mime_type is not None:
-                    try:
-                        # Fix for spyder-ide/spyder#5080. Even though
-                        # mimetypes.guess_type documentation states that
-                        # the return value will be None or a tuple of
-                        # the form type/subtype, in the Windows registry,
-                        # .sql has a mimetype of text\plain
-                        # instead of text/plain therefore mimetypes is
-                        # returning it incorrectly.
-                        file_type, bin_name = mime_type.split('/')
-                    except ValueError:
-                        file_type = None
-                    if file_type is None:
-                        icon_by_extension = self.icon('binary')
-                    elif file_type == 'audio':
-                        icon_by_extension = self.icon(
-                            'AudioFileIcon', scale_factor)
-                    elif file_type == 'video':
-                        icon_by_extension = self.icon(
-                            'VideoFileIcon', scale_factor)
-                    elif file_type == 'image':
+            if extension == '.ipynb':
+                icon_by_extension = self.icon('notebook')
+            elif extension == '.tex':
+                icon_by_extension = self.icon('file_type_tex')
+            elif extension in EDIT_EXTENSIONS:
+                icon_by_extension = self.icon('TextFileIcon', scale_factor)
+            elif mime_type is not None:
+                try:
+                    # Fix for spyder-ide/spyder#5080. Even though
+                    # mimetypes.guess_type documentation states that
+                    # the return value will be None or a tuple of
+                    # the form type/subtype, in the Windows registry,
+                    # .sql has a mimetype of text\plain
+                    # instead of text/plain therefore mimetypes is
+                    # returning it incorrectly.
+                    file_type, bin_name = mime_type.split('/')
+                except ValueError:
+                    file_type = None
+                if file_type is None:
+                    icon_by_extension = self.icon('binary')
+                elif file_type == 'audio':
+                    icon_by_extension = self.icon(
+                        'AudioFileIcon', scale_factor)
+                elif file_type == 'video':
+                    icon_by_extension = self.icon(
+                        'VideoFileIcon', scale_factor)
+                elif file_type == 'image':
+                    icon_by_extension = self.icon(
+                        'ImageFileIcon', scale_factor)
+                elif file_type == 'application':
+                    if bin_name in application_icons:
                         icon_by_extension = self.icon(
-                            'ImageFileIcon', scale_factor)
-                    elif file_type == 'application':
-                        if bin_name in application_icons:
-                            icon_by_extension = self.icon(
-                                application_icons[bin_name], scale_factor)
+                            application_icons[bin_name], scale_factor)
 
         self.ICONS_BY_EXTENSION[(extension, scale_factor)] = icon_by_extension
         return icon_by_extension
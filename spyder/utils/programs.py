@@ -8,11 +8,13 @@
 
 # Standard library imports
 from ast import literal_eval
+from concurrent.futures import ThreadPoolExecutor
 import glob
 from getpass import getuser
 import importlib
 from importlib.metadata import PackageNotFoundError, version as package_version
 import itertools
+import json
 import os
 import os.path as osp
 import re
@@ -27,10 +29,11 @@
 # Third party imports
 from packaging.version import parse
 import psutil
-from spyder_kernels.utils.pythonenv import is_conda_env
+from spyder_kernels.utils.pythonenv import get_env_dir, is_conda_env
 
 # Local imports
-from spyder.config.base import _, running_under_pytest, get_home_dir
+from spyder.config.base import (
+    _, running_under_pytest, get_conf_path, get_home_dir)
 from spyder.utils import encoding
 from spyder.utils.misc import get_python_executable
 
@@ -38,6 +41,18 @@
 logger = logging.getLogger(__name__)
 HERE = osp.abspath(osp.dirname(__file__))
 
+# File where the version of the interpreters found in the system is saved
+INTERPRETERS_INFO_CACHE = 'interpreters_info.json'
+INTERPRETERS_INFO_LOCK = threading.Lock()
+
+# File where the capabilities of the interpreters used for kernels are saved
+INTERPRETERS_CAPABILITIES_CACHE = 'interpreters_capabilities.json'
+
+# Distributions whose versions are part of the capabilities of interpreters
+CAPABILITIES_PACKAGES = [
+    'spyder-kernels', 'ipykernel', 'ipython', 'matplotlib', 'numpy', 'pandas'
+]
+
 
 class ProgramError(Exception):
     pass
@@ -1190,6 +1205,244 @@ def get_interpreter_info(path):
     return out.strip()
 
 
+def _get_interpreter_info_key(path):
+    """
+    Return the key used to check if the cached info of an interpreter is
+    still valid.
+
+    It's made of the modification time and size of the interpreter and of
+    its env `conda-meta/history` file, which changes every time packages are
+    installed or removed from a conda env.
+    """
+    key = []
+    history = osp.join(get_env_dir(path), 'conda-meta', 'history')
+    for fname in [path, history]:
+        try:
+            stat = os.stat(fname)
+            key.append([stat.st_mtime, stat.st_size])
+        except OSError:
+            key.append(None)
+
+    return key
+
+
+def _load_interpreters_info_cache(filename=INTERPRETERS_INFO_CACHE):
+    """Load the cached info of interpreters from disk."""
+    try:
+        with open(get_conf_path(filename), 'r') as f:
+            cache = json.load(f)
+        if not isinstance(cache, dict):
+            cache = {}
+    except Exception:
+        cache = {}
+
+    return cache
+
+
+def _save_interpreters_info_cache(cache, filename=INTERPRETERS_INFO_CACHE):
+    """Save the info of interpreters to disk."""
+    try:
+        with open(get_conf_path(filename), 'w') as f:
+            json.dump(cache, f)
+    except Exception:
+        logger.debug("Unable to save the cache of interpreters info",
+                     exc_info=True)
+
+
+def get_interpreters_info(paths, max_workers=8):
+    """
+    Return version information of several Python interpreters.
+
+    Parameters
+    ----------
+    paths: list
+        Paths to the interpreters.
+    max_workers: int, optional
+        Maximum number of interpreters that are run at the same time.
+
+    Returns
+    -------
+    dict
+        A dict with interpreter paths as keys and their version information
+        (as returned by :py:func:`get_interpreter_info`) as values.
+
+    Notes
+    -----
+    Results are saved on disk and only the interpreters that changed since
+    the last call (according to the modification time of their executable and
+    their `conda-meta/history` file) are run again, in parallel.
+    """
+    paths = list(dict.fromkeys(paths))
+    keys = {path: _get_interpreter_info_key(path) for path in paths}
+
+    with INTERPRETERS_INFO_LOCK:
+        cache = _load_interpreters_info_cache()
+
+    info = {}
+    outdated = []
+    for path in paths:
+        cached = cache.get(path)
+        if (
+            isinstance(cached, dict)
+            and cached.get('key') == keys[path]
+            # Failed calls are not cached
+            and cached.get('version')
+        ):
+            info[path] = cached['version']
+        else:
+            outdated.append(path)
+
+    if outdated:
+        logger.debug(f"Getting version info of {len(outdated)} interpreters")
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(outdated))
+        ) as executor:
+            versions = executor.map(get_interpreter_info, outdated)
+            info.update(zip(outdated, versions))
+
+        with INTERPRETERS_INFO_LOCK:
+            # Load cache again in case it was updated in the meantime by
+            # another thread.
+            cache = _load_interpreters_info_cache()
+            for path in outdated:
+                if info[path]:
+                    cache[path] = {'key': keys[path], 'version': info[path]}
+            _save_interpreters_info_cache(cache)
+
+    return info
+
+
+def _get_interpreter_capabilities_key(path, site_packages):
+    """
+    Return the key used to check if the cached capabilities of an
+    interpreter are still valid.
+
+    Besides the info key, it includes the modification time of its
+    site-packages directories, which changes every time packages are
+    installed, updated or removed with pip.
+    """
+    key = _get_interpreter_info_key(path)
+    for dirname in site_packages:
+        try:
+            key.append(os.stat(dirname).st_mtime)
+        except OSError:
+            key.append(None)
+
+    return key
+
+
+def _probe_interpreter_capabilities(path):
+    """Get the capabilities of an interpreter by running it once."""
+    cmd = dedent(
+        """
+        import json, platform, site, sys, sysconfig
+        from importlib.metadata import version
+
+        packages = {{}}
+        for name in {packages}:
+            try:
+                packages[name] = version(name)
+            except Exception:
+                packages[name] = None
+
+        # Dev versions of spyder-kernels can be used without installing them
+        if packages['spyder-kernels'] is None:
+            try:
+                import spyder_kernels
+                packages['spyder-kernels'] = spyder_kernels.__version__
+            except Exception:
+                pass
+
+        site_packages = set(
+            sysconfig.get_path(name) for name in ['purelib', 'platlib']
+        )
+        if site.ENABLE_USER_SITE:
+            site_packages.add(site.getusersitepackages())
+
+        print(json.dumps({{
+            'python_version': platform.python_version(),
+            'site_packages': sorted(site_packages),
+            'packages': packages,
+        }}))  # spyder: test-skip
+        """
+    ).format(packages=repr(CAPABILITIES_PACKAGES))
+
+    try:
+        # Use clean environment
+        proc = run_program(path, ['-c', cmd], env={})
+        stdout, __ = proc.communicate()
+        capabilities = json.loads(stdout.decode().strip().splitlines()[-1])
+    except Exception:
+        logger.debug(f"Unable to get capabilities of {path}", exc_info=True)
+        return None
+
+    return capabilities
+
+
+def get_interpreter_capabilities(path, refresh=False):
+    """
+    Return the capabilities of a Python interpreter.
+
+    Parameters
+    ----------
+    path: str
+        Path to the interpreter.
+    refresh: bool, optional
+        Whether to run the interpreter even if its capabilities are cached.
+
+    Returns
+    -------
+    dict or None
+        A dict with its Python version (`python_version`), site-packages
+        directories (`site_packages`) and the versions of the distributions
+        in `CAPABILITIES_PACKAGES` (`packages`, with None for the ones that
+        are not installed). None if the interpreter couldn't be run.
+
+    Notes
+    -----
+    Capabilities are saved on disk and the interpreter is only run again (to
+    get all of them at once) if it or its site-packages directories changed
+    since the last call.
+    """
+    if not refresh:
+        with INTERPRETERS_INFO_LOCK:
+            cache = _load_interpreters_info_cache(
+                INTERPRETERS_CAPABILITIES_CACHE
+            )
+
+        cached = cache.get(path)
+        if isinstance(cached, dict) and isinstance(
+            cached.get('capabilities'), dict
+        ):
+            capabilities = cached['capabilities']
+            key = _get_interpreter_capabilities_key(
+                path, capabilities.get('site_packages', [])
+            )
+            if cached.get('key') == key:
+                return capabilities
+
+    logger.debug(f"Getting capabilities of {path}")
+    capabilities = _probe_interpreter_capabilities(path)
+
+    # Failed calls are not cached
+    if capabilities is not None:
+        key = _get_interpreter_capabilities_key(
+            path, capabilities['site_packages']
+        )
+        with INTERPRETERS_INFO_LOCK:
+            # Load cache again in case it was updated in the meantime by
+            # another thread.
+            cache = _load_interpreters_info_cache(
+                INTERPRETERS_CAPABILITIES_CACHE
+            )
+            cache[path] = {'key': key, 'capabilities': capabilities}
+            _save_interpreters_info_cache(
+                cache, INTERPRETERS_CAPABILITIES_CACHE
+            )
+
+    return capabilities
+
+
 def find_git():
     """Find git executable in the system."""
     if sys.platform == 'darwin':
@@ -14,6 +14,7 @@
 import keyword
 import os
 import re
+import time
 
 # Third party imports
 from pygments.lexer import RegexLexer, bygroups
@@ -184,6 +185,10 @@ class BaseSH(QSyntaxHighlighter):
     NORMAL = 0
     # Syntax highlighting parameters.
     BLANK_ALPHA_FACTOR = 0.31
+    # Documents with at least this number of blocks are rehighlighted in
+    # time slices (in ms) after the visible area.
+    LAZY_REHIGHLIGHT_MIN_BLOCKS = 2000
+    LAZY_REHIGHLIGHT_TIME_SLICE = 20
 
     sig_outline_explorer_data_changed = Signal()
 
@@ -218,6 +223,14 @@ def __init__(self, parent, font=None, color_scheme='Spyder'):
         # List of cells
         self._cell_list = []
 
+        # Lazy rehighlighting of large documents
+        self._highlighting_deferred = False
+        self._lazy_rehighlight_block = None
+        self._lazy_rehighlight_timer = QTimer(self)
+        self._lazy_rehighlight_timer.setSingleShot(True)
+        self._lazy_rehighlight_timer.setInterval(0)
+        self._lazy_rehighlight_timer.timeout.connect(self._rehighlight_blocks)
+
     def get_background_color(self):
         return QColor(self.background_color)
 
@@ -320,6 +333,8 @@ def highlightBlock(self, text):
 
         :param text: text to highlight.
         """
+        if self._highlighting_deferred:
+            return
         self.highlight_block(text)
 
     def highlight_block(self, text):
@@ -380,10 +395,70 @@ def highlight_extras(self, text, offset=0):
         self.highlight_spaces(text, offset=offset)
         self.highlight_patterns(text, offset=offset)
 
+    def defer_highlighting(self):
+        """
+        Stop highlighting the blocks that change in the document until
+        `rehighlight` is called.
+
+        This is used to set the text of large documents, which would
+        otherwise be highlighted synchronously all at once.
+        """
+        self._highlighting_deferred = True
+
     def rehighlight(self):
-        QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
-        QSyntaxHighlighter.rehighlight(self)
-        QApplication.restoreOverrideCursor()
+        """
+        Rehighlight the whole document.
+
+        Large documents are rehighlighted right away only up to the end of
+        the visible area. The rest of them is done in small time slices so
+        that the interface stays responsive.
+        """
+        self._highlighting_deferred = False
+        self._lazy_rehighlight_timer.stop()
+        self._lazy_rehighlight_block = None
+
+        document = self.document()
+        if (document is None or
+                document.blockCount() < self.LAZY_REHIGHLIGHT_MIN_BLOCKS):
+            QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
+            QSyntaxHighlighter.rehighlight(self)
+            QApplication.restoreOverrideCursor()
+            return
+
+        last_visible = 0
+        if hasattr(self.editor, 'get_visible_block_numbers'):
+            __, last_visible = self.editor.get_visible_block_numbers()
+
+        self._lazy_rehighlight_block = 0
+        self._rehighlight_blocks(last=last_visible)
+
+    def _rehighlight_blocks(self, last=None):
+        """
+        Rehighlight pending blocks up to block number `last` or, if that's
+        not given, until the current time slice is over.
+        """
+        document = self.document()
+        if document is None or self._lazy_rehighlight_block is None:
+            self._lazy_rehighlight_block = None
+            return
+
+        time_slice = self.LAZY_REHIGHLIGHT_TIME_SLICE / 1000
+        deadline = time.perf_counter() + time_slice
+        block = document.findBlockByNumber(self._lazy_rehighlight_block)
+        while block.isValid():
+            self.rehighlightBlock(block)
+            block = block.next()
+            if last is not None:
+                if block.blockNumber() > last:
+                    break
+            elif time.perf_counter() > deadline:
+                break
+
+        if block.isValid():
+            self._lazy_rehighlight_block = block.blockNumber()
+            self._lazy_rehighlight_timer.start()
+        else:
+            self._lazy_rehighlight_block = None
 
 
 class TextSH(BaseSH):
@@ -513,12 +588,21 @@ class PythonSH(BaseSH):
     (NORMAL, INSIDE_SQ3STRING, INSIDE_DQ3STRING,
      INSIDE_SQSTRING, INSIDE_DQSTRING,
      INSIDE_NON_MULTILINE_STRING) = list(range(6))
+    STATES_MULTILINE_STRING = (INSIDE_DQ3STRING, INSIDE_SQ3STRING,
+                               INSIDE_DQSTRING, INSIDE_SQSTRING)
+    STATES_STRING = STATES_MULTILINE_STRING + (INSIDE_NON_MULTILINE_STRING,)
     DEF_TYPES = {"def": OutlineExplorerData.FUNCTION,
                  "class": OutlineExplorerData.CLASS}
 
     # Comments suitable for Outline Explorer
     OECOMMENT = re.compile(r'^(# ?--[-]+|##[#]+ )[ -]*[^- ]+')
 
+    # Maximum number of lines whose formats are cached
+    BLOCK_CACHE_SIZE = 10000
+
+    # Formats applied to the line being highlighted, if it's cacheable
+    _formats_log = None
+
     def __init__(self, parent, font=None, color_scheme='Spyder'):
         BaseSH.__init__(self, parent, font, color_scheme)
         self.cell_separators = CELL_LANGUAGES['Python']
@@ -526,6 +610,17 @@ def __init__(self, parent, font=None, color_scheme='Spyder'):
         self.outline_explorer_data_update_timer = QTimer()
         self.outline_explorer_data_update_timer.setSingleShot(True)
 
+    def setup_formats(self, font=None):
+        BaseSH.setup_formats(self, font)
+        # Cached formats are no longer valid
+        self._block_cache = {}
+
+    def setFormat(self, start, length, fmt):
+        """Reimplemented to record the formats applied to a line."""
+        if self._formats_log is not None:
+            self._formats_log.append((start, length, fmt))
+        QSyntaxHighlighter.setFormat(self, start, length, fmt)
+
     def highlight_match(self, text, match, key, value, offset,
                         state, import_stmt, oedata):
         """Highlight a single match."""
@@ -642,28 +737,43 @@ def highlight_block(self, text):
 
         self.setFormat(0, qstring_length(text), self.formats["normal"])
 
-        state = self.NORMAL
-        for match in self.PROG.finditer(text):
-            for key, value in list(match.groupdict().items()):
+        # Lines without outline explorer data or imports only depend on
+        # their text and the state they start in, so the formats computed
+        # for them can be reused the next time they're highlighted.
+        cache_key = (prev_state, text)
+        cached = self._block_cache.get(cache_key)
+        if cached is not None:
+            formats, state = cached
+            for start, length, fmt in formats:
+                QSyntaxHighlighter.setFormat(self, start, length, fmt)
+        else:
+            self._formats_log = []
+            state = self.NORMAL
+            for match in self.PROG.finditer(text):
+                # Each alternative of PROG is a single named group, so the
+                # last one matched is the one to highlight
+                key = match.lastgroup
+                value = match.group(key)
                 if value:
                     state, import_stmt, oedata = self.highlight_match(
                         text, match, key, value, offset,
                         state, import_stmt, oedata)
 
+            if oedata is None and import_stmt is None:
+                if len(self._block_cache) >= self.BLOCK_CACHE_SIZE:
+                    self._block_cache.clear()
+                self._block_cache[cache_key] = (self._formats_log, state)
+            self._formats_log = None
+
         tbh.set_state(self.currentBlock(), state)
 
         # Use normal format for indentation and trailing spaces
         # Unless we are in a string
-        states_multiline_string = [
-            self.INSIDE_DQ3STRING, self.INSIDE_SQ3STRING,
-            self.INSIDE_DQSTRING, self.INSIDE_SQSTRING]
-        states_string = states_multiline_string + [
-            self.INSIDE_NON_MULTILINE_STRING]
         self.formats['leading'] = self.formats['normal']
-        if prev_state in states_multiline_string:
+        if prev_state in self.STATES_MULTILINE_STRING:
             self.formats['leading'] = self.formats["string"]
         self.formats['trailing'] = self.formats['normal']
-        if state in states_string:
+        if state in self.STATES_STRING:
             self.formats['trailing'] = self.formats['string']
         self.highlight_extras(text, offset)
 
@@ -1167,6 +1277,9 @@ class MarkdownSH(BaseSH):
     CODE = 1
 
     def highlightBlock(self, text):
+        if self._highlighting_deferred:
+            return
+
         text = to_text_string(text)
         previous_state = self.previousBlockState()
 
@@ -6,6 +6,9 @@
 
 """Tests for conda.py"""
 
+# Standard library imports
+import os.path as osp
+
 # Third party imports
 import pytest
 from qtpy.QtGui import QIcon
@@ -29,5 +32,35 @@ def test_icon_mapping():
             raise e
 
 
+def test_icon_cache():
+    """Test that icons are created once per icon theme."""
+    qapp = qapplication()
+
+    icon = ima.icon('run')
+    assert ima.icon('run') is icon
+    assert ima.icon('run', scale_factor=0.8) is not icon
+
+    # Pixmaps can be rendered from the cached icons
+    assert not icon.pixmap(16, 16).isNull()
+
+    # Changing the icon theme discards the icons
+    ima.on_configuration_change('icon_theme', 'appearance', 'spyder 3')
+    assert ima.icon('run') is not icon
+
+
+def test_icon_by_extension(monkeypatch):
+    """Test that icons by extension don't access the file system."""
+    qapp = qapplication()
+
+    def isdir(path):
+        raise AssertionError("The file system was accessed")
+
+    monkeypatch.setattr(osp, 'isdir', isdir)
+
+    icon = ima.get_icon_by_extension('/not/a/file.py', 1.0)
+    assert icon is ima.get_icon_by_extension('other.py', 1.0)
+    assert icon is ima.icon('PythonFileIcon', 1.0)
+
+
 if __name__ == "__main__":
     pytest.main()
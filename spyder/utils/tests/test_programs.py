@@ -7,6 +7,7 @@
 # Standard library imports
 import os
 import os.path as osp
+import platform
 import sys
 
 # Third party impors
@@ -15,9 +16,13 @@
 
 # Local imports
 from spyder.config.base import running_in_ci
+from spyder.utils import programs
 from spyder.utils.programs import (_clean_win_application_path, check_version,
                                    find_program, get_application_icon,
-                                   get_installed_applications, get_temp_dir,
+                                   get_installed_applications,
+                                   get_interpreter_capabilities,
+                                   get_interpreter_info,
+                                   get_interpreters_info, get_temp_dir,
                                    is_module_installed, is_python_interpreter,
                                    is_python_interpreter_valid_name,
                                    open_files_with_application,
@@ -298,5 +303,62 @@ def test_get_module_version():
     assert get_module_version('intervaltree')
 
 
+def test_get_interpreters_info(mocker):
+    """Check that the info of interpreters is cached."""
+    # Clear the cache
+    cache_file = programs.get_conf_path(programs.INTERPRETERS_INFO_CACHE)
+    if osp.isfile(cache_file):
+        os.remove(cache_file)
+
+    info = get_interpreters_info([sys.executable])
+    assert info == {sys.executable: get_interpreter_info(sys.executable)}
+    assert info[sys.executable].startswith('Python 3')
+
+    # The interpreter is not run again if it didn't change
+    mock_info = mocker.patch.object(programs, 'get_interpreter_info')
+    assert get_interpreters_info([sys.executable]) == info
+    assert mock_info.call_count == 0
+
+    # It's run again if the cache is outdated
+    mocker.patch.object(
+        programs, '_get_interpreter_info_key', return_value=[None, None]
+    )
+    mock_info.return_value = 'Python 3.0.0'
+    assert get_interpreters_info([sys.executable]) == {
+        sys.executable: 'Python 3.0.0'
+    }
+    assert mock_info.call_count == 1
+
+
+def test_get_interpreter_capabilities(mocker):
+    """Check that the capabilities of interpreters are cached."""
+    # Clear the cache
+    cache_file = programs.get_conf_path(
+        programs.INTERPRETERS_CAPABILITIES_CACHE)
+    if osp.isfile(cache_file):
+        os.remove(cache_file)
+
+    capabilities = get_interpreter_capabilities(sys.executable)
+    assert capabilities['python_version'] == platform.python_version()
+    assert capabilities['packages']['spyder-kernels']
+    assert set(capabilities['packages']) == set(
+        programs.CAPABILITIES_PACKAGES)
+
+    # The interpreter is not run again if it didn't change
+    mock_probe = mocker.patch.object(
+        programs, '_probe_interpreter_capabilities')
+    assert get_interpreter_capabilities(sys.executable) == capabilities
+    assert mock_probe.call_count == 0
+
+    # It's run again if packages were installed or removed
+    mocker.patch.object(
+        programs, '_get_interpreter_capabilities_key', side_effect=[[0], [1]]
+    )
+    mock_probe.return_value = dict(capabilities, python_version='3.0.0')
+    assert get_interpreter_capabilities(sys.executable)[
+        'python_version'] == '3.0.0'
+    assert mock_probe.call_count == 1
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -88,6 +88,42 @@ def test_python_string_prefix():
         compare_formats(doc.firstBlock().layout().formats(), res, sh)
 
 
+def test_PythonSH_block_cache():
+    """Check that cached formats depend on the state lines start in."""
+    txt = 'x = 1\n"""\nx = 1\n"""\nx = 1'
+    doc = QTextDocument(txt)
+    sh = PythonSH(doc, color_scheme='Spyder')
+    sh.rehighlight()
+
+    code = [(0, 4, 'normal'), (4, 1, 'number')]
+    string = [(0, 5, 'string')]
+    block = doc.firstBlock()
+    for res in [code, [(0, 3, 'string')], string, [(0, 3, 'string')], code]:
+        compare_formats(block.layout().formats(), res, sh)
+        block = block.next()
+
+    # Formats are computed again after changing the color scheme
+    assert sh._block_cache
+    sh.set_color_scheme('Monokai')
+    compare_formats(doc.lastBlock().layout().formats(), code, sh)
+
+
+def test_PythonSH_lazy_rehighlight(qtbot):
+    """Check that large documents are rehighlighted in time slices."""
+    doc = QTextDocument('\n'.join(['x = 1'] * 50))
+    sh = PythonSH(doc, color_scheme='Spyder')
+    sh.LAZY_REHIGHLIGHT_MIN_BLOCKS = 10
+    sh.LAZY_REHIGHLIGHT_TIME_SLICE = 0
+    sh.set_color_scheme('Monokai')
+
+    # Only the first block is highlighted right away
+    assert sh._lazy_rehighlight_block == 1
+    qtbot.waitUntil(lambda: sh._lazy_rehighlight_block is None)
+
+    res = [(0, 4, 'normal'), (4, 1, 'number')]
+    compare_formats(doc.lastBlock().layout().formats(), res, sh)
+
+
 def test_Markdown_basic():
     txt = "Some __random__ **text** with ~~different~~ [styles](link_url)"
 
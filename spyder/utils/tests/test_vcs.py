@@ -11,6 +11,7 @@
 # Standard library imports
 import os
 import os.path as osp
+import subprocess
 import sys
 
 # Test library imports
@@ -20,8 +21,9 @@
 # Local imports
 from spyder.config.base import running_in_ci
 from spyder.utils.vcs import (ActionToolNotFound, get_git_refs,
-                              get_git_remotes, get_git_revision, get_vcs_root,
-                              remote_to_url, run_vcs_tool)
+                              get_git_remotes, get_git_revision,
+                              get_git_status, get_vcs_root, remote_to_url,
+                              run_vcs_tool)
 
 
 HERE = os.path.abspath(os.path.dirname(__file__))
@@ -48,6 +50,53 @@ def test_vcs_root(tmpdir):
     assert get_vcs_root(osp.dirname(__file__)) != None
 
 
+def test_vcs_root_new_repository(tmp_path):
+    """Test that repositories created after looking for them are found."""
+    subdir = tmp_path / 'repo' / 'package'
+    subdir.mkdir(parents=True)
+    assert get_vcs_root(str(subdir)) is None
+
+    (tmp_path / 'repo' / '.git').mkdir()
+    assert get_vcs_root(str(subdir)) == str(tmp_path / 'repo')
+    assert get_vcs_root(str(tmp_path / 'repo')) == str(tmp_path / 'repo')
+
+
+@pytest.mark.skipif(programs.find_git() is None, reason="Needs Git")
+def test_get_git_status(tmp_path):
+    """Test that the status of the files of a repository is parsed."""
+    def git(*args):
+        subprocess.run(
+            ['git', '-c', 'user.name=test', '-c', 'user.email=test@test',
+             *args],
+            cwd=str(tmp_path), check=True, capture_output=True
+        )
+
+    git('init', '-q', '-b', 'main')
+    (tmp_path / 'modified.py').write_text('modified = 0')
+    (tmp_path / 'deleted.py').write_text('deleted = 0')
+    (tmp_path / 'old name.py').write_text('renamed = 0')
+    git('add', '.')
+    git('commit', '-q', '-m', 'Initial commit')
+
+    (tmp_path / 'modified.py').write_text('modified = 1')
+    (tmp_path / 'deleted.py').unlink()
+    git('mv', 'old name.py', 'new name.py')
+    (tmp_path / 'added.py').write_text('added = 0')
+    git('add', 'added.py')
+    (tmp_path / 'subdir').mkdir()
+    (tmp_path / 'subdir' / 'untracked.py').write_text('')
+
+    status = get_git_status(str(tmp_path))
+    assert status['branch'] == 'main'
+    assert status['files'] == {
+        str(tmp_path / 'modified.py'): 'modified',
+        str(tmp_path / 'deleted.py'): 'deleted',
+        str(tmp_path / 'new name.py'): 'renamed',
+        str(tmp_path / 'added.py'): 'added',
+        str(tmp_path / 'subdir'): 'untracked',
+    }
+
+
 @skipnogit
 def test_git_revision():
     root = get_vcs_root(osp.dirname(__file__))
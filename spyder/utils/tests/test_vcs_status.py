@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for vcs_status.py"""
+
+# Standard library imports
+import shutil
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.utils import vcs
+from spyder.utils.vcs_status import VCSStatusService
+
+
+def test_get_root(qtbot, tmp_path, monkeypatch):
+    """
+    Check that roots of repositories are cached and that repositories
+    created or removed later are found after a change is notified.
+    """
+    service = VCSStatusService()
+    repo = tmp_path / 'repo'
+    subdir = repo / 'package'
+    subdir.mkdir(parents=True)
+    assert service.get_root(str(subdir)) is None
+    assert service._roots[str(subdir)] is None
+
+    # Created repository
+    (repo / '.git').mkdir()
+    assert service.get_root(str(subdir)) is None
+    service.notify_changed(str(repo))
+    assert service.get_root(str(subdir)) == str(repo)
+
+    # Cached roots are not looked up again
+    with monkeypatch.context() as m:
+        m.setattr(vcs, 'get_vcs_root', lambda path: 1 / 0)
+        assert service.get_root(str(subdir)) == str(repo)
+
+    # Removed repository
+    shutil.rmtree(str(repo / '.git'))
+    service.notify_changed(str(repo))
+    assert service.get_root(str(subdir)) is None
+
+    service.close()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for workers.py"""
+
+# Standard library imports
+import threading
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.utils.workers import WorkerManager
+
+
+def test_worker_priorities_and_cancellation(qtbot):
+    """
+    Check that waiting workers run by priority and that terminated ones are
+    not run.
+    """
+    manager = WorkerManager(max_threads=1)
+    release = threading.Event()
+    results = []
+
+    # Keep the only thread busy
+    blocking_worker = manager.create_python_worker(release.wait, 10)
+    blocking_worker.start()
+
+    workers = {}
+    for name, priority in [('low', 0), ('cancelled', 5), ('high', 10)]:
+        worker = manager.create_python_worker(results.append, name)
+        worker.start(priority=priority)
+        workers[name] = worker
+    workers['cancelled'].terminate()
+
+    release.set()
+    qtbot.waitUntil(lambda: all(w.is_finished() for w in workers.values()))
+
+    assert results == ['high', 'low']
+
+    timings = workers['low'].get_timings()
+    assert timings['waiting'] >= 0
+    assert timings['running'] >= 0
+
+    manager.terminate_all()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -202,6 +202,105 @@ def get_git_refs(repopath):
     return branches + tags, branch, files_modifed
 
 
+def get_git_ignored(dirname, names):
+    """
+    Return the entries of `names` in the directory `dirname` that are
+    ignored by Git.
+
+    An empty set is returned if `dirname` is not in a Git repository.
+    """
+    if not names:
+        return set()
+
+    root = get_vcs_root(dirname)
+    if root is None or not osp.isdir(osp.join(root, '.git')):
+        return set()
+
+    git = programs.find_git()
+    if git is None:
+        return set()
+
+    try:
+        out, __ = programs.run_program(
+            git,
+            ['check-ignore', '-z', '--stdin'],
+            cwd=dirname,
+        ).communicate(b'\0'.join(os.fsencode(name) for name in names))
+    except (subprocess.CalledProcessError, AttributeError, OSError):
+        return set()
+
+    return {os.fsdecode(name) for name in out.split(b'\0') if name}
+
+
+def get_git_status(repopath):
+    """
+    Return the active branch of the Git repository located at repopath and
+    the status of its changed files.
+
+    The result is a dictionary with the branch, or None if it can't be
+    found, and a dictionary with the status of the files that changed, by
+    absolute path. The status is one of 'modified', 'added', 'deleted',
+    'renamed', 'conflicted' or 'untracked'.
+    """
+    status = dict(branch=None, files={})
+
+    git = programs.find_git()
+    if git is None:
+        return status
+
+    try:
+        # Optional locks are disabled so that the index is not written,
+        # which would be reported as a change in the repository.
+        out, __ = programs.run_program(
+            git,
+            ['--no-optional-locks', 'status', '--porcelain=v2', '--branch',
+             '-z', '--untracked-files=normal'],
+            cwd=repopath,
+        ).communicate()
+    except (subprocess.CalledProcessError, AttributeError, OSError):
+        return status
+
+    records = iter(os.fsdecode(out).split('\0'))
+    for record in records:
+        if not record:
+            continue
+
+        kind = record[0]
+        if record.startswith('# branch.head '):
+            branch = record[len('# branch.head '):]
+            if branch != '(detached)':
+                status['branch'] = branch
+            continue
+        elif kind == '1':
+            fields = record.split(' ', 8)
+            xy = fields[1]
+            if 'D' in xy:
+                file_status = 'deleted'
+            elif xy[0] == 'A':
+                file_status = 'added'
+            else:
+                file_status = 'modified'
+        elif kind == '2':
+            fields = record.split(' ', 9)
+            file_status = 'renamed'
+
+            # The next record is the original path
+            next(records, None)
+        elif kind == 'u':
+            fields = record.split(' ', 10)
+            file_status = 'conflicted'
+        elif kind == '?':
+            fields = record.split(' ', 1)
+            file_status = 'untracked'
+        else:
+            continue
+
+        path = osp.normpath(osp.join(repopath, fields[-1]))
+        status['files'][path] = file_status
+
+    return status
+
+
 def get_git_remotes(fpath):
     """Return git remotes for repo on fpath."""
     remote_data = {}
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""
+Service that keeps the VCS status of repositories up to date.
+"""
+
+# Standard imports
+import os
+import os.path as osp
+
+# Third party imports
+from qtpy.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+# Local imports
+from spyder.utils import vcs
+from spyder.utils.workers import WorkerManager
+
+
+# Time to wait after a change before refreshing the status of a repository,
+# in milliseconds
+REFRESH_DELAY = 500
+
+
+class RepositoryStatus:
+    """Last status read from a Git repository."""
+
+    def __init__(self, root):
+        self.root = root
+        self.branch = None
+        self.files = {}
+        self.dirs = set()
+        self.loaded = False
+
+        # Whether the status is being read or needs to be read again because
+        # the repository changed while it was being read.
+        self.running = False
+        self.dirty = False
+
+    def update(self, status):
+        self.branch = status['branch']
+        self.files = status['files']
+        self.loaded = True
+
+        # Directories that contain changed files
+        self.dirs = set()
+        for path in self.files:
+            path = osp.dirname(path)
+            while (
+                len(path) > len(self.root)
+                and path not in self.dirs
+            ):
+                self.dirs.add(path)
+                path = osp.dirname(path)
+
+
+class VCSStatusService(QObject):
+    """
+    Service that caches the root directories of repositories and reads the
+    status of their files with Git in a worker thread.
+
+    Statuses are read when they are first requested and refreshed when the
+    repository or its files change.
+    """
+
+    sig_status_changed = Signal(str)
+    """
+    This signal is emitted when the status of a repository was read.
+
+    Parameters
+    ----------
+    root: str
+        Root directory of the repository.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._repos = {}
+
+        # Root directories of the directories that were looked up, or None
+        # for the ones that are not in a repository. They're forgotten when
+        # the file watchers notify that a repository could have been created
+        # or removed.
+        self._roots = {}
+        self._changed = set()
+        self._worker_manager = WorkerManager(self, max_threads=1)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DELAY)
+        self._refresh_timer.timeout.connect(self._refresh_changed)
+
+        # Commits, checkouts and staging change files inside .git
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_git_dir_changed)
+        self._watcher.fileChanged.connect(self._on_git_dir_changed)
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def get_root(self, path):
+        """
+        Return the root directory of the Git repository that contains `path`,
+        or None if there's none.
+        """
+        path = osp.abspath(path)
+        try:
+            return self._roots[path]
+        except KeyError:
+            pass
+
+        root = vcs.get_vcs_root(path)
+        if root is not None and not osp.isdir(osp.join(root, '.git')):
+            # Only the status of Git repositories can be read
+            root = None
+        self._roots[path] = root
+        return root
+
+    def get_repo_status(self, path):
+        """
+        Return the status of the repository that contains `path`, or None if
+        it's not in a repository.
+
+        The status is read in the background if it wasn't read yet, so its
+        `loaded` attribute needs to be checked.
+        """
+        root = self.get_root(path)
+        if root is None:
+            return None
+
+        repo = self._repos.get(root)
+        if repo is None:
+            repo = self._repos[root] = RepositoryStatus(root)
+            self._watch(root)
+            self._read_status(repo)
+        return repo
+
+    def get_status(self, path):
+        """
+        Return the status of a file or directory, or None if it didn't change
+        or it's not known yet.
+
+        Directories that contain changed files are reported as 'modified'.
+        """
+        path = osp.normpath(osp.abspath(path))
+        repo = self.get_repo_status(osp.dirname(path))
+        if repo is None or not repo.loaded:
+            return None
+
+        status = repo.files.get(path)
+        if status is None and path in repo.dirs:
+            status = 'modified'
+        return status
+
+    def refresh(self, path):
+        """
+        Look again for the repository that contains `path` and read its
+        status again.
+        """
+        self._forget_roots(path)
+        root = self.get_root(path)
+        if root is not None and root in self._repos:
+            self._read_status(self._repos[root])
+
+    def notify_changed(self, path):
+        """
+        Notify that a file or directory changed, so that the status of its
+        repository is refreshed.
+        """
+        # A repository could have been created or removed
+        if osp.basename(path) == '.git' or osp.isdir(path):
+            self._forget_roots(
+                osp.dirname(path) if osp.basename(path) == '.git' else path
+            )
+        self._changed.add(path)
+        self._refresh_timer.start()
+
+    def close(self):
+        """Stop reading statuses."""
+        self._refresh_timer.stop()
+        self._worker_manager.terminate_all()
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _forget_roots(self, path):
+        """Forget the roots found for `path` and its subdirectories."""
+        path = osp.abspath(path)
+        for cached_path in list(self._roots):
+            if cached_path == path or cached_path.startswith(path + os.sep):
+                del self._roots[cached_path]
+
+    def _watch(self, root):
+        git_dir = osp.join(root, '.git')
+        paths = [git_dir]
+        index = osp.join(git_dir, 'index')
+        if osp.isfile(index):
+            paths.append(index)
+        self._watcher.addPaths(paths)
+
+    def _on_git_dir_changed(self, path):
+        # The repository was removed
+        if osp.basename(path) == '.git' and not osp.isdir(path):
+            root = osp.dirname(path)
+            self._repos.pop(root, None)
+            self._forget_roots(root)
+
+        # The index is replaced when it's written, so it has to be watched
+        # again.
+        if (
+            osp.basename(path) == 'index'
+            and osp.isfile(path)
+            and path not in self._watcher.files()
+        ):
+            self._watcher.addPath(path)
+        self._changed.add(path)
+        self._refresh_timer.start()
+
+    def _refresh_changed(self):
+        changed = self._changed
+        self._changed = set()
+
+        roots = set()
+        for path in changed:
+            root = self.get_root(
+                path if osp.isdir(path) else osp.dirname(path)
+            )
+            if root is not None:
+                roots.add(root)
+
+        for root in roots:
+            if root in self._repos:
+                self._read_status(self._repos[root])
+
+    def _read_status(self, repo):
+        if repo.running:
+            repo.dirty = True
+            return
+
+        repo.running = True
+        repo.dirty = False
+        worker = self._worker_manager.create_python_worker(
+            vcs.get_git_status, repo.root
+        )
+        worker.sig_finished.connect(
+            lambda worker, output, error:
+                self._on_status_read(repo, output, error)
+        )
+        worker.start()
+
+    def _on_status_read(self, repo, output, error):
+        repo.running = False
+        if error is None and output is not None:
+            repo.update(output)
+            self.sig_status_changed.emit(repo.root)
+
+        if repo.dirty:
+            self._read_status(repo)
+
+
+_service = None
+
+
+def get_vcs_status_service():
+    """Return the VCS status service shared by the application."""
+    global _service
+    if _service is None:
+        _service = VCSStatusService()
+    return _service
@@ -14,10 +14,11 @@
 from collections import deque
 import logging
 import sys
+import time
 
 # Third party imports
-from qtpy.QtCore import (QByteArray, QObject, QProcess, QThread, QTimer,
-                         Signal)
+from qtpy.QtCore import (QByteArray, QObject, QProcess, QRunnable,
+                         QThreadPool, QTimer, Signal)
 
 # Local imports
 from spyder.py3compat import to_text_string
@@ -43,38 +44,76 @@ class PythonWorker(QObject):
     sig_started = Signal(object)
     sig_finished = Signal(object, object, object)  # worker, stdout, stderr
 
+    # Emitted when the worker stops running, even if it was terminated
+    _sig_done = Signal(object)
+
     def __init__(self, func, args, kwargs):
         """Generic python worker for running python code on threads."""
         super(PythonWorker, self).__init__()
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.priority = 0
         self._is_finished = False
         self._started = False
 
+        # Timing metrics
+        self._start_requested_time = None
+        self._run_start_time = None
+        self._run_end_time = None
+
     def is_finished(self):
         """Return True if worker status is finished otherwise return False."""
         return self._is_finished
 
-    def start(self):
-        """Start the worker (emits sig_started signal with worker as arg)."""
+    def start(self, priority=None):
+        """
+        Start the worker (emits sig_started signal with worker as arg).
+
+        Workers with a higher `priority` are run first when all threads of
+        their manager are busy.
+        """
         if not self._started:
+            if priority is not None:
+                self.priority = priority
+            self._start_requested_time = time.perf_counter()
             self.sig_started.emit(self)
             self._started = True
 
     def terminate(self):
-        """Mark the worker as finished."""
+        """
+        Mark the worker as finished.
+
+        Its function won't run if it was still waiting for a thread and its
+        result won't be emitted otherwise.
+        """
         self._is_finished = True
 
+    def get_timings(self):
+        """
+        Return the time (in seconds) the worker spent waiting for a thread
+        and running, or None for the parts that didn't happen yet.
+        """
+        waiting = running = None
+        if self._run_start_time is not None:
+            if self._start_requested_time is not None:
+                waiting = self._run_start_time - self._start_requested_time
+            if self._run_end_time is not None:
+                running = self._run_end_time - self._run_start_time
+        return dict(waiting=waiting, running=running)
+
     def _start(self):
         """Start process worker for given method args and kwargs."""
+        self._run_start_time = time.perf_counter()
         error = None
         output = None
 
-        try:
-            output = self.func(*self.args, **self.kwargs)
-        except Exception as err:
-            error = err
+        # Workers terminated while waiting for a thread are not run
+        if not self._is_finished:
+            try:
+                output = self.func(*self.args, **self.kwargs)
+            except Exception as err:
+                error = err
 
         if not self._is_finished:
             try:
@@ -82,6 +121,26 @@ def _start(self):
             except RuntimeError:
                 pass
         self._is_finished = True
+        self._run_end_time = time.perf_counter()
+
+        try:
+            self._sig_done.emit(self)
+        except RuntimeError:
+            pass
+
+
+class _PythonWorkerRunnable(QRunnable):
+    """Runnable to run a Python worker in a thread pool."""
+
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+
+        # The worker keeps a reference to us until it's garbage collected
+        self.setAutoDelete(False)
+
+    def run(self):
+        self.worker._start()
 
 
 class ProcessWorker(QObject):
@@ -224,27 +283,28 @@ def set_cwd(self, cwd):
 
 
 class WorkerManager(QObject):
-    """Manager for generic workers."""
+    """
+    Manager for generic workers.
+
+    Python workers are run in a thread pool with at most `max_threads`
+    threads as soon as they are started. Process workers are started right
+    away.
+    """
 
     def __init__(self, parent=None, max_threads=10):
         super().__init__(parent=parent)
         self.parent = parent
 
-        self._queue = deque()
-        self._queue_workers = deque()
-        self._threads = []
         self._workers = []
-        self._timer = QTimer(self)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
         self._timer_worker_delete = QTimer(self)
-        self._running_threads = 0
         self._max_threads = max_threads
 
         # Keeps references to old workers
         # Needed to avoid C++/python object errors
         self._bag_collector = deque()
 
-        self._timer.setInterval(333)
-        self._timer.timeout.connect(self._start)
         self._timer_worker_delete.setInterval(5000)
         self._timer_worker_delete.timeout.connect(self._clean_workers)
 
@@ -254,55 +314,50 @@ def _clean_workers(self):
             self._bag_collector.popleft()
         self._timer_worker_delete.stop()
 
-    def _start(self, worker=None):
-        """Start threads and check for inactive workers."""
-        if worker:
-            self._queue_workers.append(worker)
-
-        if self._queue_workers and self._running_threads < self._max_threads:
-            if self.parent is not None:
-                logger.debug(
-                    f"Workers managed in {self.parent} -- "
-                    f"In queue: {len(self._queue_workers)} -- "
-                    f"Running threads: {self._running_threads} -- "
-                    f"Workers: {len(self._workers)} -- "
-                    f"Threads: {len(self._threads)}"
-                )
-
-            worker = self._queue_workers.popleft()
-            if isinstance(worker, PythonWorker):
-                self._running_threads += 1
-                thread = QThread(None)
-                self._threads.append(thread)
-
-                worker.moveToThread(thread)
-                worker.sig_finished.connect(thread.quit)
-                thread.started.connect(worker._start)
-                thread.start()
-            elif isinstance(worker, ProcessWorker):
-                worker._start()
-        else:
-            self._timer.start()
-
-        if self._workers:
-            for w in self._workers:
-                if w.is_finished():
-                    self._bag_collector.append(w)
-                    self._workers.remove(w)
+    def _collect_finished_workers(self):
+        """Move finished workers to the workers bag."""
+        for worker in self._workers[:]:
+            if worker.is_finished():
+                self._bag_collector.append(worker)
+                self._workers.remove(worker)
 
-        if self._threads:
-            for t in self._threads:
-                if t.isFinished():
-                    self._threads.remove(t)
-                    self._running_threads -= 1
-
-        if len(self._threads) == 0 and len(self._workers) == 0:
-            self._timer.stop()
+        if self._bag_collector and not self._workers:
             self._timer_worker_delete.start()
 
+    def _start(self, worker):
+        """Run a worker as soon as possible."""
+        if isinstance(worker, PythonWorker):
+            worker._runnable = _PythonWorkerRunnable(worker)
+            self._pool.start(worker._runnable, worker.priority)
+        elif isinstance(worker, ProcessWorker):
+            worker._start()
+
+        if self.parent is not None:
+            logger.debug(
+                f"Workers managed in {self.parent} -- "
+                f"Active threads: {self._pool.activeThreadCount()} -- "
+                f"Workers: {len(self._workers)}"
+            )
+
+        self._collect_finished_workers()
+
+    def _worker_done(self, worker):
+        """Log timing metrics of a Python worker and clean it up."""
+        timings = worker.get_timings()
+        if self.parent is not None and None not in timings.values():
+            func_name = getattr(worker.func, "__qualname__", worker.func)
+            logger.debug(
+                f"Worker for {func_name} managed in {self.parent} -- "
+                f"Waited: {timings['waiting']:.3f} s -- "
+                f"Ran: {timings['running']:.3f} s"
+            )
+
+        self._collect_finished_workers()
+
     def create_python_worker(self, func, *args, **kwargs):
         """Create a new python worker instance."""
         worker = PythonWorker(func, args, kwargs)
+        worker._sig_done.connect(self._worker_done)
         self._create_worker(worker)
         return worker
 
@@ -317,14 +372,11 @@ def terminate_all(self):
         for worker in self._workers:
             worker.terminate()
 
-        for thread in self._threads:
-            try:
-                thread.quit()
-                thread.wait()
-            except Exception:
-                pass
+        # Drop workers waiting for a thread and wait for the running ones
+        self._pool.clear()
+        self._pool.waitForDone()
 
-        self._queue_workers = deque()
+        self._collect_finished_workers()
 
     def _create_worker(self, worker):
         """Common worker setup."""
@@ -45,6 +45,7 @@
 )
 
 # Local imports
+from spyder.api.config.decorators import on_conf_change
 from spyder.api.fonts import SpyderFontsMixin, SpyderFontType
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.config.base import _, running_under_pytest
@@ -121,6 +122,10 @@ class CollectionsEditorToolbarSections:
 # Numeric types
 NUMERIC_TYPES = (int, float) + get_numeric_numpy_types()
 
+# Column with the memory used by variables, which is only available for the
+# Variable Explorer
+MEMORY_COLUMN = 5
+
 
 # =============================================================================
 # ---- Utility functions and classes
@@ -136,6 +141,21 @@ def natsort(s):
     return x
 
 
+def memory_to_display(memory):
+    """Return a human-readable string for an amount of memory in bytes."""
+    if memory is None:
+        return ''
+
+    for unit in ['B', 'KiB', 'MiB', 'GiB']:
+        if memory < 1024 or unit == 'GiB':
+            break
+        memory /= 1024
+
+    if unit == 'B':
+        return '{} {}'.format(int(memory), unit)
+    return '{:.1f} {}'.format(memory, unit)
+
+
 class ProxyObject(object):
     """Dictionary proxy to an unknown object."""
 
@@ -206,6 +226,7 @@ def __init__(self, parent, data, title="", names=False,
             self.title = self.title + ' - '
         self.sizes = []
         self.types = []
+        self.memories = []
         self.set_data(data)
 
     def get_data(self):
@@ -298,18 +319,23 @@ def set_size_and_type(self, start=None, stop=None):
                          for index in range(start, stop)]
                 types = [data[self.keys[index]]['type']
                          for index in range(start, stop)]
+                memories = [data[self.keys[index]].get('memory')
+                            for index in range(start, stop)]
             else:
                 sizes = [get_size(data[self.keys[index]])
                          for index in range(start, stop)]
                 types = [get_human_readable_type(data[self.keys[index]])
                          for index in range(start, stop)]
+                memories = [None] * (stop - start)
 
         if fetch_more:
             self.sizes = self.sizes + sizes
             self.types = self.types + types
+            self.memories = self.memories + memories
         else:
             self.sizes = sizes
             self.types = types
+            self.memories = memories
 
     def load_all(self):
         """Load all the data."""
@@ -331,6 +357,9 @@ def all_string(listlike):
             self.types = sort_against(self.types, self.keys,
                                       reverse=reverse,
                                       sort_key=natsort)
+            self.memories = sort_against(self.memories, self.keys,
+                                         reverse=reverse,
+                                         sort_key=natsort)
             try:
                 self.keys.sort(reverse=reverse, key=sort_key)
             except:
@@ -340,6 +369,8 @@ def all_string(listlike):
                                                         self.types,
                                                         reverse=reverse)
             self.sizes = sort_against(self.sizes, self.types, reverse=reverse)
+            self.memories = sort_against(self.memories, self.types,
+                                         reverse=reverse)
             try:
                 self.types.sort(reverse=reverse)
             except:
@@ -349,6 +380,8 @@ def all_string(listlike):
                                                         self.sizes,
                                                         reverse=reverse)
             self.types = sort_against(self.types, self.sizes, reverse=reverse)
+            self.memories = sort_against(self.memories, self.sizes,
+                                         reverse=reverse)
             try:
                 self.sizes.sort(reverse=reverse)
             except:
@@ -358,13 +391,24 @@ def all_string(listlike):
             self.keys = sort_against(self.keys, values, reverse=reverse)
             self.sizes = sort_against(self.sizes, values, reverse=reverse)
             self.types = sort_against(self.types, values, reverse=reverse)
+            self.memories = sort_against(self.memories, values,
+                                         reverse=reverse)
+        elif column == MEMORY_COLUMN:
+            memories = [-1 if memory is None else memory
+                        for memory in self.memories]
+            self.keys[:self.rows_loaded] = sort_against(self.keys, memories,
+                                                        reverse=reverse)
+            self.sizes = sort_against(self.sizes, memories, reverse=reverse)
+            self.types = sort_against(self.types, memories, reverse=reverse)
+            self.memories = sort_against(self.memories, memories,
+                                         reverse=reverse)
         self.beginResetModel()
         self.endResetModel()
 
     def columnCount(self, qindex=QModelIndex()):
         """Array column number"""
         if self._parent.proxy_model:
-            return 5
+            return MEMORY_COLUMN + 1 if self.remote else 5
         else:
             return 4
 
@@ -416,6 +460,8 @@ def get_value(self, index):
             return self.types[index.row()]
         elif index.column() == 2:
             return self.sizes[index.row()]
+        elif index.column() == MEMORY_COLUMN:
+            return self.memories[index.row()]
         else:
             return self._data[self.keys[index.row()]]
 
@@ -424,7 +470,7 @@ def get_bgcolor(self, index):
         if index.column() == 0:
             color = QColor(Qt.lightGray)
             color.setAlphaF(.05)
-        elif index.column() < 3:
+        elif index.column() < 3 or index.column() == MEMORY_COLUMN:
             color = QColor(Qt.lightGray)
             color.setAlphaF(.2)
         else:
@@ -471,6 +517,8 @@ def data(self, index, role=Qt.DisplayRole):
             value = value['view']
         if index.column() == 3:
             display = value_to_display(value, minmax=self.minmax)
+        elif index.column() == MEMORY_COLUMN:
+            display = memory_to_display(value)
         else:
             if is_type_text_string(value):
                 display = to_text_string(value, encoding="utf-8")
@@ -512,7 +560,7 @@ def headerData(self, section, orientation, role=Qt.DisplayRole):
         i_column = int(section)
         if orientation == Qt.Horizontal:
             headers = (self.header0, _("Type"), _("Size"), _("Value"),
-                       _("Score"))
+                       _("Score"), _("Memory"))
             return to_qvariant(headers[i_column])
         else:
             return to_qvariant()
@@ -584,7 +632,7 @@ def type_to_color(self, python_type, numpy_type):
     def get_bgcolor(self, index):
         """Background color depending on value."""
         value = self.get_value(index)
-        if index.column() < 3:
+        if index.column() < 3 or index.column() == MEMORY_COLUMN:
             color = ReadOnlyCollectionsModel.get_bgcolor(self, index)
         else:
             if self.remote:
@@ -602,7 +650,7 @@ def setData(self, index, value, role=Qt.EditRole):
         """Cell content change"""
         if not index.isValid():
             return False
-        if index.column() < 3:
+        if index.column() < 3 or index.column() == MEMORY_COLUMN:
             return False
         value = display_to_value(value, self.get_value(index),
                                  ignore_errors=True)
@@ -1908,6 +1956,10 @@ def __init__(self, parent, data, shellwidget=None, remote_editing=False,
 
         self.hideColumn(4)  # Column 4 for Score
 
+        # Show the memory used by variables next to their size
+        self.horizontalHeader().moveSection(MEMORY_COLUMN, 3)
+        self.setColumnHidden(MEMORY_COLUMN, not self.get_conf('show_memory'))
+
         self.delegate = RemoteCollectionsDelegate(self, self.namespacebrowser)
         self.delegate.sig_free_memory_requested.connect(
             self.sig_free_memory_requested)
@@ -2005,6 +2057,17 @@ def setup_menu(self):
         menu = BaseTableView.setup_menu(self)
         return menu
 
+    def adjust_columns(self):
+        """Resize the first columns and the Memory one to contents."""
+        super().adjust_columns()
+        if self.automatic_column_width:
+            self.resizeColumnToContents(MEMORY_COLUMN)
+
+    @on_conf_change(option='show_memory')
+    def on_show_memory_update(self, value):
+        self.setColumnHidden(MEMORY_COLUMN, not value)
+        self.adjust_columns()
+
     def refresh_menu(self):
         if self.var_properties:
             super().refresh_menu()
@@ -2101,8 +2164,16 @@ def lessThan(self, left, right):
         This functions enables sorting of the main variable editor table,
         which does not rely on 'self.sort()'.
         """
-        leftData = self.sourceModel().data(left)
-        rightData = self.sourceModel().data(right)
+        if left.column() == MEMORY_COLUMN:
+            # Compare amounts of memory instead of their human-readable
+            # representation
+            leftData = self.sourceModel().get_value(left)
+            rightData = self.sourceModel().get_value(right)
+            leftData = -1 if leftData is None else leftData
+            rightData = -1 if rightData is None else rightData
+        else:
+            leftData = self.sourceModel().data(left)
+            rightData = self.sourceModel().data(right)
         try:
             if isinstance(leftData, str) and isinstance(rightData, str):
                 return natsort(leftData) < natsort(rightData)
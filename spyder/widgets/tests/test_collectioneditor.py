@@ -31,8 +31,8 @@
 from spyder.config.manager import CONF
 from spyder.widgets.collectionseditor import (
     CollectionsEditor, CollectionsEditorTableView, CollectionsEditorWidget,
-    CollectionsModel, LARGE_NROWS, natsort, RemoteCollectionsEditorTableView,
-    ROWS_TO_LOAD)
+    CollectionsModel, LARGE_NROWS, MEMORY_COLUMN, natsort,
+    RemoteCollectionsEditorTableView, ROWS_TO_LOAD)
 from spyder.plugins.variableexplorer.widgets.tests.test_dataframeeditor import (
     generate_pandas_indexes)
 from spyder_kernels.utils.nsview import get_size
@@ -266,6 +266,34 @@ def test_filter_rows(qtbot):
     assert editor.model().rowCount() == 0
 
 
+def test_memory_column(qtbot):
+    """Test that the Memory column shows and sorts by memory usage."""
+    variables = {
+        name: {'type': 'int',
+               'size': 1,
+               'view': '1',
+               'python_type': 'int',
+               'numpy_type': 'Unknown',
+               'memory': memory}
+        for name, memory in [('a', 2048), ('b', 100), ('c', 3 * 1024 ** 2)]
+    }
+    CONF.set('variable_explorer', 'show_memory', True)
+    editor = RemoteCollectionsEditorTableView(None, variables)
+    qtbot.addWidget(editor)
+
+    assert not editor.isColumnHidden(MEMORY_COLUMN)
+    assert data(editor.model(), 0, MEMORY_COLUMN) == '2.0 KiB'
+    assert data(editor.model(), 1, MEMORY_COLUMN) == '100 B'
+
+    # Sorting is done by the amount of memory, not its representation
+    editor.sortByColumn(MEMORY_COLUMN, Qt.DescendingOrder)
+    assert [data(editor.model(), i, 0) for i in range(3)] == ['c', 'a', 'b']
+
+    # The column is hidden when turning the option off
+    CONF.set('variable_explorer', 'show_memory', False)
+    assert editor.isColumnHidden(MEMORY_COLUMN)
+
+
 def test_remote_make_data_function():
     """
     Test that the function returned by make_data_function() is the expected
@@ -8,6 +8,12 @@
 Tests for dependencies.py
 """
 
+# Standard library imports
+import json
+import subprocess
+import sys
+from textwrap import dedent
+
 # Test library imports
 import pytest
 
@@ -36,5 +42,55 @@ def test_dependencies(dependencies_dialog):
     assert dependencies_dialog
 
 
+def test_dependencies_are_not_imported():
+    """
+    Check that declaring dependencies at startup doesn't import them and
+    measure the time it takes.
+    """
+    code = dedent(
+        """
+        import json
+        import sys
+        import time
+
+        from spyder import dependencies
+
+        imported = set(sys.modules)
+        start = time.perf_counter()
+        dependencies.declare_dependencies()
+        elapsed = time.perf_counter() - start
+
+        print(json.dumps({
+            'elapsed': elapsed,
+            'imported': sorted(set(sys.modules) - imported),
+        }))
+        """
+    )
+    output = subprocess.check_output([sys.executable, '-c', code])
+    result = json.loads(output.decode().splitlines()[-1])
+    print(f"Time to declare dependencies: {result['elapsed']:.3f} s")
+
+    modnames = {dep['modname'] for dep in dependencies.DESCRIPTIONS}
+    assert not modnames & set(result['imported'])
+    assert result['elapsed'] < 5
+
+
+def test_site_packages_key_ignores_cwd(tmp_path, monkeypatch):
+    """Check that changing the current directory keeps the cache valid."""
+    site_packages = tmp_path / 'site-packages'
+    site_packages.mkdir()
+    monkeypatch.setattr(sys, 'path', ['', str(site_packages)])
+
+    monkeypatch.chdir(str(tmp_path))
+    key = dependencies._get_site_packages_key()
+    assert [path for path, __ in key] == [str(site_packages)]
+
+    other_dir = tmp_path / 'other'
+    other_dir.mkdir()
+    monkeypatch.chdir(str(other_dir))
+    (other_dir / 'new_file.py').write_text('')
+    assert dependencies._get_site_packages_key() == key
+
+
 if __name__ == "__main__":
     pytest.main()